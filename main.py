@@ -3,6 +3,7 @@ from dotenv import load_dotenv
 from pylms.cli import input_course_name, input_dir
 from pylms.config import load, write_config
 from pylms.constants import ENV_PATH
+from pylms.data import flush_exports
 from pylms.errors import ForcedExitError, Result
 from pylms.mainloop import closed_loop, handle_err, mainloop
 from pylms.paths import prepare_paths
@@ -62,4 +63,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # Wait for spreadsheets still being written in the background
+        _ = flush_exports()
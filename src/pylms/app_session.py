@@ -0,0 +1,154 @@
+from collections.abc import Callable
+from typing import NamedTuple, final
+
+from .data import DataStore
+from .data_service import load, save
+from .data_service.load import datastore_source
+from .errors import Result, Unit
+from .history import History, load_history, save_history
+from .paths import file_stamp, get_datastore_path, get_history_journal_path, get_history_path
+
+
+class AppSessionStats(NamedTuple):
+    """
+    Counters of an `AppSession`.
+
+    :param ds_loads: (int) - Times the DataStore was read from disk.
+    :param history_loads: (int) - Times the History was read from disk.
+    :param reuses: (int) - Passes served by the DataStore and History already in memory.
+    """
+
+    ds_loads: int
+    history_loads: int
+    reuses: int
+
+
+@final
+class AppSession:
+    """
+    The DataStore and History of one run of the app, kept in memory across the passes of the menu loop.
+
+    Each is read from disk on the first pass and reused afterwards, unless its files were written by someone else since it was loaded or saved, for example by a rollback or a hand edit of the DataStore workbook. `checkpoint` saves whichever of the two changed; unchanged data is never written. `discard_unsaved` drops them instead when a failed action left changes behind.
+
+    :param load_ds: (Callable[[], Result[DataStore]]) - Reads the DataStore from disk.
+    :param load_hist: (Callable[[], Result[History]]) - Reads the History from disk.
+    """
+
+    def __init__(
+        self,
+        load_ds: Callable[[], Result[DataStore]] = load,
+        load_hist: Callable[[], Result[History]] = load_history,
+    ) -> None:
+        self._load_ds: Callable[[], Result[DataStore]] = load_ds
+        self._load_hist: Callable[[], Result[History]] = load_hist
+        self._ds: DataStore | None = None
+        self._history: History | None = None
+        self._ds_loads: int = 0
+        self._history_loads: int = 0
+        self._reuses: int = 0
+
+    def _ds_is_stale(self, ds: DataStore) -> bool:
+        if ds.prefilled or ds.stamp is None:
+            return True
+        arrow_path = get_datastore_path()
+        if ds.stamp != file_stamp(arrow_path):
+            return True
+        # The workbook was edited by hand after the last save
+        return datastore_source() != arrow_path
+
+    def _history_is_stale(self, history: History) -> bool:
+        stamp = file_stamp(get_history_path(), get_history_journal_path())
+        return history._stamp != stamp  # pyright: ignore[reportPrivateUsage]
+
+    def state(self) -> Result[tuple[DataStore, History]]:
+        """
+        Returns the DataStore and History of the session, reading from disk only the ones whose files changed since they were loaded or saved.
+
+        :return: (Result[tuple[DataStore, History]]) - The DataStore and the History.
+        :rtype: Result[tuple[DataStore, History]]
+        """
+        reused: bool = True
+
+        history = self._history
+        if history is None or self._history_is_stale(history):
+            loaded_history = self._load_hist()
+            if loaded_history.is_err():
+                return loaded_history.propagate()
+            history = loaded_history.unwrap()
+            self._history = history
+            self._history_loads += 1
+            reused = False
+
+        ds = self._ds
+        if ds is None or self._ds_is_stale(ds):
+            loaded_ds = self._load_ds()
+            if loaded_ds.is_err():
+                return loaded_ds.propagate()
+            ds = loaded_ds.unwrap()
+            self._ds = ds
+            self._ds_loads += 1
+            reused = False
+
+        if reused:
+            self._reuses += 1
+        return Result.ok((ds, history))
+
+    def checkpoint(self) -> Result[Unit]:
+        """
+        Saves the DataStore and History of the session if they changed since they were loaded or saved.
+
+        :return: (Result[Unit]) - A result object indicating success or failure.
+        :rtype: Result[Unit]
+        """
+        if self._history is not None and self._history.dirty:
+            result = save_history(self._history)
+            if result.is_err():
+                return result.propagate()
+
+        if self._ds is not None and not self._ds.prefilled:
+            # `save` itself skips data that did not change
+            result = save(self._ds)
+            if result.is_err():
+                return result.propagate()
+
+        return Result.unit()
+
+    def discard_unsaved(self) -> bool:
+        """
+        Forgets the DataStore and History if either holds changes that were not saved, so both are read from disk on the next pass.
+
+        The routines save after every action that succeeds, so changes still unsaved when a routine returns were left behind by an action that failed and must not be written.
+
+        :return: (bool) - True if unsaved changes were discarded.
+        :rtype: bool
+        """
+        ds_dirty = self._ds is not None and not self._ds.prefilled and self._ds.dirty
+        history_dirty = self._history is not None and self._history.dirty
+        if not (ds_dirty or history_dirty):
+            return False
+        self.clear()
+        return True
+
+    def stats(self) -> AppSessionStats:
+        """
+        :return: (AppSessionStats) - The load and reuse counters.
+        :rtype: AppSessionStats
+        """
+        return AppSessionStats(self._ds_loads, self._history_loads, self._reuses)
+
+    def clear(self) -> None:
+        """Forgets the DataStore and History, so both are read from disk on the next pass."""
+        self._ds = None
+        self._history = None
+
+
+# Session shared by the passes of `mainloop` and `closed_loop`.
+_APP_SESSION = AppSession()
+
+
+def get_app_session() -> AppSession:
+    """
+    :return: (AppSession) - The process-wide app session.
+    :rtype: AppSession
+    """
+    return _APP_SESSION
@@ -0,0 +1,111 @@
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import Any, final, override
+from unittest.mock import patch
+
+import pandas as pd
+
+from .app_session import AppSession, AppSessionStats
+from .config import Config
+from .constants import COHORT, DATA_COLUMNS, SERIAL, TIME
+from .data import ArrowBackend, DataStore
+from .data_service import save
+from .history import History, add_held_class, save_history, sync_classes
+from .paths import PathRegistry, file_stamp, get_datastore_path
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    data: dict[str, list[object]] = {
+        col: [f"{col} {i}" for i in range(rows)] for col in DATA_COLUMNS
+    }
+    data[SERIAL] = list(range(1, rows + 1))
+    data[COHORT] = [4] * rows
+    data[TIME] = [datetime(2026, 1, 1)] * rows
+    return pd.DataFrame(data)
+
+
+@final
+class AppSessionTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        (root / "data" / "Excel").mkdir(parents=True)
+        (root / "data" / "Json").mkdir(parents=True)
+        config = Config.default()
+        config.settings.data_dir = str(root)
+        patches: list[Any] = [
+            patch("pylms.paths.registry._REGISTRY", PathRegistry(root / "state.toml", lambda: config)),
+            patch("pylms.history.save.HISTORY_PATH", root / "default-history.json"),
+        ]
+        for p in patches:
+            _ = p.start()
+            self.addCleanup(p.stop)
+
+        _ = save(DataStore(_frame(5))).unwrap()
+        history = History()
+        history.cohort = 4
+        history.class_days = [1, 3, 5]
+        history.orientation_date = datetime(2025, 6, 9)
+        _ = sync_classes(history).unwrap()
+        _ = save_history(history).unwrap()
+
+    def test_reuses_state_until_files_change(self) -> None:
+        session = AppSession()
+        ds, history = session.state().unwrap()
+        self.assertFalse(ds.dirty)
+        self.assertFalse(history.dirty)
+
+        # Unchanged state is reused and never written
+        stamp = file_stamp(get_datastore_path())
+        for _ in range(3):
+            again = session.state().unwrap()
+            self.assertIs(again[0], ds)
+            self.assertIs(again[1], history)
+            _ = session.checkpoint().unwrap()
+        self.assertEqual(file_stamp(get_datastore_path()), stamp)
+        self.assertEqual(session.stats(), AppSessionStats(ds_loads=1, history_loads=1, reuses=3))
+
+        # Changes are saved by the checkpoint, and saving does not make the state stale
+        ds.as_ref().loc[0, DATA_COLUMNS[2]] = "Edited"
+        _ = add_held_class(history, 1).unwrap()
+        self.assertTrue(ds.dirty)
+        self.assertTrue(history.dirty)
+        _ = session.checkpoint().unwrap()
+        self.assertFalse(ds.dirty)
+        self.assertFalse(history.dirty)
+        self.assertIs(session.state().unwrap()[0], ds)
+        self.assertEqual(session.stats().reuses, 4)
+
+        # A write by someone else is picked up
+        _ = ArrowBackend().write(_frame(7), get_datastore_path()).unwrap()
+        reloaded, same_history = session.state().unwrap()
+        self.assertIsNot(reloaded, ds)
+        self.assertEqual(reloaded.as_ref().shape[0], 7)
+        self.assertIs(same_history, history)
+        self.assertEqual(session.stats(), AppSessionStats(ds_loads=2, history_loads=1, reuses=4))
+
+    def test_discards_changes_left_unsaved(self) -> None:
+        session = AppSession()
+        ds, history = session.state().unwrap()
+        stamp = file_stamp(get_datastore_path())
+        self.assertFalse(session.discard_unsaved())
+        self.assertIs(session.state().unwrap()[0], ds)
+
+        # An action that failed part way through and skipped its save
+        ds.as_ref().loc[0, DATA_COLUMNS[2]] = "Half applied"
+        _ = add_held_class(history, 1).unwrap()
+        self.assertTrue(session.discard_unsaved())
+
+        reloaded, reloaded_history = session.state().unwrap()
+        self.assertEqual(file_stamp(get_datastore_path()), stamp)
+        self.assertEqual(reloaded.as_ref().loc[0, DATA_COLUMNS[2]], f"{DATA_COLUMNS[2]} 0")
+        self.assertFalse(reloaded_history.dirty)
+        self.assertEqual(len(reloaded_history.held_classes), 0)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
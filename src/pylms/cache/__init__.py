@@ -5,9 +5,11 @@ This package provides caching and rollback command functionalities.
 Modules:
 - cache_for_cmd: Provides caching command utilities.
 - rollback_to_cmd: Provides rollback command utilities.
+- SnapshotStore: Content-addressed store backing the command snapshots.
 """
 
 from .cache import cache_for_cmd
 from .rollback import rollback_to_cmd
+from .store import SnapshotStore
 
-__all__ = ["cache_for_cmd", "rollback_to_cmd"]
+__all__ = ["cache_for_cmd", "rollback_to_cmd", "SnapshotStore"]
@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 import pandas as pd
 
 from ..constants import CACHE_CMD, CACHE_ID, CACHE_TIME
-from ..data import read
+from ..data import flush_exports, read
 from ..errors import Result, Unit, eprint
 from ..paths import (
     get_cache_path,
@@ -15,6 +15,7 @@ from ..paths import (
     get_snapshot_path,
     rm_path,
 )
+from .store import SnapshotStore
 
 
 def new_cache_record(command: str) -> tuple[pd.DataFrame, UUID]:
@@ -111,10 +112,12 @@ def copy_data(
         src = get_data_path()
         dst = new_path
 
+    cache_name: str = get_cache_path().name
+
     # Remove existing items in destination except cache directory
     for item in dst.iterdir():
         # Skip cache directory
-        if item.name == get_cache_path().name:
+        if item.name == cache_name:
             continue
         # Remove items
         result = rm_path(item)
@@ -124,7 +127,7 @@ def copy_data(
     # Copy items from source to destination, excluding cache directory
     for item in src.iterdir():
         # Skip cache directory
-        if item.name == get_cache_path().name:
+        if item.name == cache_name:
             continue
         # Recursively copy directories
         new_item: Path = dst / item.name
@@ -154,10 +157,14 @@ def copy_data(
 def cache_for_cmd(cmd: str) -> Result[Unit]:
     """Create a cache snapshot for a command and update metadata.
 
-    Generate a cache metadata record for `cmd`, copy the current project data
-    into a snapshot directory, and update the metadata file. If metadata
-    already exists it is appended (with trimming to limit size); otherwise a
-    new metadata file is created.
+    Wait for queued background writes, generate a cache metadata record for
+    `cmd`, record the current project data as a snapshot in the
+    content-addressed `SnapshotStore`, and update the metadata file. Only
+    files that changed since the previous snapshot are read and stored;
+    unchanged files are shared with earlier snapshots. If metadata already
+    exists it is appended (with trimming to limit size, which also prunes
+    the snapshots of the trimmed records); otherwise a new metadata file is
+    created.
 
     Args:
         cmd (str): Description of the command being cached.
@@ -165,13 +172,18 @@ def cache_for_cmd(cmd: str) -> Result[Unit]:
     Returns:
         Result[Unit]: Ok on success or Err containing the error encountered.
     """
+    # Wait for background writes so the snapshot holds complete files.
+    # Failures belong to the previous command and are reported by the flush.
+    _ = flush_exports()
+
     # Create a new cache record and get the snapshot ID
     record, snapshot_id = new_cache_record(cmd)
 
-    # Copy data to the snapshot location
-    result = copy_data(snapshot_id)
+    # Record the data directory in the snapshot store
+    store = SnapshotStore.default()
+    result = store.snapshot(snapshot_id)
     if result.is_err():
-        return result
+        return result.propagate()
 
     # Check if metadata path exists to update or create cache metadata
     if get_metadata_path().exists():
@@ -183,7 +195,8 @@ def cache_for_cmd(cmd: str) -> Result[Unit]:
         cache = cache.unwrap()
 
         # Limit cache size by trimming older records if necessary
-        if cache.shape[0] >= 100:
+        trimmed: bool = cache.shape[0] >= 100
+        if trimmed:
             cache = cache.loc[50:, :]
 
         # Append new record to cache
@@ -191,6 +204,11 @@ def cache_for_cmd(cmd: str) -> Result[Unit]:
 
         # Save updated cache metadata
         cache.to_csv(get_metadata_path(), index=False)
+
+        # Drop the snapshots (and blobs) only the trimmed records referenced
+        if trimmed:
+            keep = [UUID(str(value)) for value in cache[CACHE_ID]]
+            return store.prune(keep)
     else:
         # Create new cache metadata file
         record.to_csv(get_metadata_path(), index=False)
@@ -5,12 +5,14 @@ from uuid import UUID
 
 import pandas as pd
 
-from ..cli import input_num
+from ..cli import input_bool, input_num
 from ..constants import CACHE_CMD, CACHE_ID, CACHE_TIME
-from ..data import DataStream, read
+from ..data import DataStream, flush_exports, read
 from ..errors import Result, Unit
+from ..info import print_info
 from ..paths import get_data_path, get_metadata_path, get_snapshot_path
 from .cache import copy_data
+from .store import SnapshotStore
 
 
 def verify_cache_records(test_data: pd.DataFrame) -> bool:
@@ -71,9 +73,13 @@ def rollback_to_cmd(test_path: Path | None = None) -> Result[Unit]:
     rollback operation by copying snapshot data to the target path.
 
     This function reads cache metadata, prints a formatted list of available
-    snapshots, prompts the user to choose an index to restore, and then copies
-    the selected snapshot into `test_path` (or the default data path). The
-    function returns the `Result` produced by the copy operation.
+    snapshots, prompts the user to choose an index to restore, and then
+    restores the selected snapshot from its manifest in the `SnapshotStore`
+    into `test_path` (or the default data path). The files that differ from
+    the snapshot are listed as a dry run and, once confirmed, only those
+    files are rewritten, added or deleted. Snapshots created before the store
+    existed are restored by copying their snapshot directory. The function
+    returns the `Result` produced by the restore operation.
 
     Args:
         test_path (Path | None): Optional destination path to restore data to.
@@ -133,12 +139,37 @@ def rollback_to_cmd(test_path: Path | None = None) -> Result[Unit]:
     snapshot_value = cache_records[CACHE_ID].astype(str).iloc[idx - 1]
     snapshot_id = UUID(snapshot_value)
 
-    # Get the snapshot path for the rollback
-    snapshot_path = get_snapshot_path(snapshot_id)
-
     # Use provided test_path or default data path
     if test_path is None:
         test_path = get_data_path()
 
-    # Perform the rollback by copying data from snapshot to test_path
+    # A queued write landing after the restore would undo part of it
+    _ = flush_exports()
+
+    # Restore from the snapshot store when the snapshot has a manifest
+    store = SnapshotStore.default()
+    if store.has_snapshot(snapshot_id):
+        # Work out which files differ before anything is written
+        plan = store.plan_restore(snapshot_id, test_path)
+        if plan.is_err():
+            return plan.propagate()
+        plan = plan.unwrap()
+
+        # Show a dry-run summary of the restore
+        print_info(f"Rollback will make the following changes:\n{plan.summary()}")
+        if plan.is_empty():
+            return Result.unit()
+
+        choice = input_bool("Proceed with the rollback")
+        if choice.is_err():
+            return choice.propagate()
+        if not choice.unwrap():
+            return Result.err("Rollback cancelled")
+
+        # Rewrite, add and delete only the files that differ
+        return store.apply_restore(plan)
+
+    # Snapshots taken before the snapshot store existed are full directory
+    # copies; restore those by copying data from the snapshot to test_path
+    snapshot_path = get_snapshot_path(snapshot_id)
     return copy_data(snapshot_id, snapshot_path, test_path)
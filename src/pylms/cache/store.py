@@ -0,0 +1,592 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple, Self, TypedDict, final
+from uuid import UUID
+
+from ..errors import Result, Unit, eprint
+from ..paths import get_cache_path, get_data_path
+
+# Size of the chunks read from disk while hashing and storing a file.
+CHUNK_SIZE: int = 1 << 20
+
+
+class Manifest(TypedDict):
+    """On-disk description of a snapshot.
+
+    Attributes:
+        dirs (list[str]): Relative POSIX paths of every directory in the
+            snapshot, kept so that empty directories are restored as well.
+        files (dict[str, str]): Mapping of relative POSIX file paths to the
+            SHA-256 digest of the blob holding their content.
+        stats (dict[str, list[int]]): Mapping of relative POSIX file paths to
+            the `[size, mtime_ns]` of the file when the snapshot was taken.
+        taken (int): Time (in ns) at which the snapshot started.
+    """
+
+    dirs: list[str]
+    files: dict[str, str]
+    stats: dict[str, list[int]]
+    taken: int
+
+
+# (size, mtime_ns, digest) recorded for a file the last time it was hashed.
+type StatEntry = tuple[int, int, str]
+
+
+class RestorePlan(NamedTuple):
+    """The changes needed to bring a directory back to a snapshot.
+
+    Attributes:
+        dst (Path): Directory the plan applies to.
+        added (dict[str, str]): Files missing from `dst`, mapped to the digest
+            of the blob to write.
+        changed (dict[str, str]): Files whose content differs from the
+            snapshot, mapped to the digest of the blob to write.
+        removed (list[str]): Files in `dst` that are not in the snapshot.
+        dirs_added (list[str]): Directories missing from `dst`.
+        dirs_removed (list[str]): Directories in `dst` that are not in the
+            snapshot.
+        unchanged (int): Number of files already matching the snapshot.
+        mtimes (dict[str, int]): mtime (in ns) recorded by the snapshot for the
+            files to write, restored along with their content.
+    """
+
+    dst: Path
+    added: dict[str, str]
+    changed: dict[str, str]
+    removed: list[str]
+    dirs_added: list[str]
+    dirs_removed: list[str]
+    unchanged: int
+    mtimes: dict[str, int]
+
+    def is_empty(self) -> bool:
+        return (
+            len(self.added) == 0
+            and len(self.changed) == 0
+            and len(self.removed) == 0
+            and len(self.dirs_added) == 0
+            and len(self.dirs_removed) == 0
+        )
+
+    def summary(self) -> str:
+        """Describe the plan, one line per file, for a dry-run display."""
+        lines: list[str] = [
+            f"{len(self.added)} file(s) to add, {len(self.changed)} to rewrite, "
+            + f"{len(self.removed)} to delete, {self.unchanged} unchanged"
+        ]
+        lines.extend(f"  + {rel}" for rel in self.added)
+        lines.extend(f"  ~ {rel}" for rel in self.changed)
+        lines.extend(f"  - {rel}" for rel in self.removed)
+        lines.extend(f"  + {rel}/" for rel in self.dirs_added)
+        lines.extend(f"  - {rel}/" for rel in self.dirs_removed)
+        return "\n".join(lines)
+
+
+@final
+class SnapshotStore:
+    """Content-addressed, deduplicating store of data directory snapshots.
+
+    Every file in the data directory is stored once in a blob store keyed by
+    the SHA-256 digest of its content. A snapshot is a small JSON manifest
+    mapping relative paths to blob digests, so unchanged files are shared by
+    reference between snapshots instead of being copied again.
+
+    A stat index (size and mtime of every file at the time it was last
+    hashed) lets a snapshot skip reading files that have not changed, so the
+    cost of a snapshot scales with what changed rather than with the size of
+    the data directory.
+
+    Layout of the cache directory::
+
+        .cache/
+            blobs/ab/abcdef...      file contents keyed by digest
+            manifests/Snapshot{uuid}.json
+            index.json              stat index of the data directory
+
+    Attributes:
+        root (Path): Directory being snapshotted (the data directory).
+        cache (Path): Directory holding blobs, manifests and the stat index.
+            It is skipped when `cache` lives inside `root`.
+    """
+
+    def __init__(self, root: Path, cache: Path) -> None:
+        self.root: Path = root
+        self.cache: Path = cache
+
+    @classmethod
+    def default(cls) -> Self:
+        """Return the store for the configured data directory.
+
+        Returns:
+            SnapshotStore: Store rooted at `get_data_path()` and backed by
+                `get_cache_path()`.
+        """
+        return cls(get_data_path(), get_cache_path())
+
+    @property
+    def blob_dir(self) -> Path:
+        return self.cache / "blobs"
+
+    @property
+    def manifest_dir(self) -> Path:
+        return self.cache / "manifests"
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache / "index.json"
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+
+    def manifest_path(self, snapshot_id: UUID) -> Path:
+        return self.manifest_dir / f"Snapshot{snapshot_id}.json"
+
+    def has_snapshot(self, snapshot_id: UUID) -> bool:
+        return self.manifest_path(snapshot_id).exists()
+
+    def _walk(self, root: Path) -> tuple[list[str], list[Path]]:
+        """List the directories and files under `root`, skipping the cache.
+
+        Args:
+            root (Path): Directory to walk.
+
+        Returns:
+            tuple[list[str], list[Path]]: Relative POSIX paths of all
+                directories and absolute paths of all files, both sorted.
+        """
+        dirs: list[str] = []
+        files: list[Path] = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            current = Path(dirpath)
+            # Never descend into the cache directory itself
+            dirnames[:] = sorted(
+                name for name in dirnames if current / name != self.cache
+            )
+            if current != root:
+                dirs.append(current.relative_to(root).as_posix())
+            files.extend(current / name for name in sorted(filenames))
+        return dirs, files
+
+    def _read_index(self) -> tuple[dict[str, StatEntry], int]:
+        """Load the stat index, returning an empty one if it is unusable.
+
+        Returns:
+            tuple[dict[str, StatEntry], int]: The index entries and the time
+                (in ns) at which the index was written.
+        """
+        if not self.index_path.exists():
+            return {}, 0
+        try:
+            with self.index_path.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+            entries: dict[str, StatEntry] = {
+                rel: (int(size), int(mtime), str(digest))
+                for rel, (size, mtime, digest) in data["entries"].items()
+            }
+            return entries, int(data["written"])
+        except (OSError, ValueError, KeyError, TypeError):
+            # A damaged index only costs a full re-hash, never correctness.
+            return {}, 0
+
+    def _write_json(self, path: Path, data: object) -> None:
+        """Atomically write `data` as JSON to `path`."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _hash_file(self, path: Path) -> str:
+        """Return the hex SHA-256 digest of the content of `path`."""
+        hasher = hashlib.sha256()
+        with path.open("rb") as file:
+            while chunk := file.read(CHUNK_SIZE):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def _store_blob(self, path: Path) -> str:
+        """Hash `path` and add its content to the blob store.
+
+        The file is read once: the content is hashed while it is copied into
+        a temporary file, which is then renamed to its digest. If a blob with
+        the same digest already exists the temporary copy is discarded.
+
+        Args:
+            path (Path): File to store.
+
+        Returns:
+            str: Hex digest of the file content.
+        """
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        hasher = hashlib.sha256()
+        fd, tmp_name = tempfile.mkstemp(dir=self.blob_dir, suffix=".tmp")
+        try:
+            with path.open("rb") as src, os.fdopen(fd, "wb") as dst:
+                while chunk := src.read(CHUNK_SIZE):
+                    hasher.update(chunk)
+                    _ = dst.write(chunk)
+            digest = hasher.hexdigest()
+            blob = self.blob_path(digest)
+            if blob.exists():
+                os.remove(tmp_name)
+            else:
+                blob.parent.mkdir(exist_ok=True)
+                os.replace(tmp_name, blob)
+            return digest
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def snapshot(self, snapshot_id: UUID) -> Result[Path]:
+        """Record the current state of `root` as a new snapshot.
+
+        Files whose size and mtime match the stat index are not read again;
+        their digest is taken from the index. Every other file is hashed and
+        stored in the blob store only if its content is new.
+
+        Args:
+            snapshot_id (UUID): Identifier of the snapshot to create.
+
+        Returns:
+            Result[Path]: Ok with the path of the written manifest, or Err
+                with the filesystem error encountered.
+        """
+        if not self.root.is_dir():
+            msg = f"data path: '{self.root}' does not exist"
+            eprint(msg)
+            return Result.err(FileNotFoundError(msg))
+
+        index, written = self._read_index()
+        new_index: dict[str, StatEntry] = {}
+        manifest: Manifest = {"dirs": [], "files": {}, "stats": {}, "taken": 0}
+
+        try:
+            dirs, files = self._walk(self.root)
+            manifest["dirs"] = dirs
+            # Taken before any file is hashed so that files modified while the
+            # snapshot runs are never trusted by the next snapshot.
+            started = time.time_ns()
+            manifest["taken"] = started
+            for file in files:
+                rel = file.relative_to(self.root).as_posix()
+                stat = file.stat()
+                entry = index.get(rel)
+                # Reuse the recorded digest only for files that provably did not
+                # change: same size and mtime, an mtime older than the index
+                # itself (so same-tick edits are re-hashed) and a blob that has
+                # not been pruned.
+                if (
+                    entry is not None
+                    and entry[0] == stat.st_size
+                    and entry[1] == stat.st_mtime_ns
+                    and entry[1] < written
+                    and self.blob_path(entry[2]).exists()
+                ):
+                    digest = entry[2]
+                else:
+                    digest = self._store_blob(file)
+                new_index[rel] = (stat.st_size, stat.st_mtime_ns, digest)
+                manifest["files"][rel] = digest
+                manifest["stats"][rel] = [stat.st_size, stat.st_mtime_ns]
+
+            manifest_path = self.manifest_path(snapshot_id)
+            self._write_json(manifest_path, manifest)
+            self._write_json(
+                self.index_path, {"written": started, "entries": new_index}
+            )
+        except OSError as e:
+            msg = f"Failed to snapshot data path: '{self.root}'.\nError: {e}"
+            eprint(msg)
+            return Result.err(e)
+
+        return Result.ok(manifest_path)
+
+    def read_manifest(self, snapshot_id: UUID) -> Result[Manifest]:
+        """Load and validate the manifest of a snapshot.
+
+        Args:
+            snapshot_id (UUID): Identifier of the snapshot.
+
+        Returns:
+            Result[Manifest]: Ok with the manifest, or Err if it is missing
+                or malformed.
+        """
+        path = self.manifest_path(snapshot_id)
+        if not path.exists():
+            msg = f"snapshot manifest: '{path}' does not exist"
+            eprint(msg)
+            return Result.err(FileNotFoundError(msg))
+
+        try:
+            with path.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            msg = f"Failed to read snapshot manifest: '{path}'.\nError: {e}"
+            eprint(msg)
+            return Result.err(msg)
+
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("dirs"), list)
+            or not isinstance(data.get("files"), dict)
+        ):
+            msg = f"snapshot manifest: '{path}' is malformed"
+            eprint(msg)
+            return Result.err(msg)
+
+        try:
+            # `stats` and `taken` are optional: without them every file of the
+            # snapshot is compared by content.
+            manifest: Manifest = {
+                "dirs": [str(rel) for rel in data["dirs"]],
+                "files": {
+                    str(rel): str(digest) for rel, digest in data["files"].items()
+                },
+                "stats": {
+                    str(rel): [int(size), int(mtime)]
+                    for rel, (size, mtime) in data.get("stats", {}).items()
+                },
+                "taken": int(data.get("taken", 0)),
+            }
+        except (ValueError, TypeError):
+            msg = f"snapshot manifest: '{path}' is malformed"
+            eprint(msg)
+            return Result.err(msg)
+
+        return Result.ok(manifest)
+
+    def plan_restore(
+        self, snapshot_id: UUID, dst: Path | None = None
+    ) -> Result[RestorePlan]:
+        """Compute the changes needed to restore a snapshot into `dst`.
+
+        Nothing is written. A live file is unchanged when its size and mtime
+        still match those recorded in the manifest. Otherwise a size mismatch
+        marks it as changed, and only files of equal size are hashed (using
+        the stat index to avoid reading files it already knows about) and
+        compared by digest.
+
+        Args:
+            snapshot_id (UUID): Identifier of the snapshot to restore.
+            dst (Path | None): Destination directory. Defaults to `root`.
+
+        Returns:
+            Result[RestorePlan]: Ok with the plan, or Err if the manifest is
+                unusable, a referenced blob is missing or `dst` can't be read.
+        """
+        if dst is None:
+            dst = self.root
+
+        manifest = self.read_manifest(snapshot_id)
+        if manifest.is_err():
+            return manifest.propagate()
+        manifest = manifest.unwrap()
+
+        missing = [
+            rel
+            for rel, digest in manifest["files"].items()
+            if not self.blob_path(digest).exists()
+        ]
+        if len(missing) > 0:
+            msg = f"snapshot '{snapshot_id}' is incomplete, missing blobs for: {missing}"
+            eprint(msg)
+            return Result.err(msg)
+
+        # The stat index only describes `root`
+        index, written = self._read_index() if dst == self.root else ({}, 0)
+
+        added: dict[str, str] = {}
+        changed: dict[str, str] = {}
+        unchanged: int = 0
+        try:
+            live_dirs, live_files = self._walk(dst) if dst.is_dir() else ([], [])
+            live: dict[str, Path] = {
+                file.relative_to(dst).as_posix(): file for file in live_files
+            }
+            for rel, digest in manifest["files"].items():
+                path = live.get(rel)
+                if path is None:
+                    added[rel] = digest
+                    continue
+
+                stat = path.stat()
+                recorded = manifest["stats"].get(rel)
+                if recorded is not None:
+                    size, mtime = recorded
+                    # Untouched since the snapshot was taken
+                    if (
+                        size == stat.st_size
+                        and mtime == stat.st_mtime_ns
+                        and mtime < manifest["taken"]
+                    ):
+                        unchanged += 1
+                        continue
+                    # Different size, so different content
+                    if size != stat.st_size:
+                        changed[rel] = digest
+                        continue
+
+                entry = index.get(rel)
+                if (
+                    entry is not None
+                    and entry[0] == stat.st_size
+                    and entry[1] == stat.st_mtime_ns
+                    and entry[1] < written
+                ):
+                    live_digest = entry[2]
+                else:
+                    live_digest = self._hash_file(path)
+
+                if live_digest == digest:
+                    unchanged += 1
+                else:
+                    changed[rel] = digest
+        except OSError as e:
+            msg = f"Failed to compare snapshot: '{snapshot_id}' with dst: '{dst}'.\nError: {e}"
+            eprint(msg)
+            return Result.err(e)
+
+        snapshot_dirs = set(manifest["dirs"])
+        return Result.ok(
+            RestorePlan(
+                dst=dst,
+                added=added,
+                changed=changed,
+                removed=[rel for rel in live if rel not in manifest["files"]],
+                dirs_added=[rel for rel in manifest["dirs"] if rel not in live_dirs],
+                dirs_removed=[rel for rel in live_dirs if rel not in snapshot_dirs],
+                unchanged=unchanged,
+                mtimes={
+                    rel: manifest["stats"][rel][1]
+                    for rel in added | changed
+                    if rel in manifest["stats"]
+                },
+            )
+        )
+
+    def apply_restore(self, plan: RestorePlan) -> Result[Unit]:
+        """Apply a `RestorePlan`, touching only the files that differ.
+
+        Each added or changed file is written to a temporary file next to its
+        target and moved into place with an atomic rename, so an interrupted
+        restore leaves every file either at its old or its restored content,
+        never truncated and never with the directory emptied. Deletions run
+        only after every write has succeeded.
+
+        Args:
+            plan (RestorePlan): Plan computed by `plan_restore`.
+
+        Returns:
+            Result[Unit]: Ok on success or Err with the error encountered.
+        """
+        dst = plan.dst
+        index, written = self._read_index() if dst == self.root else ({}, 0)
+
+        try:
+            dst.mkdir(parents=True, exist_ok=True)
+            for rel in plan.dirs_added:
+                (dst / rel).mkdir(parents=True, exist_ok=True)
+
+            for rel, digest in (plan.added | plan.changed).items():
+                target = dst / rel
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+                os.close(fd)
+                try:
+                    _ = shutil.copyfile(self.blob_path(digest), tmp_name)
+                    # Keep the recorded mtime so that files keep their relative
+                    # age (the DataStore loader compares them).
+                    mtime = plan.mtimes.get(rel)
+                    if mtime is not None:
+                        os.utime(tmp_name, ns=(mtime, mtime))
+                    os.replace(tmp_name, target)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+                stat = target.stat()
+                index[rel] = (stat.st_size, stat.st_mtime_ns, digest)
+
+            for rel in plan.removed:
+                (dst / rel).unlink(missing_ok=True)
+                _ = index.pop(rel, None)
+
+            # Deepest directories first so parents are empty when reached
+            for rel in sorted(plan.dirs_removed, reverse=True):
+                (dst / rel).rmdir()
+
+            if dst == self.root:
+                # Bumping the index time would make entries that were too recent
+                # to trust look trustworthy, so those are dropped first.
+                index = {rel: entry for rel, entry in index.items() if entry[1] < written}
+                self._write_json(
+                    self.index_path, {"written": time.time_ns(), "entries": index}
+                )
+        except OSError as e:
+            msg = f"Failed to restore into dst: '{dst}'.\nError: {e}"
+            eprint(msg)
+            return Result.err(e)
+
+        return Result.unit()
+
+    def restore(self, snapshot_id: UUID, dst: Path | None = None) -> Result[Unit]:
+        """Restore a snapshot into `dst`, rewriting only what differs.
+
+        Args:
+            snapshot_id (UUID): Identifier of the snapshot to restore.
+            dst (Path | None): Destination directory. Defaults to `root`.
+
+        Returns:
+            Result[Unit]: Ok on success or Err with the error encountered.
+        """
+        plan = self.plan_restore(snapshot_id, dst)
+        if plan.is_err():
+            return plan.propagate()
+        return self.apply_restore(plan.unwrap())
+
+    def prune(self, keep: Iterable[UUID]) -> Result[Unit]:
+        """Delete snapshots not in `keep` and blobs no snapshot references.
+
+        Args:
+            keep (Iterable[UUID]): Identifiers of the snapshots to retain.
+
+        Returns:
+            Result[Unit]: Ok on success or Err with the error encountered.
+        """
+        keep_names = {self.manifest_path(snapshot_id).name for snapshot_id in keep}
+        referenced: set[str] = set()
+
+        try:
+            if self.manifest_dir.exists():
+                for path in self.manifest_dir.glob("Snapshot*.json"):
+                    if path.name not in keep_names:
+                        path.unlink()
+                        continue
+                    manifest = self.read_manifest(UUID(path.stem[len("Snapshot") :]))
+                    if manifest.is_err():
+                        return manifest.propagate()
+                    referenced.update(manifest.unwrap()["files"].values())
+
+            if self.blob_dir.exists():
+                for blob in self.blob_dir.glob("*/*"):
+                    if blob.name not in referenced:
+                        blob.unlink()
+                # Leftovers of interrupted writes
+                for tmp in self.blob_dir.glob("*.tmp"):
+                    tmp.unlink()
+        except (OSError, ValueError) as e:
+            msg = f"Failed to prune snapshot cache: '{self.cache}'.\nError: {e}"
+            eprint(msg)
+            return Result.err(msg)
+
+        return Result.unit()
@@ -0,0 +1,88 @@
+import tempfile
+from pathlib import Path
+from typing import final, override
+from unittest import TestCase, main
+from uuid import uuid4
+
+from .store import SnapshotStore
+
+
+@final
+class SnapshotStoreTest(TestCase):
+    @override
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.root = Path(self.tmp.name) / "data"  # pyright: ignore[reportUninitializedInstanceVariable]
+        (self.root / "Excel" / "weeks").mkdir(parents=True)
+        (self.root / "Json").mkdir()
+        _ = (self.root / "Excel" / "DataStore.xlsx").write_bytes(b"datastore")
+        _ = (self.root / "Json" / "dates.json").write_text("[]")
+        _ = (self.root / "history.json").write_text("{}")
+        self.store = SnapshotStore(self.root, self.root / ".cache")  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    @override
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_snapshot_shares_unchanged_files(self) -> None:
+        first, second = uuid4(), uuid4()
+        _ = self.store.snapshot(first).unwrap()
+        _ = (self.root / "history.json").write_text('{"cohort": 1}')
+        _ = self.store.snapshot(second).unwrap()
+
+        old = self.store.read_manifest(first).unwrap()["files"]
+        new = self.store.read_manifest(second).unwrap()["files"]
+        self.assertNotIn(".cache", " ".join(new))
+        self.assertEqual(old["Excel/DataStore.xlsx"], new["Excel/DataStore.xlsx"])
+        self.assertNotEqual(old["history.json"], new["history.json"])
+        # Three distinct contents for the first snapshot plus one changed file
+        self.assertEqual(len(list(self.store.blob_dir.glob("*/*"))), 4)
+
+    def test_restore(self) -> None:
+        snapshot_id = uuid4()
+        _ = self.store.snapshot(snapshot_id).unwrap()
+        _ = (self.root / "history.json").write_text('{"cohort": 2}')
+        (self.root / "Json" / "dates.json").unlink()
+
+        _ = self.store.restore(snapshot_id).unwrap()
+        self.assertEqual((self.root / "history.json").read_text(), "{}")
+        self.assertEqual((self.root / "Json" / "dates.json").read_text(), "[]")
+        self.assertTrue((self.root / "Excel" / "weeks").is_dir())
+
+    def test_plan_restore_only_touches_changed_files(self) -> None:
+        snapshot_id = uuid4()
+        _ = self.store.snapshot(snapshot_id).unwrap()
+        untouched = (self.root / "Excel" / "DataStore.xlsx").stat().st_mtime_ns
+        _ = (self.root / "history.json").write_text('{"cohort": 4}')
+        _ = (self.root / "Json" / "extra.json").write_text("{}")
+        (self.root / "Json" / "dates.json").unlink()
+        (self.root / "Json" / "classes").mkdir()
+
+        plan = self.store.plan_restore(snapshot_id).unwrap()
+        self.assertEqual(list(plan.added), ["Json/dates.json"])
+        self.assertEqual(list(plan.changed), ["history.json"])
+        self.assertEqual(plan.removed, ["Json/extra.json"])
+        self.assertEqual(plan.dirs_removed, ["Json/classes"])
+        self.assertEqual(plan.unchanged, 1)
+
+        _ = self.store.apply_restore(plan).unwrap()
+        self.assertTrue(self.store.plan_restore(snapshot_id).unwrap().is_empty())
+        self.assertFalse((self.root / "Json" / "extra.json").exists())
+        self.assertEqual(
+            (self.root / "Excel" / "DataStore.xlsx").stat().st_mtime_ns, untouched
+        )
+
+    def test_prune(self) -> None:
+        first, second = uuid4(), uuid4()
+        _ = self.store.snapshot(first).unwrap()
+        _ = (self.root / "history.json").write_text('{"cohort": 3}')
+        _ = self.store.snapshot(second).unwrap()
+
+        _ = self.store.prune([second]).unwrap()
+        self.assertFalse(self.store.has_snapshot(first))
+        self.assertEqual(len(list(self.store.blob_dir.glob("*/*"))), 3)
+        _ = self.store.restore(second).unwrap()
+
+
+if __name__ == "__main__":
+    _ = main()
@@ -15,16 +15,19 @@ Exports (selected):
 - clean_duplicates_with_cols, clean_str, clean_email, clean_name, clean_phone,
 - clean_cohort, clean_date, clean_time, clean_internship, clean_training,
 - clean_completion_date, clean_sort, clean_order, normalize
+- input_cohort, input_cohort_date, input_day_first
 """
 
 from .clean_col_names import clean_col_names
 from .clean_columns import clean_columns
-from .clean_completion_date import clean_completion_date
+from .clean_completion_date import clean_completion_date, input_day_first
 from .clean_duplicates import clean_duplicates, clean_duplicates_with_cols
 from .clean_email import clean_email
 from .clean_info import (
     clean_cohort,
     clean_date,
+    input_cohort,
+    input_cohort_date,
 )
 from .clean_internship import clean_internship
 from .clean_na import clean_na
@@ -53,6 +56,9 @@ __all__ = [
     "clean_internship",
     "clean_training",
     "clean_completion_date",
+    "input_cohort",
+    "input_cohort_date",
+    "input_day_first",
     "clean_sort",
     "clean_order",
     "normalize",
@@ -27,6 +27,26 @@ def _clean_date(entry: str | datetime, day_first: bool) -> str:
     return format_date(entry, COMPLETION_FMT, day_first=day_first)
 
 
+def input_day_first() -> Result[bool]:
+    """Ask whether the completion dates are written day first.
+
+    Returns:
+        Result[bool]: Ok with True for \"day first\" and False for
+        \"month first\", or an error `Result` propagated from the input prompt.
+    """
+    format_options = ["day first", "month first"]
+    result = input_option(
+        format_options,
+        title="NYSC/SIWES Completion Date",
+        prompt="Select the appropriate date format",
+    )
+    if result.is_err():
+        return result.propagate()
+
+    _, fmt = result.unwrap()
+    return Result.ok(fmt == format_options[0])
+
+
 def clean_completion_date(
     data_stream: DataStream[pd.DataFrame],
 ) -> Result[Unit]:
@@ -47,17 +67,11 @@ def clean_completion_date(
         invalid selection occurs.
     """
     data = data_stream.as_ref()
-    format_options = ["day first", "month first"]
-    result = input_option(
-        format_options,
-        title="NYSC/SIWES Completion Date",
-        prompt="Select the appropriate date format",
-    )
+    result = input_day_first()
     if result.is_err():
         return result.propagate()
 
-    _, fmt = result.unwrap()
-    day_first = fmt == format_options[0]
+    day_first = result.unwrap()
 
     def apply() -> Callable[[str], str]:
         """Return a callable that formats entries using the chosen ordering."""
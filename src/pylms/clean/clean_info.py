@@ -9,22 +9,14 @@ from ..data import DataStream
 from ..errors import Result, Unit
 
 
-def clean_cohort(
-    data_stream: DataStream[pd.DataFrame],
-) -> Result[Unit]:
-    """Prompt for and assign a cohort number to the DataStream.
+def input_cohort() -> Result[int]:
+    """Prompt for the cohort number of the registration data.
 
     Prompts the user to enter the cohort number using `input_num` and validates
-    that the provided value is a positive number. On success, the cohort value
-    is written to the column specified by the `COHORT` constant and the
-    updated DataFrame is returned wrapped in `Result.ok(DataStream(...))`.
-
-    Args:
-        data_stream (DataStream[pd.DataFrame]): DataStream containing the
-            DataFrame to update with the cohort number.
+    that the provided value is a positive number.
 
     Returns:
-        Result[Unit]: Unit Result indicating success, or an error `Result`
+        Result[int]: Ok with the cohort number, or an error `Result`
             propagated from the input prompt if validation fails.
     """
     msg: str = "\nCleaning Cohort in preprocessing stage... \nPlease enter the cohort number for this current cohort: "
@@ -40,7 +32,26 @@ def clean_cohort(
         """
         return num > 0
 
-    result = input_num(msg, 1, validator)
+    return input_num(msg, 1, validator)
+
+
+def clean_cohort(
+    data_stream: DataStream[pd.DataFrame],
+) -> Result[Unit]:
+    """Prompt for and assign a cohort number to the DataStream.
+
+    The cohort number is read with `input_cohort` and written to the column
+    specified by the `COHORT` constant.
+
+    Args:
+        data_stream (DataStream[pd.DataFrame]): DataStream containing the
+            DataFrame to update with the cohort number.
+
+    Returns:
+        Result[Unit]: Unit Result indicating success, or an error `Result`
+            propagated from the input prompt if validation fails.
+    """
+    result = input_cohort()
     if result.is_err():
         return result.propagate()
 
@@ -51,23 +62,16 @@ def clean_cohort(
     return Result.unit()
 
 
-def clean_date(
-    data_stream: DataStream[pd.DataFrame],
-) -> Result[Unit]:
-    """Prompt for and validate the cohort orientation date, then assign it.
+def input_cohort_date() -> Result[str]:
+    """Prompt for and validate the cohort orientation date.
 
     Prompts the user to enter the orientation date for the cohort. The
     expected format is `dd/mm/yyyy`. The function validates both the textual
     format and that the entered date is not earlier than a minimal allowed
-    date (constructed as `01/01/<current_year>`). If validation succeeds, the
-    date is written to the column specified by `DATE`.
-
-    Args:
-        data_stream (DataStream[pd.DataFrame]): DataStream containing the
-            DataFrame to update with the cohort orientation date.
+    date (constructed as `01/01/<current_year>`).
 
     Returns:
-        Result[Unit]: Unit result indicating success or an error `Result`
+        Result[str]: Ok with the date string, or an error `Result`
         propagated from the input prompt if validation fails.
     """
 
@@ -107,8 +111,26 @@ def clean_date(
             return False
         return True
 
-    result = input_str(msg, validator, diagnosis=diagnosis_map["result"])
+    return input_str(msg, validator, diagnosis=diagnosis_map["result"])
 
+
+def clean_date(
+    data_stream: DataStream[pd.DataFrame],
+) -> Result[Unit]:
+    """Prompt for the cohort orientation date, then assign it.
+
+    The date is read with `input_cohort_date` and written to the column
+    specified by `DATE`.
+
+    Args:
+        data_stream (DataStream[pd.DataFrame]): DataStream containing the
+            DataFrame to update with the cohort orientation date.
+
+    Returns:
+        Result[Unit]: Unit result indicating success or an error `Result`
+        propagated from the input prompt if validation fails.
+    """
+    result = input_cohort_date()
     if result.is_err():
         return result.propagate()
 
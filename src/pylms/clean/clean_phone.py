@@ -3,7 +3,7 @@ import pandas as pd
 from ..constants import PHONE
 from ..data import DataStream
 from ..errors import Result, Unit
-from ..re_phone import match_and_clean
+from ..re_phone import clean_phones
 
 
 def clean_phone(data_stream: DataStream[pd.DataFrame]) -> Result[Unit]:
@@ -11,8 +11,7 @@ def clean_phone(data_stream: DataStream[pd.DataFrame]) -> Result[Unit]:
 
     This function validates that the input DataFrame contains a column named
     by the `PHONE` constant, that the column contains non-missing string
-    values, and then applies the `match_and_clean` phone-normalization helper
-    to each value.
+    values, and then normalizes the whole column with `clean_phones`.
 
     Args:
         data_stream (DataStream[pd.DataFrame]): DataStream containing the
@@ -61,5 +60,5 @@ def clean_phone(data_stream: DataStream[pd.DataFrame]) -> Result[Unit]:
         return result.propagate()
 
     data = data_stream.as_ref()
-    data[PHONE] = data[PHONE].apply(match_and_clean)  # pyright: ignore [reportUnknownMemberType]
+    data[PHONE] = clean_phones(data[PHONE])
     return Result.unit()
@@ -1,14 +1,18 @@
-from .config import Config
-from .config_props import read_course_name, read_data_dir, read_open
-from .io import load, new_config, read_config, write_config
+from .config import DATA_ENGINES, Config, DataEngine
+from .config_props import read_course_name, read_data_dir, read_engine, read_open
+from .io import config_version, load, new_config, read_config, write_config
 
 __all__ = [
+    "config_version",
     "load",
     "new_config",
     "read_course_name",
     "read_data_dir",
+    "read_engine",
     "read_open",
     "read_config",
     "write_config",
     "Config",
+    "DataEngine",
+    "DATA_ENGINES",
 ]
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Self, cast, override
+from typing import Any, Literal, Self, cast, override
+
+# Library computing over the DataStore: "pandas" or "polars".
+type DataEngine = Literal["pandas", "polars"]
+
+DATA_ENGINES: tuple[DataEngine, ...] = ("pandas", "polars")
 
 
 class TomlProtocol(ABC):
@@ -58,24 +63,30 @@ class TomlSettings(TomlProtocol):
     Attributes:
         data_dir (str): Directory path used by the application to store data.
         course_name (str): Human-readable name of the course or instance.
+        engine (DataEngine): Library computing over the DataStore.
     """
 
-    def __init__(self, data_dir: str, course_name: str) -> None:
+    def __init__(
+        self, data_dir: str, course_name: str, engine: DataEngine = "pandas"
+    ) -> None:
         """Initialize settings.
 
         Args:
             data_dir: Directory path for data storage.
             course_name: Course name.
+            engine: Library computing over the DataStore. Defaults to "pandas".
         """
         self.data_dir: str = data_dir
         self.course_name: str = course_name
+        self.engine: DataEngine = engine
 
     @classmethod
     @override
     def default(cls) -> Self:
         """Return a default settings instance.
 
-        The default has empty strings for both `data_dir` and `course_name`.
+        The default has empty strings for both `data_dir` and `course_name`
+        and the pandas engine.
 
         Returns:
             Self: Default `TomlSettings`.
@@ -125,6 +136,9 @@ class TomlSettings(TomlProtocol):
             if key == "course_name":
                 # Accept only string values for `course_name`.
                 obj.course_name = value if isinstance(value, str) else ""
+            if key == "engine":
+                # Unknown engines fall back to pandas.
+                obj.engine = cast(DataEngine, str(value)) if value in DATA_ENGINES else "pandas"
         return obj
 
     @override
@@ -132,9 +146,14 @@ class TomlSettings(TomlProtocol):
         """Serialize settings to a dictionary.
 
         Returns:
-            dict[str, str]: Dictionary with keys `data_dir` and `course_name`.
+            dict[str, str]: Dictionary with keys `data_dir`, `course_name` and
+            `engine`.
         """
-        return {"data_dir": self.data_dir, "course_name": self.course_name}
+        return {
+            "data_dir": self.data_dir,
+            "course_name": self.course_name,
+            "engine": self.engine,
+        }
 
 
 class TomlState(TomlProtocol):
@@ -387,6 +406,15 @@ class Config(TomlProtocol):
         """
         return self.settings.data_dir
 
+    @property
+    def engine(self) -> DataEngine:
+        """Return the configured data engine.
+
+        Returns:
+            DataEngine: The `settings.engine` value.
+        """
+        return self.settings.engine
+
     @property
     def open_(self) -> list[bool]:
         """Return the state's open history.
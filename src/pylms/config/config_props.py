@@ -1,5 +1,5 @@
 from ..errors import Result, eprint
-from .config import Config
+from .config import Config, DataEngine
 from .io import read_config
 
 
@@ -99,3 +99,15 @@ def read_open() -> Result[bool]:
     # existing callers; if callers need the most recent state they should use
     # the appropriate Config APIs or modify this function explicitly.
     return Result.ok(toml.state.open[0])
+
+
+def read_engine() -> DataEngine:
+    """Return the configured data engine from persistent configuration.
+
+    Configurations written before the setting existed, or holding an unknown
+    engine, select pandas.
+
+    Returns:
+        DataEngine: "pandas" or "polars".
+    """
+    return read_config().engine
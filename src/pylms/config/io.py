@@ -3,6 +3,9 @@ import tomlkit
 from ..constants import STATE_PATH
 from .config import Config
 
+# Number of times the configuration was written by this process.
+_WRITES: int = 0
+
 
 def new_config() -> Config:
     """Create and persist a new default configuration.
@@ -51,12 +54,25 @@ def read_config() -> Config:
         return app_config
 
 
+def config_version() -> int:
+    """Return the number of configuration writes made by this process.
+
+    Caches derived from the configuration compare this number to tell
+    whether `write_config` has run since they were built, even when the
+    write left the modification time of `STATE_PATH` unchanged.
+
+    Returns:
+        int: The number of completed `write_config` calls.
+    """
+    return _WRITES
+
+
 def write_config(config: Config) -> None:
     """Write a `Config` instance to `STATE_PATH` as TOML.
 
     The configuration is converted to a mapping with `config.to_dict()` and
     serialized with `tomlkit.dumps`. The serialized text is written to the
-    `STATE_PATH` file using UTF-8 encoding.
+    `STATE_PATH` file using UTF-8 encoding. Writing bumps `config_version`.
 
     Args:
         config: The `Config` instance to serialize and write.
@@ -64,8 +80,10 @@ def write_config(config: Config) -> None:
     Raises:
         OSError: If the file cannot be written.
     """
+    global _WRITES
     config_dict = config.to_dict()
     with STATE_PATH.open(mode="w", encoding="utf-8") as f:
         toml_text: str = tomlkit.dumps(config_dict)  # pyright: ignore [reportUnknownMemberType]
         _ = f.write(toml_text)
-        return None
+    _WRITES += 1
+    return None
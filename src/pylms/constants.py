@@ -11,11 +11,35 @@ STATE_PATH: Path = DEFAULT_DATA_PATH / "state.toml"
 SECRETS_PATH: Path = PARENT_PATH / "secrets.json"
 HISTORY_PATH: Path = DEFAULT_DATA_PATH / "history.json"
 HISTORY_JSON: str = "history.json"
+# Changes to the history since its last snapshot, and how many are kept before
+# they are compacted into a new snapshot
+HISTORY_JOURNAL: str = "history.journal.jsonl"
+HISTORY_COMPACT: int = 64
 # RollCall Global Data
 GLOBAL_RECORD_PATH: Path = DEFAULT_DATA_PATH / "global_record.json"
 GLOBAL_RECORD_JSON: str = "global_record.json"
+# Local cache of retrieved form responses, one file per form id
+RESPONSES_DIR: str = "responses"
+# Queue and delivery log of bulk emails
+OUTBOX_DB: str = "outbox.sqlite3"
+# Canonical columnar copy of the DataStore
+DATASTORE_ARROW: str = "DataStore.arrow"
 DISCOVERY_DOC = "https://forms.googleapis.com/$discovery/rest?version=v1"
+# On-disk copies of the Google API discovery documents
+DISCOVERY_CACHE_PATH: Path = PARENT_PATH / ".discovery"
 SCOPES = "https://www.googleapis.com/auth/forms.body"
+# Google API request handling
+API_RETRIES: int = 5
+API_BACKOFF: float = 1.0
+FORM_WORKERS: int = 4
+# Bulk email delivery
+SMTP_HOST: str = "smtp.gmail.com"
+SMTP_WORKERS: int = 4
+# Messages per second and burst size allowed by each SMTP provider
+SMTP_RATE: float = 5.0
+SMTP_BURST: int = 10
+SMTP_RETRIES: int = 3
+SMTP_BACKOFF: float = 1.0
 
 
 class Spreadsheets(TypedDict):
@@ -27,6 +51,7 @@ class Spreadsheets(TypedDict):
     Assessment: Path
     Group: Path
     Project: Path
+    Breakdown: Path
 
 
 class Json(TypedDict):
@@ -1,6 +1,53 @@
+from .backend import ArrowBackend, ExcelBackend, StorageBackend, get_backend
 from .data_read import read
+from .datapolar import STATUS_ENUM, PolarsStore, status_count, to_polars
 from .datastore import DataStore
 from .datastream import DataStream
+from .engine import count_statuses
+from .export import ExportQueue, flush_exports, submit_export, wait_export
 from .print_fns import print_df, print_stream
+from .read_cache import ReadCache, ReadCacheStats, get_read_cache
+from .status import (
+    STATUS_CATEGORIES,
+    STATUS_DTYPE,
+    date_columns,
+    decode_status,
+    encode_status,
+    status_code,
+    status_codes,
+    to_status_column,
+    unknown_statuses,
+)
 
-__all__ = ["DataStream", "DataStore", "read", "print_df", "print_stream"]
+__all__ = [
+    "DataStream",
+    "DataStore",
+    "read",
+    "print_df",
+    "print_stream",
+    "StorageBackend",
+    "ArrowBackend",
+    "ExcelBackend",
+    "get_backend",
+    "ExportQueue",
+    "submit_export",
+    "wait_export",
+    "flush_exports",
+    "STATUS_CATEGORIES",
+    "STATUS_DTYPE",
+    "date_columns",
+    "decode_status",
+    "encode_status",
+    "status_code",
+    "status_codes",
+    "to_status_column",
+    "unknown_statuses",
+    "PolarsStore",
+    "STATUS_ENUM",
+    "status_count",
+    "to_polars",
+    "count_statuses",
+    "ReadCache",
+    "ReadCacheStats",
+    "get_read_cache",
+]
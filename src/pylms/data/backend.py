@@ -0,0 +1,149 @@
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import final, override
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from ..errors import Result, Unit, eprint
+from .data_read import read
+
+
+class StorageBackend(ABC):
+    """Storage format used to persist a DataFrame to disk.
+
+    Implementations pair a reader and a writer for a single file format so
+    that callers such as `data_service.load` and `data_service.save` can swap
+    the on-disk representation of the DataStore without changing how the
+    data is used.
+    """
+
+    suffix: str
+
+    @abstractmethod
+    def read(self, path: Path) -> Result[pd.DataFrame]:
+        """Read the DataFrame stored at `path`.
+
+        Args:
+            path (Path): File to read.
+
+        Returns:
+            Result[pd.DataFrame]: Ok with the data, or Err on failure.
+        """
+        pass
+
+    @abstractmethod
+    def write(self, data: pd.DataFrame, path: Path) -> Result[Unit]:
+        """Write `data` to `path`.
+
+        Args:
+            data (pd.DataFrame): Data to persist.
+            path (Path): Destination file.
+
+        Returns:
+            Result[Unit]: Ok on success, or Err on failure.
+        """
+        pass
+
+
+@final
+class ExcelBackend(StorageBackend):
+    """Excel workbooks written and parsed through openpyxl.
+
+    Human readable and editable, but parsing and serializing a workbook is
+    by far the slowest way to persist a DataFrame.
+    """
+
+    suffix = ".xlsx"
+
+    @override
+    def read(self, path: Path) -> Result[pd.DataFrame]:
+        return read(path, keep_na=True)
+
+    @override
+    def write(self, data: pd.DataFrame, path: Path) -> Result[Unit]:
+        try:
+            data.to_excel(path, index=False)  # pyright: ignore [reportUnknownMemberType]
+        except Exception as e:
+            msg = str(e)
+            eprint(msg)
+            return Result.err(msg)
+        return Result.unit()
+
+
+def _to_table(data: pd.DataFrame) -> pa.Table:
+    """Convert `data` to an Arrow table.
+
+    Arrow requires every column to hold a single type, while columns read
+    back from Excel can mix numbers and text. The non-missing values of such
+    columns are stored as text.
+    """
+    mixed: list[str] = [
+        col
+        for col in data.columns[data.dtypes == object]
+        if pd.api.types.infer_dtype(data[col], skipna=True).startswith("mixed")
+    ]
+    if len(mixed) > 0:
+        data = data.copy()
+        for col in mixed:
+            column = data[col]
+            data[col] = column.where(column.isna(), column.astype(str))
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+
+@final
+class ArrowBackend(StorageBackend):
+    """Uncompressed Arrow IPC (Feather v2) files.
+
+    Files are memory-mapped when read and written uncompressed so that the
+    mapping can be used without a decompression pass. Writes go through a
+    temporary file and an atomic rename, so a crash while saving never
+    leaves a truncated file behind.
+    """
+
+    suffix = ".arrow"
+
+    @override
+    def read(self, path: Path) -> Result[pd.DataFrame]:
+        return read(path, keep_na=True)
+
+    @override
+    def write(self, data: pd.DataFrame, path: Path) -> Result[Unit]:
+        parent = path.parent
+        if not parent.exists():
+            msg = f"Parent path specified: '{parent} does not exist"
+            eprint(msg)
+            return Result.err(msg)
+
+        fd, tmp_name = tempfile.mkstemp(dir=parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            feather.write_feather(_to_table(data), tmp_name, compression="uncompressed")
+            os.replace(tmp_name, path)
+        except Exception as e:
+            Path(tmp_name).unlink(missing_ok=True)
+            msg = f"Failed to write arrow file: '{path}'.\nError: {e}"
+            eprint(msg)
+            return Result.err(e)
+        return Result.unit()
+
+
+def get_backend(path: Path) -> Result[StorageBackend]:
+    """Return the storage backend handling the extension of `path`.
+
+    Args:
+        path (Path): File whose format is needed.
+
+    Returns:
+        Result[StorageBackend]: Ok with the backend, or Err if no backend
+            handles the extension.
+    """
+    for backend in (ArrowBackend(), ExcelBackend()):
+        if path.suffix == backend.suffix:
+            return Result.ok(backend)
+    msg = f"file: '{path.name}' has no storage backend. Supported formats are '.arrow' and '.xlsx'"
+    eprint(msg)
+    return Result.err(msg)
@@ -0,0 +1,58 @@
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import final, override
+from unittest import TestCase, main
+
+import numpy as np
+import pandas as pd
+
+from ..constants import COHORT, DATA_COLUMNS, SERIAL, TIME
+from .backend import ArrowBackend, ExcelBackend, get_backend
+
+
+@final
+class BackendTest(TestCase):
+    @override
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.path = Path(self.tmp.name)  # pyright: ignore[reportUninitializedInstanceVariable]
+        data: dict[str, list[object]] = {
+            col: [f"{col} {i}" for i in range(3)] for col in DATA_COLUMNS
+        }
+        data[SERIAL] = [1, 2, 3]
+        data[COHORT] = [4, 4, 4]
+        data[TIME] = [datetime(2026, 1, day) for day in range(1, 4)]
+        data["07/01/2026"] = ["Present", np.nan, "Absent"]
+        self.data = pd.DataFrame(data)  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    @override
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_arrow_matches_excel(self) -> None:
+        arrow, excel = self.path / "DataStore.arrow", self.path / "DataStore.xlsx"
+        _ = ArrowBackend().write(self.data, arrow).unwrap()
+        _ = ExcelBackend().write(self.data, excel).unwrap()
+
+        from_arrow = ArrowBackend().read(arrow).unwrap()
+        from_excel = ExcelBackend().read(excel).unwrap()
+        pd.testing.assert_frame_equal(from_arrow, from_excel)
+
+    def test_mixed_column(self) -> None:
+        self.data["Mixed"] = [1, "a", np.nan]
+        arrow = self.path / "DataStore.arrow"
+        _ = ArrowBackend().write(self.data, arrow).unwrap()
+
+        mixed = ArrowBackend().read(arrow).unwrap()["Mixed"].tolist()
+        self.assertEqual(mixed[:2], ["1", "a"])
+        self.assertTrue(pd.isna(mixed[2]))
+
+    def test_get_backend(self) -> None:
+        self.assertIsInstance(get_backend(Path("a.arrow")).unwrap(), ArrowBackend)
+        self.assertIsInstance(get_backend(Path("a.xlsx")).unwrap(), ExcelBackend)
+        self.assertTrue(get_backend(Path("a.json")).is_err())
+
+
+if __name__ == "__main__":
+    _ = main()
@@ -1,18 +1,56 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
 
 from ..errors import Result, eprint
+from .export import wait_export
+from .read_cache import ReadKey, get_read_cache
+
+
+def read_arrow(path: Path, keep_na: bool = False) -> pd.DataFrame:
+    """Read an Arrow IPC (Feather v2) file into a pandas DataFrame.
+
+    The file is memory-mapped rather than read into a buffer, so uncompressed
+    files are converted to pandas straight from the page cache. Missing values
+    are normalized to what `pd.read_excel` produces for the same data: `NaN`
+    when `keep_na` is True and empty strings in text columns otherwise.
+
+    Args:
+        path (Path): Path to the `.arrow` file.
+        keep_na (bool): If True, missing values are kept as `NaN`.
+
+    Returns:
+        pd.DataFrame: The parsed data.
+
+    Raises:
+        pyarrow.ArrowInvalid: If the file is not a valid Arrow IPC file.
+    """
+    table: pa.Table = feather.read_table(path, memory_map=True)
+    data: pd.DataFrame = table.to_pandas()
+    # Arrow turns missing strings into None where the Excel reader yields NaN
+    for col in data.columns[data.dtypes == object]:
+        column = data[col]
+        data[col] = column.where(column.notna(), np.nan if keep_na else "")
+    return data
 
 
 def read(path: Path, keep_na: bool = False) -> Result[pd.DataFrame]:
-    """Read a tabular file (Excel or CSV) into a pandas DataFrame.
+    """Read a tabular file (Excel, CSV or Arrow) into a pandas DataFrame.
 
-    Attempts to read the file located at `path` as either an Excel (.xlsx)
-    workbook or a CSV (.csv) file and returns a `Result` containing the
+    Attempts to read the file located at `path` as an Excel (.xlsx) workbook,
+    a CSV (.csv) file or an Arrow IPC (.arrow) file and returns a `Result` containing the
     parsed `pandas.DataFrame` on success. Errors encountered while locating,
     reading, or parsing the file are wrapped in a failed `Result`.
 
+    Excel and CSV files are parsed once per version on disk: the frame is
+    kept in the process-wide `ReadCache`, keyed by the resolved path, the
+    modification time and size of the file and `keep_na`, and later reads
+    of the unchanged file get a copy-on-write copy of it. Arrow files are
+    memory-mapped and not cached.
+
     Args:
         path (Path): Path to the input file to read.
         keep_na (bool): If True, preserve pandas' default NA handling when
@@ -34,6 +72,9 @@ def read(path: Path, keep_na: bool = False) -> Result[pd.DataFrame]:
         >>> read(Path('students.xlsx'))
         Result.ok(<DataFrame ...>)
     """
+    # A write of this file may still be queued; read what was last written.
+    wait_export(path)
+
     # Early-exit if the provided path does not exist to avoid attempting I/O.
     if not path.exists():
         msg = f"path: '{path} not found"
@@ -41,6 +82,14 @@ def read(path: Path, keep_na: bool = False) -> Result[pd.DataFrame]:
         return Result.err(msg)
 
     try:
+        key: ReadKey | None = None
+        if path.name.endswith(("xlsx", "csv")):
+            stat = path.stat()
+            key = ReadKey(path.resolve(), stat.st_mtime_ns, stat.st_size, keep_na)
+            cached = get_read_cache().get(key)
+            if cached is not None:
+                return Result.ok(cached)
+
         # Choose the appropriate pandas reader based on file extension.
         # We prefer explicit extension checks to avoid relying on pandas'
         # automatic engine selection, which can lead to surprising behavior.
@@ -52,12 +101,18 @@ def read(path: Path, keep_na: bool = False) -> Result[pd.DataFrame]:
         elif path.name.endswith("csv"):
             # Read CSV file. Keep same `keep_na` semantics.
             data = pd.read_csv(path, keep_default_na=keep_na)  # pyright: ignore [reportUnknownMemberType]
+        elif path.name.endswith("arrow"):
+            # Read the memory-mapped columnar copy. Keep same `keep_na` semantics.
+            data = read_arrow(path, keep_na)
         else:
             # Unsupported extension — log a clear message and return a domain error.
-            msg = f"file: '{path.name}' contains an unsupported file format. Only excel and csv files are supported"
+            msg = f"file: '{path.name}' contains an unsupported file format. Only excel, csv and arrow files are supported"
             eprint(msg)
             return Result.err(msg)
 
+        if key is not None:
+            get_read_cache().put(key, data)
+
         # Successful read — return the DataFrame wrapped in a success Result.
         return Result.ok(data)
     except PermissionError:
@@ -73,3 +128,8 @@ def read(path: Path, keep_na: bool = False) -> Result[pd.DataFrame]:
         msg = f"path: '{path}' contains empty headers"
         eprint(msg)
         return Result.err(msg)
+    except pa.ArrowInvalid as e:
+        # A truncated or foreign file with an `.arrow` extension.
+        msg = f"path: '{path}' is not a valid arrow file.\nError: {e}"
+        eprint(msg)
+        return Result.err(msg)
@@ -1,10 +1,19 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from pathlib import Path
-from typing import Self
+from typing import Literal, Self, cast, final
 
+import pandas as pd
 import polars as pl
 
-from pylms.errors import Result, Unit, eprint
+from pylms.errors import LMSError, Result, Unit, eprint
+
+from ..constants import COMMA, DATA_COLUMNS, NAME, PHONE, SEMI
+from ..record import RecordStatus
+from .backend import _to_table  # pyright: ignore[reportPrivateUsage]
+from .data_read import read
+from .datastore import DataStore
+from .export import submit_export
+from .status import DATE_COLUMN_RE, STATUS_CATEGORIES
 
 type Stream_ = Stream
 
@@ -91,3 +100,281 @@ class Records(Stream):
             return Result.ok(cls(value))
 
         return Result.err(msg)
+
+
+# Dtype of the class date columns of a PolarsStore, the polars counterpart of
+# `STATUS_DTYPE`: the same categories in the same order.
+STATUS_ENUM: pl.Enum = pl.Enum(STATUS_CATEGORIES)
+
+_LOOSE_STATUSES: dict[str, str] = {
+    status.strip().lower(): status for status in STATUS_CATEGORIES
+}
+
+
+def _to_status(column: str, dtype: pl.DataType) -> pl.Expr:
+    """Return an expression casting a class date column to `STATUS_ENUM`.
+
+    String values are matched to a status ignoring case and surrounding
+    spaces, as `encode_status` does; values that are not a status are null.
+    """
+    if dtype == STATUS_ENUM:
+        return pl.col(column)
+    return (
+        _normalized(column)
+        .replace_strict(_LOOSE_STATUSES, default=None)
+        .cast(STATUS_ENUM)
+    )
+
+
+def _normalized(column: str) -> pl.Expr:
+    return pl.col(column).cast(pl.String).str.strip_chars().str.to_lowercase()
+
+
+def to_polars(data: pd.DataFrame | pl.DataFrame) -> pl.DataFrame:
+    """Convert DataStore data to polars, with `STATUS_ENUM` date columns.
+
+    A date column holding values that are not statuses is reported and
+    kept unchanged, as `DataStore.encode_statuses` does.
+
+    Args:
+        data (pd.DataFrame | pl.DataFrame): pandas or polars data.
+
+    Returns:
+        pl.DataFrame: The data, with its class date columns encoded.
+    """
+    # Arrow, hence polars, needs one type per column; `_to_table` stores the
+    # values of columns mixing numbers and text as text.
+    frame = (
+        data
+        if isinstance(data, pl.DataFrame)
+        else cast(pl.DataFrame, pl.from_arrow(_to_table(data)))
+    )
+    schema = frame.schema
+    dates = [col for col in frame.columns if DATE_COLUMN_RE.match(col) is not None]
+    encoded = frame.select(_to_status(col, schema[col]) for col in dates)
+
+    columns: list[pl.Series] = []
+    for col in dates:
+        unknown = frame[col].filter(encoded[col].is_null() & frame[col].is_not_null())
+        if unknown.len() > 0:
+            values = sorted({str(value) for value in unknown.to_list()})
+            eprint(
+                f"Class date '{col}' holds values that are not attendance statuses: {values}. The column is kept as text until they are corrected."
+            )
+            continue
+        columns.append(encoded[col])
+    return frame.with_columns(columns)
+
+
+def status_count(columns: Sequence[str], statuses: Sequence[RecordStatus]) -> pl.Expr:
+    """Return an expression counting, per row, the cells holding one of `statuses`.
+
+    Cells are matched ignoring case and surrounding spaces, so columns kept as
+    text count the same as with `encode_status`.
+
+    Args:
+        columns (Sequence[str]): Class date columns to count over.
+        statuses (Sequence[RecordStatus]): Statuses to count.
+
+    Returns:
+        pl.Expr: UInt32 count per student, 0 when `columns` is empty.
+    """
+    if len(columns) == 0:
+        return pl.lit(0, dtype=pl.UInt32)
+    wanted = [str(status).strip().lower() for status in statuses]
+    return pl.sum_horizontal(
+        _normalized(col).is_in(wanted).fill_null(False).cast(pl.UInt32) for col in columns
+    )
+
+
+def validate(data: pl.DataFrame) -> tuple[bool, str]:
+    """Check that the first columns of `data` are `DATA_COLUMNS`, in order.
+
+    Args:
+        data (pl.DataFrame): Data to check.
+
+    Returns:
+        tuple[bool, str]: Whether the data is valid and, if not, why.
+    """
+    if not _has_data_columns(data.columns):
+        return False, f"Data does not start with the required columns {DATA_COLUMNS}"
+    return True, ""
+
+
+def _has_data_columns(columns: list[str]) -> bool:
+    return columns[: len(DATA_COLUMNS)] == DATA_COLUMNS
+
+
+@final
+class PolarsStore(Stream):
+    """The DataStore backed by a polars DataFrame.
+
+    It offers the API of `DataStore`: construction validated against
+    `DATA_COLUMNS`, `pretty`, `to_pretty` and `to_excel`. Class date columns
+    use `STATUS_ENUM`, so they convert to and from the categorical columns
+    of a `DataStore` without re-parsing the statuses. `lazy` starts a
+    `pl.LazyFrame` query, letting routines chain filters and aggregates that
+    polars optimizes and runs across cores before materializing anything.
+    """
+
+    def __init__(self, value: pl.DataFrame | Stream, prefilled: bool = False) -> None:
+        self.prefilled: bool = prefilled
+        super().__init__(value)
+
+    @classmethod
+    def from_data(cls, data: pd.DataFrame | pl.DataFrame) -> Result[Self]:
+        """Construct a PolarsStore from pandas or polars data.
+
+        Args:
+            data (pd.DataFrame | pl.DataFrame): Data holding at least the
+                columns defined in `DATA_COLUMNS`, first and in order.
+
+        Returns:
+            Result[PolarsStore]: Ok(PolarsStore) on success; Err on failure.
+        """
+        columns: list[str] = [str(col) for col in data.columns]
+        missing: list[str] = [col for col in DATA_COLUMNS if col not in columns]
+        if len(missing) > 0:
+            e = KeyError(f"{missing} not in index")
+            msg = f"Failed to validate the data, because it lacked required columns stored in the constant `DATA_COLUMNS`.\nError encountered: {e}"
+            eprint(msg)
+            return Result.err(e)
+
+        if not _has_data_columns(columns):
+            msg = f"Failed to validate the data, because it does not start with the required columns {DATA_COLUMNS}"
+            eprint(msg)
+            return Result.err(LMSError(msg))
+
+        try:
+            frame = to_polars(data)
+        except Exception as e:
+            msg = f"Failed to convert the data to polars.\nError: {e}"
+            eprint(msg)
+            return Result.err(e)
+        return Result.ok(cls(frame))
+
+    @classmethod
+    def from_local(cls, path: Path) -> Result[Self]:
+        """Create a PolarsStore by reading from a local file.
+
+        Arrow files are memory-mapped by polars directly; other formats are
+        read through `read`.
+
+        Args:
+            path (Path): Path to the source file.
+
+        Returns:
+            Result[PolarsStore]: Ok(PolarsStore) on success; Err on failure.
+        """
+        if path.suffix != ".arrow":
+            data = read(path, keep_na=True)
+            if data.is_err():
+                return data.propagate()
+            return cls.from_data(data.unwrap())
+
+        try:
+            frame = pl.read_ipc(path, memory_map=True)
+        except Exception as e:
+            msg = f"Failed to read arrow file: '{path}'.\nError: {e}"
+            eprint(msg)
+            return Result.err(e)
+        return cls.from_data(frame)
+
+    @classmethod
+    def from_datastore(cls, ds: DataStore) -> Self:
+        """Construct a PolarsStore holding the data of a DataStore.
+
+        Args:
+            ds (DataStore): Store to convert; already validated.
+
+        Returns:
+            PolarsStore: Store with the same data and `prefilled` marker.
+        """
+        return cls(to_polars(ds.as_ref()), ds.prefilled)
+
+    def to_datastore(self) -> Result[DataStore]:
+        """Convert the data back to a pandas `DataStore`.
+
+        Returns:
+            Result[DataStore]: Ok(DataStore) on success; Err on failure.
+        """
+        ds = DataStore.from_data(self.as_ref().to_pandas())
+        if ds.is_ok():
+            ds.unwrap().prefilled = self.prefilled
+        return ds
+
+    def lazy(self) -> pl.LazyFrame:
+        """Start a lazy query over the data.
+
+        Returns:
+            pl.LazyFrame: Query plan reading the stored data; nothing is
+                computed until it is collected.
+        """
+        return self.as_ref().lazy()
+
+    def date_columns(self) -> list[str]:
+        """Return the class date columns, in order.
+
+        Returns:
+            list[str]: Names of the columns named after a date.
+        """
+        return [col for col in self.as_ref().columns if DATE_COLUMN_RE.match(col) is not None]
+
+    def pretty(self) -> pl.DataFrame:
+        # Same display fields as `DataStore.pretty`, without the markers
+        return self.as_ref().with_columns(_pretty_name(), _pretty_phone())
+
+    def to_pretty(self) -> pl.DataFrame:
+        return self.as_ref().select(_pretty_name(), _pretty_phone())
+
+    def to_excel(
+        self, path: Path, style: Literal["pretty", "normal"] = "normal"
+    ) -> Result[Unit]:
+        """Persist the stored data to an Excel file in the background.
+
+        Args:
+            path (Path): Destination path for the Excel file.
+            style (Literal['pretty', 'normal']): If 'pretty' the stored data is
+                converted via `pretty()` before writing. Defaults to 'normal'.
+
+        Returns:
+            Result[Unit]: A result object indicating if the write was queued.
+                Errors raised by the write itself are reported by
+                `flush_exports`.
+        """
+        # polars frames are immutable, so the queued write can own either one
+        data = self.pretty() if style == "pretty" else self.as_ref()
+
+        def job(dst: Path) -> None:
+            _ = data.write_excel(dst)
+
+        submit_export(path, job)
+        return Result.unit()
+
+    @property
+    def data(self) -> pl.DataFrame:
+        return self.as_clone()
+
+    @data.setter
+    def data(self, data: pl.DataFrame) -> None:
+        test, msg = validate(data)
+        if not test:
+            raise Exception(msg)
+        self._value = (to_polars(data),)
+
+
+def _strip_marker(column: str, marker: str) -> pl.Expr:
+    return (
+        pl.col(column)
+        .cast(pl.String)
+        .str.replace_all(marker, "", literal=True)
+        .str.strip_chars()
+    )
+
+
+def _pretty_name() -> pl.Expr:
+    return _strip_marker(NAME, COMMA)
+
+
+def _pretty_phone() -> pl.Expr:
+    return _strip_marker(PHONE, SEMI)
@@ -0,0 +1,149 @@
+import tempfile
+from pathlib import Path
+from typing import final, override
+from unittest import TestCase, main, mock
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from ..config import Config
+from ..constants import COHORT, DATA_COLUMNS, NAME, PHONE, SERIAL
+from ..errors import LMSError
+from ..record import RecordStatus
+from .backend import ArrowBackend
+from .data_read import read
+from .datapolar import STATUS_ENUM, PolarsStore, status_count, to_polars
+from .datastore import DataStore
+from .engine import count_statuses
+from .export import flush_exports
+
+_DATES: list[str] = ["01/02/2026", "08/02/2026", "15/02/2026"]
+
+
+def _data() -> pd.DataFrame:
+    data = pd.DataFrame({col: [f"{col} {i}" for i in range(4)] for col in DATA_COLUMNS})
+    data[SERIAL] = [1, 2, 3, 4]
+    data[COHORT] = [4, 4, 4, 4]
+    data[NAME] = ["Ada, Obi", "Bola, Ade", "Chi, Eze", "Dayo, Ola"]
+    data[PHONE] = ["08012345678;", "08023456789;", "08034567890;", "08045678901;"]
+    data[_DATES[0]] = ["Present", "Absent", "Excused", np.nan]
+    data[_DATES[1]] = ["present", "CDS", "Absent", "Present"]
+    data[_DATES[2]] = [" ABSENT ", "Present", "No Class", "late"]
+    return data
+
+
+@final
+class PolarsStoreTest(TestCase):
+    @override
+    def setUp(self) -> None:
+        self.ds = DataStore.from_data(_data()).unwrap()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.ps = PolarsStore.from_datastore(self.ds)  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def test_validates_schema(self) -> None:
+        missing = PolarsStore.from_data(_data().drop(columns=[NAME]))
+        self.assertTrue(missing.is_err())
+        self.assertIsInstance(missing.unwrap_err(), KeyError)
+
+        reordered = _data()[[NAME, *[col for col in _data().columns if col != NAME]]]
+        mismatched = PolarsStore.from_data(reordered)
+        self.assertTrue(mismatched.is_err())
+        self.assertIsInstance(mismatched.unwrap_err(), LMSError)
+
+    def test_statuses_match_pandas(self) -> None:
+        frame = self.ps.as_ref()
+        self.assertEqual(self.ps.date_columns(), _DATES)
+        # "late" is not a status: both engines keep that column as text
+        self.assertEqual(frame.schema[_DATES[2]], pl.String)
+        self.assertEqual(frame[_DATES[2]].to_list(), [" ABSENT ", "Present", "No Class", "late"])
+        for col in _DATES:
+            if col != _DATES[2]:
+                self.assertEqual(frame.schema[col], STATUS_ENUM)
+            column = self.ds.as_ref()[col]
+            expected = column.astype(object).where(column.notna(), None)
+            self.assertEqual(frame[col].to_list(), expected.tolist())
+
+    def test_round_trip(self) -> None:
+        back = PolarsStore.from_data(_data()).unwrap().to_datastore().unwrap()
+        pd.testing.assert_frame_equal(back.as_ref(), self.ds.as_ref())
+
+    def test_pretty_matches_pandas(self) -> None:
+        pd.testing.assert_frame_equal(self.ps.to_pretty().to_pandas(), self.ds.to_pretty())
+        pretty = self.ps.pretty()
+        self.assertEqual(pretty.columns, self.ds.pretty().columns.tolist())
+        self.assertEqual(pretty[NAME].to_list(), self.ds.pretty()[NAME].tolist())
+        self.assertEqual(pretty[PHONE].to_list(), self.ds.pretty()[PHONE].tolist())
+
+    def test_count_statuses_engines_agree(self) -> None:
+        for statuses in ([RecordStatus.PRESENT], [RecordStatus.ABSENT, RecordStatus.EXCUSED]):
+            pandas_counts = count_statuses(self.ds, statuses, engine="pandas")
+            polars_counts = count_statuses(self.ds, statuses, engine="polars")
+            np.testing.assert_array_equal(pandas_counts, polars_counts)
+        np.testing.assert_array_equal(
+            count_statuses(self.ds, [RecordStatus.PRESENT], engine="polars"), [2, 1, 0, 1]
+        )
+        np.testing.assert_array_equal(
+            count_statuses(self.ds, [RecordStatus.ABSENT], [], engine="polars"), [0, 0, 0, 0]
+        )
+
+    def test_engine_from_config(self) -> None:
+        config = Config.from_value({"settings": {"engine": "polars"}})
+        self.assertEqual(config.engine, "polars")
+        self.assertEqual(Config.from_value({"settings": {"engine": "spark"}}).engine, "pandas")
+
+        with mock.patch("pylms.data.engine.to_polars", wraps=to_polars) as converted:
+            with mock.patch("pylms.data.engine.read_engine", return_value="polars"):
+                _ = count_statuses(self.ds, [RecordStatus.PRESENT])
+            self.assertEqual(converted.call_count, 1)
+            with mock.patch("pylms.data.engine.read_engine", return_value="pandas"):
+                _ = count_statuses(self.ds, [RecordStatus.PRESENT])
+            self.assertEqual(converted.call_count, 1)
+
+    def test_lazy_query(self) -> None:
+        present = status_count(_DATES, [RecordStatus.PRESENT]).alias("present")
+        result = (
+            self.ps.lazy()
+            .with_columns(present)
+            .filter(pl.col("present") > 0)
+            .select(pl.col(SERIAL), pl.col("present"))
+            .collect()
+        )
+        self.assertEqual(result[SERIAL].to_list(), [1, 2, 4])
+        self.assertEqual(result["present"].to_list(), [2, 1, 1])
+
+
+@final
+class PolarsStoreFileTest(TestCase):
+    @override
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.dir = Path(self.tmp.name)  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.ds = DataStore.from_data(_data()).unwrap()  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    @override
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_from_arrow_matches_pandas(self) -> None:
+        path = self.dir / "DataStore.arrow"
+        ArrowBackend().write(self.ds.as_ref(), path).unwrap()
+
+        ps = PolarsStore.from_local(path).unwrap()
+        ds = DataStore.from_local(path).unwrap()
+        pd.testing.assert_frame_equal(ps.to_datastore().unwrap().as_ref(), ds.as_ref())
+
+    def test_to_excel_round_trip(self) -> None:
+        path = self.dir / "DataStore.xlsx"
+        PolarsStore.from_datastore(self.ds).to_excel(path).unwrap()
+        flush_exports().unwrap()
+
+        reread = DataStore.from_data(read(path, keep_na=True).unwrap()).unwrap()
+        for col in [NAME, PHONE, *_DATES]:
+            self.assertEqual(
+                reread.as_ref()[col].astype(object).fillna("").tolist(),
+                self.ds.as_ref()[col].astype(object).fillna("").tolist(),
+            )
+
+
+if __name__ == "__main__":
+    _ = main()
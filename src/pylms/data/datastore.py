@@ -1,3 +1,4 @@
+import hashlib
 from pathlib import Path
 from typing import Callable, Literal, Self, final, override
 
@@ -11,8 +12,17 @@ from ..constants import (
     SEMI,
 )
 from ..errors import LMSError, Result, Unit, eprint
+from ..paths import FileStamp
 from .data_read import read
 from .datastream import DataStream
+from .export import submit_export
+from .status import (
+    STATUS_DTYPE,
+    date_columns,
+    encode_status,
+    to_status_column,
+    unknown_statuses,
+)
 
 type Validator = Callable[[pd.DataFrame], bool]
 
@@ -82,6 +92,22 @@ def validate(test_data: pd.DataFrame) -> bool:
     return True
 
 
+def has_data_columns(test_data: pd.DataFrame) -> bool:
+    """Check that the first columns of `test_data` are `DATA_COLUMNS`, in order.
+
+    Unlike `validate`, extra trailing columns (the class dates) are allowed.
+    Only the column labels are read.
+
+    Args:
+        test_data (pd.DataFrame): DataFrame to check.
+
+    Returns:
+        bool: True if the required columns lead the DataFrame, False otherwise.
+    """
+    input_cols: list[str] = test_data.columns[: len(DATA_COLUMNS)].tolist()
+    return input_cols == DATA_COLUMNS
+
+
 @final
 class DataStore(DataStream[pd.DataFrame]):
     """A DataStream specialized for pandas DataFrames with a required schema.
@@ -137,25 +163,25 @@ class DataStore(DataStream[pd.DataFrame]):
         Returns:
             Result[DataStore]: Ok(DataStore) on success; Err on failure.
         """
-        try:
-            # Attempt to slice the DataFrame to only the expected columns.
-            subset_data: pd.DataFrame = data[DATA_COLUMNS]
-        except KeyError as e:
+        # Check the column labels only; no data is copied to validate.
+        missing: list[str] = [col for col in DATA_COLUMNS if col not in data.columns]
+        if len(missing) > 0:
             # Missing columns — produce a helpful message for debugging.
+            e = KeyError(f"{missing} not in index")
             msg = f"Failed at from_local, failed to validate the passed in as argument to `data`, because it lacked required columns stored in the constant `DATA_COLUMNS.\nError encountered: {e}`"
             eprint(msg)
             return Result.err(e)
 
-        # Validate the sliced DataFrame for ordering/names.
-        if not validate(subset_data):
+        if not has_data_columns(data):
             msg = "Failed at from_local, failed to validate data stored at the file path specified as argument to `path`"
             eprint(msg)
             return Result.err(LMSError(msg))
 
-        # Create the DataStore using the validated subset, then attach the
+        # Create the DataStore from the required columns, then attach the
         # full original DataFrame (including any extra columns) to the instance.
-        ds: Self = cls(subset_data)
+        ds: Self = cls(data[DATA_COLUMNS])
         ds.data = data
+        ds.encode_statuses()
         return Result.ok(ds)
 
     def __init__(
@@ -182,21 +208,20 @@ class DataStore(DataStream[pd.DataFrame]):
              return a Result whose error can be handled while the latter will raise
              an exception.
         """
-        # If a DataStream was passed, call it to get the actual DataFrame value.
-        # Copying here ensures we don't accidentally share mutable state between
-        # the caller and this instance when a DataStream was provided.
-        true_data: pd.DataFrame = (
-            data.as_clone() if isinstance(data, DataStream) else data.copy()
-        )
         # Record whether this store contains prefilling/demo data.
         self.prefilled: bool = prefilled
+        # Fingerprint of the data and stamp of the file it was last loaded
+        # from or saved to; None until `mark_saved` is called.
+        self._saved: str | None = None
+        self._stamp: FileStamp | None = None
         # Delegate to the DataStream initializer with the module-level `validate`
-        # function enforcing the required schema at construction time.
-        super().__init__(true_data, validate)
+        # function enforcing the required schema at construction time. It
+        # takes the only copy, a lazy one, of the data.
+        super().__init__(data, validate)
 
     @classmethod
     def new_(cls, data: pd.DataFrame | DataStream[pd.DataFrame]) -> Result[Self]:
-        data = data.as_clone() if isinstance(data, DataStream) else data.copy()
+        data = data.as_view() if isinstance(data, DataStream) else data
         return cls.from_data(data)
 
     def copy_from(self, ds: Self) -> None:
@@ -204,8 +229,81 @@ class DataStore(DataStream[pd.DataFrame]):
         # The assignment to `data` uses the setter which validates the schema.
         self.data = ds.data
         self.prefilled = ds.prefilled
+        # The copied data is persisted exactly when the source's is.
+        self._saved = ds._saved
+        self._stamp = ds._stamp
+
+    def encode_statuses(self) -> None:
+        """Store the class date columns with the compact `STATUS_DTYPE`.
+
+        Each cell becomes an int8 code into the fixed `RecordStatus` order.
+        Columns already encoded are left alone, and the stored DataFrame is
+        modified in place so references taken with `as_ref` stay valid.
+        Excel and CSV files hold the status strings, which pandas writes out
+        from the categories.
+
+        A column holding values that are not statuses, such as a typo in a
+        hand-edited workbook, is reported and kept as text, so the values
+        are saved unchanged until they are corrected.
+        """
+        data = self.as_ref()
+        for col in date_columns(data):
+            if data[col].dtype == STATUS_DTYPE:
+                continue
+            codes = encode_status(data[col])
+            unknown = unknown_statuses(data[col], codes)
+            if len(unknown) > 0:
+                eprint(
+                    f"Class date '{col}' holds values that are not attendance statuses: {unknown}. The column is kept as text until they are corrected."
+                )
+                continue
+            data[col] = to_status_column(codes, data.index)
+
+    def fingerprint(self) -> str:
+        """Return a digest of the stored data.
+
+        The digest covers the column names, dtypes, index and every value,
+        so any edit, including one made in place through `as_ref`, changes it.
+
+        Returns:
+            str: Hex digest of the stored data.
+        """
+        data = self.as_ref()
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((data.columns.tolist(), data.dtypes.astype(str).tolist())).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def mark_saved(self, stamp: FileStamp) -> None:
+        """Record that the stored data matches the file it was loaded from or saved to.
+
+        Args:
+            stamp (FileStamp): Stamp of that file right after it was read or written.
+        """
+        self._saved = self.fingerprint()
+        self._stamp = stamp
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the stored data differs from what was last loaded or saved.
+
+        Returns:
+            bool: True if the data was never saved or changed since.
+        """
+        return self._saved is None or self.fingerprint() != self._saved
+
+    @property
+    def stamp(self) -> FileStamp | None:
+        """Stamp of the file the data was last loaded from or saved to.
+
+        Returns:
+            FileStamp | None: The stamp, or None if the data was never saved.
+        """
+        return self._stamp
 
     def pretty(self) -> pd.DataFrame:
+        # Only the two rewritten columns are materialized; the others are
+        # shared with the stored value until either side modifies them.
         data: pd.DataFrame = self.as_clone()
 
         # Remove formatting markers from display fields to make the output
@@ -215,10 +313,10 @@ class DataStore(DataStream[pd.DataFrame]):
         return data
 
     def to_pretty(self) -> pd.DataFrame:
-        # Produce a reduced view containing only display fields; operate on a copy
-        # to avoid mutating the store's internal value.
+        # Produce a reduced view containing only display fields. Selecting the
+        # columns is already a copy under Copy-on-Write.
         data = self.as_ref()
-        data = data[[NAME, PHONE]].copy()
+        data = data[[NAME, PHONE]]
         data[NAME] = data[NAME].astype(str).apply(apply_fn(COMMA))  # pyright: ignore [reportUnknownMemberType]
         data[PHONE] = data[PHONE].astype(str).apply(apply_fn(SEMI))  # pyright: ignore [reportUnknownMemberType]
         return data
@@ -227,38 +325,37 @@ class DataStore(DataStream[pd.DataFrame]):
     def to_excel(
         self, path: Path, style: Literal["pretty", "normal"] = "normal"
     ) -> Result[Unit]:
-        """Persist the stored data to an Excel file.
+        """Persist the stored data to an Excel file in the background.
 
         Args:
             path (Path): Destination path for the Excel file.
             style (Literal['pretty', 'normal']): If 'pretty' the stored data is
                 converted via `pretty()` before writing. Defaults to 'normal'.
 
-        Raises:
-            OSError: Propagates filesystem/pandas I/O errors.
+        Returns:
+            Result[Unit]: A result object indicating if the write was queued.
+                Errors raised by the write itself are reported by
+                `flush_exports`.
         """
         # Choose whether to transform the data for presentation prior to writing.
+        # Both branches produce a snapshot that the queued write can own.
         if style == "pretty":
             data: pd.DataFrame = self.pretty()
         else:
-            # as_ref returns the stored object by reference; pandas will read from it.
-            data = self.as_ref()
+            data = self.as_view()
 
-        try:
-            data.to_excel(path, index=False)  # pyright: ignore [reportUnknownMemberType]
-        except Exception as e:
-            msg = str(e)
-            eprint(msg)
-            return Result.err(msg)
+        def job(dst: Path) -> None:
+            data.to_excel(dst, index=False)  # pyright: ignore [reportUnknownMemberType]
 
+        submit_export(path, job)
         return Result.unit()
 
     @property
     def data(self) -> pd.DataFrame:
-        """Return a cloned copy of the underlying DataFrame.
+        """Return a copy of the underlying DataFrame.
 
         Returns:
-            pd.DataFrame: A copy of the stored data.
+            pd.DataFrame: A lazy copy of the stored data.
         """
         # Return a clone to protect internal state from accidental mutation by callers.
         return self.as_clone()
@@ -267,34 +364,18 @@ class DataStore(DataStream[pd.DataFrame]):
     def data(self, data: pd.DataFrame) -> None:
         """Validate and set the underlying DataFrame value.
 
-        The setter performs a column-name and ordering validation against
-        `DATA_COLUMNS`. If validation fails a `DataStream` instance will raise
-        an exception and the setter will not modify the stored value.
+        The setter checks the column names and order against `DATA_COLUMNS`.
+        If validation fails an exception is raised and the stored value is
+        not modified.
 
         Args:
             data (pd.DataFrame): New DataFrame to set as the store's value.
         """
-
-        # Define a lightweight validator used to check whether the incoming
-        # DataFrame matches the required schema for the store.
-        def validator(test_data: pd.DataFrame) -> bool:
-            input_cols: list[str] = test_data.columns.tolist()
-            expected_cols: list[str] = DATA_COLUMNS
-            if len(input_cols) < len(expected_cols):
-                # Not enough columns to satisfy the expected schema.
-                return False
-
-            # Compare only the first N columns (where N == len(expected_cols))
-            # so extra trailing columns are tolerated when present in the source.
-            input_subset: list[str] = input_cols[: len(expected_cols)]
-            for expected, actual in zip(expected_cols, input_subset):
-                if expected != actual:
-                    return False
-            return True
-
-        # Validate by constructing a temporary DataStream; it will raise if invalid.
-        _ = DataStream(data, validator)
-        # Store the full DataFrame (including any additional columns) in the
-        # internal single-element tuple. This mirrors previous behavior where
-        # both the required columns and any extras are preserved.
-        self._value = (data,)
+        # Only the column labels are inspected, so validating copies nothing.
+        if not has_data_columns(data):
+            raise Exception(
+                "data argument to DataStream does not pass the requirements set by its validator."
+            )
+        # Store the full DataFrame (including any additional columns). The
+        # lazy copy keeps later in-place changes by the caller out of the store.
+        self._value = (data.copy(deep=False),)
@@ -4,9 +4,15 @@ from typing import Callable, cast, overload, override
 import pandas as pd
 
 from ..errors import Result, Unit, eprint
+from .export import submit_export
 
 type DS[K: pd.DataFrame | pd.Series] = DataStream[K]
 
+# The data classes hand out copies freely and rely on Copy-on-Write to make
+# them cheap: a copy shares memory with its source until either is modified,
+# and only the modified columns are then duplicated.
+pd.set_option("mode.copy_on_write", True)
+
 
 class DataStream[T: pd.DataFrame | pd.Series]:
     """Lightweight container for a pandas DataFrame or Series with validation.
@@ -16,6 +22,13 @@ class DataStream[T: pd.DataFrame | pd.Series]:
     return either the stored object or a cloned copy, convenience methods for
     exporting to Excel, and simple introspection helpers.
 
+    Ownership: a `DataStream` owns its stored value. `as_ref` hands it out
+    for modification by the owner; `as_view` and `as_clone` hand out
+    independent copies. Under pandas Copy-on-Write, which this module
+    enables, those copies are lazy: they share memory with the stored value
+    until one side is modified, so taking one costs O(columns), not
+    O(cells).
+
     Type parameters:
         T: Either `pandas.DataFrame` or `pandas.Series`.
 
@@ -72,10 +85,12 @@ class DataStream[T: pd.DataFrame | pd.Series]:
         # (in which case we call it to get the stored object) or a raw pandas
         # object. Using this canonical underlying value simplifies validation
         # and storage below.
+        # The lazy copy gives this instance its own object, so later in-place
+        # operations by the caller (rename, drop, ...) do not reach it.
         if isinstance(data, DataStream):
             underlying_data = data.as_clone()
         else:
-            underlying_data = cast(T, data.copy())
+            underlying_data = cast(T, data.copy(deep=False))
 
         # Two valid initialization conditions:
         #  - A validator was provided and it returns True for the underlying data.
@@ -144,18 +159,26 @@ class DataStream[T: pd.DataFrame | pd.Series]:
         return self._value[0]
 
     def as_clone(self) -> T:
-        """Return a shallow copy of the underlying value.
+        """Return a copy of the underlying value.
 
-        This method uses the pandas `copy()` operation to produce a separate
-        object suitable for modification without affecting the stored value.
-        The copy is cast back to the generic type `T` for the caller.
+        The copy is independent: modifying it never affects the stored value
+        and modifying the stored value never shows through it. Under
+        Copy-on-Write the copy shares memory with the stored value until
+        either is modified, so it is taken without copying any data.
         """
-        # Create a shallow copy of the underlying pandas object to protect
-        # the internal state against external mutation.
         ref = self._value[0]
-        ref = ref.copy()
+        ref = ref.copy(deep=False)
         return cast(T, ref)
 
+    def as_view(self) -> T:
+        """Return a frozen view of the underlying value for reading.
+
+        The view is a snapshot: later changes to the stored value do not
+        show through it, and changes made to it stay local to it. It is as
+        cheap as `as_clone` and meant for callers that only read.
+        """
+        return self.as_clone()
+
     @override
     def __str__(self) -> str:
         return f"""
@@ -176,43 +199,38 @@ class DataStream[T: pd.DataFrame | pd.Series]:
         return data.shape[0] == 0
 
     def to_excel(self, path: Path) -> Result[Unit]:
-        """Write the stored DataFrame to an Excel file.
+        """Write the stored DataFrame to an Excel file in the background.
 
-        If the stored value is a `pandas.DataFrame` it will be written to the
-        given path using `DataFrame.to_excel`. If the stored value is a
-        `pandas.Series` this method does nothing.
+        The stored value is copied and the write is queued on the process-wide
+        `ExportQueue`, so this method returns without waiting for openpyxl.
+        Repeated writes to the same path that are still waiting are merged
+        into one. `read` waits for pending writes of the path it reads, and
+        `flush_exports` waits for all of them.
 
         Args:
             path (Path): Filesystem path where the Excel file will be written.
 
         Returns:
-            Result[Unit]: A result object indicating if write was successful.
+            Result[Unit]: A result object indicating if the write was queued.
 
         Note:
-            Any I/O errors raised by pandas or the filesystem is caught by the function
-            and a result object with `err` value is returned.
+            I/O errors raised while writing happen on a worker thread; they
+            are reported by `flush_exports` rather than returned here.
         """
-        # Extract the stored value and only attempt to write when it's a DataFrame.
-        # Writing a Series would either require additional handling or produce
-        # a less-structured Excel output; the existing behavior intentionally
-        # limits output to DataFrames.
-        data = self()
-
         parent = path.parent
         if not parent.exists():
             msg = f"Parent path specified: '{parent} does not exist"
             eprint(msg)
             return Result.err(msg)
 
-        try:
-            # Use pandas' to_excel implementation which will raise I/O related
-            # exceptions on failure; those propagate to callers.
-            data.to_excel(path, index=False)  # pyright: ignore [reportUnknownMemberType]
-        except Exception as e:
-            msg = str(e)
-            eprint(msg)
-            return Result.err(e)
+        # Snapshot now: the caller may keep mutating the stored value while
+        # the write is waiting in the queue.
+        data = self.as_view()
+
+        def job(dst: Path) -> None:
+            data.to_excel(dst, index=False)  # pyright: ignore [reportUnknownMemberType]
 
+        submit_export(path, job)
         return Result.unit()
 
 
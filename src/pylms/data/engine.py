@@ -0,0 +1,49 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from ..config import DataEngine, read_engine
+from ..record import RecordStatus
+from .datapolar import status_count, to_polars
+from .datastore import DataStore
+from .status import date_columns, status_code, status_codes
+
+
+def count_statuses(
+    ds: DataStore,
+    statuses: Sequence[RecordStatus],
+    columns: Sequence[str] | None = None,
+    engine: DataEngine | None = None,
+) -> np.ndarray:
+    """Count, per student, the class dates marked with one of `statuses`.
+
+    With the pandas engine the status codes of the DataStore are compared
+    in NumPy. With the polars engine the date columns are handed to polars,
+    which evaluates the count across cores. Both return the same counts.
+
+    Args:
+        ds (DataStore): Store holding the attendance.
+        statuses (Sequence[RecordStatus]): Statuses to count.
+        columns (Sequence[str] | None): Class date columns to count over;
+            all of them when None.
+        engine (DataEngine | None): Engine to count with; the configured
+            engine when None.
+
+    Returns:
+        np.ndarray: Count per student, in DataStore order.
+    """
+    data = ds.as_ref()
+    columns = date_columns(data) if columns is None else list(columns)
+    engine = read_engine() if engine is None else engine
+
+    if len(columns) == 0:
+        return np.zeros(data.shape[0], dtype=np.int64)
+
+    if engine == "polars":
+        frame = to_polars(data[columns])
+        counts = frame.lazy().select(status_count(columns, statuses)).collect()
+        return counts.to_series().to_numpy().astype(np.int64)
+
+    codes = status_codes(data, columns)
+    wanted = [status_code(status) for status in statuses]
+    return np.isin(codes, wanted).sum(axis=1)
@@ -0,0 +1,140 @@
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import final
+
+from ..errors import Result, Unit, eprint
+from .read_cache import get_read_cache
+
+type ExportJob = Callable[[Path], None]
+
+
+@final
+class ExportQueue:
+    """Background writer for spreadsheets and other derived files.
+
+    Write jobs are handed to a small pool of worker threads so that the
+    interactive thread can return to the menu while openpyxl serializes
+    workbooks. Jobs are keyed by their destination path:
+
+    - At most one job runs per path at a time, and jobs for the same path
+      run in submission order.
+    - A job submitted while an earlier job for the same path is still
+      waiting replaces it, so repeated writes to one file are merged into a
+      single write of the latest content.
+
+    Errors raised by jobs are collected and reported by `flush`.
+
+    Attributes:
+        workers (int): Number of worker threads.
+    """
+
+    def __init__(self, workers: int = 2) -> None:
+        self.workers: int = workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._cond: threading.Condition = threading.Condition()
+        # Latest job waiting to run for each path
+        self._pending: dict[Path, ExportJob] = {}
+        # Paths with a worker scheduled or running for them
+        self._active: set[Path] = set()
+        self._errors: list[tuple[Path, Exception]] = []
+
+    def _key(self, path: Path) -> Path:
+        return path.resolve()
+
+    def submit(self, path: Path, job: ExportJob) -> None:
+        """Schedule `job` to write `path` in the background.
+
+        Args:
+            path (Path): Destination the job writes to.
+            job (ExportJob): Function called with `path` on a worker thread.
+                It must not depend on data that the caller may still mutate.
+        """
+        key = self._key(path)
+        with self._cond:
+            self._pending[key] = job
+            # A worker already owns this path and will pick the new job up
+            if key in self._active:
+                return
+            self._active.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="export"
+                )
+            executor = self._executor
+        _ = executor.submit(self._run, key)
+
+    def _run(self, key: Path) -> None:
+        """Run the jobs queued for `key` until none is left."""
+        while True:
+            with self._cond:
+                job = self._pending.pop(key, None)
+                if job is None:
+                    self._active.discard(key)
+                    self._cond.notify_all()
+                    return
+            try:
+                job(key)
+            except Exception as e:
+                with self._cond:
+                    self._errors.append((key, e))
+
+    def is_pending(self, path: Path) -> bool:
+        with self._cond:
+            return self._key(path) in self._active
+
+    def wait_for(self, path: Path) -> None:
+        """Block until every job for `path` has finished."""
+        key = self._key(path)
+        with self._cond:
+            _ = self._cond.wait_for(lambda: key not in self._active)
+
+    def flush(self) -> Result[Unit]:
+        """Block until every submitted job has finished.
+
+        Returns:
+            Result[Unit]: Ok if every job since the last flush succeeded,
+                otherwise Err describing the failed writes.
+        """
+        with self._cond:
+            _ = self._cond.wait_for(lambda: len(self._active) == 0)
+            errors, self._errors = self._errors, []
+
+        if len(errors) == 0:
+            return Result.unit()
+
+        for path, error in errors:
+            eprint(f"Failed to write file: '{path}'.\nError: {error}")
+        msg = f"{len(errors)} background write(s) failed"
+        return Result.err(msg)
+
+
+# Process-wide queue used by `DataStream.to_excel` and the other writers.
+_QUEUE = ExportQueue()
+
+
+def submit_export(path: Path, job: ExportJob) -> None:
+    """Schedule `job` on the process-wide `ExportQueue`.
+
+    Once the job ran, the parses of `path` held by the read cache are
+    dropped, so the next `read` parses what was written.
+    """
+
+    def write(dst: Path) -> None:
+        try:
+            job(dst)
+        finally:
+            get_read_cache().invalidate(dst)
+
+    _QUEUE.submit(path, write)
+
+
+def wait_export(path: Path) -> None:
+    """Wait for the pending writes of `path` on the process-wide queue."""
+    _QUEUE.wait_for(path)
+
+
+def flush_exports() -> Result[Unit]:
+    """Wait for every write on the process-wide queue and report failures."""
+    return _QUEUE.flush()
@@ -0,0 +1,57 @@
+import tempfile
+import threading
+from pathlib import Path
+from typing import final, override
+from unittest import TestCase, main
+
+from .export import ExportQueue
+
+
+@final
+class ExportQueueTest(TestCase):
+    @override
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.path = Path(self.tmp.name) / "Result.xlsx"  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.queue = ExportQueue()  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    @override
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_merges_waiting_writes(self) -> None:
+        started, release = threading.Event(), threading.Event()
+        written: list[str] = []
+
+        def blocking(dst: Path) -> None:
+            started.set()
+            _ = release.wait()
+            written.append("first")
+
+        def write(value: str):
+            return lambda dst: written.append(value)
+
+        self.queue.submit(self.path, blocking)
+        _ = started.wait()
+        # Queued behind the running write; only the latest of these runs
+        for value in ("second", "third", "fourth"):
+            self.queue.submit(self.path, write(value))
+        self.assertTrue(self.queue.is_pending(self.path))
+        release.set()
+
+        _ = self.queue.flush().unwrap()
+        self.assertEqual(written, ["first", "fourth"])
+        self.assertFalse(self.queue.is_pending(self.path))
+
+    def test_flush_reports_errors(self) -> None:
+        def failing(dst: Path) -> None:
+            raise PermissionError(f"{dst} is open in another program")
+
+        self.queue.submit(self.path, failing)
+        self.assertTrue(self.queue.flush().is_err())
+        # Errors are reported once
+        self.assertTrue(self.queue.flush().is_ok())
+
+
+if __name__ == "__main__":
+    _ = main()
@@ -0,0 +1,162 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, final
+
+import pandas as pd
+
+# Largest total size of the frames kept by the process-wide cache.
+READ_CACHE_BYTES: int = 256 * 2**20
+
+
+class ReadCacheStats(NamedTuple):
+    """Counters of a `ReadCache`.
+
+    Attributes:
+        hits (int): Reads served from the cache.
+        misses (int): Reads that parsed the file.
+        bytes_saved (int): Size of the files whose parse a hit avoided.
+        entries (int): Frames currently cached.
+        size (int): Memory held by the cached frames, in bytes.
+    """
+
+    hits: int
+    misses: int
+    bytes_saved: int
+    entries: int
+    size: int
+
+
+class ReadKey(NamedTuple):
+    """Identity of one parse of a file.
+
+    Attributes:
+        path (Path): Resolved path of the file.
+        mtime_ns (int): Modification time of the file when it was read.
+        size (int): Size of the file when it was read.
+        keep_na (bool): The `keep_na` argument the file was read with.
+    """
+
+    path: Path
+    mtime_ns: int
+    size: int
+    keep_na: bool
+
+
+@final
+class ReadCache:
+    """Least recently used cache of parsed spreadsheets.
+
+    Frames are keyed by `ReadKey`, so a file changed on disk is never served
+    from the cache: its modification time or size no longer matches. Entries
+    are evicted, least recently used first, once the frames together exceed
+    `max_bytes`; a frame larger than the budget is not cached.
+
+    Frames are handed out as lazy copies. Under pandas Copy-on-Write, which
+    the data classes enable, a caller modifying its frame copies the changed
+    columns and never alters the cached one.
+
+    Args:
+        max_bytes (int): Budget for the memory held by cached frames.
+    """
+
+    def __init__(self, max_bytes: int = READ_CACHE_BYTES) -> None:
+        self.max_bytes: int = max_bytes
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[ReadKey, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._bytes_saved: int = 0
+
+    def get(self, key: ReadKey) -> pd.DataFrame | None:
+        """Return the frame cached for `key` and count the lookup.
+
+        Args:
+            key (ReadKey): Identity of the parse.
+
+        Returns:
+            pd.DataFrame | None: A lazy copy of the cached frame, or None on
+                a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            self._bytes_saved += key.size
+            return entry[0].copy(deep=False)
+
+    def put(self, key: ReadKey, data: pd.DataFrame) -> None:
+        """Cache `data` as the parse identified by `key`.
+
+        Older parses of the same file are dropped.
+
+        Args:
+            key (ReadKey): Identity of the parse.
+            data (pd.DataFrame): The parsed frame; the cache keeps a lazy copy.
+        """
+        nbytes = int(data.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            self._drop(key.path)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (data.copy(deep=False), nbytes)
+            self._size += nbytes
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def _drop(self, path: Path) -> None:
+        for key in [key for key in self._entries if key.path == path]:
+            _, nbytes = self._entries.pop(key)
+            self._size -= nbytes
+
+    def invalidate(self, path: Path) -> None:
+        """Drop every cached parse of `path`.
+
+        Args:
+            path (Path): File that was written.
+        """
+        resolved = path.resolve()
+        with self._lock:
+            self._drop(resolved)
+
+    def stats(self) -> ReadCacheStats:
+        """Return the counters of the cache.
+
+        Returns:
+            ReadCacheStats: Hit, miss and size counters.
+        """
+        with self._lock:
+            return ReadCacheStats(
+                self._hits,
+                self._misses,
+                self._bytes_saved,
+                len(self._entries),
+                self._size,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._bytes_saved = 0
+
+
+# Cache shared by `read`.
+_READ_CACHE = ReadCache()
+
+
+def get_read_cache() -> ReadCache:
+    """Return the process-wide read cache.
+
+    Returns:
+        ReadCache: The cache backing `read`.
+    """
+    return _READ_CACHE
@@ -0,0 +1,113 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import final, override
+from unittest import TestCase, main, mock
+
+import pandas as pd
+
+from .data_read import read
+from .datastream import DataStream
+from .export import flush_exports
+from .read_cache import ReadCache, ReadKey
+
+
+@final
+class ReadCacheTest(TestCase):
+    @override
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.dir = Path(self.tmp.name)  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.cache = ReadCache()  # pyright: ignore[reportUninitializedInstanceVariable]
+        patcher = mock.patch("pylms.data.read_cache._READ_CACHE", self.cache)
+        _ = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _write(self, name: str, data: pd.DataFrame) -> Path:
+        path = self.dir / name
+        DataStream(data).to_excel(path).unwrap()
+        flush_exports().unwrap()
+        return path
+
+    def test_unchanged_file_is_parsed_once(self) -> None:
+        path = self._write("Result.xlsx", pd.DataFrame({"Serial": [1, 2], "Score": [50, 70]}))
+
+        with mock.patch("pandas.read_excel", wraps=pd.read_excel) as read_excel:
+            first = read(path).unwrap()
+            second = read(path).unwrap()
+            self.assertEqual(read_excel.call_count, 1)
+
+        pd.testing.assert_frame_equal(first, second)
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+        self.assertEqual(stats.bytes_saved, path.stat().st_size)
+
+    def test_keep_na_is_part_of_the_key(self) -> None:
+        path = self.dir / "Group.csv"
+        pd.DataFrame({"Serial": [1, 2], "Name": ["Ada", None]}).to_csv(path, index=False)
+
+        kept = read(path, keep_na=True).unwrap()
+        filled = read(path).unwrap()
+        self.assertTrue(pd.isna(kept["Name"].iloc[1]))
+        self.assertEqual(filled["Name"].iloc[1], "")
+        self.assertEqual(self.cache.stats().misses, 2)
+
+    def test_returned_frames_are_independent(self) -> None:
+        path = self._write("Attendance.xlsx", pd.DataFrame({"Serial": [1, 2], "Total": [3, 4]}))
+
+        first = read(path).unwrap()
+        first.loc[0, "Total"] = 99
+        first["Extra"] = 0
+
+        second = read(path).unwrap()
+        self.assertEqual(second["Total"].tolist(), [3, 4])
+        self.assertNotIn("Extra", second.columns)
+
+    def test_to_excel_invalidates(self) -> None:
+        path = self._write("Result.xlsx", pd.DataFrame({"Score": [1]}))
+        _ = read(path).unwrap()
+        self.assertEqual(self.cache.stats().entries, 1)
+
+        mtime = path.stat().st_mtime_ns
+        _ = self._write("Result.xlsx", pd.DataFrame({"Score": [2]}))
+        # Same stamp as before: only the invalidation keeps the old frame out
+        os.utime(path, ns=(mtime, mtime))
+        self.assertEqual(self.cache.stats().entries, 0)
+        self.assertEqual(read(path).unwrap()["Score"].tolist(), [2])
+
+    def test_changed_file_is_parsed_again(self) -> None:
+        path = self.dir / "List.csv"
+        pd.DataFrame({"Serial": [1]}).to_csv(path, index=False)
+        _ = read(path).unwrap()
+
+        pd.DataFrame({"Serial": [1, 2]}).to_csv(path, index=False)
+        self.assertEqual(read(path).unwrap()["Serial"].tolist(), [1, 2])
+        self.assertEqual(self.cache.stats().entries, 1)
+
+    def test_lru_byte_budget(self) -> None:
+        data = pd.DataFrame({"Serial": range(100)})
+        nbytes = int(data.memory_usage(index=True, deep=True).sum())
+        cache = ReadCache(max_bytes=2 * nbytes)
+        keys = [ReadKey(self.dir / f"{i}.xlsx", 0, 0, False) for i in range(3)]
+
+        cache.put(keys[0], data)
+        cache.put(keys[1], data)
+        self.assertIsNotNone(cache.get(keys[0]))
+        cache.put(keys[2], data)
+
+        # keys[1] was the least recently used
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertEqual(cache.stats().size, 2 * nbytes)
+
+        cache.put(ReadKey(self.dir / "big.xlsx", 0, 0, False), pd.concat([data] * 3))
+        self.assertEqual(cache.stats().entries, 2)
+
+
+if __name__ == "__main__":
+    _ = main()
@@ -0,0 +1,127 @@
+import re
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..record import RecordStatus
+
+# Fixed category order of the status codes.
+STATUS_CATEGORIES: list[str] = [str(status) for status in RecordStatus]
+
+# Dtype of the class date columns of the DataStore: one int8 code per cell.
+STATUS_DTYPE: pd.CategoricalDtype = pd.CategoricalDtype(STATUS_CATEGORIES)
+
+# Class date columns are named after the date in the format specified by DATE_FMT.
+DATE_COLUMN_RE: re.Pattern[str] = re.compile(r"\d{2}/\d{2}/\d{4}")
+
+_STATUS_ARRAY: np.ndarray = np.array(STATUS_CATEGORIES, dtype=object)
+_LOOSE_CODES: dict[str, int] = {
+    status.strip().lower(): code for code, status in enumerate(STATUS_CATEGORIES)
+}
+
+
+def status_code(status: RecordStatus) -> int:
+    """Return the code of `status` in `STATUS_CATEGORIES`."""
+    return STATUS_CATEGORIES.index(status)
+
+
+def date_columns(data: pd.DataFrame) -> list[str]:
+    """Return the class date columns of `data`, in order.
+
+    Args:
+        data (pd.DataFrame): DataStore data.
+
+    Returns:
+        list[str]: Names of the columns named after a date.
+    """
+    return [
+        col
+        for col in data.columns
+        if isinstance(col, str) and DATE_COLUMN_RE.match(col) is not None
+    ]
+
+
+def encode_status(column: pd.Series) -> np.ndarray:
+    """Encode a class date column as `STATUS_CATEGORIES` codes.
+
+    Columns already stored with `STATUS_DTYPE` are read without conversion.
+    Other values are matched to a status ignoring case and surrounding
+    spaces, the way `retrieve_record` reads them.
+
+    Args:
+        column (pd.Series): Column of statuses.
+
+    Returns:
+        np.ndarray: int8 codes, with -1 for values that are not a status
+            (for example `NaN`).
+    """
+    if column.dtype == STATUS_DTYPE:
+        return column.cat.codes.to_numpy()
+    codes: np.ndarray = pd.Categorical(column, categories=STATUS_CATEGORIES).codes
+    loose = (codes < 0) & column.notna().to_numpy()
+    if loose.any():
+        # Hand-edited workbooks may hold "present" or "ABSENT"
+        matched = column[loose].astype(str).str.strip().str.lower().map(_LOOSE_CODES)
+        codes = codes.copy()
+        codes[loose] = matched.fillna(-1).to_numpy(dtype=np.int8)
+    return codes
+
+
+def unknown_statuses(column: pd.Series, codes: np.ndarray | None = None) -> list[str]:
+    """Return the distinct values of a class date column that are not a status.
+
+    Args:
+        column (pd.Series): Column of statuses.
+        codes (np.ndarray | None): `encode_status(column)`, if already computed.
+
+    Returns:
+        list[str]: The unrecognised values, sorted; missing values are not
+            included.
+    """
+    codes = encode_status(column) if codes is None else codes
+    unknown = (codes < 0) & column.notna().to_numpy()
+    return sorted({str(value) for value in column[unknown]})
+
+
+def decode_status(codes: np.ndarray) -> np.ndarray:
+    """Decode status codes produced by `encode_status` back into strings.
+
+    Code -1 decodes to `NaN`.
+    """
+    decoded = np.full(codes.shape, np.nan, dtype=object)
+    known = codes >= 0
+    decoded[known] = _STATUS_ARRAY[codes[known]]
+    return decoded
+
+
+def to_status_column(codes: np.ndarray, index: pd.Index) -> pd.Series:
+    """Build a class date column from status codes.
+
+    Args:
+        codes (np.ndarray): Status codes, -1 for a missing status.
+        index (pd.Index): Index of the column.
+
+    Returns:
+        pd.Series: Column with `STATUS_DTYPE`.
+    """
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=STATUS_DTYPE), index=index)
+
+
+def status_codes(data: pd.DataFrame, columns: Sequence[str] | None = None) -> np.ndarray:
+    """Return the status codes of class date columns as one matrix.
+
+    Args:
+        data (pd.DataFrame): DataStore data.
+        columns (Sequence[str] | None): Columns to encode; all class date
+            columns when None.
+
+    Returns:
+        np.ndarray: int8 matrix with one row per student and one column per
+            date, -1 where a cell holds no status.
+    """
+    columns = date_columns(data) if columns is None else columns
+    if len(columns) == 0:
+        return np.empty((data.shape[0], 0), dtype=np.int8)
+    return np.column_stack([encode_status(data[col]) for col in columns])
+
@@ -0,0 +1,99 @@
+from typing import final
+from unittest import TestCase, main
+
+import numpy as np
+import pandas as pd
+
+from ..constants import DATA_COLUMNS
+from ..record import RecordStatus
+from .datastore import DataStore
+from .status import (
+    STATUS_DTYPE,
+    decode_status,
+    encode_status,
+    status_code,
+    status_codes,
+    to_status_column,
+    unknown_statuses,
+)
+
+
+def _statuses(rows: int, dates: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    choices = np.array(["Present", "Absent", "Excused", "No Class", "CDS"], dtype=object)
+    return pd.DataFrame(
+        {
+            f"{day % 28 + 1:02d}/{day // 28 + 1:02d}/2026": rng.choice(choices, size=rows)
+            for day in range(dates)
+        }
+    )
+
+
+@final
+class StatusTest(TestCase):
+    def test_round_trip(self) -> None:
+        column = pd.Series(["Present", "Absent", np.nan, "CDS", "No Class", "Excused"])
+        codes = encode_status(column)
+        self.assertEqual(codes[2], -1)
+        decoded = decode_status(codes)
+        self.assertTrue(pd.isna(decoded[2]))
+        self.assertEqual(
+            np.delete(decoded, 2).tolist(), ["Present", "Absent", "CDS", "No Class", "Excused"]
+        )
+
+        encoded = to_status_column(codes, column.index)
+        self.assertEqual(encoded.dtype, STATUS_DTYPE)
+        np.testing.assert_array_equal(encode_status(encoded), codes)
+
+    def test_loose_matching(self) -> None:
+        codes = encode_status(pd.Series([" present", "ABSENT", "no class ", "late"]))
+        self.assertEqual(
+            codes.tolist(),
+            [
+                status_code(RecordStatus.PRESENT),
+                status_code(RecordStatus.ABSENT),
+                status_code(RecordStatus.NO_CLASS),
+                -1,
+            ],
+        )
+
+    def test_datastore_encodes_date_columns(self) -> None:
+        data = pd.DataFrame({col: ["1", "2"] for col in DATA_COLUMNS})
+        data["01/02/2026"] = ["Present", np.nan]
+        ds = DataStore.from_data(data).unwrap()
+
+        column = ds.as_ref()["01/02/2026"]
+        self.assertEqual(column.dtype, STATUS_DTYPE)
+        self.assertEqual(column.iloc[0], "Present")
+        self.assertTrue(pd.isna(column.iloc[1]))
+        self.assertEqual(status_codes(ds.as_ref()).shape, (2, 1))
+
+    def test_unknown_values_are_kept(self) -> None:
+        data = pd.DataFrame({col: ["1", "2"] for col in DATA_COLUMNS})
+        data["01/02/2026"] = ["Present", "Presnt"]
+        data["08/02/2026"] = ["Absent", "Present"]
+
+        self.assertEqual(unknown_statuses(data["01/02/2026"]), ["Presnt"])
+        ds = DataStore.from_data(data).unwrap()
+
+        # the typo stays in the DataStore, so saving does not lose it
+        self.assertEqual(ds.as_ref()["01/02/2026"].tolist(), ["Present", "Presnt"])
+        self.assertEqual(ds.as_ref()["08/02/2026"].dtype, STATUS_DTYPE)
+
+    def test_categorical_memory(self) -> None:
+        # A 10k student cohort with 150 class dates
+        frame = _statuses(10_000, 150)
+        encoded = frame.apply(lambda col: to_status_column(encode_status(col), col.index))
+
+        strings = frame.memory_usage(deep=True).sum()
+        compact = encoded.memory_usage(deep=True).sum()
+        print(
+            "\nstatus columns for 10k x 150"
+            + f"\nobject: {strings / 2**20:.1f} MiB"
+            + f"\ncategorical: {compact / 2**20:.1f} MiB"
+        )
+        self.assertGreaterEqual(strings / compact, 8)
+
+
+if __name__ == "__main__":
+    _ = main()
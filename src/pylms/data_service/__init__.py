@@ -6,7 +6,7 @@ from .load import load
 from .new import new
 from .prefill import prefill_ds
 from .remove import remove_students
-from .save import save
+from .save import export_ds, save
 from .sub import sub
 from .view import view
 
@@ -18,6 +18,7 @@ __all__ = [
     "list_ds",
     "prefill_ds",
     "save",
+    "export_ds",
     "sub",
     "view",
     "append_update",
@@ -0,0 +1,56 @@
+from typing import final
+from unittest import TestCase, main
+
+import numpy as np
+import pandas as pd
+
+from ..constants import DATA_COLUMNS, NAME, SERIAL
+from ..data import STATUS_DTYPE, DataStore
+from .add import add
+from .sub import sub
+
+_DATES: list[str] = ["01/02/2026", "08/02/2026"]
+
+
+def _ds(names: list[str], statuses: list[list[object]]) -> DataStore:
+    data = pd.DataFrame({col: [f"{col} {name}" for name in names] for col in DATA_COLUMNS})
+    data[NAME] = names
+    data[SERIAL] = list(range(1, len(names) + 1))
+    for date, column in zip(_DATES, statuses):
+        data[date] = column
+    return DataStore.from_data(data).unwrap()
+
+
+@final
+class AppendTest(TestCase):
+    def test_add_to_encoded_datastore(self) -> None:
+        superset = _ds(["Ada", "Bola"], [["Present", "Absent"], ["No Class", "No Class"]])
+        self.assertEqual(superset.as_ref()[_DATES[0]].dtype, STATUS_DTYPE)
+
+        subset_data = superset.as_clone().iloc[:0][DATA_COLUMNS]
+        subset_data.loc[0] = [f"{col} Chi" for col in DATA_COLUMNS]
+        subset_data.loc[0, NAME] = "Chi"
+        subset = DataStore.from_data(subset_data).unwrap()
+
+        data = add(superset, subset).unwrap().as_ref()
+        self.assertEqual(data[NAME].tolist(), ["Ada", "Bola", "Chi"])
+        self.assertEqual(data[SERIAL].tolist(), [1, 2, 3])
+        # a held class leaves the new student blank; a class that did not
+        # hold is marked for everyone
+        self.assertEqual(data[_DATES[0]].tolist(), ["Present", "Absent", " "])
+        self.assertEqual(data[_DATES[1]].tolist(), ["No Class"] * 3)
+
+    def test_sub_from_encoded_datastore(self) -> None:
+        ds = _ds(["Ada", "Bola", "Chi"], [["Present", " ", "Present"], ["Absent", np.nan, "Excused"]])
+
+        sub(ds, [1])
+        data = ds.as_ref()
+        self.assertEqual(data[NAME].tolist(), ["Bola", "Chi"])
+        self.assertEqual(data[SERIAL].tolist(), [1, 2])
+        # only "Present" and blanks left: the blanks are filled as present
+        self.assertEqual(data[_DATES[0]].tolist(), ["Present", "Present"])
+        self.assertEqual(data[_DATES[1]].dtype, STATUS_DTYPE)
+
+
+if __name__ == "__main__":
+    _ = main()
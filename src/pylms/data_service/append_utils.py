@@ -1,31 +1,30 @@
-import re
-
+import numpy as np
 import pandas as pd
 
-from ..constants import NAME, SERIAL, SPACE_DELIM, UNIQUE_COLUMNS
-from ..data import DataStore
+from ..constants import NAME, SERIAL, UNIQUE_COLUMNS
+from ..data import DataStore, date_columns, encode_status, status_code, to_status_column
 from ..record import RecordStatus
 
 
 def _clean_date(data: pd.DataFrame):
-    def fill_space(entry: str) -> str:
-        if entry != SPACE_DELIM:
-            return entry
-        return RecordStatus.PRESENT
+    empty: int = status_code(RecordStatus.EMPTY)
+    present: int = status_code(RecordStatus.PRESENT)
 
-    for column in data.columns.tolist():
-        if re.fullmatch(r"^\d{2}/\d{2}/\d{4}$", column) is None:
-            continue
-        unique_values: list[str] = data[column].unique().flatten().tolist()
-        if RecordStatus.EXCUSED in unique_values:
+    # compare status codes: date columns are categorical, see `encode_statuses`
+    for column in date_columns(data):
+        codes: np.ndarray = encode_status(data[column])
+        unique_values: set[int] = set(np.unique(codes).tolist())
+        if status_code(RecordStatus.EXCUSED) in unique_values:
             continue
-        if RecordStatus.ABSENT in unique_values:
+        if status_code(RecordStatus.ABSENT) in unique_values:
             continue
-        if RecordStatus.NO_CLASS in unique_values:
-            data[column] = RecordStatus.NO_CLASS
+        if status_code(RecordStatus.NO_CLASS) in unique_values:
+            codes = np.full_like(codes, status_code(RecordStatus.NO_CLASS))
+            data[column] = to_status_column(codes, data.index)
             continue
-        if RecordStatus.PRESENT in unique_values:
-            data.loc[:, column] = data[column].map(fill_space)
+        if present in unique_values:
+            codes = np.where(codes == empty, present, codes).astype(np.int8)
+            data[column] = to_status_column(codes, data.index)
 
 
 def clean_after_ops(ds: DataStore) -> None:
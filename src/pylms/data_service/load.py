@@ -1,24 +1,59 @@
 from pathlib import Path
 
-from ..data import DataStore
+from ..data import DataStore, wait_export
 from ..errors import Result
 from ..info import print_info
-from ..paths import get_paths_excel
+from ..paths import file_stamp, get_datastore_path, get_paths_excel
 from .prefill import prefill_ds
 
 
+def datastore_source() -> Path | None:
+    """Return the file the DataStore should be loaded from.
+
+    The Arrow file is the canonical copy. The Excel workbook is used instead
+    when no Arrow file exists yet (data saved before the Arrow backend) or
+    when the workbook is newer than the Arrow file, i.e. it was edited by
+    hand after the last save.
+
+    :return: (Path | None) - The file to load, or None if neither exists.
+    :rtype: Path | None
+    """
+    arrow_path: Path = get_datastore_path()
+    excel_path: Path = get_paths_excel()["DataStore"]
+    # Let a queued export land before comparing the two copies
+    wait_export(excel_path)
+
+    if not arrow_path.exists():
+        return excel_path if excel_path.exists() else None
+
+    if (
+        excel_path.exists()
+        and excel_path.stat().st_mtime_ns > arrow_path.stat().st_mtime_ns
+    ):
+        print_info(
+            f"'{excel_path.name}' was edited after the last save. Loading it instead of '{arrow_path.name}'."
+        )
+        return excel_path
+
+    return arrow_path
+
+
 def load() -> Result[DataStore]:
     # get DataStore path
-    path: Path = get_paths_excel()["DataStore"]
+    path = datastore_source()
 
     # load DataStore from path if it exists
     # else return dummy DataStore
-    if path.exists():
+    if path is not None:
         init_ds = DataStore.from_local(path)
         if init_ds.is_err():
             return init_ds.propagate()
 
         init_ds = init_ds.unwrap()
+        # Only the Arrow file is the saved copy; data read from the Excel
+        # workbook is left unsaved so the next `save` writes it.
+        if path == get_datastore_path():
+            init_ds.mark_saved(file_stamp(path))
     else:
         msg = "DataStore not found. Please register a new cohort first before performing any other operations."
         print_info(msg)
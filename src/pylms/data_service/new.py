@@ -3,13 +3,12 @@ from ..data import DataStore
 from ..errors import Result
 from ..history import History
 from ..info import print_info, printpass
-from ..paths import get_paths_excel
 from ..preprocess import clean_reg_data
-from .load import load
+from .load import datastore_source, load
 
 
 def new(history: History) -> Result[DataStore]:
-    if get_paths_excel()["DataStore"].exists():
+    if datastore_source() is not None:
         app_ds = load()
         if app_ds.is_err():
             return app_ds.propagate()
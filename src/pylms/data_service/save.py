@@ -1,27 +1,104 @@
+import os
+import tempfile
 from pathlib import Path
 
 from pylms.cli_utils import emphasis
 
-from ..data import DataStore
+from ..data import ArrowBackend, DataStore, submit_export
 from ..errors import Result, Unit, eprint
 from ..info import printpass
-from ..paths import get_data_path, get_paths_excel
+from ..paths import file_stamp, get_data_path, get_datastore_path, get_paths_excel
 
 
-def save(ds: DataStore) -> Result[Unit]:
+def save(ds: DataStore, export: bool = False) -> Result[Unit]:
+    """Persist the DataStore to its canonical Arrow file.
+
+    The Arrow copy is what `load` reads back. The Excel copy
+    (`DataStore.xlsx`) is only a derived export and is written when `export`
+    is True; otherwise it is refreshed by `export_ds` on exit. Nothing is
+    written when the data has not changed since it was loaded or saved and
+    the Arrow file was not changed by another writer.
+
+    :param ds: (DataStore) - The DataStore to persist.
+    :type ds: DataStore
+    :param export: (bool) - Whether to also write the Excel export.
+    :type export: bool
+
+    :return: (Result[Unit]) - A result object indicating success or failure.
+    :rtype: Result[Unit]
+    """
     if ds.prefilled:
         msg = "Error: DataStore is prefilled and has no actual data"
         eprint(msg)
         return Result.err(msg)
 
     data_path = get_data_path()
-    ds_path: Path = get_paths_excel()["DataStore"]
+    ds_path: Path = get_datastore_path()
 
-    result = ds.to_excel(ds_path)
+    if ds.stamp == file_stamp(ds_path) and not ds.dirty:
+        return export_ds(ds) if export else Result.unit()
+
+    # Class dates added since loading are stored as strings; compact them
+    ds.encode_statuses()
+    result = ArrowBackend().write(ds.as_ref(), ds_path)
     if result.is_err():
         return result.propagate()
+    ds.mark_saved(file_stamp(ds_path))
 
     path_display = str(ds_path).replace(str(data_path), "...DATA")
     path_display = emphasis(path_display)
     printpass(f'DataStore saved at path "{path_display}"')
+
+    if export:
+        return export_ds(ds)
+    return Result.unit()
+
+
+def export_ds(ds: DataStore) -> Result[Unit]:
+    """Queue the Excel export of the DataStore if it is out of date.
+
+    The export is written in the background and given the same mtime as
+    the Arrow file it was derived from. `load` relies on this to tell an
+    export apart from a workbook that was edited by hand after the last
+    save.
+
+    :param ds: (DataStore) - The DataStore to export.
+    :type ds: DataStore
+
+    :return: (Result[Unit]) - A result object indicating success or failure.
+    :rtype: Result[Unit]
+    """
+    if ds.prefilled:
+        return Result.unit()
+
+    arrow_path: Path = get_datastore_path()
+    excel_path: Path = get_paths_excel()["DataStore"]
+
+    # Nothing to do when the export already matches the canonical copy
+    if (
+        arrow_path.exists()
+        and excel_path.exists()
+        and arrow_path.stat().st_mtime_ns == excel_path.stat().st_mtime_ns
+    ):
+        return Result.unit()
+
+    data = ds.as_clone()
+    mtime: int | None = arrow_path.stat().st_mtime_ns if arrow_path.exists() else None
+
+    def job(dst: Path) -> None:
+        # Written next to the target and renamed with its final mtime, so
+        # `load` never sees a half-written workbook that looks hand-edited.
+        fd, tmp_name = tempfile.mkstemp(dir=dst.parent, suffix=".xlsx")
+        os.close(fd)
+        try:
+            data.to_excel(tmp_name, index=False)  # pyright: ignore [reportUnknownMemberType]
+            if mtime is not None:
+                os.utime(tmp_name, ns=(mtime, mtime))
+            os.replace(tmp_name, dst)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    # Written in the background; failures are reported by `flush_exports`
+    submit_export(excel_path, job)
     return Result.unit()
@@ -1,3 +1,32 @@
-from .run import MailError, run_email
+from .delivery import Deliverable, Delivery, deliver, is_transient
+from .limiter import TokenBucket, get_limiter
+from .outbox import (
+    Outbox,
+    OutboxSummary,
+    QueuedMessage,
+    campaign_id,
+    message_digest,
+    send_campaign,
+)
+from .pool import Connector, SmtpPool
+from .run import MailError, connect_smtp, run_email
 
-__all__ = ["run_email", "MailError"]
+__all__ = [
+    "run_email",
+    "connect_smtp",
+    "MailError",
+    "deliver",
+    "Deliverable",
+    "Delivery",
+    "is_transient",
+    "TokenBucket",
+    "get_limiter",
+    "SmtpPool",
+    "Connector",
+    "Outbox",
+    "OutboxSummary",
+    "QueuedMessage",
+    "campaign_id",
+    "message_digest",
+    "send_campaign",
+]
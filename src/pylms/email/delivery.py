@@ -0,0 +1,200 @@
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.message import EmailMessage
+from smtplib import (
+    SMTPException,
+    SMTPRecipientsRefused,
+    SMTPResponseException,
+    SMTPServerDisconnected,
+)
+from typing import NamedTuple, Protocol
+
+from ..constants import SMTP_BACKOFF, SMTP_HOST, SMTP_RETRIES, SMTP_WORKERS
+from .limiter import TokenBucket, get_limiter
+from .pool import Connector, SmtpPool
+from .run import connect_smtp
+
+# Reply code of a server that is closing the connection.
+_CLOSING: int = 421
+
+
+class Deliverable(Protocol):
+    """
+    A message together with its recipient, such as `messages.MessageRecord`.
+    """
+
+    @property
+    def name(self) -> str | None: ...
+
+    @property
+    def email(self) -> str: ...
+
+    @property
+    def message(self) -> EmailMessage: ...
+
+
+class Delivery(NamedTuple):
+    """
+    Outcome of sending one message of a bulk send.
+
+    :ivar index: (int) - Position of the message in the sequence passed to `deliver`.
+    :ivar name: (str | None) - The name of the recipient, or None if not provided.
+    :ivar email: (str) - The email address of the recipient.
+    :ivar error: (str | None) - Why the message was not delivered, or None if it was.
+    :ivar attempts: (int) - Number of times sending was attempted.
+    """
+
+    index: int
+    name: str | None
+    email: str
+    error: str | None
+    attempts: int
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    :param error: (Exception) - The error raised while sending a message.
+    :type error: Exception
+
+    :return: (bool) - True if the message may go through when sent again: a 4xx reply, a dropped connection or a network error.
+    :rtype: bool
+    """
+    if isinstance(error, SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, SMTPServerDisconnected):
+        return True
+    if isinstance(error, SMTPException):
+        return False
+    return isinstance(error, OSError)
+
+
+def _keeps_connection(error: Exception) -> bool:
+    """
+    :return: (bool) - True if the server answered the failed send and the session can carry on.
+    :rtype: bool
+    """
+    if isinstance(error, SMTPResponseException):
+        return error.smtp_code != _CLOSING
+    return isinstance(error, SMTPRecipientsRefused)
+
+
+def _deliver_one(
+    index: int,
+    record: Deliverable,
+    sender: str,
+    pool: SmtpPool,
+    limiter: TokenBucket,
+    retries: int,
+    backoff: float,
+) -> Delivery:
+    """
+    Sends one message, retrying transient failures on a fresh connection with exponential backoff and full jitter.
+    """
+    attempt: int = 0
+    while True:
+        limiter.acquire()
+        try:
+            server = pool.acquire()
+        except Exception as e:
+            error: Exception = e
+        else:
+            try:
+                refused = server.send_message(
+                    record.message, from_addr=sender, to_addrs=record.email
+                )
+            except Exception as e:
+                error = e
+                if _keeps_connection(e):
+                    pool.release(server)
+                else:
+                    pool.discard(server)
+            except BaseException:
+                pool.discard(server)
+                raise
+            else:
+                pool.release(server)
+                return Delivery(
+                    index,
+                    record.name,
+                    record.email,
+                    None if len(refused) == 0 else str(refused),
+                    attempt + 1,
+                )
+
+        if attempt >= retries or not is_transient(error):
+            return Delivery(index, record.name, record.email, str(error), attempt + 1)
+        delay = random.uniform(0, backoff * 2**attempt)
+        attempt += 1
+        time.sleep(delay)
+
+
+def deliver(
+    messages: Iterable[Deliverable],
+    sender: str,
+    *,
+    connect: Connector = connect_smtp,
+    provider: str = SMTP_HOST,
+    limiter: TokenBucket | None = None,
+    workers: int = SMTP_WORKERS,
+    retries: int = SMTP_RETRIES,
+    backoff: float = SMTP_BACKOFF,
+    on_delivery: Callable[[Delivery], None] | None = None,
+) -> list[Delivery]:
+    """
+    Sends many messages concurrently over a pool of SMTP connections.
+
+    Each of the `workers` threads sends over its own connection from an `SmtpPool`, and every send first takes a token from the provider's rate limiter. A message that fails with a transient error (see `is_transient`) is sent again up to `retries` times; when the connection dropped, a new one is opened for the retry. A failure never stops the other messages from being sent.
+
+    :param messages: (Iterable[Deliverable]) - The messages to send. They are consumed lazily, a few at a time.
+    :type messages: Iterable[Deliverable]
+    :param sender: (str) - The envelope sender address.
+    :type sender: str
+    :param connect: (Connector, optional) - Opens an authenticated connection. Defaults to `connect_smtp`.
+    :type connect: Connector
+    :param provider: (str, optional) - The SMTP host whose rate limiter is used. Defaults to SMTP_HOST.
+    :type provider: str
+    :param limiter: (TokenBucket | None, optional) - The rate limiter to use instead of the provider's.
+    :type limiter: TokenBucket | None
+    :param workers: (int, optional) - The number of connections and sending threads. Defaults to SMTP_WORKERS.
+    :type workers: int
+    :param retries: (int, optional) - The maximum number of retries of a message after its first attempt. Defaults to SMTP_RETRIES.
+    :type retries: int
+    :param backoff: (float, optional) - The delay in seconds before the first retry. It doubles after every retry. Defaults to SMTP_BACKOFF.
+    :type backoff: float
+    :param on_delivery: (Callable[[Delivery], None] | None, optional) - Called from the sending thread with the outcome of each message as soon as it is known.
+    :type on_delivery: Callable[[Delivery], None] | None
+
+    :return: (list[Delivery]) - The outcome of each message, in the order of `messages`.
+    :rtype: list[Delivery]
+    """
+    bucket: TokenBucket = limiter if limiter is not None else get_limiter(provider)
+    pool = SmtpPool(connect, max(1, workers))
+
+    def send(index: int, record: Deliverable) -> Delivery:
+        delivery = _deliver_one(index, record, sender, pool, bucket, retries, backoff)
+        if on_delivery is not None:
+            on_delivery(delivery)
+        return delivery
+
+    deliveries: list[Delivery] = []
+    # Messages handed to the threads but not finished yet. Keeping this bounded
+    # means a lazily rendered campaign is never held in memory all at once.
+    in_flight: deque[Future[Delivery]] = deque()
+    try:
+        with ThreadPoolExecutor(max_workers=pool.size, thread_name_prefix="smtp") as executor:
+            for index, record in enumerate(messages):
+                if len(in_flight) >= 2 * pool.size:
+                    deliveries.append(in_flight.popleft().result())
+                in_flight.append(executor.submit(send, index, record))
+            while len(in_flight) > 0:
+                deliveries.append(in_flight.popleft().result())
+    finally:
+        pool.close()
+    return deliveries
@@ -0,0 +1,221 @@
+import asyncio
+import socket
+import threading
+import time
+import unittest
+from collections import Counter
+from email.message import EmailMessage
+from smtplib import SMTP
+from typing import Any, NamedTuple, final, override
+
+from aiosmtpd.controller import Controller
+
+from .delivery import Delivery, deliver
+from .limiter import TokenBucket
+
+SENDER = "lms@example.com"
+
+
+class Outgoing(NamedTuple):
+    name: str | None
+    email: str
+    message: EmailMessage
+
+
+class FlakyHandler:
+    """aiosmtpd handler with injected latency and failures keyed by recipient."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        fail_once: frozenset[str] = frozenset(),
+        drop_once: frozenset[str] = frozenset(),
+        always_fail: frozenset[str] = frozenset(),
+        reject: frozenset[str] = frozenset(),
+    ) -> None:
+        self.latency = latency
+        self.fail_once = fail_once
+        self.drop_once = drop_once
+        self.always_fail = always_fail
+        self.reject = reject
+        self.attempts: Counter[str] = Counter()
+        self.delivered: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def handle_RCPT(
+        self, server: Any, session: Any, envelope: Any, address: str, rcpt_options: Any
+    ) -> str:
+        if address in self.reject:
+            return "550 5.1.1 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+
+        rcpt: str = envelope.rcpt_tos[0]
+        self.attempts[rcpt] += 1
+        first = self.attempts[rcpt] == 1
+        if rcpt in self.always_fail or (rcpt in self.fail_once and first):
+            return "451 4.3.0 Try again later"
+        if rcpt in self.drop_once and first:
+            return "421 4.7.0 Closing connection"
+        self.delivered.append(rcpt)
+        return "250 Message accepted"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _messages(count: int) -> list[Outgoing]:
+    messages: list[Outgoing] = []
+    for i in range(count):
+        message = EmailMessage()
+        message["Subject"] = f"Message {i}"
+        message.set_content(f"Hello student {i}")
+        messages.append(Outgoing(f"Student {i}", f"student{i}@example.com", message))
+    return messages
+
+
+def _unlimited() -> TokenBucket:
+    return TokenBucket(rate=1e6, capacity=1_000)
+
+
+@final
+class DeliverTest(unittest.TestCase):
+    def _serve(self, handler: FlakyHandler) -> Controller:
+        controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+        controller.start()
+        self.addCleanup(controller.stop)
+        return controller
+
+    def _connector(self, controller: Controller) -> Any:
+        opened: list[int] = []
+        lock = threading.Lock()
+
+        def connect() -> SMTP:
+            with lock:
+                opened.append(1)
+            return SMTP(controller.hostname, controller.port)
+
+        return connect, opened
+
+    def test_retries_and_reconnects(self) -> None:
+        messages = _messages(30)
+        emails = [message.email for message in messages]
+        handler = FlakyHandler(
+            fail_once=frozenset(emails[0:5]),
+            drop_once=frozenset(emails[5:10]),
+            reject=frozenset(emails[10:11]),
+        )
+        connect, opened = self._connector(self._serve(handler))
+
+        deliveries = deliver(
+            messages, SENDER, connect=connect, limiter=_unlimited(), workers=4, backoff=0
+        )
+
+        self.assertEqual([d.index for d in deliveries], list(range(30)))
+        failed = [d for d in deliveries if not d.ok]
+        self.assertEqual([d.email for d in failed], emails[10:11])
+        self.assertIn("No such user", str(failed[0].error))
+        self.assertEqual(failed[0].attempts, 1)
+        for d in deliveries[0:10]:
+            self.assertTrue(d.ok)
+            self.assertEqual(d.attempts, 2)
+        self.assertTrue(all(d.attempts == 1 for d in deliveries[11:]))
+
+        # Every accepted message arrived exactly once
+        self.assertEqual(sorted(handler.delivered), sorted(emails[:10] + emails[11:]))
+        # Dropped connections were replaced
+        self.assertGreaterEqual(len(opened), 5)
+
+    def test_gives_up_after_retries(self) -> None:
+        messages = _messages(3)
+        handler = FlakyHandler(always_fail=frozenset([messages[1].email]))
+        connect, _ = self._connector(self._serve(handler))
+
+        deliveries = deliver(
+            messages,
+            SENDER,
+            connect=connect,
+            limiter=_unlimited(),
+            retries=2,
+            backoff=0,
+        )
+
+        bad: Delivery = deliveries[1]
+        self.assertFalse(bad.ok)
+        self.assertEqual(bad.attempts, 3)
+        self.assertIn("Try again later", str(bad.error))
+        self.assertTrue(deliveries[0].ok and deliveries[2].ok)
+
+    def test_connections_run_concurrently(self) -> None:
+        messages = _messages(24)
+        handler = FlakyHandler(latency=0.05)
+        connect, _ = self._connector(self._serve(handler))
+
+        serial = deliver(messages, SENDER, connect=connect, limiter=_unlimited(), workers=1)
+        self.assertEqual(handler.peak, 1)
+
+        pooled = deliver(messages, SENDER, connect=connect, limiter=_unlimited(), workers=6)
+
+        self.assertTrue(all(d.ok for d in serial + pooled))
+        self.assertLessEqual(handler.peak, 6)
+        self.assertGreater(handler.peak, 1)
+
+    def test_rate_limited(self) -> None:
+        messages = _messages(10)
+        connect, _ = self._connector(self._serve(FlakyHandler()))
+
+        start = time.perf_counter()
+        deliveries = deliver(
+            messages, SENDER, connect=connect, limiter=TokenBucket(rate=20, capacity=1), workers=4
+        )
+        elapsed = time.perf_counter() - start
+
+        self.assertTrue(all(d.ok for d in deliveries))
+        # One token up front, then 9 more at 20 per second
+        self.assertGreaterEqual(elapsed, 0.4)
+
+
+@final
+class TokenBucketTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.now = 0.0  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.sleeps: list[float] = []  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def _clock(self) -> float:
+        return self.now
+
+    def _sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def test_burst_then_rate(self) -> None:
+        bucket = TokenBucket(rate=2, capacity=3, clock=self._clock, sleep=self._sleep)
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(self.sleeps, [])
+        self.assertFalse(bucket.try_acquire())
+
+        bucket.acquire()
+        self.assertEqual(self.sleeps, [0.5])
+
+        self.now += 10
+        for _ in range(3):
+            self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Callable, final
+
+from ..constants import SMTP_BURST, SMTP_RATE
+
+
+@final
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how many messages are sent per second.
+
+    The bucket holds at most `capacity` tokens and gains `rate` tokens every second. Every send takes one token, waiting for it when the bucket is empty, so bursts of up to `capacity` messages go out at once and the long-run rate never exceeds `rate`.
+
+    :ivar rate: (float) - Tokens added per second.
+    :ivar capacity: (int) - Maximum number of tokens held.
+    """
+
+    def __init__(
+        self,
+        rate: float = SMTP_RATE,
+        capacity: int = SMTP_BURST,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate: float = rate
+        self.capacity: int = capacity
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], None] = sleep
+        self._lock: threading.Lock = threading.Lock()
+        self._tokens: float = float(capacity)
+        self._stamp: float = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available.
+
+        :return: (bool) - True if a token was taken.
+        :rtype: bool
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def acquire(self) -> None:
+        """
+        Take a token, sleeping until one is available.
+
+        :return: (None) - This method does not return a value.
+        :rtype: None
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return None
+                wait: float = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+_LIMITERS: dict[str, TokenBucket] = {}
+_LIMITERS_LOCK: threading.Lock = threading.Lock()
+
+
+def get_limiter(provider: str) -> TokenBucket:
+    """
+    Return the process-wide rate limiter of an SMTP provider, creating it on first use.
+
+    Every bulk send to the same provider shares one bucket, so concurrent sends together stay under the provider's limit.
+
+    :param provider: (str) - The SMTP host of the provider.
+    :type provider: str
+
+    :return: (TokenBucket) - The provider's rate limiter.
+    :rtype: TokenBucket
+    """
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(provider)
+        if limiter is None:
+            limiter = TokenBucket()
+            _LIMITERS[provider] = limiter
+        return limiter
@@ -0,0 +1,383 @@
+import hashlib
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime
+from email import message_from_bytes
+from email.message import EmailMessage
+from email.policy import default
+from pathlib import Path
+from types import TracebackType
+from typing import NamedTuple, Self, cast, final
+
+from ..info import print_info
+from ..paths import get_outbox_path
+from .delivery import Deliverable, Delivery, deliver
+
+PENDING: str = "pending"
+SENT: str = "sent"
+FAILED: str = "failed"
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS outbox (
+    campaign TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    recipient TEXT NOT NULL,
+    name TEXT,
+    digest TEXT NOT NULL,
+    body BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (campaign, position)
+);
+CREATE TABLE IF NOT EXISTS delivery_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    campaign TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    recipient TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    error TEXT,
+    logged_at TEXT NOT NULL
+);
+"""
+
+# Queue a message, or requeue it when its recipient or content changed since it
+# was queued. A message that is unchanged keeps its status, so sent mail stays sent.
+_ENQUEUE: str = """
+INSERT INTO outbox (campaign, position, recipient, name, digest, body, status, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, 'pending', ?)
+ON CONFLICT (campaign, position) DO UPDATE SET
+    recipient = excluded.recipient,
+    name = excluded.name,
+    digest = excluded.digest,
+    body = excluded.body,
+    status = 'pending',
+    attempts = 0,
+    error = NULL,
+    updated_at = excluded.updated_at
+WHERE outbox.digest != excluded.digest OR outbox.recipient != excluded.recipient
+"""
+
+
+class QueuedMessage(NamedTuple):
+    """
+    A message waiting in the outbox.
+
+    :ivar position: (int) - Position of the message in the records of its campaign.
+    :ivar name: (str | None) - The name of the recipient, or None if not provided.
+    :ivar email: (str) - The email address of the recipient.
+    :ivar message: (EmailMessage) - The rendered message.
+    """
+
+    position: int
+    name: str | None
+    email: str
+    message: EmailMessage
+
+
+class OutboxSummary(NamedTuple):
+    """
+    Number of messages of a campaign in each state.
+    """
+
+    pending: int
+    sent: int
+    failed: int
+
+
+def campaign_id(*parts: str) -> str:
+    """
+    Derive a stable campaign key from the parts that identify a bulk send, such as its kind and subject.
+
+    :param parts: (str) - The identifying parts.
+    :type parts: str
+
+    :return: (str) - A short hex digest of the parts.
+    :rtype: str
+    """
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def message_digest(message: EmailMessage) -> str:
+    """
+    Digest the subject and content of a message.
+
+    The serialized message cannot be hashed directly because multipart boundaries are random.
+
+    :param message: (EmailMessage) - The message to digest.
+    :type message: EmailMessage
+
+    :return: (str) - The hex digest.
+    :rtype: str
+    """
+    hasher = hashlib.sha256(str(message["Subject"]).encode("utf-8"))
+    for part in message.walk():
+        if part.is_multipart():
+            continue
+        content = cast(EmailMessage, part).get_content()
+        hasher.update(part.get_content_type().encode("utf-8"))
+        hasher.update(content if isinstance(content, bytes) else str(content).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+@final
+class Outbox:
+    """
+    SQLite backed queue of rendered messages with a log of every delivery attempt.
+
+    Messages are keyed by campaign and their position in the records of the campaign, so students who share an email address each get their own message. Once a message is sent it is never sent again unless its recipient or content changes, so a bulk send that was interrupted or partly failed can be run again and only the unsent remainder goes out. Outcomes are written as each message is sent and the database is shared safely between the sending threads.
+
+    :ivar path: (Path) - The database file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self._lock: threading.Lock = threading.Lock()
+        self._conn: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        _ = self._conn.execute("PRAGMA journal_mode=WAL")
+        _ = self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(
+        self,
+        campaign: str,
+        records: Iterable[Deliverable],
+        on_queued: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        Queue the messages of a campaign. Messages already queued with the same content keep their status.
+
+        The records are consumed lazily and serialized one at a time, so a campaign is never held in memory all at once.
+
+        :param campaign: (str) - The campaign key, see `campaign_id`.
+        :type campaign: str
+        :param records: (Iterable[Deliverable]) - The rendered messages.
+        :type records: Iterable[Deliverable]
+        :param on_queued: (Callable[[int], None] | None, optional) - Called with the position of each record as it is queued.
+        :type on_queued: Callable[[int], None] | None
+        """
+        now = _now()
+
+        def rows() -> Iterator[tuple[str, int, str, str | None, str, bytes, str]]:
+            for position, record in enumerate(records):
+                if on_queued is not None:
+                    on_queued(position)
+                yield (
+                    campaign,
+                    position,
+                    record.email,
+                    record.name,
+                    message_digest(record.message),
+                    record.message.as_bytes(),
+                    now,
+                )
+
+        with self._lock, self._conn:
+            _ = self._conn.executemany(_ENQUEUE, rows())
+
+    def iter_pending(self, campaign: str, batch: int = 256) -> Iterator[QueuedMessage]:
+        """
+        Yield the messages of a campaign that were not sent yet, in the order of their positions.
+
+        Rows are read `batch` at a time, so memory use does not grow with the size of the campaign.
+
+        :param campaign: (str) - The campaign key.
+        :type campaign: str
+        :param batch: (int, optional) - The number of rows read at a time. Defaults to 256.
+        :type batch: int
+
+        :return: (Iterator[QueuedMessage]) - The unsent messages.
+        :rtype: Iterator[QueuedMessage]
+        """
+        last: int = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT position, name, recipient, body FROM outbox WHERE campaign = ? AND status != ? AND position > ? ORDER BY position LIMIT ?",
+                    (campaign, SENT, last, batch),
+                ).fetchall()
+            if len(rows) == 0:
+                return
+            for position, name, recipient, body in rows:
+                last = position
+                yield QueuedMessage(
+                    position,
+                    name,
+                    recipient,
+                    cast(EmailMessage, message_from_bytes(body, policy=default)),
+                )
+
+    def pending(self, campaign: str) -> list[QueuedMessage]:
+        """
+        :param campaign: (str) - The campaign key.
+        :type campaign: str
+
+        :return: (list[QueuedMessage]) - The messages of the campaign that were not sent yet, in the order of their positions.
+        :rtype: list[QueuedMessage]
+        """
+        return list(self.iter_pending(campaign))
+
+    def record(self, campaign: str, delivery: Delivery) -> None:
+        """
+        Store the outcome of sending a message and append it to the delivery log.
+
+        :param campaign: (str) - The campaign key.
+        :type campaign: str
+        :param delivery: (Delivery) - The outcome, with `index` holding the position of the message in the campaign.
+        :type delivery: Delivery
+        """
+        now = _now()
+        status = SENT if delivery.ok else FAILED
+        with self._lock, self._conn:
+            _ = self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = attempts + ?, error = ?, updated_at = ? WHERE campaign = ? AND position = ?",
+                (status, delivery.attempts, delivery.error, now, campaign, delivery.index),
+            )
+            _ = self._conn.execute(
+                "INSERT INTO delivery_log (campaign, position, recipient, status, attempts, error, logged_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (campaign, delivery.index, delivery.email, status, delivery.attempts, delivery.error, now),
+            )
+
+    def requeue(self, campaign: str) -> None:
+        """
+        Mark every message of a campaign as not sent, so the campaign goes out again in full. The delivery log is kept.
+
+        :param campaign: (str) - The campaign key.
+        :type campaign: str
+        """
+        with self._lock, self._conn:
+            _ = self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = 0, error = NULL, updated_at = ? WHERE campaign = ?",
+                (PENDING, _now(), campaign),
+            )
+
+    def finished(self, campaign: str) -> bool:
+        """
+        :param campaign: (str) - The campaign key.
+        :type campaign: str
+
+        :return: (bool) - True if the campaign was queued and every one of its messages was sent.
+        :rtype: bool
+        """
+        summary = self.summary(campaign)
+        return summary.sent > 0 and summary.pending == 0 and summary.failed == 0
+
+    def summary(self, campaign: str) -> OutboxSummary:
+        """
+        :param campaign: (str) - The campaign key.
+        :type campaign: str
+
+        :return: (OutboxSummary) - The number of messages of the campaign in each state.
+        :rtype: OutboxSummary
+        """
+        with self._lock:
+            counts = dict(
+                self._conn.execute(
+                    "SELECT status, COUNT(*) FROM outbox WHERE campaign = ? GROUP BY status",
+                    (campaign,),
+                ).fetchall()
+            )
+        return OutboxSummary(
+            counts.get(PENDING, 0), counts.get(SENT, 0), counts.get(FAILED, 0)
+        )
+
+    def log(self, campaign: str) -> list[tuple[str, str, int, str | None, str]]:
+        """
+        :param campaign: (str) - The campaign key.
+        :type campaign: str
+
+        :return: (list[tuple[str, str, int, str | None, str]]) - The logged attempts of the campaign as (recipient, status, attempts, error, logged at), oldest first.
+        :rtype: list[tuple[str, str, int, str | None, str]]
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT recipient, status, attempts, error, logged_at FROM delivery_log WHERE campaign = ? ORDER BY id",
+                (campaign,),
+            ).fetchall()
+
+
+def send_campaign(
+    campaign: str,
+    records: Iterable[Deliverable],
+    sender: str,
+    *,
+    outbox: Outbox | None = None,
+    **kwargs: object,
+) -> list[Delivery]:
+    """
+    Sends a campaign through the outbox, skipping recipients that already received their message.
+
+    The messages are queued first, then the unsent ones are delivered with `deliver` and each outcome is stored as soon as it is known. If the run is interrupted, running it again sends only what was not delivered. `records` may be a generator: messages are streamed into the outbox and back out of it, so memory stays flat however large the campaign.
+
+    :param campaign: (str) - The campaign key, see `campaign_id`.
+    :type campaign: str
+    :param records: (Iterable[Deliverable]) - The rendered messages of the campaign.
+    :type records: Iterable[Deliverable]
+    :param sender: (str) - The envelope sender address.
+    :type sender: str
+    :param outbox: (Outbox | None, optional) - The outbox to use. Defaults to the outbox at `get_outbox_path()`.
+    :type outbox: Outbox | None
+    :param kwargs: (object) - Passed on to `deliver`.
+    :type kwargs: object
+
+    :return: (list[Delivery]) - The outcome of each message sent in this run, with `index` pointing into `records`.
+    :rtype: list[Delivery]
+    """
+    if outbox is None:
+        with Outbox(get_outbox_path()) as box:
+            return send_campaign(campaign, records, sender, outbox=box, **kwargs)
+
+    count: int = 0
+
+    def queued(position: int) -> None:
+        nonlocal count
+        count = position + 1
+
+    outbox.enqueue(campaign, records, on_queued=queued)
+
+    # Position in the campaign of each message handed to `deliver`, by its index there
+    positions: list[int] = []
+
+    def unsent() -> Iterator[QueuedMessage]:
+        for queued_message in outbox.iter_pending(campaign):
+            # Messages queued by an earlier run past the end of the campaign stay queued
+            if queued_message.position >= count:
+                return
+            positions.append(queued_message.position)
+            yield queued_message
+
+    def located(delivery: Delivery) -> Delivery:
+        return delivery._replace(index=positions[delivery.index])
+
+    deliveries = deliver(
+        unsent(),
+        sender,
+        on_delivery=lambda delivery: outbox.record(campaign, located(delivery)),
+        **kwargs,  # pyright: ignore[reportArgumentType]
+    )
+
+    skipped = count - len(deliveries)
+    if skipped > 0:
+        print_info(f"Skipped {skipped} recipient(s) who already received this message.")
+    return [located(delivery) for delivery in deliveries]
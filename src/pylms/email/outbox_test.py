@@ -0,0 +1,186 @@
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from email.message import EmailMessage
+from pathlib import Path
+from smtplib import SMTPResponseException
+from typing import Any, NamedTuple, final, override
+
+from .limiter import TokenBucket
+from .outbox import Outbox, campaign_id, message_digest, send_campaign
+
+SENDER = "lms@example.com"
+
+
+class Outgoing(NamedTuple):
+    name: str | None
+    email: str
+    message: EmailMessage
+
+
+class FakeServer:
+    """Stand-in SMTP connection recording what it sends."""
+
+    def __init__(
+        self, sent: Counter[str], lock: threading.Lock, reject: set[str], crash_after: int | None
+    ) -> None:
+        self.sent = sent
+        self.lock = lock
+        self.reject = reject
+        self.crash_after = crash_after
+
+    def send_message(self, msg: EmailMessage, from_addr: str, to_addrs: str) -> dict[str, Any]:
+        with self.lock:
+            if self.crash_after is not None and sum(self.sent.values()) >= self.crash_after:
+                raise SystemExit("killed")
+            if to_addrs in self.reject:
+                raise SMTPResponseException(550, b"Mailbox unavailable")
+            self.sent[to_addrs] += 1
+        return {}
+
+    def close(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+
+def _messages(count: int, body: str = "Your result is ready") -> list[Outgoing]:
+    messages: list[Outgoing] = []
+    for i in range(count):
+        message = EmailMessage()
+        message["Subject"] = "Cohort 31 Result"
+        message.set_content("This is an HTML email.")
+        message.add_alternative(f"<p>Dear Student {i}. {body}</p>", subtype="html")
+        messages.append(Outgoing(f"Student {i}", f"student{i}@example.com", message))
+    return messages
+
+
+@final
+class OutboxTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path: Path = Path(tmp.name) / "outbox.sqlite3"  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.sent: Counter[str] = Counter()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.lock = threading.Lock()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.campaign = campaign_id("result", "Cohort 31 Result")  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def _send(
+        self, messages: list[Outgoing], reject: set[str] = set(), crash_after: int | None = None
+    ) -> list[Any]:
+        def connect() -> Any:
+            return FakeServer(self.sent, self.lock, reject, crash_after)
+
+        with Outbox(self.path) as outbox:
+            return send_campaign(
+                self.campaign,
+                messages,
+                SENDER,
+                outbox=outbox,
+                connect=connect,
+                limiter=TokenBucket(rate=1e6, capacity=1_000),
+                workers=1,
+                backoff=0,
+            )
+
+    def test_resume_after_crash_skips_delivered(self) -> None:
+        messages = _messages(20)
+        with self.assertRaises(SystemExit):
+            _ = self._send(messages, crash_after=7)
+        self.assertEqual(sum(self.sent.values()), 7)
+
+        # A new process opens the same outbox
+        with Outbox(self.path) as outbox:
+            summary = outbox.summary(self.campaign)
+            self.assertEqual(summary.sent, 7)
+            self.assertEqual(summary.pending, 13)
+
+        deliveries = self._send(messages)
+        self.assertEqual(len(deliveries), 13)
+        self.assertEqual([d.index for d in deliveries], list(range(7, 20)))
+        # Everybody received exactly one message
+        self.assertEqual(set(self.sent), {m.email for m in messages})
+        self.assertTrue(all(count == 1 for count in self.sent.values()))
+
+    def test_retry_sends_only_failed_remainder(self) -> None:
+        messages = _messages(10)
+        bad = {messages[2].email, messages[5].email}
+        first = self._send(messages, reject=bad)
+        self.assertEqual(sorted(d.email for d in first if not d.ok), sorted(bad))
+
+        second = self._send(messages)
+        self.assertEqual(sorted(d.email for d in second), sorted(bad))
+        self.assertTrue(all(d.ok for d in second))
+
+        with Outbox(self.path) as outbox:
+            self.assertEqual(outbox.summary(self.campaign).sent, 10)
+            log = outbox.log(self.campaign)
+        self.assertEqual(len(log), 12)
+        self.assertEqual([row[1] for row in log if row[0] == messages[2].email], ["failed", "sent"])
+
+        # Nothing is left to send
+        self.assertEqual(self._send(messages), [])
+
+    def test_changed_content_is_sent_again(self) -> None:
+        _ = self._send(_messages(3))
+        changed = _messages(3)
+        changed[1] = _messages(3, body="Your result was corrected")[1]
+
+        deliveries = self._send(changed)
+        self.assertEqual([d.email for d in deliveries], [changed[1].email])
+        self.assertEqual(self.sent[changed[1].email], 2)
+
+    def test_shared_email_sends_each_record(self) -> None:
+        # Two students registered with the same address each get their own result
+        messages = _messages(4)
+        messages[2] = messages[2]._replace(email=messages[1].email)
+
+        deliveries = self._send(messages)
+        self.assertEqual(sorted(d.index for d in deliveries), [0, 1, 2, 3])
+        self.assertEqual([d.name for d in sorted(deliveries)], [m.name for m in messages])
+        self.assertEqual(self.sent[messages[1].email], 2)
+        with Outbox(self.path) as outbox:
+            self.assertEqual(outbox.summary(self.campaign).sent, 4)
+        self.assertEqual(self._send(messages), [])
+
+    def test_changed_recipient_is_sent_again(self) -> None:
+        _ = self._send(_messages(3))
+        moved = _messages(3)
+        moved[0] = moved[0]._replace(email="new@example.com")
+
+        deliveries = self._send(moved)
+        self.assertEqual([(d.index, d.email) for d in deliveries], [(0, "new@example.com")])
+
+    def test_requeue_sends_finished_campaign_again(self) -> None:
+        messages = _messages(3)
+        _ = self._send(messages)
+        with Outbox(self.path) as outbox:
+            self.assertTrue(outbox.finished(self.campaign))
+            outbox.requeue(self.campaign)
+            self.assertFalse(outbox.finished(self.campaign))
+
+        self.assertEqual(len(self._send(messages)), 3)
+        self.assertTrue(all(count == 2 for count in self.sent.values()))
+        with Outbox(self.path) as outbox:
+            self.assertEqual(len(outbox.log(self.campaign)), 6)
+
+    def test_digest_ignores_boundaries(self) -> None:
+        first, second = _messages(1)[0].message, _messages(1)[0].message
+        self.assertNotEqual(first.as_bytes(), second.as_bytes())
+        self.assertEqual(message_digest(first), message_digest(second))
+
+    def test_queued_message_round_trips(self) -> None:
+        messages = _messages(2)
+        with Outbox(self.path) as outbox:
+            outbox.enqueue(self.campaign, messages)
+            queued = outbox.pending(self.campaign)
+        self.assertEqual([(q.position, q.email) for q in queued], list(enumerate(m.email for m in messages)))
+        self.assertEqual(queued[0].message["Subject"], "Cohort 31 Result")
+        self.assertEqual(message_digest(queued[0].message), message_digest(messages[0].message))
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,82 @@
+import threading
+from smtplib import SMTP
+from typing import Callable, final
+
+type Connector = Callable[[], SMTP]
+
+
+@final
+class SmtpPool:
+    """
+    Pool of authenticated SMTP connections shared by the threads of a bulk send.
+
+    Connections are opened on demand with `connect` and reused after they are released. At most `size` connections are open or in use at once; `acquire` blocks while all of them are taken.
+
+    :ivar size: (int) - Maximum number of connections.
+    :ivar opened: (int) - Number of connections opened so far, including reconnects.
+    """
+
+    def __init__(self, connect: Connector, size: int) -> None:
+        self.size: int = size
+        self.opened: int = 0
+        self._connect: Connector = connect
+        self._slots: threading.Semaphore = threading.Semaphore(size)
+        self._lock: threading.Lock = threading.Lock()
+        self._idle: list[SMTP] = []
+
+    def acquire(self) -> SMTP:
+        """
+        Take an idle connection, or open a new one if none is idle.
+
+        :return: (SMTP) - A connection the caller must hand back with `release` or `discard`.
+        :rtype: SMTP
+
+        :raises Exception: Any error raised by `connect` while opening a connection.
+        """
+        _ = self._slots.acquire()
+        with self._lock:
+            if len(self._idle) > 0:
+                return self._idle.pop()
+        try:
+            server = self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.opened += 1
+        return server
+
+    def release(self, server: SMTP) -> None:
+        """
+        Hand a healthy connection back to the pool for reuse.
+
+        :param server: (SMTP) - A connection taken with `acquire`.
+        :type server: SMTP
+        """
+        with self._lock:
+            self._idle.append(server)
+        self._slots.release()
+
+    def discard(self, server: SMTP) -> None:
+        """
+        Close a broken connection so that the next `acquire` reconnects.
+
+        :param server: (SMTP) - A connection taken with `acquire`.
+        :type server: SMTP
+        """
+        try:
+            server.close()
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """
+        Quit every idle connection.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server in idle:
+            try:
+                _ = server.quit()
+            except Exception:
+                server.close()
@@ -1,6 +1,7 @@
 from smtplib import SMTP, SMTP_SSL, SMTPException
 from typing import Callable
 
+from ..constants import SMTP_HOST
 from ..errors import Result, Unit
 from ..paths import must_get_env
 
@@ -8,15 +9,16 @@ from ..paths import must_get_env
 type MailError = dict[str, tuple[int, bytes]]
 
 
-def run_email(mail_fn: Callable[[SMTP], Result[Unit]]) -> Result[Unit]:
+def connect_smtp() -> SMTP:
     """
-    Establish an SMTP connection, authenticate, execute a mail function, and close the connection.
+    Open an authenticated SMTP connection to the provider at `SMTP_HOST`.
 
-    :param mail_fn: (Callable[[SMTP], Result[Unit]]) - A function that takes an SMTP object and performs email operations.
-    :type mail_fn: Callable[[SMTP], Result[Unit]]
+    STARTTLS on port 587 is tried first, falling back to SSL on port 465.
 
-    :return: (Result[Unit]) - returns a Result object indicating success or failure.
-    :rtype: Result[Unit]
+    :return: (SMTP) - An authenticated SMTP connection.
+    :rtype: SMTP
+
+    :raises SMTPException: If the connection or login fails on both ports.
     """
     # Retrieve the sender's email address from environment variables
     email: str = must_get_env("EMAIL")
@@ -24,10 +26,9 @@ def run_email(mail_fn: Callable[[SMTP], Result[Unit]]) -> Result[Unit]:
     # Retrieve the sender's email password from environment variables
     password: str = must_get_env("PASSWORD")
 
-    server: SMTP | None = None
     try:
-        # Create an SMTP connection to Gmail's SMTP server on port 587 using STARTTLS
-        server = SMTP("smtp.gmail.com", 587)
+        # Create an SMTP connection to the provider's SMTP server on port 587 using STARTTLS
+        server: SMTP = SMTP(SMTP_HOST, 587)
 
         # Disable debug logging
         server.set_debuglevel(False)
@@ -37,23 +38,36 @@ def run_email(mail_fn: Callable[[SMTP], Result[Unit]]) -> Result[Unit]:
 
         # Log in to the SMTP server using the provided credentials
         _ = server.login(email, password)
-
-        # Execute the provided mail function, passing the authenticated SMTP server object
-        _ = mail_fn(server)
-        return Result[Unit].unit()
+        return server
     except (TimeoutError, SMTPException):
-        # Create an SMTP connection to Gmail's SMTP server on port 465 using SSL
-        server = SMTP_SSL("smtp.gmail.com", 465)
+        # Create an SMTP connection to the provider's SMTP server on port 465 using SSL
+        server = SMTP_SSL(SMTP_HOST, 465)
 
         # Disable debug logging
         server.set_debuglevel(False)
 
         # Log in to the SMTP server using the provided credentials
         _ = server.login(email, password)
+        return server
+
+
+def run_email(mail_fn: Callable[[SMTP], Result[Unit]]) -> Result[Unit]:
+    """
+    Establish an SMTP connection, authenticate, execute a mail function, and close the connection.
+
+    :param mail_fn: (Callable[[SMTP], Result[Unit]]) - A function that takes an SMTP object and performs email operations.
+    :type mail_fn: Callable[[SMTP], Result[Unit]]
+
+    :return: (Result[Unit]) - returns the result of `mail_fn`, or an error if the connection failed.
+    :rtype: Result[Unit]
+    """
+    server: SMTP | None = None
+    try:
+        # Open an authenticated connection to the SMTP server
+        server = connect_smtp()
 
         # Execute the provided mail function, passing the authenticated SMTP server object
-        _ = mail_fn(server)
-        return Result[Unit].unit()
+        return mail_fn(server)
     except Exception as e:
         # Raise a custom error if any SMTP-related exception occurs
         return Result[Unit].err(e)
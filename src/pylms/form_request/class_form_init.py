@@ -1,34 +1,49 @@
 from datetime import datetime
 
 from ..cli import input_email
-from ..constants import TIMESTAMP_FMT
+from ..constants import COMMA_DELIM, TIMESTAMP_FMT
 from ..data import DataStore
-from ..errors import Result, Unit
+from ..errors import Result, Unit, eprint
 from ..history import History, add_class_form, add_held_class
 from ..models import ClassFormInfo
-from .excused_class_form import init_excused_form
-from .present_class_form import init_present_form
+from ..service import FormJob, ServiceFactory, build_services, run_provision_forms
+from .excused_class_form import excused_form_job
+from .present_class_form import present_form_job
 
 
-def init_class_form(
-    ds: DataStore, history: History, form_dates: list[str]
+def provision_class_forms(
+    ds: DataStore,
+    history: History,
+    form_dates: list[str],
+    email: str,
+    services: ServiceFactory = build_services,
 ) -> Result[Unit]:
-    email = input_email(
-        "Enter an email address to share the form with: ",
-    )
-    if email.is_err():
-        return email.propagate()
-    email = email.unwrap()
-
+    # Provision the present and excused forms of every date concurrently
+    jobs: list[FormJob] = []
     for date in form_dates:
-        present_form = init_present_form(ds, date, email)
-        if present_form.is_err():
-            return present_form.propagate()
-        present_form = present_form.unwrap()
+        jobs.append(present_form_job(ds, date))
+        jobs.append(excused_form_job(ds, date))
 
-        excused_form = init_excused_form(ds, date, email)
-        if excused_form.is_err():
-            return excused_form.propagate()
+    results = run_provision_forms(jobs, email, services=services)
+
+    # Commit every date whose two forms were provisioned, in order. A failed
+    # date does not stop the later ones: their forms exist already.
+    failed_dates: list[str] = []
+    for idx, date in enumerate(form_dates):
+        present_form = results[2 * idx]
+        excused_form = results[2 * idx + 1]
+        if present_form.is_err() or excused_form.is_err():
+            failed_dates.append(date)
+            # The form that was provisioned is not recorded anywhere else
+            for form in (present_form, excused_form):
+                if form.is_ok():
+                    orphan = form.unwrap()
+                    eprint(
+                        f"The class form of {date} '{orphan.name}' was created but its other form failed, so it was not recorded. Delete it from Google Drive before requesting the forms of {date} again.\nUrl: {orphan.url}"
+                    )
+            continue
+
+        present_form = present_form.unwrap()
         excused_form = excused_form.unwrap()
 
         form_info: ClassFormInfo = ClassFormInfo(
@@ -49,4 +64,22 @@ def init_class_form(
 
         add_class_form(history, form_info)
 
+    if len(failed_dates) > 0:
+        msg = f"The class forms of {COMMA_DELIM.join(failed_dates)} could not be provisioned."
+        eprint(msg)
+        return Result.err(msg)
+
     return Result.unit()
+
+
+def init_class_form(
+    ds: DataStore, history: History, form_dates: list[str]
+) -> Result[Unit]:
+    email = input_email(
+        "Enter an email address to share the form with: ",
+    )
+    if email.is_err():
+        return email.propagate()
+    email = email.unwrap()
+
+    return provision_class_forms(ds, history, form_dates, email)
@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime
+from typing import Any, final, override
+from unittest.mock import patch
+
+import pandas as pd
+
+from ..constants import COHORT, DATA_COLUMNS, SERIAL
+from ..data import DataStore
+from ..errors import Result
+from ..history import History, sync_classes
+from ..models import Form
+from ..service import FormJob
+from .class_form_init import provision_class_forms
+from .present_class_form import present_form_job
+
+
+def _form(job: FormJob) -> Form:
+    return Form(title=job.title, name=job.name, url=f"url/{job.name}", uuid=job.name)
+
+
+@final
+class ProvisionClassFormsTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        data: dict[str, list[object]] = {col: [f"{col} {i}" for i in range(3)] for col in DATA_COLUMNS}
+        data[SERIAL] = [1, 2, 3]
+        data[COHORT] = [4, 4, 4]
+        self.ds = DataStore.from_data(pd.DataFrame(data)).unwrap()  # pyright: ignore[reportUninitializedInstanceVariable]
+
+        self.history = History()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.history.cohort = 4
+        self.history.class_days = [1, 3, 5]
+        self.history.orientation_date = datetime(2025, 6, 9)
+        _ = sync_classes(self.history).unwrap()
+        self.dates = list(self.history.calendar.labels[:3])  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def test_records_every_complete_date(self) -> None:
+        # The excused form of the first date fails; its present form and the
+        # forms of the later dates were provisioned
+        def provision(jobs: list[FormJob], *_: Any, **__: Any) -> list[Result[Form]]:
+            return [
+                Result.err("setup failed") if idx == 1 else Result.ok(_form(job))
+                for idx, job in enumerate(jobs)
+            ]
+
+        with patch("pylms.form_request.class_form_init.run_provision_forms", provision):
+            with patch("pylms.form_request.class_form_init.eprint") as eprint:
+                result = provision_class_forms(self.ds, self.history, self.dates, "a@b.com")
+
+        self.assertTrue(result.is_err())
+        self.assertEqual([info.date for info in self.history.class_forms], self.dates[1:])
+        self.assertEqual(len(self.history.held_classes), 2)
+        # the orphaned present form of the first date is reported with its url
+        reported = " ".join(str(call.args[0]) for call in eprint.call_args_list)
+        self.assertIn(f"url/{present_form_job(self.ds, self.dates[0]).name}", reported)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -1,38 +1,24 @@
 from ..constants import COHORT, NAME
 from ..data import DataStore
-from ..errors import Result, eprint
 from ..form_utils import return_name
 from ..models import (
     ChoiceQuestion,
     Content,
     ContentBody,
     CreateItem,
-    Form,
     Item,
     Location,
     OptionDict,
     Question,
     QuestionItem,
 )
-from ..service import (
-    run_create_form,
-    run_publish_form,
-    run_setup_form,
-    run_share_form,
-)
+from ..service import FormJob
 
 
-def init_present_form(ds: DataStore, input_date: str, email: str) -> Result[Form]:
+def present_form_job(ds: DataStore, input_date: str) -> FormJob:
     names: list[str] = ds.to_pretty()[NAME].tolist()
     cohort_no: int = ds.as_ref()[COHORT].iloc[0]
     head = return_name(cohort_no, "Attendance", input_date)
-    form_title, form_name = head.title, head.name
-    present_form: Form | None = run_create_form(form_title, form_name)
-    if present_form is None:
-        msg = f"Form creation failed when creating attendance for students for date {input_date}. \nPlease restart the program and try again."
-        eprint(msg)
-        return Result.err(msg)
-
     form_content: ContentBody = ContentBody(
         requests=[
             Content(
@@ -73,26 +59,4 @@ def init_present_form(ds: DataStore, input_date: str, email: str) -> Result[Form
             ),
         ]
     )
-    present_form = run_setup_form(
-        present_form,
-        form_content,
-    )
-    if present_form is None:
-        msg = f"Form setup failed when creating attendance for students for date {input_date}. \nPlease restart the program and try again."
-        eprint(msg)
-        return Result.err(msg)
-
-    present_form = run_publish_form(present_form)
-
-    if present_form is None:
-        msg = "Failed to publish form. Please try again."
-        eprint(msg)
-        return Result.err(msg)
-
-    present_form = run_share_form(present_form, email)
-    if present_form is None:
-        msg = "Form sharing failed when trying to share form \nPlease restart the program and try again."
-        eprint(msg)
-        return Result.err(msg)
-
-    return Result.ok(present_form)
+    return FormJob(title=head.title, name=head.name, content=form_content)
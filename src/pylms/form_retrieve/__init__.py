@@ -1,5 +1,6 @@
+from .bulk import FormRequest, retrieve_forms
 from .cds_form import retrieve_cds_form
-from .class_form import retrieve_class_form
+from .class_form import retrieve_class_form, retrieve_class_forms
 from .enums import ClassType, RetrieveType
 from .update_form import retrieve_update_form
 
@@ -7,6 +8,9 @@ __all__ = [
     "retrieve_update_form",
     "retrieve_cds_form",
     "retrieve_class_form",
+    "retrieve_class_forms",
+    "retrieve_forms",
+    "FormRequest",
     "ClassType",
     "RetrieveType",
 ]
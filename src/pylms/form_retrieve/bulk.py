@@ -0,0 +1,51 @@
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from ..constants import FORM_WORKERS
+from ..data import DataStream
+from ..errors import Result, eprint
+from ..models import AllFormInfo
+from .enums import ClassType
+from .form import retrieve_form
+from .form_id import form_id
+
+type FormRequest = tuple[AllFormInfo, ClassType | None]
+
+
+def retrieve_forms(
+    requests: Sequence[FormRequest], max_workers: int = FORM_WORKERS
+) -> dict[str, Result[DataStream[pd.DataFrame]]]:
+    """
+    Retrieves many forms and their responses concurrently. Each worker thread fetches the questions and then the responses of one form at a time with its own API client, so up to `max_workers` forms are in flight at once. A form requested twice is only retrieved once.
+
+    :param requests: (Sequence[FormRequest]) - The forms to retrieve, each given as its details and the class type selecting the form.
+    :type requests: Sequence[FormRequest]
+    :param max_workers: (int, optional) - The maximum number of forms retrieved at once. Defaults to FORM_WORKERS.
+    :type max_workers: int
+
+    :return: (dict[str, Result[DataStream[pd.DataFrame]]]) - The responses of every form keyed by form id. Requests whose class type does not fit their form details are left out.
+    :rtype: dict[str, Result[DataStream[pd.DataFrame]]]
+    """
+    unique: dict[str, FormRequest] = {}
+    for info, class_type in requests:
+        uuid = form_id(info, class_type)
+        if uuid.is_err():
+            continue
+        _ = unique.setdefault(uuid.unwrap(), (info, class_type))
+
+    def _retrieve(request: FormRequest) -> Result[DataStream[pd.DataFrame]]:
+        info, class_type = request
+        try:
+            return retrieve_form(info, class_type=class_type)
+        except Exception as e:
+            msg = f"Retrieval of form '{form_id(info, class_type).unwrap()}' failed.\nError: {e}"
+            eprint(msg)
+            return Result.err(msg)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="retrieve"
+    ) as executor:
+        results = executor.map(_retrieve, unique.values())
+        return dict(zip(unique.keys(), results))
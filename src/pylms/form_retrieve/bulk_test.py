@@ -0,0 +1,155 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Self, final, override
+from unittest.mock import patch
+
+from ..constants import NAME
+from ..models import CDSFormInfo, ClassFormInfo, FormData
+from ..service import FormResource, FormsService, ResponseResource
+from .bulk import retrieve_forms
+from .enums import ClassType
+
+
+@final
+class FakeRequest:
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def execute(self) -> Any:
+        return self.value
+
+
+@final
+class FakeForms(FormResource, ResponseResource, FormsService):
+    """Forms API serving one name question and one response per form."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.gets: list[str] = []
+
+    @override
+    def forms(self) -> Self:
+        return self
+
+    @override
+    def responses(self) -> Self:
+        return self
+
+    @override
+    def create(self, *, body: FormData) -> Any:
+        raise NotImplementedError
+
+    @override
+    def get(self, *, formId: str, responseId: str = "") -> Any:
+        with self.lock:
+            self.gets.append(formId)
+        question = {"questionId": "q1", "required": True}
+        return FakeRequest(
+            {
+                "formId": formId,
+                "info": {"title": formId, "documentTitle": formId},
+                "settings": {},
+                "revisionId": "1",
+                "responderUri": f"url/{formId}",
+                "items": [
+                    {"itemId": "i1", "title": NAME, "questionItem": {"question": question}}
+                ],
+            }
+        )
+
+    @override
+    def list(
+        self,
+        *,
+        formId: str,
+        filter: str | None = None,
+        pageSize: int = 5000,
+        pageToken: str | None = None,
+    ) -> Any:
+        answer = {"questionId": "q1", "textAnswers": {"answers": [{"value": formId}]}}
+        response = {
+            "responseId": "r1",
+            "createTime": "2026-01-05T10:00:00Z",
+            "lastSubmittedTime": "2026-01-05T10:00:00Z",
+            "answers": {"q1": answer},
+        }
+        return FakeRequest({"responses": [response]})
+
+    @override
+    def batchUpdate(self, *, formId: str, body: dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+    @override
+    def setPublishSettings(self, *, formId: str, body: dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+
+@final
+class FakeSession:
+    def __init__(self, forms: FakeForms) -> None:
+        self.forms = forms
+
+    def client(self, api: str, version: str) -> FakeForms:
+        return self.forms
+
+
+def _class_info(date: str) -> ClassFormInfo:
+    return ClassFormInfo(
+        date=date,
+        present_name="",
+        present_title="",
+        present_url="",
+        present_id=f"present {date}",
+        excused_name="",
+        excused_title="",
+        excused_url="",
+        excused_id=f"excused {date}",
+        timestamp="",
+    )
+
+
+@final
+class RetrieveFormsTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()  # pyright: ignore[reportUninitializedInstanceVariable]
+        tmp_path = Path(self.tmp.name)
+        # keep the response caches of the fake forms out of the data directory
+        self.patch = patch(  # pyright: ignore[reportUninitializedInstanceVariable]
+            "pylms.form_retrieve.form_responses.get_responses_path",
+            lambda uuid: tmp_path / f"{uuid}.json",  # pyright: ignore[reportUnknownLambdaType]
+        )
+        _ = self.patch.start()
+
+    @override
+    def tearDown(self) -> None:
+        _ = self.patch.stop()
+        self.tmp.cleanup()
+
+    def test_retrieve_forms(self) -> None:
+        forms = FakeForms()
+        infos = [_class_info(f"0{day}/01/2026") for day in range(5, 9)]
+        requests = [(info, class_type) for info in infos for class_type in ClassType]
+        # duplicates and requests that do not fit their form are dropped
+        requests += [(infos[0], ClassType.PRESENT), (infos[0], None)]
+
+        with patch("pylms.service.service_init.get_session", return_value=FakeSession(forms)):
+            retrieved = retrieve_forms(requests, max_workers=3)
+
+        self.assertEqual(len(retrieved), 8)
+        self.assertEqual(sorted(forms.gets), sorted(retrieved.keys()))
+        for uuid, stream in retrieved.items():
+            self.assertEqual(stream.unwrap()()[NAME].tolist(), [uuid])
+
+    def test_single_form(self) -> None:
+        forms = FakeForms()
+        info = CDSFormInfo(name="", title="", url="", uuid="cds", timestamp="")
+        with patch("pylms.service.service_init.get_session", return_value=FakeSession(forms)):
+            retrieved = retrieve_forms([(info, None)])
+        self.assertEqual(list(retrieved.keys()), ["cds"])
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -4,8 +4,11 @@ from pylms.history import History, match_info_by_date
 
 from ..data import DataStream
 from ..errors import Result
+from ..models import ClassFormInfo
+from .bulk import FormRequest, retrieve_forms
 from .enums import ClassType
 from .form import retrieve_form
+from .form_id import form_id
 
 
 def retrieve_class_form(
@@ -17,3 +20,40 @@ def retrieve_class_form(
     info = info.unwrap()
 
     return retrieve_form(info, class_type=class_type)
+
+
+def retrieve_class_forms(
+    history: History, class_dates: list[str]
+) -> dict[tuple[str, ClassType], Result[DataStream[pd.DataFrame]]]:
+    """
+    Retrieves the present and excused forms of many class dates in one concurrent sweep.
+
+    :param history: (History) - The history holding the class forms.
+    :type history: History
+    :param class_dates: (list[str]) - The class dates whose forms are retrieved.
+    :type class_dates: list[str]
+
+    :return: (dict[tuple[str, ClassType], Result[DataStream[pd.DataFrame]]]) - The responses keyed by class date and class type.
+    :rtype: dict[tuple[str, ClassType], Result[DataStream[pd.DataFrame]]]
+    """
+    infos: dict[str, Result[ClassFormInfo]] = {
+        date: match_info_by_date(history, date) for date in class_dates
+    }
+
+    requests: list[FormRequest] = [
+        (info.unwrap(), class_type)
+        for info in infos.values()
+        if not info.is_err()
+        for class_type in ClassType
+    ]
+    by_id = retrieve_forms(requests)
+
+    retrieved: dict[tuple[str, ClassType], Result[DataStream[pd.DataFrame]]] = {}
+    for date, info in infos.items():
+        for class_type in ClassType:
+            if info.is_err():
+                retrieved[(date, class_type)] = info.propagate()
+                continue
+            uuid = form_id(info.unwrap(), class_type).unwrap()
+            retrieved[(date, class_type)] = by_id[uuid]
+    return retrieved
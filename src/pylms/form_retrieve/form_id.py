@@ -0,0 +1,28 @@
+from ..errors import Result, eprint
+from ..models import AllFormInfo, ClassFormInfo
+from .enums import ClassType
+
+
+def form_id(info: AllFormInfo, class_type: ClassType | None = None) -> Result[str]:
+    """
+    Returns the id of the Google Form described by `info`. Class forms hold two forms, so `class_type` selects between the present and the excused form.
+
+    :param info: (AllFormInfo) - The details of the form.
+    :type info: AllFormInfo
+    :param class_type: (ClassType | None) - The class type indicating the form type.
+    :type class_type: ClassType | None
+
+    :return: (Result[str]) - Ok with the form id, or Err if `class_type` does not fit `info`.
+    :rtype: Result[str]
+    """
+    match info:
+        case _ if isinstance(info, ClassFormInfo) and class_type == ClassType.PRESENT:
+            return Result.ok(info.present_id)
+        case _ if isinstance(info, ClassFormInfo) and class_type == ClassType.EXCUSED:
+            return Result.ok(info.excused_id)
+        case _ if not isinstance(info, ClassFormInfo):
+            return Result.ok(info.uuid)
+        case _:
+            msg = f"specified form_info type {type(info).__name__} and class type {class_type} are invalid"
+            eprint(msg)
+            return Result.err(msg)
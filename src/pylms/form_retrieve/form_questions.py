@@ -1,9 +1,10 @@
 from typing import Any
 
-from ..errors import Result, eprint
-from ..models import AllFormInfo, ClassFormInfo, FormModel
-from ..service import FormResource, FormsService, run_service
+from ..errors import Result
+from ..models import AllFormInfo, FormModel
+from ..service import FormResource, FormsService, execute, run_service
 from .enums import ClassType
+from .form_id import form_id
 
 
 def _retrieve_form_questions(
@@ -32,19 +33,10 @@ def _retrieve_form_questions(
     resource: FormResource = service.forms()
 
     # get the form response based on the form info
-    match info:
-        case _ if isinstance(info, ClassFormInfo) and class_type == ClassType.PRESENT:
-            form_response: dict[Any, Any] = resource.get(  # pyright: ignore[reportUnknownMemberType]
-                formId=info.present_id
-            ).execute()
-        case _ if isinstance(info, ClassFormInfo) and class_type == ClassType.EXCUSED:
-            form_response = resource.get(formId=info.excused_id).execute()  # pyright: ignore[reportUnknownMemberType]
-        case _ if not isinstance(info, ClassFormInfo):
-            form_response = resource.get(formId=info.uuid).execute()  # pyright: ignore[reportUnknownMemberType]
-        case _:
-            msg = f"specified form_info type {type(info).__name__} and class type {class_type} are invalid"
-            eprint(msg)
-            return Result.err(msg)
+    uuid = form_id(info, class_type)
+    if uuid.is_err():
+        return uuid.propagate()
+    form_response: dict[Any, Any] = execute(resource.get(formId=uuid.unwrap()))
 
     # create an instance of the form model from the form response
     form_model: FormModel = FormModel(**form_response)
@@ -6,12 +6,14 @@ from ..data import DataStream
 from ..errors import Result, eprint
 from ..models import (
     AllFormInfo,
-    ClassFormInfo,
     Response,
     ResponseModel,
 )
+from ..paths import get_responses_path
 from ..service import FormsService, ResponseResource, run_service
 from .enums import ClassType
+from .form_id import form_id
+from .sync import sync_responses
 
 
 def _retrieve_form_responses(
@@ -44,25 +46,16 @@ def _retrieve_form_responses(
     response_resource: ResponseResource = service.forms().responses()
 
     # determine which form to retrieve responses from based on the class type
-    match form_info:
-        case _ if (
-            isinstance(form_info, ClassFormInfo) and class_type == ClassType.PRESENT
-        ):
-            request = response_resource.list(formId=form_info.present_id)
-        case _ if (
-            isinstance(form_info, ClassFormInfo) and class_type == ClassType.EXCUSED
-        ):
-            request = response_resource.list(formId=form_info.excused_id)
-        case _ if not isinstance(form_info, ClassFormInfo):
-            request = response_resource.list(formId=form_info.uuid)
-        case _:
-            msg = f"specified form_info type {type(form_info).__name__} and class type {class_type} are invalid"
-            eprint(msg)
-            return Result.err(msg)
-
-    # execute the request and load its response
-    response_dict: dict[str, list[Response]] = request.execute()  # pyright: ignore [reportUnknownMemberType]
-    response_model: ResponseModel = ResponseModel(**response_dict)
+    uuid = form_id(form_info, class_type)
+    if uuid.is_err():
+        return uuid.propagate()
+    uuid = uuid.unwrap()
+
+    # fetch the responses submitted since the last sync and load every cached response
+    responses: list[Response] = sync_responses(
+        response_resource, uuid, get_responses_path(uuid)
+    )
+    response_model: ResponseModel = ResponseModel(responses=responses)
 
     # create a dictionary with the column names and an empty list for each
     response_data_dict: dict[str, list[str]] = {
@@ -0,0 +1,108 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from dateutil.parser import isoparse
+
+from ..models import Response
+from ..service import ResponseResource, execute
+
+# Largest page the Forms API serves for responses.list
+PAGE_SIZE: int = 5000
+
+
+def _read_cache(path: Path) -> tuple[str | None, dict[str, dict[str, Any]]]:
+    """
+    Reads the response cache of a form.
+
+    :param path: (Path) - The cache file.
+    :type path: Path
+
+    :return: (tuple[str | None, dict[str, dict[str, Any]]]) - The high-water mark and the cached responses keyed by response id. A missing or unreadable cache yields no mark and no responses, so that everything is fetched again.
+    :rtype: tuple[str | None, dict[str, dict[str, Any]]]
+    """
+    if not path.exists():
+        return None, {}
+    try:
+        with path.open("r", encoding="utf-8") as file:
+            content: dict[str, Any] = json.load(file)
+        return content.get("high_water"), content.get("responses", {})
+    except (OSError, ValueError):
+        return None, {}
+
+
+def _write_cache(
+    path: Path, form_id: str, high_water: str | None, responses: dict[str, dict[str, Any]]
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(
+                {"form_id": form_id, "high_water": high_water, "responses": responses},
+                file,
+            )
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _list_pages(
+    resource: ResponseResource, form_id: str, filter: str | None
+) -> list[dict[str, Any]]:
+    """
+    Lists the responses of a form, following `nextPageToken` until every page is read.
+    """
+    responses: list[dict[str, Any]] = []
+    page_token: str | None = None
+    while True:
+        page: dict[str, Any] = execute(
+            resource.list(
+                formId=form_id, filter=filter, pageSize=PAGE_SIZE, pageToken=page_token
+            )
+        )
+        responses.extend(page.get("responses", []))
+        page_token = page.get("nextPageToken")
+        if not page_token:
+            return responses
+
+
+def sync_responses(
+    resource: ResponseResource, form_id: str, path: Path
+) -> list[Response]:
+    """
+    Brings the local response cache of a form up to date and returns every response it holds.
+
+    Only responses submitted at or after the high-water mark, the latest `lastSubmittedTime` seen so far, are fetched. Responses are merged by `responseId`, so an edited response replaces its earlier version and a response on the mark is not counted twice.
+
+    :param resource: (ResponseResource) - The resource used to list responses.
+    :type resource: ResponseResource
+    :param form_id: (str) - The id of the form.
+    :type form_id: str
+    :param path: (Path) - The cache file of the form.
+    :type path: Path
+
+    :return: (list[Response]) - All responses of the form, oldest submission first.
+    :rtype: list[Response]
+    """
+    high_water, cached = _read_cache(path)
+
+    filter = None if high_water is None else f"timestamp >= {high_water}"
+    fetched = _list_pages(resource, form_id, filter)
+
+    for response in fetched:
+        cached[response["responseId"]] = response
+
+    ordered = sorted(
+        cached.values(), key=lambda response: isoparse(response["lastSubmittedTime"])
+    )
+    if len(ordered) > 0:
+        high_water = ordered[-1]["lastSubmittedTime"]
+
+    if len(fetched) > 0 or not path.exists():
+        _write_cache(path, form_id, high_water, cached)
+
+    return [Response(**response) for response in ordered]
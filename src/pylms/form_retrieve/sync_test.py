@@ -0,0 +1,111 @@
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, final, override
+
+from dateutil.parser import isoparse
+
+from ..service import ResponseResource
+from .sync import sync_responses
+
+
+@final
+class FakeRequest:
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def execute(self) -> Any:
+        return self.value
+
+
+@final
+class FakeResponses(ResponseResource):
+    """Serves stored responses two per page, honouring `timestamp >= N` filters."""
+
+    def __init__(self) -> None:
+        self.responses: dict[str, dict[str, Any]] = {}
+        self.filters: list[str | None] = []
+        self.served = 0
+
+    def submit(self, response_id: str, time: str, value: str) -> None:
+        answer = {"questionId": "q1", "textAnswers": {"answers": [{"value": value}]}}
+        self.responses[response_id] = {
+            "responseId": response_id,
+            "createTime": time,
+            "lastSubmittedTime": time,
+            "answers": {"q1": answer},
+        }
+
+    @override
+    def get(self, *, formId: str, responseId: str) -> object:
+        raise NotImplementedError
+
+    @override
+    def list(
+        self,
+        *,
+        formId: str,
+        filter: str | None = None,
+        pageSize: int = 5000,
+        pageToken: str | None = None,
+    ) -> Any:
+        if pageToken is None:
+            self.filters.append(filter)
+        matched = list(self.responses.values())
+        if filter is not None:
+            since = isoparse(filter.removeprefix("timestamp >= "))
+            matched = [r for r in matched if isoparse(r["lastSubmittedTime"]) >= since]
+        start = int(pageToken or 0)
+        page: dict[str, Any] = {"responses": matched[start : start + 2]}
+        self.served += len(page["responses"])
+        if start + 2 < len(matched):
+            page["nextPageToken"] = str(start + 2)
+        return FakeRequest(page)
+
+
+@final
+class SyncResponsesTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.path = Path(self.tmp.name) / "responses" / "form.json"  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.resource = FakeResponses()  # pyright: ignore[reportUninitializedInstanceVariable]
+        for i in range(5):
+            self.resource.submit(f"r{i}", f"2026-01-05T10:0{i}:00.5Z", f"v{i}")
+
+    @override
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_all_pages(self) -> None:
+        responses = sync_responses(self.resource, "form", self.path)
+        self.assertEqual([r.responseId for r in responses], [f"r{i}" for i in range(5)])
+        self.assertEqual(self.resource.filters, [None])
+
+    def test_incremental(self) -> None:
+        _ = sync_responses(self.resource, "form", self.path)
+        self.resource.served = 0
+
+        self.resource.submit("r5", "2026-01-05T11:00:00Z", "v5")
+        # an edited response keeps its id and moves past the high-water mark
+        self.resource.submit("r1", "2026-01-05T11:30:00Z", "edited")
+        responses = sync_responses(self.resource, "form", self.path)
+
+        self.assertEqual(self.resource.filters[-1], "timestamp >= 2026-01-05T10:04:00.5Z")
+        # the response on the mark is fetched again, along with the two new ones
+        self.assertEqual(self.resource.served, 3)
+        self.assertEqual(
+            [r.responseId for r in responses], ["r0", "r2", "r3", "r4", "r5", "r1"]
+        )
+        self.assertEqual(responses[-1].answers["q1"].textAnswers.answers[0].value, "edited")
+
+    def test_unreadable_cache(self) -> None:
+        self.path.parent.mkdir(parents=True)
+        _ = self.path.write_text("{", encoding="utf-8")
+        responses = sync_responses(self.resource, "form", self.path)
+        self.assertEqual(len(responses), 5)
+        self.assertEqual(self.resource.filters, [None])
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -2,6 +2,7 @@
 It includes methods for adding held and marked classes and updating class dates."""
 
 from .classes import extend_weeks, replan_weeks, set_class_days, sync_classes
+from .course_calendar import Calendar
 from .dates import retrieve_dates
 from .dates_with_history import all_dates
 from .groups import get_num_groups, set_group
@@ -30,7 +31,7 @@ from .retrieve import (
     match_date_index,
     match_info_by_date,
 )
-from .save import save_history
+from .save import compact_history, save_history
 from .update import (
     add_cds_form,
     add_class_form,
@@ -44,6 +45,7 @@ from .update import (
 )
 
 __all__ = [
+    "Calendar",
     "History",
     "Interlude",
     "add_cds_form",
@@ -81,6 +83,7 @@ __all__ = [
     "get_unrecorded_classes",
     "match_date_index",
     "match_info_by_date",
+    "compact_history",
     "save_history",
     "retrieve_dates",
 ]
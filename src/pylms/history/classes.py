@@ -1,8 +1,8 @@
-from datetime import datetime, timedelta
 from typing import overload
 
 from ..constants import WEEK_DAYS
 from ..errors import Result, Unit, eprint
+from .course_calendar import plan_calendar
 from .history import History
 
 
@@ -12,7 +12,7 @@ def sync_classes(history: History) -> Result[Unit]:
 
     This method calculates the dates for the classes based on the class dates and the orientation date.
     It generates a list of dates for the entire duration of the course, ensuring that only the
-    weekdays specified in ``class_dates`` are included.
+    weekdays specified in ``class_dates`` are included. The calendar is memoized by `plan_calendar`.
 
     :param history: (History) - The instance of the History class.
     :type history: History
@@ -32,64 +32,15 @@ def sync_classes(history: History) -> Result[Unit]:
         eprint(msg)
         return Result.err(msg)
 
-    # Generate all dates for the course duration, starting from the day after orientation
-    dates = [
-        history.orientation_date + timedelta(days=i)
-        for i in range(1, 7 * history.weeks)
-    ]
-
-    # Identify the last date in the generated range
-    last_date = dates[-1]
-
-    # Calculate how many days remain in the final week to reach the next Sunday
-    diff = 6 - last_date.weekday()
-
-    # Generate the remaining dates to complete the final week
-    dates_left: list[datetime] = [
-        last_date + timedelta(days=i) for i in range(1, diff + 1)
-    ]
-
-    # Extend the list of all dates to include the remaining days in the final week
-    dates.extend(dates_left)
-
-    # Check for interlude
-
+    # Lay out the class dates, reusing the calendar if this course was planned before
     interlude = history.interlude
-
-    if interlude is None:
-        # Filter all dates to include only those that match the specified class weekdays
-        history.dates = [date for date in dates if date.weekday() in history.class_days]
-        history._updated = True  # pyright: ignore[reportPrivateUsage]
-
-        return Result.unit()
-
-    gap_start = interlude.start
-
-    pre_dates = [date for date in dates if date <= gap_start]
-
-    held_days = (gap_start - pre_dates[0]).days
-    held_weeks = held_days // 7
-
-    if held_days % 7 != 0:
-        held_weeks += 1
-
-    rem_weeks = history.weeks - held_weeks
-
-    gap_end = interlude.end
-
-    shifted_dates = [gap_end + timedelta(i) for i in range(7 * rem_weeks)]
-
-    last_date = shifted_dates[-1]
-
-    diff = 6 - last_date.weekday()
-
-    # Generate the remaining dates to complete the final week
-    dates_left = [last_date + timedelta(days=i) for i in range(1, diff + 1)]
-
-    dates = pre_dates + shifted_dates + dates_left
-    dates = [date for date in dates if date.weekday() in history.class_days]
-
-    history.dates = dates
+    calendar = plan_calendar(
+        history.orientation_date,
+        tuple(history.class_days),
+        history.weeks,
+        None if interlude is None else (interlude.start, interlude.end),
+    )
+    history.set_calendar(calendar)
     history._updated = True  # pyright: ignore[reportPrivateUsage]
 
     return Result.unit()
@@ -0,0 +1,98 @@
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple, Self
+
+from ..constants import DATE_FMT
+
+
+class Calendar(NamedTuple):
+    """
+    The class dates of a course, as datetimes and as strings in the format specified by DATE_FMT.
+
+    :ivar dates: (tuple[datetime, ...]) - The class dates in order.
+    :ivar labels: (tuple[str, ...]) - The class dates formatted with DATE_FMT.
+    :ivar positions: (dict[str, int]) - The class number of each formatted date, counting from 1.
+    """
+
+    dates: tuple[datetime, ...]
+    labels: tuple[str, ...]
+    positions: dict[str, int]
+
+    @classmethod
+    def from_dates(cls, dates: Sequence[datetime]) -> Self:
+        """
+        :param dates: (Sequence[datetime]) - The class dates in order.
+        :type dates: Sequence[datetime]
+
+        :return: (Calendar) - The calendar of the dates.
+        :rtype: Calendar
+        """
+        labels = tuple(date.strftime(DATE_FMT) for date in dates)
+        positions: dict[str, int] = {}
+        for num, label in enumerate(labels, start=1):
+            _ = positions.setdefault(label, num)
+        return cls(tuple(dates), labels, positions)
+
+    def position(self, label: str) -> int | None:
+        """
+        :param label: (str) - A date in the format specified by DATE_FMT.
+        :type label: str
+
+        :return: (int | None) - The number of the class held on the date, counting from 1, or None if no class is held on it.
+        :rtype: int | None
+        """
+        return self.positions.get(label)
+
+
+@lru_cache(maxsize=32)
+def plan_calendar(
+    orientation_date: datetime,
+    class_days: tuple[int, ...],
+    weeks: int,
+    interlude: tuple[datetime, datetime] | None,
+) -> Calendar:
+    """
+    Lays out the class dates of a course. Calendars are memoized, so a course is only planned once per set of parameters.
+
+    Classes start the day after orientation and run for `weeks` weeks, completed to the end of the last week, on the weekdays in `class_days`. An interlude pauses the course from its start to its end; the weeks not held before it are held after it.
+
+    :param orientation_date: (datetime) - The orientation date.
+    :type orientation_date: datetime
+    :param class_days: (tuple[int, ...]) - The weekdays on which classes are held, 0 being Monday.
+    :type class_days: tuple[int, ...]
+    :param weeks: (int) - The number of weeks the course lasts.
+    :type weeks: int
+    :param interlude: (tuple[datetime, datetime] | None) - The start and end of the interlude, or None if there is none.
+    :type interlude: tuple[datetime, datetime] | None
+
+    :return: (Calendar) - The calendar of the course.
+    :rtype: Calendar
+    """
+
+    def complete_week(dates: list[datetime]) -> list[datetime]:
+        # Extend the dates with the days left to the next Sunday
+        last_date = dates[-1]
+        diff = 6 - last_date.weekday()
+        return dates + [last_date + timedelta(days=i) for i in range(1, diff + 1)]
+
+    # All dates for the course duration, starting from the day after orientation
+    dates = complete_week(
+        [orientation_date + timedelta(days=i) for i in range(1, 7 * weeks)]
+    )
+
+    if interlude is not None:
+        gap_start, gap_end = interlude
+        pre_dates = [date for date in dates if date <= gap_start]
+
+        held_days = (gap_start - pre_dates[0]).days
+        held_weeks = held_days // 7
+        if held_days % 7 != 0:
+            held_weeks += 1
+
+        rem_weeks = weeks - held_weeks
+        shifted_dates = [gap_end + timedelta(i) for i in range(7 * rem_weeks)]
+        dates = pre_dates + complete_week(shifted_dates)
+
+    # Keep only the dates that fall on class days
+    return Calendar.from_dates([date for date in dates if date.weekday() in class_days])
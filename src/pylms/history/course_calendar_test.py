@@ -0,0 +1,94 @@
+import unittest
+from datetime import datetime, timedelta
+from typing import final, override
+
+from ..constants import DATE_FMT
+from .classes import extend_weeks, sync_classes
+from .course_calendar import plan_calendar
+from .dates_with_history import all_dates
+from .history import History
+from .interlude import Interlude
+
+
+def _plan(
+    orientation: datetime,
+    class_days: list[int],
+    weeks: int,
+    interlude: Interlude | None,
+) -> list[datetime]:
+    """The class dates as sync_classes laid them out before they were memoized."""
+    dates = [orientation + timedelta(days=i) for i in range(1, 7 * weeks)]
+    last_date = dates[-1]
+    dates += [last_date + timedelta(days=i) for i in range(1, 6 - last_date.weekday() + 1)]
+    if interlude is None:
+        return [date for date in dates if date.weekday() in class_days]
+
+    pre_dates = [date for date in dates if date <= interlude.start]
+    held_days = (interlude.start - pre_dates[0]).days
+    held_weeks = held_days // 7 + (1 if held_days % 7 != 0 else 0)
+    shifted = [interlude.end + timedelta(i) for i in range(7 * (weeks - held_weeks))]
+    last_date = shifted[-1]
+    shifted += [last_date + timedelta(days=i) for i in range(1, 6 - last_date.weekday() + 1)]
+    return [date for date in pre_dates + shifted if date.weekday() in class_days]
+
+
+@final
+class CourseCalendarTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        plan_calendar.cache_clear()
+
+    def _history(self) -> History:
+        history = History()
+        history.class_days = [1, 3, 5]
+        history.orientation_date = datetime(2025, 6, 9)
+        _ = sync_classes(history).unwrap()
+        return history
+
+    def test_matches_unmemoized_plan(self) -> None:
+        orientation = datetime(2025, 6, 9)
+        for class_days in ([1, 3, 5], [0, 2, 4]):
+            for weeks in (1, 5, 12):
+                history = History()
+                history.class_days = class_days
+                history.orientation_date = orientation
+                history.weeks = weeks
+                _ = sync_classes(history).unwrap()
+                self.assertEqual(history.dates, _plan(orientation, class_days, weeks, None))
+
+        history = self._history()
+        interlude = Interlude.new(history.dates[4], 10).unwrap()
+        history.interlude = interlude
+        _ = sync_classes(history).unwrap()
+        self.assertEqual(history.dates, _plan(orientation, [1, 3, 5], 5, interlude))
+
+    def test_calendar_is_reused_until_changed(self) -> None:
+        history = self._history()
+        calendar = history.calendar
+        self.assertIs(history.calendar, calendar)
+        self.assertEqual(all_dates(history, ""), [d.strftime(DATE_FMT) for d in history.dates])
+
+        # The same course is planned once
+        _ = sync_classes(history).unwrap()
+        self.assertIs(history.calendar, calendar)
+        self.assertEqual(plan_calendar.cache_info().hits, 1)
+
+        # Changing the course replans it
+        _ = extend_weeks(history, 1).unwrap()
+        self.assertIsNot(history.calendar, calendar)
+        self.assertEqual(len(all_dates(history, "")), 18)
+        self.assertEqual(history.calendar.position(all_dates(history, "")[-1]), 18)
+
+        # Assigning the dates directly drops the cached calendar
+        history.dates = history.dates[:3]
+        self.assertEqual(all_dates(history, ""), [d.strftime(DATE_FMT) for d in history.dates])
+        self.assertIsNone(history.calendar.position(calendar.labels[3]))
+
+        # The returned list is a copy
+        labels = all_dates(history, "")
+        labels.append("01/01/2000")
+        self.assertEqual(len(all_dates(history, "")), 3)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
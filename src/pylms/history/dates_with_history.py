@@ -1,7 +1,6 @@
 from datetime import datetime
 from typing import overload
 
-from ..constants import DATE_FMT
 from .history import History
 
 
@@ -19,4 +18,5 @@ def all_dates(history: History, sample: str | datetime) -> list[str] | list[date
     if isinstance(sample, datetime):
         return history.dates
     else:
-        return [date.strftime(DATE_FMT) for date in history.dates]
+        # A copy of the memoized string view, so callers may modify it
+        return list(history.calendar.labels)
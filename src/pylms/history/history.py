@@ -1,10 +1,45 @@
 from datetime import datetime
 from pathlib import Path
+from typing import Literal, override
 
 from ..models import CDSFormInfo, ClassFormInfo, UpdateFormInfo
+from ..paths import FileStamp
+from .course_calendar import Calendar
+from .index import HistoryIndex
 from .interlude import Interlude
 
 
+# Attributes of `History` that are persisted, in the order they are saved.
+HISTORY_FIELDS: tuple[str, ...] = (
+    "cohort",
+    "class_days",
+    "dates",
+    "orientation_date",
+    "weeks",
+    "interlude",
+    "held_classes",
+    "marked_classes",
+    "class_forms",
+    "recorded_class_forms",
+    "cds_forms",
+    "recorded_cds_forms",
+    "update_forms",
+    "recorded_update_forms",
+    "attendance",
+    "assessment",
+    "project",
+    "result",
+    "merit",
+)
+
+# Attributes the class dates are derived from.
+CALENDAR_FIELDS: frozenset[str] = frozenset(
+    ("dates", "orientation_date", "class_days", "weeks", "interlude")
+)
+
+type Change = tuple[Literal["set", "add"], str, object]
+
+
 class History:
     """A class to manage the history of classes, dates, and other related information.
     This class provides methods to load history data from a file, update dates based on class dates,
@@ -65,9 +100,34 @@ class History:
             and the path to the merit awardees file.
 
         _updated (bool): A boolean indicating whether the dates have been updated.
+
+        _changes (list[Change]): The changes made to persisted attributes since the history was
+            loaded or saved, oldest first. An attribute that is assigned is recorded as ("set", name, None);
+            an item appended to a list attribute with `mark_added` is recorded as ("add", name, item).
+
+        _generation (str | None): The generation of the snapshot this history was loaded from,
+            or None if it was not loaded from a journaled snapshot.
+
+        _journaled (int): The number of journal entries written on top of that snapshot.
+
+        _stamp (FileStamp | None): The stamp of the snapshot and journal files when this history was last
+            loaded or saved, or None if it was never. A different stamp on disk means another writer changed them.
+
+        _index (HistoryIndex): Hash indexes over the lists above, kept in step with them.
+
+        _calendar_version (int): Bumped whenever the class dates or an attribute they are derived from is assigned.
+
+        _calendar (tuple[int, Calendar] | None): The calendar of the class dates and the version it was built at.
     """
 
     def __init__(self) -> None:
+        self._changes: list[Change] = []
+        self._generation: str | None = None
+        self._journaled: int = 0
+        self._stamp: FileStamp | None = None
+        self._index: HistoryIndex = HistoryIndex(self)
+        self._calendar_version: int = 0
+        self._calendar: tuple[int, Calendar] | None = None
         self.cohort: int | None = None
         self.class_days: list[int] = []
         self.dates: list[datetime] = []
@@ -89,6 +149,105 @@ class History:
         self.merit: tuple[bool, Path] = (False, Path())
         self.group: tuple[bool, int] = (False, 0)
         self._updated: bool = False
+        self._changes.clear()
+
+    @override
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        if name in HISTORY_FIELDS:
+            self._changes.append(("set", name, None))
+            self._index.invalidate(name)
+        if name in CALENDAR_FIELDS:
+            self.bump_calendar()
+
+    def mark_added(self, name: str, item: object) -> None:
+        """
+        Records that `item` was appended to the list attribute `name`, so that only the item is journaled when the history is saved and the indexes over the list are updated in place.
+
+        :param name: (str) - The name of the list attribute.
+        :type name: str
+        :param item: (object) - The appended item.
+        :type item: object
+        :return: (None) - This method does not return anything.
+        :rtype: None
+        """
+        self._changes.append(("add", name, item))
+        self._index.added(name, item)
+
+    def bump_calendar(self) -> None:
+        """
+        Marks the cached calendar as stale, so it is rebuilt from `dates` when next needed.
+
+        :return: (None) - This method does not return anything.
+        :rtype: None
+        """
+        self._calendar_version += 1
+
+    def set_calendar(self, calendar: Calendar) -> None:
+        """
+        Sets the class dates from a planned calendar and caches the calendar.
+
+        :param calendar: (Calendar) - The calendar of the course.
+        :type calendar: Calendar
+        :return: (None) - This method does not return anything.
+        :rtype: None
+        """
+        self.dates = list(calendar.dates)
+        self._calendar = (self._calendar_version, calendar)
+
+    @property
+    def calendar(self) -> Calendar:
+        """
+        The class dates as datetimes and as strings with the class number of each date. It is built once and reused until the dates change.
+
+        :return: (Calendar) - The calendar of the class dates.
+        :rtype: Calendar
+        """
+        if self._calendar is None or self._calendar[0] != self._calendar_version:
+            self._calendar = (self._calendar_version, Calendar.from_dates(self.dates))
+        return self._calendar[1]
+
+    @property
+    def index(self) -> HistoryIndex:
+        """
+        Hash indexes over the class dates and form lists of the history.
+
+        :return: (HistoryIndex) - The indexes.
+        :rtype: HistoryIndex
+        """
+        return self._index
+
+    def pop_changes(self) -> list[Change]:
+        """
+        Returns the changes made since the history was loaded or saved and forgets them.
+
+        An attribute that was assigned is reported once with "set", and items appended to it are then dropped since saving its whole value covers them.
+
+        :return: (list[Change]) - The changes, oldest first.
+        :rtype: list[Change]
+        """
+        assigned: set[str] = {name for op, name, _ in self._changes if op == "set"}
+        changes: list[Change] = []
+        seen: set[str] = set()
+        for op, name, item in self._changes:
+            if op == "set":
+                if name not in seen:
+                    seen.add(name)
+                    changes.append((op, name, item))
+            elif name not in assigned:
+                changes.append((op, name, item))
+        self._changes.clear()
+        return changes
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Property indicating whether the history has changes that were not saved.
+
+        :return: (bool) - True if a persisted attribute was assigned or appended to since the history was loaded or saved.
+        :rtype: bool
+        """
+        return len(self._changes) > 0
 
     @property
     def updated(self) -> bool:
@@ -0,0 +1,133 @@
+from datetime import datetime
+from typing import Any, Literal
+
+from ..models import CDSFormInfo, ClassFormInfo, UpdateFormInfo
+
+type Form = ClassFormInfo | CDSFormInfo | UpdateFormInfo
+type FormKey = tuple[type, tuple[Any, ...]]
+type ClassList = Literal["held_classes", "marked_classes"]
+type RecordedForms = Literal[
+    "recorded_class_forms", "recorded_cds_forms", "recorded_update_forms"
+]
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)  # pyright: ignore[reportUnknownVariableType]
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())  # pyright: ignore[reportUnknownVariableType]
+    return value
+
+
+def form_key(form: Form) -> FormKey:
+    """
+    A hashable key for a form. Two forms have the same key exactly when they compare equal.
+
+    :param form: (Form) - The form.
+    :type form: Form
+
+    :return: (FormKey) - The key of the form.
+    :rtype: FormKey
+    """
+    return type(form), _freeze(list(form.__dict__.values()))
+
+
+class HistoryIndex:
+    """
+    Hash indexes over the lists of a `History`, so lookups take constant time instead of a scan.
+
+    Each index is built from its list the first time it is needed. `History` drops the indexes derived from an attribute when the attribute is assigned, and updates them in place when an item is appended through `History.mark_added`.
+
+    :ivar owner: (object) - The history whose lists are indexed.
+    """
+
+    def __init__(self, owner: object) -> None:
+        self.owner: object = owner
+        self._forms_by_date: dict[str, ClassFormInfo] | None = None
+        self._form_keys: dict[str, set[FormKey]] = {}
+        self._class_sets: dict[str, set[datetime]] = {}
+
+    def invalidate(self, name: str) -> None:
+        """
+        Drops the indexes derived from the attribute `name`.
+
+        :param name: (str) - The name of the attribute that was assigned.
+        :type name: str
+        :return: (None) - This method does not return anything.
+        :rtype: None
+        """
+        match name:
+            case "class_forms":
+                self._forms_by_date = None
+            case _:
+                _ = self._form_keys.pop(name, None)
+                _ = self._class_sets.pop(name, None)
+
+    def added(self, name: str, item: Any) -> None:
+        """
+        Updates the indexes derived from the list attribute `name` after `item` was appended to it.
+
+        :param name: (str) - The name of the list attribute.
+        :type name: str
+        :param item: (Any) - The appended item.
+        :type item: Any
+        :return: (None) - This method does not return anything.
+        :rtype: None
+        """
+        if name == "class_forms" and self._forms_by_date is not None:
+            if item.date in self._forms_by_date:
+                # The form that comes first in the sorted list wins; rebuild to find it
+                self._forms_by_date = None
+            else:
+                self._forms_by_date[item.date] = item
+        elif name in self._form_keys:
+            self._form_keys[name].add(form_key(item))
+        elif name in self._class_sets:
+            self._class_sets[name].add(item)
+
+    def form_for_date(self, date: str) -> ClassFormInfo | None:
+        """
+        :param date: (str) - A class date in the format specified by DATE_FMT.
+        :type date: str
+
+        :return: (ClassFormInfo | None) - The first class form for the date, or None if there is none.
+        :rtype: ClassFormInfo | None
+        """
+        if self._forms_by_date is None:
+            forms: list[ClassFormInfo] = getattr(self.owner, "class_forms")
+            index: dict[str, ClassFormInfo] = {}
+            for form in forms:
+                _ = index.setdefault(form.date, form)
+            self._forms_by_date = index
+        return self._forms_by_date.get(date)
+
+    def has_form(self, name: RecordedForms, form: Form) -> bool:
+        """
+        :param name: (RecordedForms) - The name of a list of recorded forms.
+        :type name: RecordedForms
+        :param form: (Form) - The form to look up.
+        :type form: Form
+
+        :return: (bool) - True if an equal form is in the list.
+        :rtype: bool
+        """
+        keys = self._form_keys.get(name)
+        if keys is None:
+            forms: list[Form] = getattr(self.owner, name)
+            keys = {form_key(each) for each in forms}
+            self._form_keys[name] = keys
+        return form_key(form) in keys
+
+    def class_set(self, name: ClassList) -> set[datetime]:
+        """
+        :param name: (ClassList) - "held_classes" or "marked_classes".
+        :type name: ClassList
+
+        :return: (set[datetime]) - The dates in the list.
+        :rtype: set[datetime]
+        """
+        dates = self._class_sets.get(name)
+        if dates is None:
+            dates = set(getattr(self.owner, name))
+            self._class_sets[name] = dates
+        return dates
@@ -0,0 +1,154 @@
+import unittest
+from datetime import datetime
+from typing import final
+
+from ..constants import DATE_FMT, TIMESTAMP_FMT
+from ..models import CDSFormInfo, ClassFormInfo, UpdateFormInfo
+from .classes import sync_classes
+from .history import History
+from .retrieve import (
+    get_available_cds_forms,
+    get_available_class_forms,
+    get_available_update_forms,
+    get_unheld_classes,
+    get_unmarked_classes,
+    get_unrecorded_classes,
+    match_date_index,
+    match_info_by_date,
+)
+from .update import (
+    add_cds_form,
+    add_class_form,
+    add_held_class,
+    add_marked_class,
+    add_recorded_cds_form,
+    add_recorded_class_form,
+    add_recorded_update_form,
+    add_update_form,
+)
+
+
+def _stamp(second: int) -> str:
+    return datetime(2025, 6, 9, 10, 0, second).strftime(TIMESTAMP_FMT)
+
+
+def _class_form(date: str, tag: str, second: int = 0) -> ClassFormInfo:
+    return ClassFormInfo(
+        date=date,
+        present_name=f"Present {tag}",
+        present_title=f"Present {tag}",
+        present_url=f"https://forms/{tag}/present",
+        present_id=f"present-{tag}",
+        excused_name=f"Excused {tag}",
+        excused_title=f"Excused {tag}",
+        excused_url=f"https://forms/{tag}/excused",
+        excused_id=f"excused-{tag}",
+        timestamp=_stamp(second),
+    )
+
+
+def _cds_form(tag: str) -> CDSFormInfo:
+    return CDSFormInfo(name=tag, title=tag, url=tag, uuid=tag, timestamp=_stamp(1))
+
+
+def _update_form(tag: str, dates: list[str]) -> UpdateFormInfo:
+    return UpdateFormInfo(
+        week_num=1,
+        year_num=2025,
+        name=tag,
+        title=tag,
+        url=tag,
+        uuid=tag,
+        dates=dates,
+        timestamp=_stamp(2),
+    )
+
+
+@final
+class HistoryIndexTest(unittest.TestCase):
+    def _history(self) -> History:
+        history = History()
+        history.class_days = [1, 3, 5]
+        history.orientation_date = datetime(2025, 6, 9)
+        _ = sync_classes(history).unwrap()
+        return history
+
+    def _check(self, history: History) -> None:
+        """Compares every lookup with the linear scan it replaces."""
+        dates = [date.strftime(DATE_FMT) for date in history.dates]
+        for num, date in enumerate(dates, start=1):
+            self.assertEqual(match_date_index(history, date).unwrap(), num)
+            matched = [form for form in history.class_forms if form.date == date]
+            info = match_info_by_date(history, date)
+            if len(matched) == 0:
+                self.assertTrue(info.is_err())
+            else:
+                self.assertIs(info.unwrap(), matched[0])
+        self.assertTrue(match_date_index(history, "01/01/2000").is_err())
+
+        self.assertEqual(
+            get_available_class_forms(history),
+            [f for f in history.class_forms if f not in history.recorded_class_forms],
+        )
+        self.assertEqual(
+            get_available_cds_forms(history),
+            [f for f in history.cds_forms if f not in history.recorded_cds_forms],
+        )
+        self.assertEqual(
+            get_available_update_forms(history),
+            [f for f in history.update_forms if f not in history.recorded_update_forms],
+        )
+        self.assertEqual(
+            get_unheld_classes(history, ""),
+            [d.strftime(DATE_FMT) for d in history.dates if d not in history.held_classes],
+        )
+        self.assertEqual(
+            get_unmarked_classes(history, datetime.now()),
+            [d for d in history.dates if d not in history.marked_classes],
+        )
+        held = {d.strftime(DATE_FMT) for d in history.held_classes}
+        unmarked = {
+            d.strftime(DATE_FMT) for d in history.dates if d not in history.marked_classes
+        }
+        self.assertEqual(get_unrecorded_classes(history, ""), sorted(held & unmarked))
+
+    def test_lookups_follow_mutations(self) -> None:
+        history = self._history()
+        dates = [date.strftime(DATE_FMT) for date in history.dates]
+        self._check(history)
+
+        # Build the indexes, then change the lists through the mutators
+        for i, date in enumerate(dates[:6]):
+            add_class_form(history, _class_form(date, f"c{i}"))
+            _ = add_held_class(history, date)
+        _ = add_marked_class(history, 2)
+        add_recorded_class_form(history, _class_form(dates[1], "c1"))
+        add_cds_form(history, _cds_form("a"))
+        add_cds_form(history, _cds_form("b"))
+        add_recorded_cds_form(history, _cds_form("a"))
+        add_update_form(history, _update_form("u", dates[:3]))
+        add_update_form(history, _update_form("v", dates[3:6]))
+        add_recorded_update_form(history, _update_form("v", dates[3:6]))
+        self._check(history)
+
+        # A second form for a date that already has one
+        add_class_form(history, _class_form(dates[0], "late", second=30))
+        self._check(history)
+
+        # Assigning a list replaces its index
+        history.recorded_class_forms = []
+        history.held_classes = history.held_classes[:2]
+        history.weeks = 6
+        _ = sync_classes(history).unwrap()
+        self._check(history)
+
+    def test_marking_requires_held_class(self) -> None:
+        history = self._history()
+        self.assertTrue(add_marked_class(history, 1).is_err())
+        _ = add_held_class(history, 1).unwrap()
+        _ = add_marked_class(history, 1).unwrap()
+        self.assertEqual(history.marked_classes, history.dates[:1])
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -1,18 +1,236 @@
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from ..date import parse_dates, to_date
-from ..errors import Result, eprint
-from ..models import CDSFormInfo, ClassFormInfo, UpdateFormInfo
-from ..paths import get_history_path
+from ..errors import Result, Unit, eprint
+from ..models import CDSFormInfo, ClassFormInfo, UpdateFormInfo, sort_form
+from ..paths import file_stamp, get_history_journal_path, get_history_path
 from .classes import sync_classes
-from .history import History
+from .history import HISTORY_FIELDS, History
 from .interlude import Interlude
 
+_FORM_MODELS: dict[str, type[ClassFormInfo] | type[CDSFormInfo] | type[UpdateFormInfo]] = {
+    "class_forms": ClassFormInfo,
+    "recorded_class_forms": ClassFormInfo,
+    "cds_forms": CDSFormInfo,
+    "recorded_cds_forms": CDSFormInfo,
+    "update_forms": UpdateFormInfo,
+    "recorded_update_forms": UpdateFormInfo,
+}
+
+_FORM_KINDS: dict[str, str] = {
+    "class_forms": "Class",
+    "recorded_class_forms": "Class",
+    "cds_forms": "CDS",
+    "recorded_cds_forms": "CDS",
+    "update_forms": "Update",
+    "recorded_update_forms": "Update",
+}
+
+_RECORDS: dict[str, str] = {
+    "attendance": "Attendance",
+    "assessment": "Assessment",
+    "project": "Project",
+    "result": "Result",
+    "merit": "Merit",
+}
+
+
+def _set_field(history: History, key: str, value: Any) -> Result[Unit]:
+    """Validates the saved value of a persisted attribute and sets it on the history.
+
+    :param history: (History) - The history being loaded.
+    :type history: History
+    :param key: (str) - The name of the attribute.
+    :type key: str
+    :param value: (Any) - The value as saved by `save_history`.
+    :type value: Any
+
+    :return: (Result[Unit]) - a result object.
+    :rtype: Result[Unit]
+    """
+    match key:
+        case "cohort":
+            if not isinstance(value, int):
+                msg = "Cohort must be an integer."
+                eprint(msg)
+                return Result.err(msg)
+            history.cohort = value
+
+        case "class_days":
+            if not isinstance(value, list) or len(value) != 3:
+                msg = "Class dates must be a list of exactly 3 integers."
+                eprint(msg)
+                return Result.err(msg)
+            if not all(isinstance(num, int) for num in value):
+                msg = "All class dates must be integers."
+                eprint(msg)
+                return Result.err(msg)
+            history.class_days = [num for num in value]
+
+        case "dates":
+            if not isinstance(value, list):
+                msg = "Dates must be a list of date strings."
+                eprint(msg)
+                return Result.err(msg)
+            if len(value) == 0:
+                msg = "Dates must have more than one element"
+                eprint(msg)
+                return Result.err(msg)
+            dates = parse_dates(value)
+            if dates.is_err():
+                return dates.propagate()
+            history.dates = dates.unwrap()
+
+        case "orientation_date":
+            if value is None:
+                msg = "orientation_date is not set"
+                eprint(msg)
+                return Result.err(msg)
+            if not isinstance(value, str):
+                msg = "orientation_date is expected to be a `str`."
+                eprint(msg)
+                return Result.err(msg)
+            date = to_date(value)
+            if date.is_err():
+                return date.propagate()
+            history.orientation_date = date.unwrap()
+
+        case "weeks":
+            if not isinstance(value, int) or value < 1:
+                msg = "Weeks must be a positive integer."
+                eprint(msg)
+                return Result.err(msg)
+            history.weeks = value
+
+        case "interlude":
+            if value is None:
+                history.interlude = None
+                return Result.unit()
+            interlude = Interlude.from_dict(value)
+            if interlude.is_err():
+                return interlude.propagate()
+            history.interlude = interlude.unwrap()
+
+        case "held_classes" | "marked_classes":
+            if not isinstance(value, list):
+                title = "Held" if key == "held_classes" else "Marked"
+                msg = f"{title} classes must be a list of date strings."
+                eprint(msg)
+                return Result.err(msg)
+            dates = parse_dates(value)
+            if dates.is_err():
+                return dates.propagate()
+            setattr(history, key, dates.unwrap())
+
+        case key if key in _FORM_MODELS:
+            if not isinstance(value, list) or not all(
+                isinstance(info, dict) for info in value
+            ):
+                msg = f"{_FORM_KINDS[key]} forms must be a list of dictionaries"
+                eprint(msg)
+                return Result.err(msg)
+            model = _FORM_MODELS[key]
+            setattr(history, key, [model.model_validate(info) for info in value])
+
+        case key if key in _RECORDS:
+            if not isinstance(value, list) or len(value) != 2:
+                msg = f"{_RECORDS[key]} must be a list with two elements: a boolean and a file path."
+                eprint(msg)
+                return Result.err(msg)
+            setattr(history, key, (value[0], Path(value[1])))
+
+        case _:
+            pass
+
+    return Result.unit()
+
+
+def _add_item(history: History, key: str, value: Any) -> Result[Unit]:
+    """Validates a journaled item and appends it to a list attribute of the history, keeping the list sorted.
+
+    :param history: (History) - The history being loaded.
+    :type history: History
+    :param key: (str) - The name of the list attribute.
+    :type key: str
+    :param value: (Any) - The item as journaled by `save_history`.
+    :type value: Any
+
+    :return: (Result[Unit]) - a result object.
+    :rtype: Result[Unit]
+    """
+    if key in ("held_classes", "marked_classes"):
+        if not isinstance(value, str):
+            msg = f"Journaled {key} entry must be a date string."
+            eprint(msg)
+            return Result.err(msg)
+        date = to_date(value)
+        if date.is_err():
+            return date.propagate()
+        item: datetime = date.unwrap()
+        items: list[datetime] = getattr(history, key)
+        items.append(item)
+        items.sort()
+        history.mark_added(key, item)
+        return Result.unit()
+
+    if key in _FORM_MODELS:
+        if not isinstance(value, dict):
+            msg = f"Journaled {key} entry must be a dictionary."
+            eprint(msg)
+            return Result.err(msg)
+        form = _FORM_MODELS[key].model_validate(value)
+        forms: list[Any] = getattr(history, key)
+        forms.append(form)
+        forms.sort(key=sort_form)
+        history.mark_added(key, form)
+        return Result.unit()
+
+    msg = f"Cannot add items to history attribute '{key}'."
+    eprint(msg)
+    return Result.err(msg)
+
+
+def _replay(history: History, path: Path, generation: str | None) -> Result[int]:
+    """Applies the journal entries written on top of the snapshot of `generation`, in order.
+
+    Entries of other generations were already compacted into a snapshot and are skipped, as are lines left incomplete by an interrupted write.
+
+    :return: (Result[int]) - The number of entries applied.
+    :rtype: Result[int]
+    """
+    if generation is None or not path.exists():
+        return Result.ok(0)
+
+    applied: int = 0
+    with path.open("r", encoding="utf-8") as file:
+        for line in file:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(entry, dict) or entry.get("generation") != generation:
+                continue
+            op, key, value = entry.get("op"), entry.get("field"), entry.get("value")
+            if key not in HISTORY_FIELDS:
+                continue
+            if op == "set":
+                result = _set_field(history, key, value)
+            else:
+                result = _add_item(history, key, value)
+            if result.is_err():
+                return result.propagate()
+            applied += 1
+    return Result.ok(applied)
+
 
 def load_history() -> Result[History]:
     """Loads the history data from a JSON file and initializes the History object.
+
+    The JSON file is the last snapshot of the history. The changes saved since, which `save_history` appends to the history journal, are then replayed on top of it.
+
     :return: (History) - An instance of the History class with loaded data.
     :rtype: History
 
@@ -35,224 +253,33 @@ def load_history() -> Result[History]:
         eprint(msg)
         return Result.err(msg)
 
-    # Check and set attribute `cohort`
-    if "cohort" in data:
-        if not isinstance(data["cohort"], int):
-            msg = "Cohort must be an integer."
-            eprint(msg)
-            return Result.err(msg)
-
-        history.cohort = data["cohort"]
+    # Set every saved attribute
+    for key in HISTORY_FIELDS:
+        if key in data:
+            result = _set_field(history, key, data[key])
+            if result.is_err():
+                return result.propagate()
 
-    # Check and set attribute `class_days`
-    if "class_days" in data:
-        if not isinstance(data["class_days"], list) or len(data["class_days"]) != 3:
-            msg = "Class dates must be a list of exactly 3 integers."
-            eprint(msg)
-            return Result.err(msg)
-        if not all(isinstance(num, int) for num in data["class_days"]):
-            msg = "All class dates must be integers."
-            eprint(msg)
-            return Result.err(msg)
-        history.class_days = [num for num in data["class_days"]]
-
-    # Check and set attribute `dates`
-    if "dates" in data:
-        if not isinstance(data["dates"], list):
-            msg = "Dates must be a list of date strings."
-            eprint(msg)
-            return Result.err(msg)
-        if len(data["dates"]) == 0:
-            msg = "Dates must have more than one element"
-            eprint(msg)
-            return Result.err(msg)
-        dates = parse_dates(data["dates"])
-        if dates.is_err():
-            return dates.propagate()
-
-        history.dates = dates.unwrap()
+    # Replay the changes saved since the snapshot
+    generation = data.get("generation")
+    generation = generation if isinstance(generation, str) else None
+    journaled = _replay(history, get_history_journal_path(), generation)
+    if journaled.is_err():
+        return journaled.propagate()
 
-    # Check and set attribute `orientation_date`
-    if "orientation_date" in data:
-        orientation_date = data["orientation_date"]
-        if orientation_date is None:
-            msg = "orientation_date is not set"
-            eprint(msg)
-            return Result.err(msg)
-
-        if not isinstance(orientation_date, str):
-            msg = "orientation_date is expected to be a `str`."
-            eprint(msg)
-            return Result.err(msg)
-
-        date = to_date(orientation_date)
-        if date.is_err():
-            return date.propagate()
-        date = date.unwrap()
-
-        history.orientation_date = date
-
-    # Check and set attribute `weeks`
-    if "weeks" in data:
-        if not isinstance(data["weeks"], int) or data["weeks"] < 1:
-            msg = "Weeks must be a positive integer."
-            eprint(msg)
-            return Result.err(msg)
-        history.weeks = data["weeks"]
-
-    if "interlude" in data:
-        interlude = Interlude.from_dict(data["interlude"])
-        if interlude.is_err():
-            return interlude.propagate()
-
-        history.interlude = interlude.unwrap()
-
-    # Check and set attribute `held_classes`
-    if "held_classes" in data:
-        if not isinstance(data["held_classes"], list):
-            msg = "Held classes must be a list of date strings."
-            eprint(msg)
-            return Result.err(msg)
-        dates = parse_dates(data["held_classes"])
-        if dates.is_err():
-            return dates.propagate()
-
-        history.held_classes = dates.unwrap()
-
-    # Check and set attribute `marked_classes`
-    if "marked_classes" in data:
-        if not isinstance(data["marked_classes"], list):
-            msg = "Marked classes must be a list of date strings."
-            eprint(msg)
-            return Result.err(msg)
-
-        datetimes: list[datetime] = []
-        raw_dates: list[str] = data["marked_classes"]
-        for date_str in raw_dates:
-            value = to_date(date_str)
-            if value.is_err():
-                return value.propagate()
-            value = value.unwrap()
-            datetimes.append(value)
-
-        dates = parse_dates(raw_dates)
-        if dates.is_err():
-            return dates.propagate()
-
-        history.marked_classes = dates.unwrap()
-
-    # Check and set attribute `class_forms`
-    if "class_forms" in data:
-        if not isinstance(data["class_forms"], list) and not isinstance(
-            data["class_forms"][0], dict
-        ):
-            msg = "Class forms must be a list of dictionaries"
-            eprint(msg)
-            return Result.err(msg)
-        history.class_forms = [
-            ClassFormInfo.model_validate(info) for info in data["class_forms"]
-        ]
-
-    # Check and set attribute `recorded_class_forms`
-    if "recorded_class_forms" in data:
-        if not isinstance(data["recorded_class_forms"], list) and not isinstance(
-            data["recorded_class_forms"][0], dict
-        ):
-            msg = "Class forms must be a list of dictionaries"
-            eprint(msg)
-            return Result.err(msg)
-        history.recorded_class_forms = [
-            ClassFormInfo.model_validate(info) for info in data["recorded_class_forms"]
-        ]
-
-    # Check and set attribute `cds_forms`
-    if "cds_forms" in data:
-        if not isinstance(data["cds_forms"], list) and not isinstance(
-            data["cds_forms"][0], dict
-        ):
-            msg = "CDS forms must be a list of dictionaries"
-            eprint(msg)
-            return Result.err(msg)
-        history.cds_forms = [
-            CDSFormInfo.model_validate(info) for info in data["cds_forms"]
-        ]
-
-    # Check and set attribute `recorded_cds_forms`
-    if "recorded_cds_forms" in data:
-        if not isinstance(data["recorded_cds_forms"], list) and not isinstance(
-            data["recorded_cds_forms"][0], dict
-        ):
-            msg = "CDS forms must be a list of dictionaries"
-            eprint(msg)
-            return Result.err(msg)
-        history.recorded_cds_forms = [
-            CDSFormInfo.model_validate(info) for info in data["recorded_cds_forms"]
-        ]
-
-    # Check and set attribute `update_forms`
-    if "update_forms" in data:
-        if not isinstance(data["update_forms"], list) and not isinstance(
-            data["update_forms"][0], dict
-        ):
-            msg = "Update forms must be a list of dictionaries"
-            eprint(msg)
-            return Result.err(msg)
-        history.update_forms = [
-            UpdateFormInfo.model_validate(info) for info in data["update_forms"]
-        ]
-
-    # Check and set attribute `recorded_update_forms`
-    if "recorded_update_forms" in data:
-        if not isinstance(data["recorded_update_forms"], list) and not isinstance(
-            data["recorded_update_forms"][0], dict
-        ):
-            msg = "Update forms must be a list of dictionaries"
-            eprint(msg)
-            return Result.err(msg)
-        history.recorded_update_forms = [
-            UpdateFormInfo.model_validate(info)
-            for info in data["recorded_update_forms"]
-        ]
-
-    # Check and set attributes `attendance`, `assessment`, `project`, and `result`
-    if "attendance" in data:
-        if not isinstance(data["attendance"], list) or len(data["attendance"]) != 2:
-            msg = "Attendance must be a list with two elements: a boolean and a file path."
-            eprint(msg)
-            return Result.err(msg)
-        history.attendance = (data["attendance"][0], Path(data["attendance"][1]))
-
-    if "assessment" in data:
-        if not isinstance(data["assessment"], list) or len(data["assessment"]) != 2:
-            msg = "Assessment must be a list with two elements: a boolean and a file path."
-            eprint(msg)
-            return Result.err(msg)
-        history.assessment = (data["assessment"][0], Path(data["assessment"][1]))
-
-    if "project" in data:
-        if not isinstance(data["project"], list) or len(data["project"]) != 2:
-            msg = "Project must be a list with two elements: a boolean and a file path."
-            eprint(msg)
-            return Result.err(msg)
-        history.project = (data["project"][0], Path(data["project"][1]))
-
-    if "result" in data:
-        if not isinstance(data["result"], list) or len(data["result"]) != 2:
-            msg = "Result must be a list with two elements: a boolean and a file path."
-            eprint(msg)
-            return Result.err(msg)
-        history.result = (data["result"][0], Path(data["result"][1]))
-
-    if "merit" in data:
-        if not isinstance(data["merit"], list) or len(data["merit"]) != 2:
-            msg = "Merit must be a list with two elements: a boolean and a file path."
-            eprint(msg)
-            return Result.err(msg)
-        history.merit = (data["merit"][0], Path(data["merit"][1]))
+    saved_dates: list[datetime] = list(history.dates)
 
     # Update the dates based on the loaded data
     result = sync_classes(history)
     if result.is_err():
         return result.propagate()
 
+    # Loading is not a change, except when the dates no longer match the saved ones
+    _ = history.pop_changes()
+    if history.dates != saved_dates:
+        history.dates = history.dates
+    history._generation = generation  # pyright: ignore[reportPrivateUsage]
+    history._journaled = journaled.unwrap()  # pyright: ignore[reportPrivateUsage]
+    history._stamp = file_stamp(history_path, get_history_journal_path())  # pyright: ignore[reportPrivateUsage]
+
     return Result.ok(history)
@@ -10,13 +10,14 @@ from .history import History
 
 
 def match_date_index(history: History, date: str) -> Result[int]:
-    dates = all_dates(history, "")
-    if date not in dates:
+    num = history.calendar.position(date)
+    if num is None:
+        dates = all_dates(history, "")
         msg = f"{date} not in src: '{dates}'"
         eprint(msg)
         return Result.err(msg)
 
-    return Result.ok(dates.index(date) + 1)
+    return Result.ok(num)
 
 
 def match_info_by_date(history: History, class_date: str) -> Result[ClassFormInfo]:
@@ -28,13 +29,13 @@ def match_info_by_date(history: History, class_date: str) -> Result[ClassFormInf
     :return: (ClassFormInfo) - The Class Form that matches the given date.
     :rtype: ClassFormInfo
     """
-    matched_forms = [form for form in history.class_forms if form.date == class_date]
-    if len(matched_forms) == 0:
+    matched_form = history.index.form_for_date(class_date)
+    if matched_form is None:
         msg = f"No class form matches the specified date: {class_date}"
         eprint(msg)
         return Result.err(msg)
 
-    return Result.ok(matched_forms[0])
+    return Result.ok(matched_form)
 
 
 def get_available_class_forms(history: History) -> list[ClassFormInfo]:
@@ -45,7 +46,9 @@ def get_available_class_forms(history: History) -> list[ClassFormInfo]:
     :rtype: list[ClassFormInfo]
     """
     return [
-        form for form in history.class_forms if form not in history.recorded_class_forms
+        form
+        for form in history.class_forms
+        if not history.index.has_form("recorded_class_forms", form)
     ]
 
 
@@ -57,7 +60,9 @@ def get_available_cds_forms(history: History) -> list[CDSFormInfo]:
     :rtype: list[CDSFormInfo]
     """
     return [
-        form for form in history.cds_forms if form not in history.recorded_cds_forms
+        form
+        for form in history.cds_forms
+        if not history.index.has_form("recorded_cds_forms", form)
     ]
 
 
@@ -72,7 +77,7 @@ def get_available_update_forms(history: History) -> list[UpdateFormInfo]:
     return [
         form
         for form in history.update_forms
-        if form not in history.recorded_update_forms
+        if not history.index.has_form("recorded_update_forms", form)
     ]
 
 
@@ -84,20 +89,24 @@ def get_classes(
 ) -> list[str] | list[datetime]:
     if prop == "held":
         dates = history.held_classes
+        date_set = history.index.class_set("held_classes")
     else:
         dates = history.marked_classes
+        date_set = history.index.class_set("marked_classes")
 
     if isinstance(sample, datetime):
         if present:
             return dates
         else:
-            return [date for date in history.dates if date not in dates]
+            return [date for date in history.dates if date not in date_set]
     else:
         if present:
             return [date.strftime(DATE_FMT) for date in dates]
         else:
             return [
-                date.strftime(DATE_FMT) for date in history.dates if date not in dates
+                date.strftime(DATE_FMT)
+                for date in history.dates
+                if date not in date_set
             ]
 
 
@@ -1,125 +1,138 @@
 import json
+import os
+import uuid
 from pathlib import Path
+from typing import Any
 
-from ..constants import DATE_FMT, HISTORY_PATH
+from ..constants import DATE_FMT, HISTORY_COMPACT, HISTORY_PATH
 from ..errors import Result, Unit, eprint
-from ..paths import get_history_path, get_paths_json
-from .dates_with_history import all_dates
-from .history import History
+from ..paths import (
+    file_stamp,
+    get_history_journal_path,
+    get_history_path,
+    get_paths_json,
+)
+from .history import HISTORY_FIELDS, History
+
+
+def _encode_item(key: str, item: Any) -> Any:
+    """Encodes an item of a list attribute of the history as JSON."""
+    if key in ("dates", "held_classes", "marked_classes"):
+        # Dates are saved in the format specified by DATE_FMT
+        return item.strftime(DATE_FMT)
+    # ClassFormInfo, CDSFormInfo and UpdateFormInfo objects are saved as dictionaries
+    return item.model_dump(mode="json")
+
+
+def _encode_field(history: History, key: str) -> Any:
+    """Encodes a persisted attribute of the history as JSON."""
+    value = getattr(history, key)
+    match key:
+        case "cohort" | "weeks":
+            # Cohort number and number of weeks the course lasts
+            return value
+        case "class_days":
+            # List of 3 integers representing weekdays on which classes are held
+            return list(value)
+        case "orientation_date":
+            # Orientation date in the format specified by DATE_FMT or None
+            return value.strftime(DATE_FMT) if value is not None else None
+        case "interlude":
+            # Interlude if present
+            return value.to_dict() if value is not None else None
+        case "attendance" | "assessment" | "project" | "result" | "merit":
+            # List of boolean and file path
+            return [value[0], str(value[1])]
+        case _:
+            # Class dates, held and marked classes and forms
+            return [_encode_item(key, item) for item in value]
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    """Writes `data` to `path` through a temporary file, so the file is never left half written."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    with tmp.open("w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2)
+    os.replace(tmp, path)
+
+
+def compact_history(history: History) -> None:
+    """Writes a full snapshot of the history and discards its journal.
+
+    The snapshot gets a new generation, so journal entries of the previous snapshot are ignored on load even if removing the journal was interrupted.
+
+    :param history: (History) - The history to save.
+    :type history: History
+    :return: (None) - This function does not return anything.
+    :rtype: None
+    """
+    generation = uuid.uuid4().hex
+    data: dict[str, Any] = {key: _encode_field(history, key) for key in HISTORY_FIELDS}
+    data["generation"] = generation
+
+    # Save the history data to the JSON file
+    history_path: Path = get_history_path()
+    _write_json(history_path, data)
+
+    # Mirror it at the default location, unless that is the file just written
+    if HISTORY_PATH.resolve() != history_path.resolve():
+        _write_json(HISTORY_PATH, data)
+
+    get_history_journal_path().unlink(missing_ok=True)
+    history._generation = generation  # pyright: ignore[reportPrivateUsage]
+    history._journaled = 0  # pyright: ignore[reportPrivateUsage]
 
 
 def save_history(history: History) -> Result[Unit]:
-    """Saves the current history data to a JSON file.
+    """Saves the changes made to the history since it was loaded or last saved.
+
+    Each change is appended to the history journal as one JSON line: an assigned attribute is saved whole, and an item added to a list, such as a held class or a class form, is saved alone. Once the journal holds `HISTORY_COMPACT` entries it is compacted into a new snapshot. A history that was not loaded from a journaled snapshot is saved as a new snapshot.
 
     :return: (Result[Unit]) - a result object.
     :rtype: Result[Unit]
 
     """
-    data = {
-        # Cohort number
-        "cohort": history.cohort,
-        # List of 3 integers representing weekdays on which classes are held
-        "class_days": list(history.class_days),
-        # List of 3 integers representing weekdays on which classes are marked
-        "dates": [date.strftime(DATE_FMT) for date in history.dates],
-        # orientation date in the format specified by DATE_FMT or None
-        "orientation_date": history.orientation_date.strftime(DATE_FMT)
-        if history.orientation_date is not None
-        else None,
-        # Number of weeks the course lasts
-        "weeks": history.weeks,
-        # Interlude if present
-        "interlude": history.interlude.to_dict()
-        if history.interlude is not None
-        else None,
-        # List of classes for which attendance has been generated
-        "held_classes": [date.strftime(DATE_FMT) for date in history.held_classes],
-        # List of classes for which attendance has been marked
-        "marked_classes": [date.strftime(DATE_FMT) for date in history.marked_classes],
-        # List of dictionaries representing ClassFormInfo objects
-        "class_forms": [data.model_dump(mode="json") for data in history.class_forms],
-        # List of dictionaries representing ClassFormInfo objects for
-        # recorded classes
-        "recorded_class_forms": [
-            data.model_dump(mode="json") for data in history.recorded_class_forms
-        ],
-        # List of dictionaries representing CDSFormInfo objects
-        "cds_forms": [data.model_dump(mode="json") for data in history.cds_forms],
-        # List of dictionaries representing CDSFormInfo objects
-        # for recorded CDS forms
-        "recorded_cds_forms": [
-            data.model_dump(mode="json") for data in history.recorded_cds_forms
-        ],
-        # List of dictionaries representing UpdateFormInfo objects
-        "update_forms": [data.model_dump(mode="json") for data in history.update_forms],
-        # List of dictionaries representing UpdateFormInfo objects
-        # for recorded update forms
-        "recorded_update_forms": [
-            data.model_dump(mode="json") for data in history.recorded_update_forms
-        ],
-        "attendance": [
-            history.attendance[0],
-            str(history.attendance[1]),
-        ],  # List of boolean and file path
-        "assessment": [
-            history.assessment[0],
-            str(history.assessment[1]),
-        ],  # List of boolean and file path
-        "project": [
-            history.project[0],
-            str(history.project[1]),
-        ],  # List of boolean and file path
-        "result": [
-            history.result[0],
-            str(history.result[1]),
-        ],  # List of boolean and file path
-        "merit": [
-            history.merit[0],
-            str(history.merit[1]),
-        ],  # List of boolean and file path
-    }
+    changes = history.pop_changes()
+    generation: str | None = history._generation  # pyright: ignore[reportPrivateUsage]
 
-    # Save the history data to the JSON file
-    with get_history_path().open("w", encoding="utf-8") as file:
-        json.dump(data, file, indent=2)
+    compacted: bool = generation is None or not get_history_path().exists()
+    if compacted:
+        compact_history(history)
+    elif len(changes) > 0:
+        lines: list[str] = []
+        for op, key, item in changes:
+            value = _encode_field(history, key) if op == "set" else _encode_item(key, item)
+            entry = {"generation": generation, "op": op, "field": key, "value": value}
+            lines.append(json.dumps(entry) + "\n")
 
-    # Save the history data to the JSON file
-    with HISTORY_PATH.open("w") as file:
-        json.dump(data, file, indent=2)
+        # Append the changes to the journal, after ending a line left
+        # unterminated by an interrupted write
+        journal_path: Path = get_history_journal_path()
+        if journal_path.exists() and journal_path.stat().st_size > 0:
+            with journal_path.open("rb") as file:
+                _ = file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    lines.insert(0, "\n")
+        with journal_path.open("a", encoding="utf-8") as file:
+            file.writelines(lines)
+        history._journaled += len(changes)  # pyright: ignore[reportPrivateUsage]
+
+        if history._journaled >= HISTORY_COMPACT:  # pyright: ignore[reportPrivateUsage]
+            compact_history(history)
+            compacted = True
 
     # Save the dates to the JSON file (`Json/dates.json`)
     # if the dates have changed
-
-    # Get `Json/dates.json`
     dates_json_path: Path = get_paths_json()["Date"]
-
-    # Check if `Json/dates.json` exists
-    if not dates_json_path.exists():
-        # Create `Json/dates.json`, save the dates and return
-        with dates_json_path.open("w") as file:
-            json.dump(all_dates(history, ""), file, indent=2)
-        return Result.unit()
-
-    # Load the dates from the JSON file `Json/dates.json`
-    dates_json_list: list[str] = []
-    with dates_json_path.open("r") as file:
-        dates_data = json.load(file)
-        if not isinstance(dates_data, list):
-            msg = "dates_data is not a list"
+    dates_changed = any(key == "dates" for _, key, _ in changes)
+    if compacted or dates_changed or not dates_json_path.exists():
+        try:
+            with dates_json_path.open("w") as file:
+                json.dump(list(history.calendar.labels), file, indent=2)
+        except OSError as e:
+            msg = f"Failed to save the class dates: {e}"
             eprint(msg)
             return Result.err(msg)
-        if len(dates_data) != 0 and not all(
-            isinstance(value, str) for value in dates_data
-        ):
-            msg = "dates_data is not a list"
-            eprint(msg)
-            return Result.err(msg)
-
-        dates_json_list.extend(dates_data)
-
-    # Update the dates in the JSON file if they have changed
-    if dates_json_list != all_dates(history, ""):
-        with dates_json_path.open("w") as file:
-            json.dump(all_dates(history, ""), file, indent=2)
 
+    history._stamp = file_stamp(get_history_path(), get_history_journal_path())  # pyright: ignore[reportPrivateUsage]
     return Result.unit()
@@ -0,0 +1,166 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, final, override
+from unittest.mock import patch
+
+from ..constants import DATE_FMT, HISTORY_COMPACT, TIMESTAMP_FMT
+from ..models import ClassFormInfo
+from .classes import sync_classes
+from .history import History
+from .new import load_history
+from . import save
+from .save import save_history
+from .update import add_class_form, add_held_class
+
+
+def _form(day: str) -> ClassFormInfo:
+    fields = {
+        name: f"{name}-{day}"
+        for name in ClassFormInfo.model_fields
+        if name not in ("date", "timestamp")
+    }
+    return ClassFormInfo(
+        date=day, timestamp=datetime.now().strftime(TIMESTAMP_FMT), **fields
+    )
+
+
+@final
+class SaveHistoryTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        self.snapshot: Path = root / "history.json"  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.journal: Path = root / "history.journal.jsonl"  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.dates: Path = root / "dates.json"  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.mirror: Path = root / "default-history.json"  # pyright: ignore[reportUninitializedInstanceVariable]
+        patches: list[Any] = [
+            patch("pylms.history.save.get_history_path", return_value=self.snapshot),
+            patch("pylms.history.new.get_history_path", return_value=self.snapshot),
+            patch("pylms.history.save.get_history_journal_path", return_value=self.journal),
+            patch("pylms.history.new.get_history_journal_path", return_value=self.journal),
+            patch("pylms.history.save.get_paths_json", return_value={"Date": self.dates}),
+            patch("pylms.history.save.HISTORY_PATH", self.mirror),
+        ]
+        for p in patches:
+            _ = p.start()
+            self.addCleanup(p.stop)
+
+    def _new_history(self) -> History:
+        history = History()
+        history.cohort = 31
+        history.class_days = [1, 3, 5]
+        history.orientation_date = datetime(2025, 6, 9)
+        _ = sync_classes(history).unwrap()
+        return history
+
+    def _lines(self) -> list[dict[str, Any]]:
+        if not self.journal.exists():
+            return []
+        return [json.loads(line) for line in self.journal.read_text().splitlines()]
+
+    def test_changes_are_journaled_and_replayed(self) -> None:
+        history = self._new_history()
+        _ = save_history(history).unwrap()
+        self.assertTrue(self.snapshot.exists())
+        self.assertEqual(self._lines(), [])
+        self.assertEqual(json.loads(self.dates.read_text())[0], history.dates[0].strftime(DATE_FMT))
+
+        history = load_history().unwrap()
+        snapshot = self.snapshot.read_text()
+        _ = add_held_class(history, 1).unwrap()
+        add_class_form(history, _form(history.dates[0].strftime(DATE_FMT)))
+        history.weeks = 6
+        _ = sync_classes(history).unwrap()
+        _ = save_history(history).unwrap()
+
+        # Only the changes were written, the snapshot is untouched
+        self.assertEqual(self.snapshot.read_text(), snapshot)
+        self.assertEqual(
+            [(line["op"], line["field"]) for line in self._lines()],
+            [
+                ("add", "held_classes"),
+                ("add", "class_forms"),
+                ("set", "weeks"),
+                ("set", "dates"),
+            ],
+        )
+
+        loaded = load_history().unwrap()
+        self.assertEqual(loaded.held_classes, history.held_classes)
+        self.assertEqual(loaded.class_forms, history.class_forms)
+        self.assertEqual(loaded.weeks, 6)
+        self.assertEqual(len(loaded.dates), 18)
+
+        # Saving an unchanged history writes nothing
+        _ = save_history(loaded).unwrap()
+        self.assertEqual(len(self._lines()), 4)
+        self.assertEqual(len(json.loads(self.dates.read_text())), 18)
+
+    def test_set_covers_earlier_adds(self) -> None:
+        _ = save_history(self._new_history()).unwrap()
+        history = load_history().unwrap()
+        _ = add_held_class(history, 1).unwrap()
+        history.held_classes = []
+        _ = add_held_class(history, 2).unwrap()
+        _ = save_history(history).unwrap()
+
+        self.assertEqual(
+            [(line["op"], line["field"]) for line in self._lines()],
+            [("set", "held_classes")],
+        )
+        self.assertEqual(load_history().unwrap().held_classes, [history.dates[1]])
+
+    def test_compacts_into_snapshot(self) -> None:
+        _ = save_history(self._new_history()).unwrap()
+        history = load_history().unwrap()
+        for num in range(1, HISTORY_COMPACT + 1):
+            day = datetime(2025, 6, 9) + timedelta(days=num)
+            add_class_form(history, _form(day.strftime(DATE_FMT)))
+            _ = save_history(history).unwrap()
+
+        # The journal was folded into the snapshot
+        self.assertFalse(self.journal.exists())
+        loaded = load_history().unwrap()
+        self.assertEqual(len(loaded.class_forms), HISTORY_COMPACT)
+        self.assertEqual(loaded.class_forms, history.class_forms)
+
+    def test_snapshot_is_mirrored_atomically(self) -> None:
+        write_json = patch("pylms.history.save._write_json", wraps=save._write_json)  # pyright: ignore[reportPrivateUsage]
+        with write_json as written:
+            _ = save_history(self._new_history()).unwrap()
+        self.assertEqual([call.args[0] for call in written.call_args_list], [self.snapshot, self.mirror])
+        self.assertEqual(json.loads(self.mirror.read_text()), json.loads(self.snapshot.read_text()))
+
+        # The default location is the data directory's own history file
+        with patch("pylms.history.save.HISTORY_PATH", self.snapshot), write_json as written:
+            _ = save_history(self._new_history()).unwrap()
+        self.assertEqual([call.args[0] for call in written.call_args_list], [self.snapshot])
+
+    def test_ignores_stale_and_torn_entries(self) -> None:
+        _ = save_history(self._new_history()).unwrap()
+        history = load_history().unwrap()
+        _ = add_held_class(history, 1).unwrap()
+        _ = save_history(history).unwrap()
+
+        with self.journal.open("a") as file:
+            # An entry of an older snapshot and a write cut short
+            _ = file.write(json.dumps({"generation": "old", "op": "set", "field": "weeks", "value": 9}) + "\n")
+            _ = file.write('{"generation": "')
+
+        loaded = load_history().unwrap()
+        self.assertEqual(loaded.weeks, 5)
+        self.assertEqual(loaded.held_classes, [history.dates[0]])
+
+        # Changes saved after the torn write are still replayed
+        _ = add_held_class(loaded, 2).unwrap()
+        _ = save_history(loaded).unwrap()
+        self.assertEqual(load_history().unwrap().held_classes, history.dates[0:2])
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -1,10 +1,9 @@
 from datetime import datetime
 from typing import Literal, overload
 
-from ..date import parse_dates
+from ..constants import DATE_FMT
 from ..errors import Result, Unit, eprint
 from ..models import CDSFormInfo, ClassFormInfo, UpdateFormInfo, sort_form
-from .dates_with_history import all_dates
 from .history import History
 
 
@@ -70,33 +69,31 @@ def add_prop_class(
             class_num: int = class_id
 
     else:
-        if class_id not in all_dates(history, ""):
+        num = history.calendar.position(class_id)
+        if num is None:
             msg = f"Class Date: {class_id} is not part of the valid dates list for this program."
             eprint(msg)
             return Result.err(msg)
         else:
-            class_num = all_dates(history, "").index(class_id) + 1
+            class_num = num
 
     # Get the date corresponding to the class number and add it to held classes
     target_date: datetime = history.dates[class_num - 1]
-    target_date_str: str = all_dates(history, "")[class_num - 1]
+    target_date_str: str = target_date.strftime(DATE_FMT)
 
     if prop == "held":
         history.held_classes.append(target_date)
         history.held_classes.sort()
+        history.mark_added("held_classes", target_date)
     else:
-        held_classes = parse_dates(history.held_classes)
-        if held_classes.is_err():
-            return held_classes.propagate()
-        held_classes = held_classes.unwrap()
-
-        if target_date_str not in held_classes:
+        if target_date not in history.index.class_set("held_classes"):
             msg = f"Specified class date: {target_date_str} has not been held yet and cannot be marked if not held."
             eprint(msg)
             return Result.err(msg)
 
         history.marked_classes.append(target_date)
         history.marked_classes.sort()
+        history.mark_added("marked_classes", target_date)
 
     return Result.unit()
 
@@ -112,6 +109,7 @@ def add_cds_form(history: History, form: CDSFormInfo) -> None:
     """
     history.cds_forms.append(form)
     history.cds_forms.sort(key=sort_form)
+    history.mark_added("cds_forms", form)
 
 
 def add_recorded_cds_form(history: History, form: CDSFormInfo) -> None:
@@ -125,6 +123,7 @@ def add_recorded_cds_form(history: History, form: CDSFormInfo) -> None:
     """
     history.recorded_cds_forms.append(form)
     history.recorded_cds_forms.sort(key=sort_form)
+    history.mark_added("recorded_cds_forms", form)
 
 
 def add_update_form(history: History, form: UpdateFormInfo) -> None:
@@ -138,6 +137,7 @@ def add_update_form(history: History, form: UpdateFormInfo) -> None:
     """
     history.update_forms.append(form)
     history.update_forms.sort(key=sort_form)
+    history.mark_added("update_forms", form)
 
 
 def add_recorded_update_form(history: History, form: UpdateFormInfo) -> None:
@@ -151,6 +151,7 @@ def add_recorded_update_form(history: History, form: UpdateFormInfo) -> None:
     """
     history.recorded_update_forms.append(form)
     history.recorded_update_forms.sort(key=sort_form)
+    history.mark_added("recorded_update_forms", form)
 
 
 def add_class_form(history: History, form: ClassFormInfo) -> None:
@@ -164,6 +165,7 @@ def add_class_form(history: History, form: ClassFormInfo) -> None:
     """
     history.class_forms.append(form)
     history.class_forms.sort(key=sort_form)
+    history.mark_added("class_forms", form)
 
 
 def add_recorded_class_form(history: History, form: ClassFormInfo) -> None:
@@ -177,3 +179,4 @@ def add_recorded_class_form(history: History, form: ClassFormInfo) -> None:
     """
     history.recorded_class_forms.append(form)
     history.recorded_class_forms.sort(key=sort_form)
+    history.mark_added("recorded_class_forms", form)
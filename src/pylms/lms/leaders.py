@@ -1,12 +1,12 @@
 import random
-import re
 from pathlib import Path
 from typing import Literal, NamedTuple
 
+import numpy as np
 import pandas as pd
 
 from ..constants import GENDER, GROUP, NAME, SERIAL
-from ..data import DataStore, DataStream, read
+from ..data import DataStore, DataStream, count_statuses, read
 from ..errors import Result, Unit, eprint
 from ..history import History, get_num_groups
 from ..paths import (
@@ -16,6 +16,7 @@ from ..paths import (
     get_group_path,
     get_leader_path,
 )
+from ..record import RecordStatus
 
 
 class Nominations(NamedTuple):
@@ -30,14 +31,13 @@ class LeaderMap(NamedTuple):
     assistants: list[int]
 
 
+def count_present(ds: DataStore) -> np.ndarray:
+    # number of classes each student was present for, in DataStore order
+    return count_statuses(ds, [RecordStatus.PRESENT])
+
+
 def get_present_count(ds: DataStore, serial: int) -> int:
-    data: pd.DataFrame = ds.as_ref()
-    columns: list[str] = data.columns.tolist()
-    date_columns: list[str] = [
-        col for col in columns if re.match(r"\d{2}/\d{2}/\d{4}", col) is not None
-    ]
-    data_row = data.loc[:, date_columns].iloc[serial - 1].astype(str)
-    return sum(1 for entry in data_row if entry.lower() == "present")
+    return int(count_present(ds)[serial - 1])
 
 
 def get_nominations(
@@ -52,8 +52,10 @@ def get_nominations(
         if gender == gender_type
     ]
 
+    # count once for the whole DataStore rather than once per serial
+    all_counts = count_present(ds)
     present_counts: list[int] = [
-        get_present_count(ds, serial) for _, serial in gender_serials
+        int(all_counts[serial - 1]) for _, serial in gender_serials
     ]
 
     max_count: int = max(present_counts)
@@ -108,6 +110,7 @@ def select_leaders(ds: DataStore, history: History) -> Result[Unit]:
     leader_names: list[str] = []
     assistant_names: list[str] = []
     leader_groups: list[int] = []
+    all_counts = count_present(ds)
 
     for group in range(1, groups + 1):
         group_path: Path = get_group_path(group)
@@ -140,7 +143,7 @@ def select_leaders(ds: DataStore, history: History) -> Result[Unit]:
             group_data.loc[group_data[SERIAL] == leader, NAME].astype(str).iloc[0]
         )
         present_counts: list[int] = [
-            get_present_count(ds, serial) for serial in serials
+            int(all_counts[serial - 1]) for serial in serials
         ]
         assistant_name: str = (
             group_data.loc[group_data[SERIAL] == assistant, NAME].astype(str).iloc[0]
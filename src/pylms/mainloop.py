@@ -1,12 +1,12 @@
 import traceback
 from typing import Callable
 
+from .app_session import get_app_session
 from .cache import cache_for_cmd
 from .cli import input_bool, interact
 from .config import Config
-from .data_service import load, view
+from .data_service import export_ds, view
 from .errors import LMSError, Result, eprint
-from .history import load_history
 from .info import print_info
 from .result_utils import view_result
 from .routines import (
@@ -24,9 +24,12 @@ def handle_err(func: Callable[[], Result[bool]]) -> bool | None:
     try:
         result = func()
         if result.is_err():
+            # Reload on the next pass rather than keep what the failed pass changed
+            get_app_session().clear()
             return None
         return result.unwrap()
     except LMSError as e:
+        get_app_session().clear()
         result = input_bool(prompt="Do you wish to view error trace")
         if result.is_err():
             return None
@@ -50,15 +53,12 @@ def mainloop(config: Config) -> Result[bool]:
         "Quit",
     ]
 
-    history = load_history()
-    if history.is_err():
-        return history.propagate()
-    history = history.unwrap()
-
-    ds = load()
-    if ds.is_err():
-        return ds.propagate()
-    ds = ds.unwrap()
+    # Reuse the DataStore and History of the previous pass unless their files changed
+    session = get_app_session()
+    state = session.state()
+    if state.is_err():
+        return state.propagate()
+    ds, history = state.unwrap()
 
     selection = interact(menu)
 
@@ -91,10 +91,18 @@ def mainloop(config: Config) -> Result[bool]:
         case 7:
             handle_message(ds, history)
         case _:
+            # Refresh the Excel export of the DataStore before leaving
+            result = export_ds(ds)
+            if result.is_err():
+                return result.propagate()
             print_info(
                 "Hello friend, Jayce 🎓 again, I hope I have helped you a lot today. See you again next time!"
             )
             return Result.ok(False)
+
+    # A failed action leaves its changes unsaved; drop them so the next pass reloads from disk
+    if session.discard_unsaved():
+        print_info("Changes left by the failed operation were discarded.")
     return Result.ok(True)
 
 
@@ -107,17 +115,12 @@ def closed_loop(config: Config) -> Result[bool]:
         "Quit",
     ]
 
-    history = load_history()
-    if history.is_err():
-        return history.propagate()
-
-    history = history.unwrap()
-
-    ds = load()
-    if ds.is_err():
-        return ds.propagate()
-
-    ds = ds.unwrap()
+    # Reuse the DataStore and History of the previous pass unless their files changed
+    session = get_app_session()
+    state = session.state()
+    if state.is_err():
+        return state.propagate()
+    ds, history = state.unwrap()
 
     selection = interact(menu)
 
@@ -128,30 +131,27 @@ def closed_loop(config: Config) -> Result[bool]:
 
     match int(selection):
         case 1:
-            app_ds = load()
-            if app_ds.is_err():
-                return app_ds.propagate()
-            app_ds = app_ds.unwrap()
-
-            result = view(app_ds)
+            result = view(ds)
             if result.is_err():
                 return result.propagate()
         case 2:
-            app_ds = load()
-
-            if app_ds.is_err():
-                return app_ds.propagate()
-            app_ds = app_ds.unwrap()
-
-            result = view_result(app_ds)
+            result = view_result(ds)
             if result.is_err():
                 return result.propagate()
 
         case 3:
             handle_cohort(config, ds, history)
         case _:
+            # Refresh the Excel export of the DataStore before leaving
+            result = export_ds(ds)
+            if result.is_err():
+                return result.propagate()
             print_info(
                 "Hello friend, Jayce 🎓 again, I hope I have helped you a lot today. See you again next time!"
             )
             return Result.ok(False)
+
+    # A failed action leaves its changes unsaved; drop them so the next pass reloads from disk
+    if session.discard_unsaved():
+        print_info("Changes left by the failed operation were discarded.")
     return Result.ok(True)
@@ -1,108 +1,65 @@
-from email.message import EmailMessage
-from smtplib import SMTP
+from collections.abc import Iterator
 
-from ..constants import COMMA_DELIM, EMAIL, GENDER, NAME, SPACE_DELIM
+from ..cli import input_bool
 from ..data import DataStore
-from ..email import MailError, run_email
-from ..errors import Result, Unit
+from ..email import Delivery, Outbox, campaign_id, send_campaign
+from ..errors import LMSError, Result, Unit
 from ..history import History
-from ..paths import must_get_env
+from ..paths import get_outbox_path, must_get_env
 from .all_msg_builders import (
     build_assessment_all_msg,
     build_custom_all_msg,
 )
 from .message_record import MessageRecord
+from .template import (
+    MessageTemplate,
+    compile_message,
+    iter_recipients,
+    render_messages,
+)
 from .utils import MessageBuilder, TextBody
 
 
-def _construct_html_message(
-    *, title: str, designation: str, name: str, body: str
-) -> str:
-    return f"""
-<h2 style="padding-bottom: 4px; font-size: 18px; font-weight: bold">
-    Dear {designation}{name}
-</h2>
-<br>
-<p style="text-transform: uppercase; padding-bottom: 4px; font-weight: bold; text-align: center;">{title}</p>
-{"\n".join([f"<p style='padding-bottom: 1px'>{line}</p>" for line in body.split("\n")])}
-<br>
-<footer style="padding: 4px">
-    <p style="font-weight: bold">Best Regards</p>
-    <p style="font-weight: bold; font-style: italic">Jason, Joseph</p>
-</footer>
-        """
-
-
 def _build_all_message(
-    ds: DataStore, builder: MessageBuilder
-) -> Result[list[MessageRecord]]:
+    ds: DataStore, builder: MessageBuilder, sender: str
+) -> Result[tuple[MessageTemplate, Iterator[MessageRecord]]]:
     """
     Build personalized email messages for each student in the DataStore.
 
+    The title and body are compiled into a template once. The messages are rendered lazily,
+    one per student as they are sent, so a large cohort is never held in memory all at once.
+
     :param ds: (DataStore) - A DataStore object containing student data.
     :type ds: DataStore
 
     :param builder: (MessageBuilder) - A builder to return the text body to be used in the email message.
     :type body: MessageBuilder
 
-    :return: (Result[list[MessageRecord]]) - A Result object containing a list of MessageRecord objects representing the personalized email messages.
-    :rtype: Result[list[MessageRecord]]
-    """
-    # Get the number of rows (students) in the DataStore
-    nrows: int = ds.as_ref().shape[0]
-
-    # Initialize a list to collect any mail errors
-    messages: list[MessageRecord] = []
-
-    # Retrieve sender email from environment variables
-    sender: str = must_get_env("EMAIL")
+    :param sender: (str) - The sender's email address.
+    :type sender: str
 
+    :return: (Result[tuple[MessageTemplate, Iterator[MessageRecord]]]) - A Result object containing the compiled template and an iterator over the personalized email messages.
+    :rtype: Result[tuple[MessageTemplate, Iterator[MessageRecord]]]
+    """
     result: Result[TextBody] = builder()
     if result.is_err():
         return result.propagate()
 
     title, body = result.unwrap()
-
-    # Iterate over each student to send personalized email
-    for i in range(nrows):
-        # Determine designation based on gender
-        gender: str = ds.as_ref()[GENDER].astype(str).iloc[i]
-        designation: str = (
-            "Mr. "
-            if gender.startswith("M")
-            else "Ms. "
-            if gender.startswith("F")
-            else ""
-        )
-
-        # Retrieve student name and email
-        name: str = (
-            ds.as_ref()[NAME].astype(str).iloc[i].replace(COMMA_DELIM, SPACE_DELIM)
-        )
-        email: str = ds.as_ref()[EMAIL].astype(str).iloc[i]
-
-        # Create an EmailMessage object and set its subject
-        message: EmailMessage = EmailMessage()
-        message["Subject"] = title
-        message["From"] = sender
-
-        # construct the html email message from its parameters
-        html_body = _construct_html_message(
-            title=title, designation=designation, name=name, body=body
-        )
-        message.set_content(html_body, subtype="html")
-        messages.append(MessageRecord(name=name, email=email, message=message))
-    return Result.ok(messages)
+    template: MessageTemplate = compile_message(title, body)
+    return Result.ok((template, render_messages(template, iter_recipients(ds), sender)))
 
 
-def _message_all_emails(
-    server: SMTP, ds: DataStore, builder: MessageBuilder
-) -> Result[Unit]:
+def _message_all_emails(ds: DataStore, builder: MessageBuilder) -> Result[Unit]:
     """
-    Send personalized emails to all students using the provided SMTP server.
+    Send personalized emails to all students concurrently over a pool of SMTP connections.
 
-    :param server: (SMTP) - An SMTP server instance used to send emails.
-    :type server: SMTP
+    Messages go through the on-disk outbox, so students who already received this message
+    in an earlier, interrupted or partly failed run are skipped. When every student already
+    received it, the user is asked whether to send it to all of them again.
+
+    :param ds: (DataStore) - A DataStore object containing student data.
+    :type ds: DataStore
 
     :param builder: (MessageBuilder) - A callable that returns a result
                     object containing the email title and body.
@@ -113,62 +70,61 @@ def _message_all_emails(
     :rtype: Result[Unit]
     """
 
-    # Initialize a list to collect any mail errors
-    errors: list[MailError] = []
-
     # Retrieve sender email from environment variables
     sender: str = must_get_env("EMAIL")
 
-    # Call the builder function to get the list of messages to send
-    result: Result[list[MessageRecord]] = _build_all_message(ds, builder)
+    # Call the builder function to get the messages to send
+    result: Result[tuple[MessageTemplate, Iterator[MessageRecord]]] = (
+        _build_all_message(ds, builder, sender)
+    )
     if result.is_err():
         # Return error result if builder failed
         return result.propagate()
 
-    # Unwrap the result to get the list of MessageRecord objects
-    messages: list[MessageRecord] = result.unwrap()
-
-    # Iterate over each message and send it
-    for i, message in enumerate(messages):
-        name: str | None = message.name
-        content: EmailMessage = message.message
-        email: str = message.email
-        try:
-            # Attempt to send the email via the SMTP server
-            err: MailError = server.send_message(
-                content, from_addr=sender, to_addrs=email
+    template, messages = result.unwrap()
+
+    if ds.as_ref().shape[0] == 0:
+        return Result.unit()
+
+    # Send every message not yet delivered for this subject through the outbox
+    # and collect the outcome for each recipient
+    campaign: str = campaign_id("all", template.subject)
+    with Outbox(get_outbox_path()) as outbox:
+        if outbox.finished(campaign):
+            resend: Result[bool] = input_bool(
+                f"A message titled '{template.subject}' was already sent to every student. Send it again?"
             )
-            # Check if there were any errors sending to this email
-            if err != {}:
-                # Append any errors to the errors list
-                errors.append({f"{i + 1}": (1, bytes(str(err), "utf-8"))})
-                continue
+            if resend.is_err():
+                return resend.propagate()
+            if resend.unwrap():
+                outbox.requeue(campaign)
+        deliveries: list[Delivery] = send_campaign(
+            campaign, messages, sender, outbox=outbox
+        )
+    for delivery in deliveries:
+        if delivery.ok:
+            name = delivery.name
             print(
-                f"\nMail sent successfully to {f'{name} with ' if name is not None else ''}{email}\n"
+                f"\nMail sent successfully to {f'{name} with ' if name is not None else ''}{delivery.email}\n"
             )
-        except Exception as e:
-            # Catch any exceptions during sending and record the error
-            errors.append({f"{i + 1}": (1, bytes(str(e), "utf-8"))})
-            continue
 
     # If there were any errors, print detailed error messages
-    if len(errors) > 0:
-        for err in errors:
-            for index in err:
-                # Extract the name, and email for which sending failed
-                i = int(index)
-                err_name: str | None = messages[i - 1].name
-                err_email: str = messages[i - 1].email
-                # Craft a detailed error message
-                if err_name is None:
-                    err_print: str = f"{i}. Failed to send email to {err_email}"
-                else:
-                    err_print = f"{i}. Failed to send email to {err_name} with email: {err_email}"
-                # Print the error message with recipient name and email address
-                print(err_print)
-            print()
+    failed: list[Delivery] = [delivery for delivery in deliveries if not delivery.ok]
+    if len(failed) > 0:
+        for delivery in failed:
+            i = delivery.index + 1
+            # Craft a detailed error message
+            if delivery.name is None:
+                err_print: str = f"{i}. Failed to send email to {delivery.email}"
+            else:
+                err_print = f"{i}. Failed to send email to {delivery.name} with email: {delivery.email}"
+            # Print the error message with recipient name, email address and the cause
+            print(f"{err_print}. Error: {delivery.error}")
+        print()
         # Return an error result if there were failures
-        return result.propagate()
+        return Result.err(
+            LMSError(f"Failed to send emails to {len(failed)} recipients.")
+        )
 
     # Return a success result if all emails were sent
     return Result.unit()
@@ -179,10 +135,10 @@ def custom_message_all(ds: DataStore) -> Result[Unit]:
     Send a message to all email addresses stored in the provided DataStore.
 
     This function initiates the process of sending a message to all recipients listed in the DataStore.
-    It delegates the actual email sending to a helper function, which is executed within
-    a managed SMTP session provided by `run_email`. The function ensures that the SMTP connection is
-    properly established and closed, and that any errors encountered during the email sending process
-    are captured and returned as part of the Result object.
+    It delegates the actual email sending to a helper function, which sends the messages concurrently
+    over a pool of SMTP connections managed by `email.deliver`. The connections are established and
+    closed by the pool, and any errors encountered during the email sending process are captured and
+    returned as part of the Result object.
 
     :param ds: (DataStore) - The data source containing recipient information
     (must include columns for gender, name, and email).
@@ -193,20 +149,12 @@ def custom_message_all(ds: DataStore) -> Result[Unit]:
     :rtype: Result[Unit]
     """
 
-    # Use run_email to establish SMTP connection and execute the email sending routine
-    return run_email(
-        lambda service: _message_all_emails(
-            service,
-            ds,
-            build_custom_all_msg,
-        )
-    )
+    # Send the message over a pool of SMTP connections
+    return _message_all_emails(ds, build_custom_all_msg)
 
 
 def assessment_message_all(ds: DataStore, history: History) -> Result[Unit]:
     def _builder_intermediary() -> Result[TextBody]:
         return build_assessment_all_msg(history)
 
-    return run_email(
-        lambda service: _message_all_emails(service, ds, _builder_intermediary)
-    )
+    return _message_all_emails(ds, _builder_intermediary)
@@ -0,0 +1,156 @@
+from collections.abc import Iterator
+from email.message import EmailMessage
+from string import Formatter
+from typing import NamedTuple, final
+
+import numpy as np
+import pandas as pd
+
+from ..constants import COMMA_DELIM, EMAIL, GENDER, NAME, SPACE_DELIM
+from ..data import DataStore
+from .message_record import MessageRecord
+
+
+@final
+class Template:
+    """
+    A text template parsed once into literal chunks and the fields between them.
+
+    The source uses `str.format` fields, e.g. ``"Dear {name}"``. Fields given as keyword arguments when compiling are filled in once; the remaining fields are filled by `render` for every recipient, which only joins strings.
+
+    :ivar fields: (tuple[str, ...]) - The fields `render` expects, in order of appearance.
+    """
+
+    def __init__(self, source: str, **static: str) -> None:
+        chunks: list[str] = [""]
+        fields: list[str] = []
+        for literal, field, _, _ in Formatter().parse(source):
+            chunks[-1] += literal
+            if field is None:
+                continue
+            if field in static:
+                chunks[-1] += static[field]
+            else:
+                fields.append(field)
+                chunks.append("")
+        self._chunks: tuple[str, ...] = tuple(chunks)
+        self.fields: tuple[str, ...] = tuple(fields)
+
+    def render(self, **values: str) -> str:
+        """
+        :param values: (str) - A value for each field in `fields`.
+        :type values: str
+
+        :return: (str) - The rendered text.
+        :rtype: str
+        """
+        parts: list[str] = [self._chunks[0]]
+        for field, chunk in zip(self.fields, self._chunks[1:]):
+            parts.append(values[field])
+            parts.append(chunk)
+        return "".join(parts)
+
+
+_HTML_MESSAGE: str = """
+<h2 style="padding-bottom: 4px; font-size: 18px; font-weight: bold">
+    Dear {designation}{name}
+</h2>
+<br>
+<p style="text-transform: uppercase; padding-bottom: 4px; font-weight: bold; text-align: center;">{title}</p>
+{body}
+<br>
+<footer style="padding: 4px">
+    <p style="font-weight: bold">Best Regards</p>
+    <p style="font-weight: bold; font-style: italic">Jason, Joseph</p>
+</footer>
+        """
+
+
+class MessageTemplate(NamedTuple):
+    """
+    A compiled email addressed to each recipient by designation and name.
+
+    :ivar subject: (str) - The subject of every message.
+    :ivar html: (Template) - The HTML body with the `designation` and `name` fields.
+    """
+
+    subject: str
+    html: Template
+
+
+def compile_message(title: str, body: str) -> MessageTemplate:
+    """
+    Compile the title and body of a message sent to all students. The body is split into paragraphs once for all recipients.
+
+    :param title: (str) - The title, used as the subject and heading.
+    :type title: str
+    :param body: (str) - The body; each line becomes a paragraph.
+    :type body: str
+
+    :return: (MessageTemplate) - The compiled message.
+    :rtype: MessageTemplate
+    """
+    paragraphs = "\n".join(
+        [f"<p style='padding-bottom: 1px'>{line}</p>" for line in body.split("\n")]
+    )
+    return MessageTemplate(title, Template(_HTML_MESSAGE, title=title, body=paragraphs))
+
+
+class Recipient(NamedTuple):
+    """
+    :ivar designation: (str) - "Mr. ", "Ms. " or "" from the recipient's gender.
+    :ivar name: (str) - The display name.
+    :ivar email: (str) - The email address.
+    """
+
+    designation: str
+    name: str
+    email: str
+
+
+def iter_recipients(ds: DataStore) -> Iterator[Recipient]:
+    """
+    Extract the designation, display name and email of every student, one column at a time.
+
+    :param ds: (DataStore) - A DataStore object containing student data.
+    :type ds: DataStore
+
+    :return: (Iterator[Recipient]) - The recipients in DataStore order.
+    :rtype: Iterator[Recipient]
+    """
+    data: pd.DataFrame = ds.as_ref()
+    genders: pd.Series = data[GENDER].astype(str)
+    designations = np.select(
+        [genders.str.startswith("M"), genders.str.startswith("F")],
+        ["Mr. ", "Ms. "],
+        default="",
+    ).tolist()
+    names = data[NAME].astype(str).str.replace(COMMA_DELIM, SPACE_DELIM).tolist()
+    emails = data[EMAIL].astype(str).tolist()
+    for designation, name, email in zip(designations, names, emails):
+        yield Recipient(designation, name, email)
+
+
+def render_messages(
+    template: MessageTemplate, recipients: Iterator[Recipient], sender: str
+) -> Iterator[MessageRecord]:
+    """
+    Render a message for each recipient lazily, so only the message being sent is held in memory.
+
+    :param template: (MessageTemplate) - The compiled message.
+    :type template: MessageTemplate
+    :param recipients: (Iterator[Recipient]) - The recipients.
+    :type recipients: Iterator[Recipient]
+    :param sender: (str) - The sender's email address.
+    :type sender: str
+
+    :return: (Iterator[MessageRecord]) - The rendered messages.
+    :rtype: Iterator[MessageRecord]
+    """
+    for recipient in recipients:
+        message: EmailMessage = EmailMessage()
+        message["Subject"] = template.subject
+        message["From"] = sender
+        html = template.html.render(designation=recipient.designation, name=recipient.name)
+        message.set_content(html, subtype="html")
+        yield MessageRecord(name=recipient.name, email=recipient.email, message=message)
@@ -0,0 +1,86 @@
+import tracemalloc
+import unittest
+from collections.abc import Iterator
+from typing import final
+
+from .template import (
+    Recipient,
+    Template,
+    compile_message,
+    render_messages,
+)
+
+SENDER = "lms@example.com"
+TITLE = "Assessment Schedule"
+BODY = "The assessment holds on Friday.\nBring your laptops.\nBe punctual."
+
+
+def _reference_html(*, title: str, designation: str, name: str, body: str) -> str:
+    """The message as it was built with an f-string for every recipient."""
+    return f"""
+<h2 style="padding-bottom: 4px; font-size: 18px; font-weight: bold">
+    Dear {designation}{name}
+</h2>
+<br>
+<p style="text-transform: uppercase; padding-bottom: 4px; font-weight: bold; text-align: center;">{title}</p>
+{"\n".join([f"<p style='padding-bottom: 1px'>{line}</p>" for line in body.split("\n")])}
+<br>
+<footer style="padding: 4px">
+    <p style="font-weight: bold">Best Regards</p>
+    <p style="font-weight: bold; font-style: italic">Jason, Joseph</p>
+</footer>
+        """
+
+
+def _recipients(count: int) -> Iterator[Recipient]:
+    designations = ["Mr. ", "Ms. ", ""]
+    for i in range(count):
+        yield Recipient(designations[i % 3], f"Student {{{i}}}", f"student{i}@example.com")
+
+
+@final
+class TemplateTest(unittest.TestCase):
+    def test_static_fields_are_filled_at_compile_time(self) -> None:
+        template = Template("{greeting}, {name}. {closing}", greeting="Hello", closing="Bye")
+        self.assertEqual(template.fields, ("name",))
+        self.assertEqual(template.render(name="Ada"), "Hello, Ada. Bye")
+
+    def test_matches_reference_html(self) -> None:
+        template = compile_message(TITLE, BODY)
+        recipients = list(_recipients(3))
+        records = list(render_messages(template, iter(recipients), SENDER))
+
+        self.assertEqual(template.subject, TITLE)
+        for recipient, record in zip(recipients, records):
+            self.assertEqual(record.email, recipient.email)
+            self.assertEqual(record.message["Subject"], TITLE)
+            self.assertEqual(record.message["From"], SENDER)
+            expected = _reference_html(
+                title=TITLE,
+                designation=recipient.designation,
+                name=recipient.name,
+                body=BODY,
+            )
+            self.assertEqual(record.message.get_content(), expected + "\n")
+
+    def test_rendering_is_lazy(self) -> None:
+        template = compile_message(TITLE, BODY)
+        count = 100
+
+        tracemalloc.start()
+        for _ in render_messages(template, _recipients(count), SENDER):
+            pass
+        _, streamed = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        materialized = list(render_messages(template, _recipients(count), SENDER))
+        _, held = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertEqual(len(materialized), count)
+        self.assertLess(streamed * 3, held)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -5,6 +5,7 @@ from .awardees_path import (
 )
 from .cache_path import get_metadata_path, get_snapshot_path
 from .cds_form_path import get_cds_path
+from .datastore_path import get_datastore_path
 from .env import must_get_env
 from .global_record_path import get_global_record_path
 from .grade_path import (
@@ -17,7 +18,7 @@ from .group_data_path import (
     get_group_path,
 )
 from .half_cohort_path import get_cohort_path
-from .history_path import get_history_path
+from .history_path import get_history_journal_path, get_history_path
 from .leader_path import (
     get_criterion_path,
     get_group_criterion_path,
@@ -33,8 +34,12 @@ from .path_fns import (
     get_paths_json,
     get_paths_weeks,
 )
+from .outbox_path import get_outbox_path
 from .prepare import prepare_paths
+from .registry import PathRegistry, RegistryStats, get_registry
+from .responses_path import get_responses_dir, get_responses_path
 from .rm import rm_path
+from .stamp import FileStamp, file_stamp
 from .update_form_path import (
     get_update_path,
     last_update_path,
@@ -54,6 +59,7 @@ __all__ = [
     "get_snapshot_path",
     "get_criterion_path",
     "get_cds_path",
+    "get_datastore_path",
     "get_update_path",
     "get_fast_track_path",
     "get_cohort_path",
@@ -64,7 +70,11 @@ __all__ = [
     "get_group_criterion_path",
     "get_global_record_path",
     "get_history_path",
+    "get_history_journal_path",
     "get_list_path",
+    "get_responses_dir",
+    "get_responses_path",
+    "get_outbox_path",
     "get_leader_path",
     "get_grading_leader",
     "get_merged_path",
@@ -74,5 +84,10 @@ __all__ = [
     "to_update_record",
     "must_get_env",
     "prepare_paths",
+    "PathRegistry",
+    "RegistryStats",
+    "get_registry",
     "rm_path",
+    "FileStamp",
+    "file_stamp",
 ]
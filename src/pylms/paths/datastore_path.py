@@ -0,0 +1,8 @@
+from pathlib import Path
+
+from ..constants import DATASTORE_ARROW
+from .path_fns import get_data_path
+
+
+def get_datastore_path() -> Path:
+    return get_data_path() / DATASTORE_ARROW
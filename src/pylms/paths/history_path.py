@@ -1,8 +1,12 @@
 from pathlib import Path
 
-from ..constants import HISTORY_JSON
+from ..constants import HISTORY_JOURNAL, HISTORY_JSON
 from .path_fns import get_data_path
 
 
 def get_history_path() -> Path:
     return get_data_path() / HISTORY_JSON
+
+
+def get_history_journal_path() -> Path:
+    return get_data_path() / HISTORY_JOURNAL
@@ -0,0 +1,8 @@
+from pathlib import Path
+
+from ..constants import OUTBOX_DB
+from .path_fns import get_data_path
+
+
+def get_outbox_path() -> Path:
+    return get_data_path() / OUTBOX_DB
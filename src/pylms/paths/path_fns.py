@@ -1,53 +1,33 @@
 from pathlib import Path
 
-from ..config.io import read_config
 from ..constants import Json, Spreadsheets
+from .registry import get_registry
 
 
 def get_data_path() -> Path:
-    return Path(read_config().data_dir) / "data"
+    return get_registry().resolve().data
 
 
 def get_excel_path() -> Path:
-    return get_data_path() / "Excel"
+    return get_registry().resolve().excel
 
 
 def get_json_path() -> Path:
-    return get_data_path() / "Json"
+    return get_registry().resolve().json
 
 
 def get_cache_path() -> Path:
-    return get_data_path() / ".cache"
+    return get_registry().resolve().cache
 
 
 def get_paths_weeks() -> Path:
-    return get_excel_path() / "weeks"
+    return get_registry().resolve().weeks
 
 
 def get_paths_excel() -> Spreadsheets:
-    excel = get_excel_path()
-    return {
-        "DataStore": excel / "DataStore.xlsx",
-        "Result": excel / "Result.xlsx",
-        "Registration": excel / "Registration.xlsx",
-        "List": excel / "List.xlsx",
-        "Attendance": excel / "Attendance.xlsx",
-        "Assessment": excel / "Assessment.xlsx",
-        "Group": excel / "Group.xlsx",
-        "Project": excel / "Project.xlsx",
-    }
+    # A copy, so callers cannot alter the registry
+    return get_registry().resolve().spreadsheets.copy()
 
 
 def get_paths_json() -> Json:
-    json_path = get_json_path()
-    return {
-        "Classes": json_path / "classes",
-        "Records": json_path / "records",
-        "Update": json_path / "update",
-        "CDS": json_path / "CDS",
-        "UpdateForm": json_path / "update",
-        "UpdateRecord": json_path / "update",
-        "CDSForm": json_path / "CDS",
-        "CDSRecord": json_path / "CDS",
-        "Date": json_path / "dates.json",
-    }
+    return get_registry().resolve().json_files.copy()
@@ -0,0 +1,169 @@
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import NamedTuple, final
+
+from ..config import Config, config_version, read_config
+from ..constants import STATE_PATH, Json, Spreadsheets
+
+
+class RegistryStats(NamedTuple):
+    """Counters of a `PathRegistry`.
+
+    Attributes:
+        parses (int): Times the configuration file was read and parsed.
+        hits (int): Lookups served from the resolved paths.
+    """
+
+    parses: int
+    hits: int
+
+
+class ResolvedPaths(NamedTuple):
+    """The paths derived from one version of the configuration.
+
+    Attributes:
+        data (Path): The data directory.
+        excel (Path): The directory of the spreadsheets.
+        json (Path): The directory of the JSON files.
+        cache (Path): The directory of the snapshot cache.
+        weeks (Path): The directory of the weekly DataStore exports.
+        spreadsheets (Spreadsheets): The spreadsheet files.
+        json_files (Json): The JSON files and directories.
+    """
+
+    data: Path
+    excel: Path
+    json: Path
+    cache: Path
+    weeks: Path
+    spreadsheets: Spreadsheets
+    json_files: Json
+
+
+def resolve_paths(config: Config) -> ResolvedPaths:
+    """Derive every data path from a configuration.
+
+    Args:
+        config: The configuration naming the data directory.
+
+    Returns:
+        ResolvedPaths: The paths under the configured data directory.
+    """
+    data = Path(config.data_dir) / "data"
+    excel = data / "Excel"
+    json_path = data / "Json"
+    return ResolvedPaths(
+        data=data,
+        excel=excel,
+        json=json_path,
+        cache=data / ".cache",
+        weeks=excel / "weeks",
+        spreadsheets={
+            "DataStore": excel / "DataStore.xlsx",
+            "Result": excel / "Result.xlsx",
+            "Registration": excel / "Registration.xlsx",
+            "List": excel / "List.xlsx",
+            "Attendance": excel / "Attendance.xlsx",
+            "Assessment": excel / "Assessment.xlsx",
+            "Group": excel / "Group.xlsx",
+            "Project": excel / "Project.xlsx",
+            "Breakdown": excel / "Breakdown.xlsx",
+        },
+        json_files={
+            "Classes": json_path / "classes",
+            "Records": json_path / "records",
+            "Update": json_path / "update",
+            "CDS": json_path / "CDS",
+            "UpdateForm": json_path / "update",
+            "UpdateRecord": json_path / "update",
+            "CDSForm": json_path / "CDS",
+            "CDSRecord": json_path / "CDS",
+            "Date": json_path / "dates.json",
+        },
+    )
+
+
+@final
+class PathRegistry:
+    """Process-wide cache of the paths derived from the configuration.
+
+    The configuration file is parsed the first time a path is needed and
+    the resolved paths are reused until the configuration changes: either
+    `write_config` ran in this process, or the modification time or size of
+    the file differs from when it was parsed. A lookup therefore costs one
+    `stat` of the file instead of a TOML parse.
+
+    Args:
+        state_path: The configuration file.
+        read: Reads and parses the configuration file.
+    """
+
+    def __init__(self, state_path: Path, read: Callable[[], Config]) -> None:
+        self.state_path: Path = state_path
+        self._read: Callable[[], Config] = read
+        self._lock: threading.Lock = threading.Lock()
+        self._stamp: tuple[int, int, int] | None = None
+        self._paths: ResolvedPaths | None = None
+        self._parses: int = 0
+        self._hits: int = 0
+
+    def _current_stamp(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.state_path.stat()
+        except OSError:
+            # Not cached: reading reports the missing file
+            return None
+        return config_version(), stat.st_mtime_ns, stat.st_size
+
+    def resolve(self) -> ResolvedPaths:
+        """Return the paths of the current configuration.
+
+        Returns:
+            ResolvedPaths: The resolved paths, parsed again only if the
+            configuration changed since the last lookup.
+
+        Raises:
+            OSError: If the configuration file cannot be read.
+            tomlkit.exceptions.TOMLKitError: If parsing fails.
+        """
+        stamp = self._current_stamp()
+        with self._lock:
+            if stamp is not None and stamp == self._stamp and self._paths is not None:
+                self._hits += 1
+                return self._paths
+            paths = resolve_paths(self._read())
+            self._parses += 1
+            self._stamp = stamp
+            self._paths = paths
+            return paths
+
+    def stats(self) -> RegistryStats:
+        """Return the counters of the registry.
+
+        Returns:
+            RegistryStats: The parse and hit counters.
+        """
+        with self._lock:
+            return RegistryStats(self._parses, self._hits)
+
+    def clear(self) -> None:
+        """Drop the resolved paths and reset the counters."""
+        with self._lock:
+            self._stamp = None
+            self._paths = None
+            self._parses = 0
+            self._hits = 0
+
+
+# Registry shared by the `get_*_path` functions.
+_REGISTRY = PathRegistry(STATE_PATH, read_config)
+
+
+def get_registry() -> PathRegistry:
+    """Return the process-wide path registry.
+
+    Returns:
+        PathRegistry: The registry backing the `get_*_path` functions.
+    """
+    return _REGISTRY
@@ -0,0 +1,61 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import final, override
+from unittest import TestCase, main
+from unittest.mock import patch
+
+import tomlkit
+
+from ..config import Config, read_config, write_config
+from .registry import PathRegistry, RegistryStats
+
+
+def _config(data_dir: str) -> Config:
+    config = Config.default()
+    config.settings.data_dir = data_dir
+    return config
+
+
+@final
+class PathRegistryTest(TestCase):
+    @override
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state: Path = Path(tmp.name) / "state.toml"  # pyright: ignore[reportUninitializedInstanceVariable]
+        state_patch = patch("pylms.config.io.STATE_PATH", self.state)
+        _ = state_patch.start()
+        self.addCleanup(state_patch.stop)
+        write_config(_config("/course/a"))
+        self.registry: PathRegistry = PathRegistry(self.state, read_config)  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def test_parses_once_per_version(self) -> None:
+        for _ in range(50):
+            paths = self.registry.resolve()
+            self.assertEqual(paths.data, Path("/course/a/data"))
+        self.assertEqual(paths.spreadsheets["DataStore"], Path("/course/a/data/Excel/DataStore.xlsx"))
+        self.assertEqual(paths.json_files["Date"], Path("/course/a/data/Json/dates.json"))
+        self.assertEqual(self.registry.stats(), RegistryStats(parses=1, hits=49))
+
+    def test_invalidated_by_write_config(self) -> None:
+        _ = self.registry.resolve()
+        # Same size and, on coarse clocks, the same modification time
+        write_config(_config("/course/b"))
+        self.assertEqual(self.registry.resolve().data, Path("/course/b/data"))
+        self.assertEqual(self.registry.stats().parses, 2)
+
+    def test_invalidated_by_outside_edit(self) -> None:
+        _ = self.registry.resolve()
+        stat = self.state.stat()
+        _ = self.state.write_text(tomlkit.dumps(_config("/elsewhere").to_dict()))  # pyright: ignore[reportUnknownMemberType]
+        os.utime(self.state, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(self.registry.resolve().data, Path("/elsewhere/data"))
+        self.assertEqual(self.registry.stats().parses, 2)
+
+        self.registry.clear()
+        self.assertEqual(self.registry.stats(), RegistryStats(parses=0, hits=0))
+
+
+if __name__ == "__main__":
+    _ = main()
@@ -0,0 +1,12 @@
+from pathlib import Path
+
+from ..constants import RESPONSES_DIR
+from .path_fns import get_json_path
+
+
+def get_responses_dir() -> Path:
+    return get_json_path() / RESPONSES_DIR
+
+
+def get_responses_path(form_id: str) -> Path:
+    return get_responses_dir() / f"{form_id}.json"
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+type FileStamp = tuple[tuple[int, int] | None, ...]
+
+
+def file_stamp(*paths: Path) -> FileStamp:
+    """
+    :param paths: (Path) - The files to stamp.
+    :type paths: Path
+
+    :return: (FileStamp) - The modification time and size of each file, or None for a file that does not exist. Two stamps differ when any of the files was written in between.
+    :rtype: FileStamp
+    """
+    stamps: list[tuple[int, int] | None] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            stamps.append(None)
+            continue
+        stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
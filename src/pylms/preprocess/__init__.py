@@ -1,8 +1,15 @@
 from .clean_new_data import clean_new_data
-from .clean_reg_data import clean_reg, clean_reg_data
+from .clean_reg_data import clean_reg, clean_reg_data, clean_reg_eager
+from .reg_pipeline import RegInfo, build_reg, clean_reg_lazy, input_reg_info, prepare_reg
 
 __all__ = [
     "clean_new_data",
     "clean_reg_data",
     "clean_reg",
+    "clean_reg_eager",
+    "clean_reg_lazy",
+    "build_reg",
+    "prepare_reg",
+    "input_reg_info",
+    "RegInfo",
 ]
@@ -24,9 +24,10 @@ from ..cli import input_path
 from ..constants import NAME, PHONE
 from ..data import DataStore, DataStream, read
 from ..errors import Result
+from .reg_pipeline import build_reg, input_reg_info, prepare_reg
 
 
-def clean_reg(data_stream: DataStream[pd.DataFrame]) -> Result[DataStore]:
+def clean_reg_eager(data_stream: DataStream[pd.DataFrame]) -> Result[DataStore]:
     """
     private helper function that carries out the actual cleaning operation on the registration data that is passed in as a `DataStream` object containing and underlying pandas DataFrame. After cleaning the data, the data is returned back as a `DataStore`.
 
@@ -96,6 +97,33 @@ def clean_reg(data_stream: DataStream[pd.DataFrame]) -> Result[DataStore]:
     return Result.ok(DataStore(data_stream))
 
 
+def clean_reg(
+    data_stream: DataStream[pd.DataFrame], streaming: bool = False
+) -> Result[DataStore]:
+    """
+    Cleans the registration data passed in as a `DataStream` into a `DataStore`.
+
+    The result is the same as that of `clean_reg_eager`, but after the column names are normalized and the user has entered the cohort details, every remaining step runs as a single polars query. See `preprocess.reg_pipeline.build_reg` for more info.
+
+    :param data_stream: ( DataStream[pd.DataFrame] ): The registration data
+    :type data_stream: DataStream[pd.DataFrame]
+    :param streaming: ( bool ): Collect the query with the polars streaming engine, meant for very large exports
+    :type streaming: bool
+
+    :return: a preprocessed `DataStore` object
+    :rtype: Result[DataStore]
+    """
+    result = prepare_reg(data_stream)
+    if result.is_err():
+        return result.propagate()
+
+    info = input_reg_info()
+    if info.is_err():
+        return info.propagate()
+
+    return build_reg(data_stream, info.unwrap(), streaming)
+
+
 def clean_reg_data() -> Result[DataStore]:
     """
     This function prompts the user to enter the path to the registration excel spreadsheet file. Reads it and preprocesses it to a DataStore.
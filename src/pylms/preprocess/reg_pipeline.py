@@ -0,0 +1,267 @@
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from ..clean import (
+    clean_col_names,
+    clean_columns,
+    clean_na,
+    input_cohort,
+    input_cohort_date,
+    input_day_first,
+)
+from ..constants import (
+    COHORT,
+    COMPLETION,
+    COMPLETION_FMT,
+    DATA_COLUMNS,
+    DATE,
+    EMAIL,
+    GENDER,
+    INTERNSHIP,
+    NA_COLUMNS_FILL,
+    NAME,
+    PHONE,
+    SEMI_DELIM,
+    SERIAL,
+    TIME,
+    TIME_FMT,
+    TRAINING,
+    UNIQUE_COLUMNS,
+)
+from ..data import DataStore, DataStream
+from ..date import format_date
+from ..errors import Result, Unit, eprint
+from ..re_phone import match_and_clean
+
+# Position of each row in the registration sheet, carried through the plan so
+# that pass-through columns can be picked from the source afterwards.
+_ROW: str = "__row"
+
+# Columns of the registration sheet read by the plan.
+REG_COLUMNS: list[str] = [TIME, NAME, GENDER, PHONE, EMAIL, INTERNSHIP, COMPLETION]
+
+# Columns whose missing values the step-by-step cleaners never handled.
+_REQUIRED: list[str] = [TIME, EMAIL, INTERNSHIP, COMPLETION]
+
+# Characters removed by `str.strip`. polars strips a smaller set by default.
+_WHITESPACE: str = "".join(c for c in map(chr, range(0x3001)) if c.isspace())
+
+
+class RegInfo(NamedTuple):
+    """Cohort details entered by the user while cleaning registration data.
+
+    :param cohort: The cohort number
+    :param date: The orientation date of the cohort as dd/mm/yyyy
+    :param day_first: Whether completion dates are written day first
+    """
+
+    cohort: int
+    date: str
+    day_first: bool
+
+
+def input_reg_info() -> Result[RegInfo]:
+    """
+    Prompts the user for the cohort number, the orientation date and the format of the completion dates, in that order.
+
+    :return: the cohort details, or the error of the first prompt that failed
+    :rtype: Result[RegInfo]
+    """
+    cohort = input_cohort()
+    if cohort.is_err():
+        return cohort.propagate()
+
+    date = input_cohort_date()
+    if date.is_err():
+        return date.propagate()
+
+    day_first = input_day_first()
+    if day_first.is_err():
+        return day_first.propagate()
+
+    return Result.ok(RegInfo(cohort.unwrap(), date.unwrap(), day_first.unwrap()))
+
+
+def prepare_reg(data_stream: DataStream[pd.DataFrame]) -> Result[Unit]:
+    """
+    Normalizes the column names of the registration data in place, drops the columns not in `DATA_COLUMNS` and checks for missing values that cannot be filled.
+
+    :param data_stream: ( DataStream[pd.DataFrame] ): The registration data
+    :type data_stream: DataStream[pd.DataFrame]
+
+    :return: a unit result, or the validation error raised by `clean_na`
+    :rtype: Result[Unit]
+    """
+    clean_col_names(data_stream)
+    clean_columns(data_stream)
+    return clean_na(data_stream)
+
+
+def _clean_phone_batch(entries: pl.Series) -> pl.Series:
+    """
+    Cleans stripped phone strings the same way as `re_phone.clean_phones`.
+
+    :param entries: ( pl.Series ): Stripped phone strings
+    :type entries: pl.Series
+
+    :return: the formatted phone strings
+    :rtype: pl.Series
+    """
+    is_ten = entries.str.contains(r"^\d{10}$")
+    is_eleven = entries.str.contains(r"^0\d{10}$")
+    others = entries.filter(~(is_ten | is_eleven)).unique()
+    mapping = {value: match_and_clean(value) for value in others.to_list()}
+
+    semi = SEMI_DELIM.strip()
+    frame = pl.DataFrame({PHONE: entries, "ten": is_ten, "eleven": is_eleven})
+    return frame.select(
+        pl.when(pl.col("ten"))
+        .then(pl.lit("0") + pl.col(PHONE) + semi)
+        .when(pl.col("eleven"))
+        .then(pl.col(PHONE) + semi)
+        .otherwise(
+            pl.col(PHONE).replace_strict(mapping, default=None, return_dtype=pl.String)
+        )
+        .alias(PHONE)
+    ).to_series()
+
+
+def _date_column(
+    column: pd.Series, fmt: str, day_first: bool = True
+) -> tuple[pd.Series, pl.Expr]:
+    """
+    Returns the values to load for a date column and the expression formatting them.
+
+    Native datetime columns are formatted inside the plan. Any other column is formatted once per distinct value with `format_date` before loading.
+
+    :param column: ( pd.Series ): The date column of the registration data
+    :type column: pd.Series
+    :param fmt: ( str ): The format of the output strings
+    :type fmt: str
+    :param day_first: ( bool ): Whether string dates are written day first
+    :type day_first: bool
+
+    :return: the values to load and the expression producing the formatted strings
+    :rtype: tuple[pd.Series, pl.Expr]
+    """
+    name = str(column.name)
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return column, pl.col(name).dt.to_string(fmt)
+
+    codes, uniques = pd.factorize(column)
+    formatted = np.array(
+        [format_date(value, fmt, day_first=day_first) for value in uniques],
+        dtype=object,
+    )
+    return pd.Series(formatted[codes], index=column.index, name=name), pl.col(name)
+
+
+def build_reg(
+    data_stream: DataStream[pd.DataFrame], info: RegInfo, streaming: bool = False
+) -> Result[DataStore]:
+    """
+    Cleans prepared registration data with a single polars query.
+
+    Every cleaning step is an expression on a `LazyFrame`: emails are lowercased and stripped, internships uppercased, phones formatted, dates formatted and duplicates removed, after which the plan is collected once. The result is sorted by name with the same unstable sort pandas uses, so ties keep the order `clean_sort` gives them, and the output is identical to the step-by-step cleaners.
+
+    :param data_stream: ( DataStream[pd.DataFrame] ): Registration data that went through `prepare_reg`
+    :type data_stream: DataStream[pd.DataFrame]
+    :param info: ( RegInfo ): The cohort details entered by the user
+    :type info: RegInfo
+    :param streaming: ( bool ): Collect with the polars streaming engine, which processes very large exports in batches
+    :type streaming: bool
+
+    :return: the cleaned registration data
+    :rtype: Result[DataStore]
+    """
+    data: pd.DataFrame = data_stream.as_ref()
+    missing: list[str] = [col for col in REG_COLUMNS if col not in data.columns]
+    if len(missing) > 0:
+        msg = f"Registration data is missing the columns: {missing}"
+        eprint(msg)
+        return Result.err(msg)
+
+    for col in _REQUIRED:
+        if data[col].isna().any():
+            msg = f"Column '{col}' of the registration data has missing values"
+            eprint(msg)
+            return Result.err(msg)
+
+    time, time_expr = _date_column(data[TIME], TIME_FMT)
+    completion, completion_expr = _date_column(
+        data[COMPLETION], COMPLETION_FMT, day_first=info.day_first
+    )
+
+    try:
+        source = pl.from_pandas(
+            pd.DataFrame(
+                {
+                    _ROW: np.arange(data.shape[0]),
+                    TIME: time.to_numpy(),
+                    NAME: data[NAME].astype(str).to_numpy(),
+                    PHONE: data[PHONE].astype(str).to_numpy(),
+                    EMAIL: data[EMAIL].to_numpy(),
+                    INTERNSHIP: data[INTERNSHIP].to_numpy(),
+                    COMPLETION: completion.to_numpy(),
+                }
+            )
+        )
+        plan = (
+            source.lazy()
+            .with_columns(
+                time_expr,
+                completion_expr,
+                pl.col(EMAIL).str.to_lowercase().str.strip_chars(_WHITESPACE),
+                pl.col(INTERNSHIP).str.to_uppercase(),
+                pl.col(PHONE)
+                .str.strip_chars(_WHITESPACE)
+                .map_batches(
+                    _clean_phone_batch, return_dtype=pl.String, is_elementwise=True
+                ),
+            )
+            .unique(subset=UNIQUE_COLUMNS, keep="first", maintain_order=True)
+        )
+        cleaned = plan.collect(engine="streaming" if streaming else "auto")
+    except Exception as e:
+        msg = f"Failed to clean the registration data.\nError: {e}"
+        eprint(msg)
+        return Result.err(msg)
+
+    # Sort the names as `DataFrame.sort_values` does for an object column
+    names: np.ndarray = cleaned[NAME].to_numpy().astype(object)
+    cleaned = cleaned[np.argsort(names, kind="quicksort")]
+
+    rows: np.ndarray = cleaned[_ROW].to_numpy()
+    result: pd.DataFrame = cleaned.drop(_ROW).to_pandas()
+    result[GENDER] = data[GENDER].iloc[rows].reset_index(drop=True)
+    result[SERIAL] = np.arange(1, result.shape[0] + 1)
+    result[COHORT] = info.cohort
+    result[DATE] = info.date
+    result[TRAINING] = NA_COLUMNS_FILL[TRAINING]
+
+    return DataStore.from_data(result[DATA_COLUMNS])
+
+
+def clean_reg_lazy(
+    data_stream: DataStream[pd.DataFrame], info: RegInfo, streaming: bool = False
+) -> Result[DataStore]:
+    """
+    Cleans registration data with `prepare_reg` followed by `build_reg` without prompting the user.
+
+    :param data_stream: ( DataStream[pd.DataFrame] ): The registration data
+    :type data_stream: DataStream[pd.DataFrame]
+    :param info: ( RegInfo ): The cohort details
+    :type info: RegInfo
+    :param streaming: ( bool ): Collect with the polars streaming engine
+    :type streaming: bool
+
+    :return: the cleaned registration data
+    :rtype: Result[DataStore]
+    """
+    result = prepare_reg(data_stream)
+    if result.is_err():
+        return result.propagate()
+    return build_reg(data_stream, info, streaming)
@@ -1,14 +1,7 @@
-from typing import Callable
-
-from ._re_match import re_match
-
-
-def match_and_clean(entry: str) -> str:
-    entry = entry.strip()
-    func: Callable[[str], str] = re_match(entry)
-    return func(entry)
-
+from ._match import match_and_clean
+from ._vector import clean_phones
 
 __all__ = [
     "match_and_clean",
+    "clean_phones",
 ]
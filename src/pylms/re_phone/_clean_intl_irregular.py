@@ -52,8 +52,13 @@ def clean_intl_comp_irregular(entry: str, delim: str) -> str:
             # in the remaining part of the string i.e., `temp_str`
             temp_str: str = new_entry[1:]
 
-            # get index of next `+` or starting point of next phone number
+            # get index of next `+` or starting point of next phone number.
+            # `temp_str` starts one char into `new_entry`, hence the + 1, and
+            # -1 means this is the last phone number in the string.
             next_plus_idx: int = temp_str.find("+")
+            next_plus_idx = (
+                len(new_entry) if next_plus_idx == -1 else next_plus_idx + 1
+            )
 
             # get all chars from the start of `new_entry` to right before
             # the start of the next intl phone number
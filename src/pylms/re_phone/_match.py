@@ -0,0 +1,14 @@
+from functools import lru_cache
+from typing import Callable
+
+from ._re_match import re_match
+
+# Number of distinct raw phone strings whose cleaned form is remembered
+PHONE_CACHE_SIZE: int = 8192
+
+
+@lru_cache(maxsize=PHONE_CACHE_SIZE)
+def match_and_clean(entry: str) -> str:
+    entry = entry.strip()
+    func: Callable[[str], str] = re_match(entry)
+    return func(entry)
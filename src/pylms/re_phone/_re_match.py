@@ -1,6 +1,6 @@
 import re
 from functools import partial
-from typing import Callable
+from typing import Callable, NamedTuple
 
 from ..constants import BACK_SLASH, COMMA, FRONT_SLASH, NA, SEMI, SPACE_DELIM
 from ._clean_intl import (
@@ -27,77 +27,113 @@ from ._clean_local import (
 )
 
 
-def re_match(phone_str: str) -> Callable[[str], str]:
-    match phone_str:
-        case _ if re.fullmatch(r"^\d{10}$", phone_str):
-            return clean10
-
-        case _ if re.fullmatch(r"^0\d{10}$", phone_str):
-            return clean11
-
-        case _ if re.fullmatch(r"^(0\d{10}\s)+(0\d{10})\b$", phone_str):
-            return clean_space_sep
-
-        case _ if re.fullmatch(r"^(0\d{10},\s*)+(0\d{10})\b$", phone_str):
-            return clean_comma_sep
-
-        case _ if re.fullmatch(r"^(0\d{10};\s*)+(0\d{10})\b$", phone_str):
-            return clean_semi_sep
-
-        case _ if re.fullmatch(r"^0(?:\s*\d){10}$", phone_str):
-            return clean_irregular_space
-
-        case _ if re.fullmatch(r"^(0(?:\s*\d){10}\s)+(0(?:\s*\d){10})\b$", phone_str):
-            return partial(clean_composite_irregular, delim=SPACE_DELIM)
-
-        case _ if re.fullmatch(r"^(0(?:\s*\d){10},\s*)+(0(?:\s*\d){10})\b$", phone_str):
-            return partial(clean_composite_irregular, delim=COMMA)
-
-        case _ if re.fullmatch(r"^(0(?:\s*\d){10};\s*)+(0(?:\s*\d){10})\b$", phone_str):
-            return partial(clean_composite_irregular, delim=SEMI)
-
-        case _ if re.fullmatch(r"^(0(?:\s*\d){10}/\s*)+(0(?:\s*\d){10})\b$", phone_str):
-            return partial(clean_composite_irregular, delim=FRONT_SLASH)
-
-        case _ if re.fullmatch(
-            r"^(0(?:\s*\d){10}\\\s*)+(0(?:\s*\d){10})\b$", phone_str
-        ):
-            return partial(clean_composite_irregular, delim=BACK_SLASH)
-
-        case _ if re.fullmatch(r"^(\+\d+\d{10})\b$", phone_str):
-            return clean_intl
-
-        case _ if re.fullmatch(r"^(\+\d+\d{10}\s)+(\+\d+\d{10})\b$", phone_str):
-            return clean_intl_space_sep
-
-        case _ if re.fullmatch(r"^(\+\d+\d{10},\s*)+(\+\d+\d{10})\b$", phone_str):
-            return clean_intl_comma_sep
-
-        case _ if re.fullmatch(r"^(\+\d+\d{10};\s*)+(\+\d+\d{10})\b$", phone_str):
-            return clean_intl_semi_sep
-
-        case _ if re.fullmatch(r"^\+(?:\s*\d)+(?:\s*\d){10}$", phone_str):
-            return clean_intl_irregular
-
-        case _ if re.fullmatch(
-            r"^(\+(?:\s*\d)+(?:\s*\d){10}\s)+(\+(?:\s*\d)+(?:\s*\d){10})\b$", phone_str
-        ):
-            return partial(clean_intl_comp_irregular, delim=SPACE_DELIM)
-
-        case _ if re.fullmatch(
-            r"^(\+(?:\s*\d)+(?:\s*\d){10},\s*)+(\+(?:\s*\d)+(?:\s*\d){10})\b$",
-            phone_str,
-        ):
-            return partial(clean_intl_comp_irregular, delim=COMMA)
-
-        case _ if re.fullmatch(
-            r"^(\+(?:\s*\d)+(?:\s*\d){10};\s*)+(\+(?:\s*\d)+(?:\s*\d){10})\b$",
-            phone_str,
-        ):
-            return partial(clean_intl_comp_irregular, delim=SEMI)
-
-        case _ if re.fullmatch(r"^\d+\d{10}$", phone_str):
-            return clean_intl_special
-
-        case _:
-            return lambda x: NA
+type Cleaner = Callable[[str], str]
+
+
+class Rule(NamedTuple):
+    """A phone number shape and the function that cleans it.
+
+    `lead` is the first character every match starts with: "0", "+", or "d"
+    for any digit. It lets `re_match` skip rules that cannot match.
+    """
+
+    lead: str
+    pattern: re.Pattern[str]
+    clean: Cleaner
+
+
+# Patterns are tried in order and the first full match wins. Repeated digit
+# runs are written as `(?:\s*\d){11,}` rather than `(?:\s*\d)+(?:\s*\d){10}`:
+# both accept the same strings, but the former does not backtrack over every
+# split point of the digits when the match fails.
+RULES: list[Rule] = [
+    Rule("d", re.compile(r"^\d{10}$"), clean10),
+    Rule("0", re.compile(r"^0\d{10}$"), clean11),
+    Rule("0", re.compile(r"^(0\d{10}\s)+(0\d{10})\b$"), clean_space_sep),
+    Rule("0", re.compile(r"^(0\d{10},\s*)+(0\d{10})\b$"), clean_comma_sep),
+    Rule("0", re.compile(r"^(0\d{10};\s*)+(0\d{10})\b$"), clean_semi_sep),
+    Rule("0", re.compile(r"^0(?:\s*\d){10}$"), clean_irregular_space),
+    Rule(
+        "0",
+        re.compile(r"^(0(?:\s*\d){10}\s)+(0(?:\s*\d){10})\b$"),
+        partial(clean_composite_irregular, delim=SPACE_DELIM),
+    ),
+    Rule(
+        "0",
+        re.compile(r"^(0(?:\s*\d){10},\s*)+(0(?:\s*\d){10})\b$"),
+        partial(clean_composite_irregular, delim=COMMA),
+    ),
+    Rule(
+        "0",
+        re.compile(r"^(0(?:\s*\d){10};\s*)+(0(?:\s*\d){10})\b$"),
+        partial(clean_composite_irregular, delim=SEMI),
+    ),
+    Rule(
+        "0",
+        re.compile(r"^(0(?:\s*\d){10}/\s*)+(0(?:\s*\d){10})\b$"),
+        partial(clean_composite_irregular, delim=FRONT_SLASH),
+    ),
+    Rule(
+        "0",
+        re.compile(r"^(0(?:\s*\d){10}\\\s*)+(0(?:\s*\d){10})\b$"),
+        partial(clean_composite_irregular, delim=BACK_SLASH),
+    ),
+    Rule("+", re.compile(r"^(\+\d{11,})\b$"), clean_intl),
+    Rule("+", re.compile(r"^(\+\d{11,}\s)+(\+\d{11,})\b$"), clean_intl_space_sep),
+    Rule("+", re.compile(r"^(\+\d{11,},\s*)+(\+\d{11,})\b$"), clean_intl_comma_sep),
+    Rule("+", re.compile(r"^(\+\d{11,};\s*)+(\+\d{11,})\b$"), clean_intl_semi_sep),
+    Rule("+", re.compile(r"^\+(?:\s*\d){11,}$"), clean_intl_irregular),
+    Rule(
+        "+",
+        re.compile(r"^(\+(?:\s*\d){11,}\s)+(\+(?:\s*\d){11,})\b$"),
+        partial(clean_intl_comp_irregular, delim=SPACE_DELIM),
+    ),
+    Rule(
+        "+",
+        re.compile(r"^(\+(?:\s*\d){11,},\s*)+(\+(?:\s*\d){11,})\b$"),
+        partial(clean_intl_comp_irregular, delim=COMMA),
+    ),
+    Rule(
+        "+",
+        re.compile(r"^(\+(?:\s*\d){11,};\s*)+(\+(?:\s*\d){11,})\b$"),
+        partial(clean_intl_comp_irregular, delim=SEMI),
+    ),
+    Rule("d", re.compile(r"^\d{11,}$"), clean_intl_special),
+]
+
+# Rules grouped by the first character of the phone string, keeping their order
+_ZERO_RULES: list[Rule] = [rule for rule in RULES if rule.lead in ("0", "d")]
+_DIGIT_RULES: list[Rule] = [rule for rule in RULES if rule.lead == "d"]
+_INTL_RULES: list[Rule] = [rule for rule in RULES if rule.lead == "+"]
+
+
+def _clean_na(entry: str) -> str:
+    return NA
+
+
+def re_match(phone_str: str) -> Cleaner:
+    """Return the cleaning function for the shape of `phone_str`.
+
+    Only the rules that can match the first character of `phone_str` are
+    tried, in the order of `RULES`.
+
+    :param phone_str: ( str ): A stripped phone string.
+    :type phone_str: str
+
+    :rtype: Cleaner
+    :return: The cleaning function of the first matching rule, or one returning NA.
+    """
+    first: str = phone_str[:1]
+    if first == "+":
+        rules = _INTL_RULES
+    elif first == "0":
+        rules = _ZERO_RULES
+    elif first.isdecimal():
+        rules = _DIGIT_RULES
+    else:
+        return _clean_na
+
+    for rule in rules:
+        if rule.pattern.fullmatch(phone_str) is not None:
+            return rule.clean
+    return _clean_na
@@ -0,0 +1,36 @@
+import pandas as pd
+
+from ..constants import SEMI_DELIM
+from ._match import match_and_clean
+
+
+def clean_phones(column: pd.Series) -> pd.Series:
+    """
+    Cleans a whole column of phone strings.
+
+    The two most common shapes, 10 digits and 11 digits starting with 0, are
+    formatted with vectorized string operations. Every other distinct value
+    is cleaned once with `match_and_clean` and mapped back onto the column.
+
+    :param column: ( pd.Series ): Phone strings to be formatted
+    :type column: pd.Series
+
+    :rtype: pd.Series
+    :return: The formatted phone strings, aligned with `column`
+    """
+    entries: pd.Series = column.astype(str).str.strip()
+    cleaned: pd.Series = pd.Series(pd.NA, index=entries.index, dtype=object)
+
+    is_ten = entries.str.fullmatch(r"\d{10}")
+    cleaned[is_ten] = "0" + entries[is_ten] + SEMI_DELIM.strip()
+
+    is_eleven = entries.str.fullmatch(r"0\d{10}")
+    cleaned[is_eleven] = entries[is_eleven] + SEMI_DELIM.strip()
+
+    rest = ~(is_ten | is_eleven)
+    if rest.any():
+        others = entries[rest]
+        mapping = {value: match_and_clean(value) for value in others.unique()}
+        cleaned[rest] = others.map(mapping)
+
+    return cleaned
@@ -0,0 +1,59 @@
+import unittest
+from typing import final
+
+import pandas as pd
+
+from . import clean_phones, match_and_clean
+
+EXPECTED: dict[str, str] = {
+    "8012345678": "08012345678;",
+    "08012345678": "08012345678;",
+    "08012345678 08098765432": "08012345678; 08098765432;",
+    "08012345678, 08098765432": "08012345678; 08098765432;",
+    "08012345678;08098765432": "08012345678; 08098765432;",
+    "0801 234 5678": "08012345678;",
+    "0801 234 5678, 0809 876 5432": "08012345678; 08098765432;",
+    "0801 234 5678; 0809 876 5432": "08012345678; 08098765432;",
+    "0801 234 5678/0809 876 5432": "08012345678; 08098765432;",
+    "0801 234 5678\\0809 876 5432": "08012345678; 08098765432;",
+    "+2348012345678": "+234 8012345678;",
+    "+2348012345678 +2348098765432": "+234 8012345678; +234 8098765432;",
+    "+2348012345678, +2348098765432": "+234 8012345678; +234 8098765432;",
+    "+2348012345678;+2348098765432": "+234 8012345678; +234 8098765432;",
+    "+234 801 234 5678": "+234 8012345678;",
+    "+234 801 234 5678 +234 809 876 5432": "+234 8012345678; +234 8098765432;",
+    "+234 801 234 5678, +234 809 876 5432": "+234 8012345678; +234 8098765432;",
+    "+234 801 234 5678; +234 809 876 5432": "+234 8012345678; +234 8098765432;",
+    "2348012345678": "+234 8012345678;",
+    "abc": "N/A",
+    "": "N/A",
+    "  08012345678  ": "08012345678;",
+    "0801234567": "00801234567;",
+    "123": "N/A",
+    "+12": "N/A",
+    "08012345678,08098765432,08011112222": "08012345678; 08098765432; 08011112222;",
+}
+
+
+@final
+class MatchAndCleanTest(unittest.TestCase):
+    def test_match_and_clean(self) -> None:
+        for entry, expected in EXPECTED.items():
+            with self.subTest(entry=entry):
+                self.assertEqual(match_and_clean(entry), expected)
+
+    def test_clean_phones(self) -> None:
+        column = pd.Series(list(EXPECTED.keys()) * 3)
+        cleaned = clean_phones(column)
+        self.assertEqual(cleaned.tolist(), list(EXPECTED.values()) * 3)
+        self.assertTrue(cleaned.index.equals(column.index))
+
+    def test_memoized(self) -> None:
+        _ = match_and_clean("0803 111 2222")
+        hits = match_and_clean.cache_info().hits
+        _ = match_and_clean("0803 111 2222")
+        self.assertEqual(match_and_clean.cache_info().hits, hits + 1)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
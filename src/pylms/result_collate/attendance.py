@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 from ..constants import COMMA_DELIM, NAME, SERIAL
-from ..data import DataStore, DataStream
+from ..data import DataStore, DataStream, count_statuses
 from ..errors import Result, Unit, eprint
 from ..history import (
     History,
@@ -53,7 +53,6 @@ def collate_attendance(ds: DataStore, history: History) -> Result[Unit]:
     # Retrieve and filter the relevant data for the held classes
     pretty = ds.to_pretty()
     data = ds.as_ref()
-    dates_data: pd.DataFrame = data.loc[:, held_dates]
 
     # Prompt the user to enter attendance requirement
     req = input_marks_req("Enter the Attendance Requirement [1 - 100]: ")
@@ -63,23 +62,14 @@ def collate_attendance(ds: DataStore, history: History) -> Result[Unit]:
 
     req = req.unwrap()
 
-    # Define a function to map attendance status to integer values
-    def map_to_int(value: str) -> int:
-        match True:
-            case _ if value == RecordStatus.ABSENT:
-                return 0
-            case _:
-                return 1
-
-    # Map attendance data to integers and calculate the total count per student
-    count_data: pd.DataFrame = dates_data.map(map_to_int)  # pyright: ignore[reportUnknownMemberType]
-    count_arr: np.ndarray = count_data.to_numpy()
-    count_arr = count_arr.sum(axis=1)
-    count_arr = count_arr.flatten()
+    # Every status but absent counts as attended; count the absences per
+    # student over the held classes with the configured engine
+    absences = count_statuses(ds, [RecordStatus.ABSENT], held_dates)
+    count_arr: np.ndarray = len(held_dates) - absences
 
     # Check if all attendance records are complete
     max_len: int = max(count_arr.shape)
-    if max_len != count_data.shape[0]:
+    if max_len != data.shape[0]:
         msg = "Incomplete class records detected."
         eprint(msg)
         return Result.err(msg)
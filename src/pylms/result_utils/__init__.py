@@ -1,3 +1,10 @@
+from .breakdown import (
+    Breakdown,
+    StudentBreakdown,
+    compute_breakdown,
+    export_breakdown,
+    read_breakdown,
+)
 from .col_name import (
     det_assessment_overall_col,
     det_assessment_req_col,
@@ -20,6 +27,11 @@ from .val import val_assessment_data, val_attendance_data, val_result_data
 from .view import view_result
 
 __all__ = [
+    "Breakdown",
+    "StudentBreakdown",
+    "compute_breakdown",
+    "export_breakdown",
+    "read_breakdown",
     "det_assessment_overall_col",
     "det_assessment_score_col",
     "det_assessment_req_col",
@@ -0,0 +1,295 @@
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from ..constants import COHORT, EMAIL, GENDER, NAME, REASON, REMARK
+from ..data import DataStore, DataStream, read
+from ..errors import Result, Unit, eprint
+from ..paths import get_paths_excel
+from .find import find_col
+
+SERIAL: str = "S/N"
+DESIGNATION: str = "Designation"
+ATTENDANCE_COUNT: str = "Attendance Count"
+ATTENDANCE_SCORE: str = "Attendance Score"
+ASSESSMENT_SCORE: str = "Assessment Score"
+PROJECT_SCORE: str = "Project Score"
+BONUS_MARKS: str = "Bonus Marks"
+PENALTY_MARKS: str = "Penalty Marks"
+RESULT_SCORE: str = "Result Score"
+ERROR: str = "Error"
+
+
+@dataclass(slots=True, frozen=True)
+class StudentBreakdown:
+    """
+    The result breakdown of one student, with every score already formatted for display.
+
+    :ivar num: (int) - The serial number of the student in the result sheet.
+    :ivar name: (str) - The name of the student.
+    :ivar designation: (str) - "Mr. ", "Ms. " or "" from the student's gender.
+    :ivar email: (str) - The email address of the student.
+    :ivar cohort: (int) - The cohort of the student.
+    :ivar attendance_count: (int) - The number of classes attended.
+    :ivar attendance_score: (str) - The attendance score, e.g. "91.67%".
+    :ivar assessment_score: (str) - The assessment score.
+    :ivar project_score: (str) - The project score.
+    :ivar bonus_marks: (str) - The bonus marks, e.g. "2%".
+    :ivar penalty_marks: (str) - The penalty marks.
+    :ivar result_score: (str) - The overall result.
+    :ivar remark: (str) - The remark on the result.
+    :ivar reason: (str) - The reason for the remark.
+    """
+
+    num: int
+    name: str
+    designation: str
+    email: str
+    cohort: int
+    attendance_count: int
+    attendance_score: str
+    assessment_score: str
+    project_score: str
+    bonus_marks: str
+    penalty_marks: str
+    result_score: str
+    remark: str
+    reason: str
+
+
+class BreakdownHeader(NamedTuple):
+    """
+    The parts of the result breakdown shared by all students.
+
+    :ivar classes: (int) - The number of classes held.
+    :ivar assessment_max: (str) - The weight of the assessment in the result, e.g. "60".
+    :ivar project_max: (str) - The weight of the project in the result.
+    :ivar attendance_req: (str) - The attendance requirement, e.g. "75%".
+    :ivar assessment_req: (str) - The assessment requirement.
+    :ivar result_req: (str) - The pass mark.
+    """
+
+    classes: int
+    assessment_max: str
+    project_max: str
+    attendance_req: str
+    assessment_req: str
+    result_req: str
+
+
+class Breakdown(NamedTuple):
+    """
+    The result breakdown of a cohort.
+
+    :ivar header: (BreakdownHeader) - The values shared by all students.
+    :ivar table: (pd.DataFrame) - One row of formatted values per student, in the order of the result sheet. Rows that cannot be mailed have their reason in the `ERROR` column.
+    """
+
+    header: BreakdownHeader
+    table: pd.DataFrame
+
+    def students(self) -> Iterator[StudentBreakdown]:
+        """
+        :return: (Iterator[StudentBreakdown]) - The breakdown of each student without an error, in the order of the result sheet.
+        :rtype: Iterator[StudentBreakdown]
+        """
+        table = self.table[self.table[ERROR] == ""]
+        columns = [
+            table[SERIAL].tolist(),
+            table[NAME].tolist(),
+            table[DESIGNATION].tolist(),
+            table[EMAIL].tolist(),
+            table[COHORT].astype(int).tolist(),
+            table[ATTENDANCE_COUNT].tolist(),
+            table[ATTENDANCE_SCORE].tolist(),
+            table[ASSESSMENT_SCORE].tolist(),
+            table[PROJECT_SCORE].tolist(),
+            table[BONUS_MARKS].tolist(),
+            table[PENALTY_MARKS].tolist(),
+            table[RESULT_SCORE].tolist(),
+            table[REMARK].tolist(),
+            table[REASON].tolist(),
+        ]
+        for row in zip(*columns):
+            yield StudentBreakdown(*row)
+
+    def bad_records(self) -> list[tuple[int, str, str, str]]:
+        """
+        :return: (list[tuple[int, str, str, str]]) - The serial number, name, email and error of each student that cannot be mailed.
+        :rtype: list[tuple[int, str, str, str]]
+        """
+        table = self.table[self.table[ERROR] != ""]
+        return list(
+            zip(
+                table[SERIAL].tolist(),
+                table[NAME].tolist(),
+                table[EMAIL].tolist(),
+                table[ERROR].tolist(),
+            )
+        )
+
+
+def _fmt(fmt: str, values: np.ndarray) -> list[str]:
+    """Formats every element of `values` with the printf-style `fmt`."""
+    return np.char.mod(fmt, values).tolist()
+
+
+def _max_score(col: str, label: str) -> Result[str]:
+    match = re.search(r"(\d+)", col)
+    if match is None:
+        msg = f"Error parsing {label} max score"
+        eprint(f"{msg}\n")
+        return Result.err(msg)
+    return Result.ok(f"{float(match.group(1)):.0f}")
+
+
+def compute_breakdown(result: pd.DataFrame, data: pd.DataFrame) -> Result[Breakdown]:
+    """
+    Computes the result breakdown of every student in one pass over the columns of the result sheet.
+
+    Scores, bonus and penalty marks and designations are computed for whole columns at once and formatted into strings, so the cost grows linearly with the number of students. Rows of `result` and `data` are matched by position.
+
+    :param result: (pd.DataFrame) - The collated result sheet.
+    :type result: pd.DataFrame
+    :param data: (pd.DataFrame) - The student data, in the same order as `result`.
+    :type data: pd.DataFrame
+
+    :return: (Result[Breakdown]) - The breakdown of the cohort, or an error if a column cannot be found.
+    :rtype: Result[Breakdown]
+    """
+    result_stream: DataStream[pd.DataFrame] = DataStream(result)
+    columns: dict[str, Result[str]] = {
+        "assessment_score": find_col(result_stream, "Assessment", "Score"),
+        "assessment_req": find_col(result_stream, "Assessment", "Req"),
+        "attendance_count": find_col(result_stream, "Attendance", "Count"),
+        "attendance_score": find_col(result_stream, "Attendance", "Score"),
+        "attendance_req": find_col(result_stream, "Attendance", "Req"),
+        "project_score": find_col(result_stream, "Project", "Score"),
+        "result_score": find_col(result_stream, "Result", "Score"),
+        "result_req": find_col(result_stream, "Result", "Req"),
+    }
+    for col in columns.values():
+        if col.is_err():
+            return col.propagate()
+    cols: dict[str, str] = {key: col.unwrap() for key, col in columns.items()}
+
+    assessment_max = _max_score(cols["assessment_score"], "assessment")
+    if assessment_max.is_err():
+        return assessment_max.propagate()
+    project_max = _max_score(cols["project_score"], "project")
+    if project_max.is_err():
+        return project_max.propagate()
+
+    nrows: int = result.shape[0]
+
+    # All scores as arrays, one conversion per column
+    assessment: np.ndarray = result[cols["assessment_score"]].astype(float).to_numpy()
+    attendance_count: np.ndarray = result[cols["attendance_count"]].astype(int).to_numpy()
+    attendance: np.ndarray = result[cols["attendance_score"]].astype(float).to_numpy()
+    project: np.ndarray = result[cols["project_score"]].astype(float).to_numpy()
+    score: np.ndarray = result[cols["result_score"]].astype(float).to_numpy()
+
+    # Marks that are not explained by the assessment and project are bonus marks
+    # when positive and penalty marks when negative
+    marks: np.ndarray = np.round(score - (assessment + project), 0)
+    bonus: np.ndarray = np.where(marks < 0, 0, marks).astype(int)
+    penalty: np.ndarray = np.where(marks < 0, -marks, 0).astype(int)
+
+    classes: float = pd.Series(
+        100 * result[cols["attendance_count"]] / attendance
+    ).mode().iloc[0]
+
+    header = BreakdownHeader(
+        classes=int(round(classes, 0)),
+        assessment_max=assessment_max.unwrap(),
+        project_max=project_max.unwrap(),
+        attendance_req=f"{result[cols['attendance_req']].astype(float).iloc[0]:.0f}%",
+        assessment_req=f"{result[cols['assessment_req']].astype(float).iloc[0]:.2f}%",
+        result_req=f"{result[cols['result_req']].astype(float).iloc[0]:.0f}%",
+    )
+
+    names: pd.Series = result[NAME].astype(str).str.strip().reset_index(drop=True)
+    emails: pd.Series = (
+        data[EMAIL].iloc[:nrows].astype(str).str.strip().reset_index(drop=True)
+    )
+    genders: pd.Series = (
+        data[GENDER].iloc[:nrows].astype(str).str.strip().str.lower().reset_index(drop=True)
+    )
+    designations: np.ndarray = np.select(
+        [genders.str.startswith("m"), genders.str.startswith("f")],
+        ["Mr. ", "Ms. "],
+        default="",
+    )
+    errors: np.ndarray = np.where(emails == "", "Email is empty", "")
+
+    # The cohort is only needed for students who can be mailed
+    valid: np.ndarray = errors == ""
+    cohorts = pd.Series(pd.NA, index=range(nrows), dtype="Int64")
+    cohorts[valid] = data[COHORT].iloc[:nrows].to_numpy()[valid].astype(int)
+
+    table = pd.DataFrame(
+        {
+            SERIAL: np.arange(1, nrows + 1),
+            NAME: names,
+            DESIGNATION: designations,
+            EMAIL: emails,
+            COHORT: cohorts,
+            ATTENDANCE_COUNT: attendance_count,
+            ATTENDANCE_SCORE: _fmt("%.2f%%", attendance),
+            ASSESSMENT_SCORE: _fmt("%.2f%%", assessment),
+            PROJECT_SCORE: _fmt("%.2f%%", project),
+            BONUS_MARKS: _fmt("%.0f%%", bonus),
+            PENALTY_MARKS: _fmt("%.0f%%", penalty),
+            RESULT_SCORE: _fmt("%.2f%%", score),
+            REMARK: result[REMARK].astype(str).to_numpy(),
+            REASON: result[REASON].astype(str).to_numpy(),
+            ERROR: errors,
+        }
+    )
+    return Result.ok(Breakdown(header, table))
+
+
+def read_breakdown(ds: DataStore) -> Result[Breakdown]:
+    """
+    Reads the collated result sheet and computes the result breakdown of every student.
+
+    :param ds: (DataStore) - A DataStore instance containing student data.
+    :type ds: DataStore
+
+    :return: (Result[Breakdown]) - The breakdown of the cohort.
+    :rtype: Result[Breakdown]
+    """
+    path: Path = get_paths_excel()["Result"]
+    if not path.exists():
+        msg = "Results has not been generated yet. Please collate results before running this operation"
+        eprint(msg)
+        return Result.err(msg)
+
+    result = read(path)
+    if result.is_err():
+        return result.propagate()
+    return compute_breakdown(result.unwrap(), ds.as_ref())
+
+
+def export_breakdown(ds: DataStore, path: Path | None = None) -> Result[Unit]:
+    """
+    Writes the result breakdown of every student to a spreadsheet without sending any mail.
+
+    :param ds: (DataStore) - A DataStore instance containing student data.
+    :type ds: DataStore
+    :param path: (Path | None, optional) - The spreadsheet to write. Defaults to the "Breakdown" spreadsheet.
+    :type path: Path | None
+
+    :return: (Result[Unit]) - returns a Result object indicating success or failure.
+    :rtype: Result[Unit]
+    """
+    breakdown = read_breakdown(ds)
+    if breakdown.is_err():
+        return breakdown.propagate()
+    dst: Path = path if path is not None else get_paths_excel()["Breakdown"]
+    return DataStream(breakdown.unwrap().table).to_excel(dst)
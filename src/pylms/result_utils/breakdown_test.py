@@ -0,0 +1,149 @@
+import os
+import time
+import unittest
+from typing import final
+
+import numpy as np
+import pandas as pd
+
+from ..constants import COHORT, EMAIL, GENDER, NAME, REASON, REMARK
+from .breakdown import compute_breakdown
+
+ASSESSMENT_COL = "Assessment [60%]"
+ATTENDANCE_COUNT_COL = "Attendance [12]"
+ATTENDANCE_COL = "Attendance [100%]"
+PROJECT_COL = "Project [40%]"
+RESULT_COL = "Result [100%]"
+
+
+def _frames(nrows: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(7)
+    count = rng.integers(0, 13, nrows)
+    assessment = rng.uniform(0, 60, nrows).round(2)
+    project = rng.uniform(0, 40, nrows).round(2)
+    result = pd.DataFrame(
+        {
+            NAME: [f" Student {i} " for i in range(nrows)],
+            ATTENDANCE_COUNT_COL: count,
+            ATTENDANCE_COL: 100 * count / 12,
+            "Attendance Req": 75.0,
+            ASSESSMENT_COL: assessment,
+            "Assessment Req": 50.0,
+            PROJECT_COL: project,
+            RESULT_COL: (assessment + project + rng.integers(-3, 4, nrows)).round(2),
+            "Result Req": 70.0,
+            REMARK: rng.choice(["Pass", "Fail"], nrows),
+            REASON: "N/A",
+        }
+    )
+    data = pd.DataFrame(
+        {
+            GENDER: rng.choice(["Male", "female", "", " M"], nrows),
+            EMAIL: [f"student{i}@example.com" if i % 17 else " " for i in range(nrows)],
+            COHORT: 31,
+        }
+    )
+    return result, data
+
+
+def _reference(result: pd.DataFrame, data: pd.DataFrame) -> list[tuple[object, ...]]:
+    """The breakdown as it was computed row by row when sending results."""
+    rows: list[tuple[object, ...]] = []
+    for idx in range(result.shape[0]):
+        assessment_score = result.loc[:, ASSESSMENT_COL].astype(float).iloc[idx]
+        attendance_count = result.loc[:, ATTENDANCE_COUNT_COL].astype(int).iloc[idx]
+        attendance_score = result.loc[:, ATTENDANCE_COL].astype(float).iloc[idx]
+        project_score = result.loc[:, PROJECT_COL].astype(float).iloc[idx]
+        result_score = result.loc[:, RESULT_COL].astype(float).iloc[idx]
+        marks = round(result_score - (assessment_score + project_score), 0)
+        penalty, bonus = (-1 * int(marks), 0) if marks < 0 else (0, int(marks))
+        name = result.loc[:, NAME].astype(str).iloc[idx].strip()
+        gender = data.loc[:, GENDER].astype(str).iloc[idx].strip()
+        email = data.loc[:, EMAIL].astype(str).iloc[idx].strip()
+        if email == "":
+            continue
+        designation = (
+            "Mr. "
+            if gender.strip().lower().startswith("m")
+            else "Ms. "
+            if gender.strip().lower().startswith("f")
+            else ""
+        )
+        rows.append(
+            (
+                idx + 1,
+                name,
+                designation,
+                email,
+                int(data.loc[:, COHORT].astype(int).iloc[idx]),
+                int(attendance_count),
+                f"{attendance_score:.2f}%",
+                f"{assessment_score:.2f}%",
+                f"{project_score:.2f}%",
+                f"{bonus:.0f}%",
+                f"{penalty:.0f}%",
+                f"{result_score:.2f}%",
+                result.loc[:, REMARK].astype(str).iloc[idx],
+                result.loc[:, REASON].astype(str).iloc[idx],
+            )
+        )
+    return rows
+
+
+@final
+class BreakdownTest(unittest.TestCase):
+    def test_matches_row_by_row(self) -> None:
+        result, data = _frames(300)
+        breakdown = compute_breakdown(result, data).unwrap()
+
+        students = [
+            (
+                s.num,
+                s.name,
+                s.designation,
+                s.email,
+                s.cohort,
+                s.attendance_count,
+                s.attendance_score,
+                s.assessment_score,
+                s.project_score,
+                s.bonus_marks,
+                s.penalty_marks,
+                s.result_score,
+                s.remark,
+                s.reason,
+            )
+            for s in breakdown.students()
+        ]
+        self.assertEqual(students, _reference(result, data))
+
+        bad = breakdown.bad_records()
+        self.assertEqual([num for num, *_ in bad], [i + 1 for i in range(0, 300, 17)])
+        self.assertTrue(all(error == "Email is empty" for *_, error in bad))
+
+        header = breakdown.header
+        self.assertEqual(header.classes, 12)
+        self.assertEqual((header.assessment_max, header.project_max), ("60", "40"))
+        self.assertEqual(
+            (header.attendance_req, header.assessment_req, header.result_req),
+            ("75%", "50.00%", "70%"),
+        )
+
+    @unittest.skipUnless(os.environ.get("PYLMS_BENCH"), "set PYLMS_BENCH=1 to run benchmarks")
+    def test_scales_linearly(self) -> None:
+        result, data = _frames(2_000)
+
+        start = time.perf_counter()
+        _ = _reference(result, data)
+        row_by_row = time.perf_counter() - start
+
+        start = time.perf_counter()
+        breakdown = compute_breakdown(result, data).unwrap()
+        _ = list(breakdown.students())
+        vectorized = time.perf_counter() - start
+
+        self.assertLess(vectorized * 10, row_by_row)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -5,7 +5,7 @@ import numpy as np
 import pandas as pd
 
 from ..constants import GROUP, NAME, SERIAL
-from ..data import DataStream, read
+from ..data import DataStream, read, submit_export
 from ..errors import Result, Unit, eprint
 from ..paths import get_grade_path, get_group_dir, get_group_path
 
@@ -107,6 +107,9 @@ def prepare_grading(num_groups: int) -> Result[Unit]:
 
 
 def _write_sheets(path: Path, *dfs: tuple[pd.DataFrame, str]) -> None:
-    with pd.ExcelWriter(path) as file:
-        for df, sheet_name in dfs:
-            df.to_excel(file, index=False, sheet_name=sheet_name)  # pyright: ignore[reportUnknownMemberType]
+    def job(dst: Path) -> None:
+        with pd.ExcelWriter(dst) as file:
+            for df, sheet_name in dfs:
+                df.to_excel(file, index=False, sheet_name=sheet_name)  # pyright: ignore[reportUnknownMemberType]
+
+    submit_export(path, job)
@@ -1,169 +1,21 @@
-import re
 from email.message import EmailMessage
-from pathlib import Path
 from smtplib import SMTP
-from typing import Any
-
-import pandas as pd
 
 from ..cli import input_option
 from ..config import read_course_name
-from ..constants import COHORT, EMAIL, GENDER, NAME, REASON, REMARK
-from ..data import DataStore, DataStream, read
-from ..email import run_email
-from ..errors import LMSError, Result, Unit, eprint
-from ..paths import get_paths_excel, must_get_env
-from .find import find_col
-
-
-def _send_result(ds: DataStore, server: SMTP) -> Result[Unit]:
-    """
-    Sends individualized result breakdown emails to students using the provided SMTP server.
-
-    Reads result data from an Excel file, extracts relevant columns for each student,
-    formats a personalized message with their scores and requirements, and sends the message
-    to the student's email address.
-
-    :param ds: (DataStore) - A DataStore instance containing student data.
-    :type ds: DataStore
-    :param server: (SMTP) - An SMTP server instance used to send emails.
-    :type server: SMTP
-
-    :return: (Result[Unit]) - returns a Result object indicating success or failure.
-    :rtype: Result[Unit]
-
-    :raises Exception: Any exceptions raised by the SMTP server's send_message method or data reading functions will propagate.
-    """
-
-    # Get the sender's email address from environment variables
-    sender_email: str = must_get_env("EMAIL")
+from ..data import DataStore
+from ..email import Delivery, campaign_id, run_email, send_campaign
+from ..errors import LMSError, Result, Unit
+from ..messages.message_record import MessageRecord
+from ..messages.template import Template
+from ..paths import must_get_env
+from .breakdown import BreakdownHeader, StudentBreakdown, read_breakdown
 
-    # Get the path to the result Excel file
-    path: Path = get_paths_excel()["Result"]
 
-    # Get course name
-    course_name = read_course_name()
-    if course_name.is_err():
-        return course_name.propagate()
-    course_name = course_name.unwrap()
-
-    # Read the result data into a DataFrame
-    result = read(path)
-
-    if result.is_err():
-        return result.propagate()
-    result = result.unwrap()
-
-    # Wrap the DataFrame in a DataStream for further processing
-    result_stream: DataStream[pd.DataFrame] = DataStream(result)
-    result = result_stream()
-
-    # Get the data from the DataStore
-    data: pd.DataFrame = ds.as_ref()
-
-    # Find the relevant column names for each required field
-    assessment_score_col: str = find_col(result_stream, "Assessment", "Score").unwrap()
-    assessment_max_match: re.Match[str] | None = re.search(
-        r"(\d+)", assessment_score_col
-    )
-    if assessment_max_match is None:
-        msg = "Error parsing assessment max score"
-        eprint(f"{msg}\n")
-        return Result.err(msg)
-
-    assessment_max: float = float(assessment_max_match.group(1))
-
-    assessment_req_col: str = find_col(result_stream, "Assessment", "Req").unwrap()
-    attendance_count_col: str = find_col(result_stream, "Attendance", "Count").unwrap()
-    attendance_score_col: str = find_col(result_stream, "Attendance", "Score").unwrap()
-    attendance_req_col: str = find_col(result_stream, "Attendance", "Req").unwrap()
-    project_score_col: str = find_col(result_stream, "Project", "Score").unwrap()
-
-    project_max_match: re.Match[str] | None = re.search(r"(\d+)", project_score_col)
-    if project_max_match is None:
-        msg = "Error parsing project max score"
-        print(f"{msg}\n")
-        return Result.err(msg)
-
-    project_max: float = float(project_max_match.group(1))
-
-    result_col: str = find_col(result_stream, "Result", "Score").unwrap()
-    result_req_col: str = find_col(result_stream, "Result", "Req").unwrap()
-
-    # extract all requirements
-    assessment_req: float = result.loc[:, assessment_req_col].astype(float).iloc[0]
-    attendance_req: float = result.loc[:, attendance_req_col].astype(float).iloc[0]
-    result_req: float = result.loc[:, result_req_col].astype(float).iloc[0]
-
-    attendance_score_data: pd.Series = (
-        100
-        * result.loc[:, attendance_count_col]
-        / result.loc[:, attendance_score_col].astype(float)
-    )
-    classes_float: float = attendance_score_data.mode().iloc[0]
-    classes: int = int(round(classes_float, 0))
-
-    bad_records: list[tuple[int, str, str, dict[str, Any]]] = []
-
-    # Iterate over each student in the result DataFrame
-    for idx in range(result.shape[0]):
-        # Extract all scores and requirements for the current student
-        assessment_score: float = (
-            result.loc[:, assessment_score_col].astype(float).iloc[idx]
-        )
-        attendance_count: int = (
-            result.loc[:, attendance_count_col].astype(int).iloc[idx]
-        )
-        attendance_score: float = (
-            result.loc[:, attendance_score_col].astype(float).iloc[idx]
-        )
-
-        project_score: float = result.loc[:, project_score_col].astype(float).iloc[idx]
-        result_score: float = result.loc[:, result_col].astype(float).iloc[idx]
-
-        remark: str = result.loc[:, REMARK].astype(str).iloc[idx]
-        reason: str = result.loc[:, REASON].astype(str).iloc[idx]
-
-        marks: float = result_score - (assessment_score + project_score)
-        marks = round(marks, 0)
-
-        if marks < 0:
-            penalty_marks: int = -1 * int(marks)
-            bonus_marks: int = 0
-        else:
-            penalty_marks = 0
-            bonus_marks = int(marks)
-
-        # Extract data fields for the current student
-        name: str = result.loc[:, NAME].astype(str).iloc[idx]
-        name = name.strip()
-        gender: str = data.loc[:, GENDER].astype(str).iloc[idx]
-        gender = gender.strip()
-        email: str = data.loc[:, EMAIL].astype(str).iloc[idx]
-        email = email.strip()
-
-        # Check if the email is empty
-        if email == "":
-            bad_records.append((idx + 1, name, email, {"error": (1, "Email is empty")}))
-            continue
-
-        cohort: int = data.loc[:, COHORT].astype(int).iloc[idx]
-
-        attendance_score_str: str = f"{attendance_score:.2f}%"
-        attendance_req_str: str = f"{attendance_req:.0f}%"
-        assessment_score_str: str = f"{assessment_score:.2f}%"
-        assessment_req_str: str = f"{assessment_req:.2f}%"
-        project_score_str: str = f"{project_score:.2f}%"
-        result_score_str: str = f"{result_score:.2f}%"
-        result_req_str: str = f"{result_req:.0f}%"
-        bonus_marks_str: str = f"{bonus_marks:.0f}%"
-        penalty_marks_str: str = f"{penalty_marks:.0f}%"
-
-        # Compose the personalized message for the student
-        msg: str = f"""
+_RESULT_HTML: str = """
 <h2>
   <bold>
-    Dear {"Mr. " if gender.strip().lower().startswith("m") else "Ms. " if gender.strip().lower().startswith("f") else ""}{name},
+    Dear {designation}{name},
   <bold>
 </h2>
 
@@ -182,33 +34,33 @@ def _send_result(ds: DataStore, server: SMTP) -> Result[Unit]:
     <tbody>
       <tr>
         <td style="padding: 8px;">Attendance (100%)</td>
-        <td style="padding: 8px;">{attendance_score_str}</td>
-        <td style="padding: 8px;">{attendance_req_str}</td>
+        <td style="padding: 8px;">{attendance_score}</td>
+        <td style="padding: 8px;">{attendance_req}</td>
       </tr>
       <tr>
-        <td style="padding: 8px;">Assessment ({assessment_max:.0f}%)</td>
-        <td style="padding: 8px;">{assessment_score_str}</td>
-        <td style="padding: 8px;">{assessment_req_str}</td>
+        <td style="padding: 8px;">Assessment ({assessment_max}%)</td>
+        <td style="padding: 8px;">{assessment_score}</td>
+        <td style="padding: 8px;">{assessment_req}</td>
       </tr>
       <tr>
-        <td style="padding: 8px;">Project ({project_max:.0f}%)</td>
-        <td style="padding: 8px;">{project_score_str}</td>
+        <td style="padding: 8px;">Project ({project_max}%)</td>
+        <td style="padding: 8px;">{project_score}</td>
         <td style="padding: 8px;">N/A</td>
       </tr>
       <tr>
         <td style="padding: 8px;">Bonus Marks (+ve)</td>
-        <td style="padding: 8px;">{bonus_marks_str}</td>
+        <td style="padding: 8px;">{bonus_marks}</td>
         <td style="padding: 8px;">N/A</td>
       </tr>
       <tr>
         <td style="padding: 8px;">Penalty Marks (-ve)</td>
-        <td style="padding: 8px;">{penalty_marks_str}</td>
+        <td style="padding: 8px;">{penalty_marks}</td>
         <td style="padding: 8px;">N/A</td>
       </tr>
       <tr>
         <td style="padding: 8px;">Result (100%)</td>
-        <td style="padding: 8px;">{result_score_str}</td>
-        <td style="padding: 8px;">{result_req_str}</td>
+        <td style="padding: 8px;">{result_score}</td>
+        <td style="padding: 8px;">{result_req}</td>
       </tr>
     </tbody>
 </table>
@@ -242,25 +94,7 @@ def _send_result(ds: DataStore, server: SMTP) -> Result[Unit]:
 </footer>
         """
 
-        # Create the email message
-        email_msg: EmailMessage = EmailMessage()
-        email_msg["Subject"] = f"{course_name} Cohort {cohort} Result"
-        email_msg.set_content(
-            "This is an HTML email. Please view in a compatible client."
-        )
-        email_msg.add_alternative(msg, subtype="html")
-
-        try:
-            # Send the email to the student
-            if idx == 0:
-                email_msg = EmailMessage()
-                email_msg["Subject"] = (
-                    f"Test: {read_course_name()} Cohort {cohort} Result"
-                )
-                email_msg.set_content(
-                    "This is an HTML email. Please view in a compatible client."
-                )
-                mod_msg = f"""
+_PREVIEW_HTML: str = """
 <h2>
   <bold>
     Dear Facilitator. Please confirm the format for this email before I send to all the students.
@@ -268,37 +102,127 @@ def _send_result(ds: DataStore, server: SMTP) -> Result[Unit]:
 </h2>
 {msg}
               """
-                email_msg.add_alternative(mod_msg, subtype="html")
-                email1: str = must_get_env("FACILITATOR_EMAIL1")
-                email2: str = must_get_env("FACILITATOR_EMAIL2")
-                send_err: dict[str, tuple[int, bytes]] = server.send_message(
-                    email_msg, from_addr=sender_email, to_addrs=[email1, email2]
-                )
-
-                option_result = input_option(
-                    ["Yes", "No"],
-                    prompt=f"Please confirm the format of the email as sent to either {email1} or {email2}. Is it okay? ",
-                )
-                if option_result.is_err():
-                    return Result[Unit].err(option_result.unwrap_err())
-                option_idx, _ = option_result.unwrap()
-                if option_idx != 1:
-                    return Result[Unit].err(Exception("Email format not okay"))
-
-            send_err = server.send_message(
-                email_msg, from_addr=sender_email, to_addrs=email
-            )
-        except Exception as e:
-            send_err = {"error": (1, bytes(str(e), "utf-8"))}
 
-        num: int = idx + 1
-        if send_err != {}:
-            bad_records.append((num, name, email, send_err))
-        else:
+
+def _result_message(
+    template: Template, student: StudentBreakdown, course_name: str
+) -> tuple[EmailMessage, str]:
+    """
+    Renders the result email of one student.
+
+    :param template: (Template) - The result email compiled with the values shared by all students.
+    :type template: Template
+    :param student: (StudentBreakdown) - The result breakdown of the student.
+    :type student: StudentBreakdown
+    :param course_name: (str) - The name of the course.
+    :type course_name: str
+
+    :return: (tuple[EmailMessage, str]) - The email message and its HTML body.
+    :rtype: tuple[EmailMessage, str]
+    """
+    msg: str = template.render(
+        designation=student.designation,
+        name=student.name,
+        attendance_count=str(student.attendance_count),
+        attendance_score=student.attendance_score,
+        assessment_score=student.assessment_score,
+        project_score=student.project_score,
+        bonus_marks=student.bonus_marks,
+        penalty_marks=student.penalty_marks,
+        result_score=student.result_score,
+        remark=student.remark,
+        reason=student.reason,
+    )
+    email_msg: EmailMessage = EmailMessage()
+    email_msg["Subject"] = f"{course_name} Cohort {student.cohort} Result"
+    email_msg.set_content("This is an HTML email. Please view in a compatible client.")
+    email_msg.add_alternative(msg, subtype="html")
+    return email_msg, msg
+
+
+def _send_result(ds: DataStore) -> Result[Unit]:
+    """
+    Sends individualized result breakdown emails to students over a pool of SMTP connections.
+
+    Computes the result breakdown of every student in one vectorized pass with `read_breakdown`,
+    renders a personalized message with their scores and requirements for each student as it is sent,
+    and sends the messages to the students' email addresses concurrently once the facilitators
+    confirm the format. Students who already received their result in an earlier run are skipped.
+
+    :param ds: (DataStore) - A DataStore instance containing student data.
+    :type ds: DataStore
+
+    :return: (Result[Unit]) - returns a Result object indicating success or failure.
+    :rtype: Result[Unit]
+    """
+
+    # Get the sender's email address from environment variables
+    sender_email: str = must_get_env("EMAIL")
+
+    # Get course name
+    course_name = read_course_name()
+    if course_name.is_err():
+        return course_name.propagate()
+    course_name = course_name.unwrap()
+
+    # Compute the breakdown of every student at once
+    breakdown = read_breakdown(ds)
+    if breakdown.is_err():
+        return breakdown.propagate()
+    breakdown = breakdown.unwrap()
+
+    # Fill in the values shared by all students once
+    header: BreakdownHeader = breakdown.header
+    template = Template(
+        _RESULT_HTML,
+        classes=str(header.classes),
+        assessment_max=header.assessment_max,
+        project_max=header.project_max,
+        attendance_req=header.attendance_req,
+        assessment_req=header.assessment_req,
+        result_req=header.result_req,
+    )
+
+    bad_records: list[tuple[int, str, str, str]] = breakdown.bad_records()
+    students: list[StudentBreakdown] = list(breakdown.students())
+
+    if len(students) > 0:
+        # Send a copy for the facilitators to confirm the format before anything is sent
+        first, first_html = _result_message(template, students[0], course_name)
+        preview: EmailMessage = EmailMessage()
+        preview["Subject"] = f"Test: {first['Subject']}"
+        preview.set_content("This is an HTML email. Please view in a compatible client.")
+        preview.add_alternative(_PREVIEW_HTML.format(msg=first_html), subtype="html")
+        confirm = run_email(
+            lambda server: _confirm_preview(server, preview, sender_email)
+        )
+        if confirm.is_err():
+            return confirm.propagate()
+
+    # Send the results not yet delivered for this cohort through the outbox
+    # and collect the outcome for each student. Messages are rendered as they are sent.
+    deliveries: list[Delivery] = []
+    if len(students) > 0:
+        subject: str = f"{course_name} Cohort {students[0].cohort} Result"
+        records = (
+            MessageRecord(
+                name=student.name,
+                email=student.email,
+                message=_result_message(template, student, course_name)[0],
+            )
+            for student in students
+        )
+        deliveries = send_campaign(campaign_id("result", subject), records, sender_email)
+    for delivery in deliveries:
+        num: int = students[delivery.index].num
+        if delivery.ok:
             print(
-                f"\nS/N: {num}. Successfully sent email to {name} with email: {email}"
+                f"\nS/N: {num}. Successfully sent email to {delivery.name} with email: {delivery.email}"
             )
+        else:
+            bad_records.append((num, str(delivery.name), delivery.email, str(delivery.error)))
 
+    bad_records.sort(key=lambda record: record[0])
     for num, name, email, send_err in bad_records:
         print(
             f"\nS/N: {num}. Error sending email to {name} with email: {email}.\nError encountered: {send_err}"
@@ -310,6 +234,39 @@ def _send_result(ds: DataStore, server: SMTP) -> Result[Unit]:
     return Result[Unit].unit()
 
 
+def _confirm_preview(server: SMTP, preview: EmailMessage, sender: str) -> Result[Unit]:
+    """
+    Sends the preview of a result email to the facilitators and asks whether its format is okay.
+
+    :param server: (SMTP) - An SMTP server instance used to send the preview.
+    :type server: SMTP
+    :param preview: (EmailMessage) - The preview message.
+    :type preview: EmailMessage
+    :param sender: (str) - The sender's email address.
+    :type sender: str
+
+    :return: (Result[Unit]) - Ok if the facilitators confirm the format, otherwise an error.
+    :rtype: Result[Unit]
+    """
+    email1: str = must_get_env("FACILITATOR_EMAIL1")
+    email2: str = must_get_env("FACILITATOR_EMAIL2")
+    try:
+        _ = server.send_message(preview, from_addr=sender, to_addrs=[email1, email2])
+    except Exception as e:
+        return Result[Unit].err(e)
+
+    option_result = input_option(
+        ["Yes", "No"],
+        prompt=f"Please confirm the format of the email as sent to either {email1} or {email2}. Is it okay? ",
+    )
+    if option_result.is_err():
+        return Result[Unit].err(option_result.unwrap_err())
+    option_idx, _ = option_result.unwrap()
+    if option_idx != 1:
+        return Result[Unit].err(Exception("Email format not okay"))
+    return Result[Unit].unit()
+
+
 def mail_result(ds: DataStore) -> Result[Unit]:
     """
     Initiates the process of sending result emails to students.
@@ -327,6 +284,5 @@ def mail_result(ds: DataStore) -> Result[Unit]:
     :raises Exception: Any exceptions raised during the email sending process (such as SMTP errors) may propagate.
     """
 
-    # Run the email sending process using the configured email utility.
-    # The lambda ensures the DataStore is passed to the result-sending logic.
-    return run_email(lambda server: _send_result(ds, server))
+    # Run the email sending process; it manages its own SMTP connections.
+    return _send_result(ds)
@@ -3,6 +3,7 @@ from .cds import record_cds
 from .cohort import record_cohort
 from .excused import record_excused
 from .input_dates import input_class_date
+from .marking import Turnout, mark_attendance
 from .present import record_present
 from .read_cds import extract_cds
 from .record import run_record
@@ -15,5 +16,7 @@ __all__ = [
     "record_cohort",
     "record_present",
     "record_cds",
+    "mark_attendance",
+    "Turnout",
     "run_record",
 ]
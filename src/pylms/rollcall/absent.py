@@ -3,7 +3,7 @@ import pandas as pd
 from ..constants import DATE
 from ..data import DataStore, DataStream
 from ..record import RecordStatus
-from .names_filter import filter_names
+from .marking import KEPT_STATUSES
 
 
 def record_absent(
@@ -14,23 +14,11 @@ def record_absent(
         data_ref[turnout_date] = RecordStatus.ABSENT
         return None
 
-    turnout_stream = filter_names(turnout_stream)
-    turnout_data: pd.DataFrame = turnout_stream()
-    date_col: str = turnout_data[DATE].iloc[0]
+    date_col: str = turnout_stream()[DATE].iloc[0]
 
-    class_record: list[str] = data_ref[date_col].tolist()
-    new_class_record: list[str] = [
-        RecordStatus.ABSENT
-        if old_record
-        not in [
-            RecordStatus.PRESENT,
-            RecordStatus.NO_CLASS,
-            RecordStatus.EXCUSED,
-            RecordStatus.CDS,
-        ]
-        else old_record
-        for old_record in class_record
-    ]
-
-    data_ref[date_col] = new_class_record
+    # Vectorized membership test instead of scanning a list per record
+    class_record: pd.Series = data_ref[date_col]
+    data_ref[date_col] = class_record.where(
+        class_record.isin(KEPT_STATUSES), str(RecordStatus.ABSENT)
+    )
     return None
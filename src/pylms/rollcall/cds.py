@@ -1,50 +1,75 @@
 import re
-from typing import cast
 
 import pandas as pd
 
 from ..constants import CDS, NAME, WORK_DAYS
-from ..data import DataStore, DataStream
+from ..data import STATUS_DTYPE, DataStore, DataStream, encode_status, to_status_column
 from ..date import to_day_num
 from ..record import RecordStatus
 
+_DATE_COL: re.Pattern[str] = re.compile(r"^\d{2}/\d{2}/\d{4}")
 
-def record_cds(ds: DataStore, cds_data_stream: DataStream[pd.DataFrame]) -> None:
-    pretty = ds.to_pretty()
-    names = pretty.loc[:, NAME].astype(str)
-    data_ref = ds.as_ref()
-    cds_data = cds_data_stream()
 
-    cds_names = cds_data[NAME].tolist()
-    cds_names = [name.title() for name in cds_names]
-    cds_days = cds_data[CDS].tolist()
+def date_cols_by_day(columns: pd.Index) -> dict[int, list[str]]:
+    """Group the class date columns of a DataStore by their ISO weekday.
 
-    for idx, row in data_ref.iterrows():
-        idx = cast(int, idx)
-        new_row = row.copy()
-        each_name = names.iloc[idx]
+    Args:
+        columns (pd.Index): Columns of the DataStore.
 
-        if each_name not in cds_names:
+    Returns:
+        dict[int, list[str]]: Date columns keyed by weekday number (Monday is 1).
+    """
+    by_day: dict[int, list[str]] = {}
+    for col in columns:
+        if not isinstance(col, str) or _DATE_COL.fullmatch(col) is None:
             continue
+        by_day.setdefault(to_day_num(col), []).append(col)
+    return by_day
 
-        cds_name_idx: int = cds_names.index(each_name)
-        cds_day: str = cds_days[cds_name_idx]
 
-        if cds_day not in WORK_DAYS:
-            continue
+def cds_day_nums(names: pd.Series, cds_data: pd.DataFrame) -> pd.Series:
+    """Look up the CDS weekday of every student.
+
+    A student listed more than once keeps their first entry, and entries
+    that are not a work day are ignored.
+
+    Args:
+        names (pd.Series): Student names in DataStore order.
+        cds_data (pd.DataFrame): CDS form responses with `NAME` and `CDS` columns.
+
+    Returns:
+        pd.Series: Weekday number aligned with `names`, `NaN` for students
+            without a CDS work day.
+    """
+    cds_days = pd.Series(
+        cds_data[CDS].to_numpy(), index=cds_data[NAME].astype(str).str.title()
+    )
+    cds_days = cds_days[~cds_days.index.duplicated(keep="first")]
+    cds_days = cds_days[cds_days.isin(WORK_DAYS)]
+    day_nums = {day: to_day_num(day) for day in WORK_DAYS}
+    return names.map(cds_days.map(day_nums))
 
-        cds_day_num: int = to_day_num(cds_day)
 
-        for index in row.index:
-            if re.fullmatch(r"^\d{2}/\d{2}/\d{4}", index) is None:
-                continue
-            date_col: str = index
-            date_day_num: int = to_day_num(date_col)
-            if cds_day_num == date_day_num and new_row.at[date_col] != str(
-                RecordStatus.NO_CLASS
-            ):
-                new_row.at[date_col] = str(RecordStatus.CDS)
+def record_cds(ds: DataStore, cds_data_stream: DataStream[pd.DataFrame]) -> None:
+    names = ds.to_pretty()[NAME].astype(str)
+    data_ref = ds.as_ref()
+
+    student_days = cds_day_nums(names, cds_data_stream()).to_numpy()
+    no_class = str(RecordStatus.NO_CLASS)
+
+    for day_num, date_cols in date_cols_by_day(data_ref.columns).items():
+        mask = student_days == day_num
+        if not mask.any():
+            continue
+
+        # Columns created empty are float; make room for the statuses
+        for col in date_cols:
+            if data_ref[col].dtype not in (object, STATUS_DTYPE):
+                data_ref[col] = to_status_column(encode_status(data_ref[col]), data_ref.index)
 
-        data_ref.loc[idx, :] = new_row
+        block = data_ref.loc[mask, date_cols]
+        data_ref.loc[mask, date_cols] = block.where(
+            block == no_class, str(RecordStatus.CDS)
+        )
 
     return None
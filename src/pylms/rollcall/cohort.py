@@ -1,11 +1,19 @@
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from ..cli import input_bool
 from ..constants import COHORT, DATA_COLUMNS, DATE_FMT
-from ..data import DataStore, DataStream
+from ..data import (
+    STATUS_CATEGORIES,
+    DataStore,
+    DataStream,
+    encode_status,
+    status_code,
+    to_status_column,
+)
 from ..errors import Result, eprint
 from ..history import (
     History,
@@ -45,6 +53,13 @@ def fill_records(record_input: str) -> RecordStatus:
             return RecordStatus.ABSENT
 
 
+# `fill_records` over status codes; the last entry is what -1 (no status) maps to
+_FILLED_CODES: np.ndarray = np.array(
+    [status_code(fill_records(status)) for status in [*STATUS_CATEGORIES, ""]],
+    dtype=np.int8,
+)
+
+
 def record_cohort(ds: DataStore, history: History) -> Result[Path]:
     # get DataStore data in its pretty form
     pretty: pd.DataFrame = ds.pretty()
@@ -119,12 +134,9 @@ def record_cohort(ds: DataStore, history: History) -> Result[Path]:
         # if `column` is in `DATA_COLUMNS` i.e., it is not a date column skip
         if column in DATA_COLUMNS:
             continue
-        # format column by using fill_record on all its entries
-        class_record = cohort_data.loc[:, column].astype(str)
-        new_class_record = [fill_records(record) for record in class_record]
-        new_class_record = [str(record) for record in new_class_record]
-        # update the column data with the `new_class_record`
-        cohort_data.loc[:, column] = new_class_record
+        # format column by applying fill_records to all its entries at once
+        codes = encode_status(cohort_data[column])
+        cohort_data[column] = to_status_column(_FILLED_CODES[codes], cohort_data.index)
 
     # output the data to local file storage
     cohort_stream = DataStream(cohort_data)
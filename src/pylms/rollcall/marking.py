@@ -0,0 +1,103 @@
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from ..constants import DATE, NAME
+from ..data import DataStore, DataStream, encode_status, status_code, to_status_column
+from ..record import RecordStatus
+from .names_filter import filter_names
+
+# Statuses an absent mark never overwrites.
+KEPT_STATUSES: list[str] = [
+    RecordStatus.PRESENT,
+    RecordStatus.NO_CLASS,
+    RecordStatus.EXCUSED,
+    RecordStatus.CDS,
+]
+
+_PRESENT: int = status_code(RecordStatus.PRESENT)
+_EXCUSED: int = status_code(RecordStatus.EXCUSED)
+_ABSENT: int = status_code(RecordStatus.ABSENT)
+_KEPT: np.ndarray = np.array([status_code(status) for status in KEPT_STATUSES])
+
+
+class Turnout(NamedTuple):
+    """Names collected by the attendance forms of one class date.
+
+    Attributes:
+        date (str): Class date column the turnout marks.
+        present (pd.Series): Names of the students who marked themselves present.
+        excused (pd.Series): Names of the students who asked to be excused.
+    """
+
+    date: str
+    present: pd.Series
+    excused: pd.Series
+
+
+def turnout_names(turnout_stream: DataStream[pd.DataFrame]) -> pd.Series:
+    """Return the names in a form turnout that were submitted on the class date.
+
+    Args:
+        turnout_stream (DataStream[pd.DataFrame]): Responses of a class form.
+
+    Returns:
+        pd.Series: The names as strings; empty if the form has no responses.
+    """
+    if turnout_stream.is_empty():
+        return pd.Series([], dtype=object)
+    return filter_names(turnout_stream)()[NAME].astype(str)
+
+
+def turnout_date(turnout_stream: DataStream[pd.DataFrame]) -> str:
+    """Return the class date a non-empty form turnout was collected for."""
+    return str(turnout_stream()[DATE].iloc[0])
+
+
+def mark_codes(
+    names: pd.Series, codes: np.ndarray, present: pd.Series, excused: pd.Series
+) -> np.ndarray:
+    """Mark one class date in a single vectorized pass.
+
+    The outcome matches marking present, then excused, then absent one after
+    the other: excused students are marked excused, other present students
+    are marked present, and everybody else becomes absent unless they
+    already hold one of the `KEPT_STATUSES`.
+
+    Args:
+        names (pd.Series): Student names in DataStore order.
+        codes (np.ndarray): Current status codes of the class date.
+        present (pd.Series): Names on the present form.
+        excused (pd.Series): Names on the excused form.
+
+    Returns:
+        np.ndarray: New status codes.
+    """
+    is_present = names.isin(present).to_numpy()
+    is_excused = names.isin(excused).to_numpy()
+    kept = np.where(np.isin(codes, _KEPT), codes, _ABSENT)
+    return np.where(is_excused, _EXCUSED, np.where(is_present, _PRESENT, kept))
+
+
+def mark_attendance(ds: DataStore, turnouts: Sequence[Turnout]) -> None:
+    """Mark present, excused and absent students for many class dates.
+
+    Student names are normalized once for all dates and every date is
+    marked with `mark_codes`, so the cost is linear in students × dates.
+
+    Args:
+        ds (DataStore): DataStore holding the class date columns.
+        turnouts (Sequence[Turnout]): Turnout of each date to mark.
+    """
+    if len(turnouts) == 0:
+        return None
+
+    names: pd.Series = ds.to_pretty()[NAME].astype(str)
+    data_ref: pd.DataFrame = ds.as_ref()
+    for turnout in turnouts:
+        codes = encode_status(data_ref[turnout.date])
+        new_codes = mark_codes(names, codes, turnout.present, turnout.excused)
+        data_ref[turnout.date] = to_status_column(new_codes, data_ref.index)
+    return None
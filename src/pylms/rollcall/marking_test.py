@@ -0,0 +1,86 @@
+import unittest
+from typing import final, override
+
+import numpy as np
+import pandas as pd
+
+from ..data import decode_status, encode_status
+from ..record import RecordStatus
+from .marking import KEPT_STATUSES, mark_codes
+
+
+def _mark_by_row(
+    names: list[str], column: list[object], present: list[str], excused: list[str]
+) -> list[object]:
+    """Row by row marking as done before the vectorized engine."""
+    marked: list[object] = []
+    for name, status in zip(names, column):
+        if name in excused:
+            marked.append(str(RecordStatus.EXCUSED))
+        elif name in present:
+            marked.append(str(RecordStatus.PRESENT))
+        elif status in KEPT_STATUSES:
+            marked.append(status)
+        else:
+            marked.append(str(RecordStatus.ABSENT))
+    return marked
+
+
+@final
+class MarkingTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.names = pd.Series([f"Student {i}" for i in range(8)])  # pyright: ignore [reportUninitializedInstanceVariable]
+        self.column = pd.Series(  # pyright: ignore [reportUninitializedInstanceVariable]
+            [
+                np.nan,
+                "Absent",
+                "CDS",
+                "No Class",
+                "Excused",
+                "Present",
+                " ",
+                np.nan,
+            ],
+            dtype=object,
+        )
+
+    def test_encode_round_trip(self) -> None:
+        codes = encode_status(self.column)
+        self.assertEqual(codes[0], -1)
+        self.assertEqual(
+            decode_status(codes[1:-1]).tolist(), self.column.iloc[1:-1].tolist()
+        )
+
+    def test_matches_row_by_row(self) -> None:
+        present = pd.Series(["Student 0", "Student 1", "Student 2", "Student 7"])
+        excused = pd.Series(["Student 1", "Student 6"])
+        codes = mark_codes(self.names, encode_status(self.column), present, excused)
+        expected = _mark_by_row(
+            self.names.tolist(),
+            self.column.tolist(),
+            present.tolist(),
+            excused.tolist(),
+        )
+        self.assertEqual(decode_status(codes).tolist(), expected)
+
+    def test_empty_turnout_keeps_statuses(self) -> None:
+        empty = pd.Series([], dtype=object)
+        codes = mark_codes(self.names, encode_status(self.column), empty, empty)
+        self.assertEqual(
+            decode_status(codes).tolist(),
+            [
+                "Absent",
+                "Absent",
+                "CDS",
+                "No Class",
+                "Excused",
+                "Present",
+                "Absent",
+                "Absent",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -1,6 +1,6 @@
 from ..data import DataStore
 from ..errors import Result, Unit
-from ..form_retrieve import ClassType, retrieve_class_form
+from ..form_retrieve import ClassType, retrieve_class_forms
 from ..history import (
     History,
     add_marked_class,
@@ -9,10 +9,8 @@ from ..history import (
     match_info_by_date,
 )
 from ..info import print_info, printpass
-from .absent import record_absent
-from .excused import record_excused
 from .input_dates import input_class_date
-from .present import record_present
+from .marking import Turnout, mark_attendance, turnout_names
 
 
 def run_record(ds: DataStore, history: History) -> Result[Unit]:
@@ -23,38 +21,50 @@ def run_record(ds: DataStore, history: History) -> Result[Unit]:
 
     dates = dates.unwrap()
 
+    # Retrieve the turnout of every date in one sweep, then mark them all in one pass
+    retrieved = retrieve_class_forms(history, dates)
+    turnouts: list[Turnout] = []
     for each_date in dates:
-        present_turnout = retrieve_class_form(history, each_date, ClassType.PRESENT)
+        present_turnout = retrieved[(each_date, ClassType.PRESENT)]
 
         if present_turnout.is_err():
             continue
 
         present_turnout = present_turnout.unwrap()
 
-        excused_turnout = retrieve_class_form(history, each_date, ClassType.EXCUSED)
+        excused_turnout = retrieved[(each_date, ClassType.EXCUSED)]
 
         if excused_turnout.is_err():
             continue
 
         excused_turnout = excused_turnout.unwrap()
 
-        if not present_turnout.is_empty():
-            record_present(ds, present_turnout)
-            print_info(f"Attendance for {each_date} marked successfully")
-        else:
+        if present_turnout.is_empty():
             print_info(
                 f"Class Form for {each_date} which marks 'Present' students has no responses"
             )
 
-        if not excused_turnout.is_empty():
-            record_excused(ds, excused_turnout)
-            print_info(f"Excused List for {each_date} marked successfully")
-        else:
+        if excused_turnout.is_empty():
             print_info(
                 f"Class Form for {each_date} which marks 'Excused' students has no responses"
             )
 
-        record_absent(ds, present_turnout, each_date)
+        turnouts.append(
+            Turnout(
+                date=each_date,
+                present=turnout_names(present_turnout),
+                excused=turnout_names(excused_turnout),
+            )
+        )
+
+    mark_attendance(ds, turnouts)
+
+    for turnout in turnouts:
+        each_date = turnout.date
+        if len(turnout.present) > 0:
+            print_info(f"Attendance for {each_date} marked successfully")
+        if len(turnout.excused) > 0:
+            print_info(f"Excused List for {each_date} marked successfully")
 
         info = match_info_by_date(history, each_date)
         if info.is_err():
@@ -65,8 +75,10 @@ def run_record(ds: DataStore, history: History) -> Result[Unit]:
         _ = add_marked_class(history, each_date).unwrap()
         print_info(f"Recorded all those absent for date '{each_date}'")
 
-    for date in dates:
-        class_num = match_date_index(history, date).unwrap()
-        printpass(f"Recorded attendance for Class {class_num} held on '{date}'")
+    for turnout in turnouts:
+        class_num = match_date_index(history, turnout.date).unwrap()
+        printpass(
+            f"Recorded attendance for Class {class_num} held on '{turnout.date}'"
+        )
 
     return Result.unit()
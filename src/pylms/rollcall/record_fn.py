@@ -1,9 +1,9 @@
 import pandas as pd
 
-from ..constants import DATE, NAME
+from ..constants import NAME
 from ..data import DataStore, DataStream
 from ..record import RecordStatus
-from .names_filter import filter_names
+from .marking import turnout_date, turnout_names
 
 
 def record(
@@ -13,16 +13,13 @@ def record(
     data_ref: pd.DataFrame = ds.as_ref()
     all_names = pretty.loc[:, NAME].astype(str)
 
-    turnout_stream = filter_names(turnout_stream)
-    turnout_data: pd.DataFrame = turnout_stream()
-    present_names = turnout_data.loc[:, NAME].astype(str)
-    class_date: str = turnout_data[DATE].iloc[0]
+    present_names = turnout_names(turnout_stream)
+    class_date: str = turnout_date(turnout_stream)
 
-    class_record = data_ref.loc[:, class_date].astype(str)
+    class_record = data_ref[class_date]
 
-    new_class_record = [
-        str(fill_value) if each_name in present_names.tolist() else old_record
-        for each_name, old_record in zip(all_names, class_record)
-    ]
-    data_ref.loc[:, class_date] = new_class_record
+    # Hash-based membership test over the whole column instead of a list scan
+    # per student. Replacing the column keeps its status encoding.
+    is_present = all_names.isin(present_names)
+    data_ref[class_date] = class_record.where(~is_present, str(fill_value))
     return None
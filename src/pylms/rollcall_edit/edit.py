@@ -11,6 +11,7 @@ from ..history import (
     get_unmarked_classes,
 )
 from ..models import ClassFormInfo
+from ..record import RecordStatus
 from .edit_all import edit_all_records
 from .edit_multiple import edit_multiple_records
 from .edit_single import edit_single_record
@@ -53,8 +54,9 @@ def edit_record(ds: DataStore, history: History) -> Result[Unit]:
     data = ds.as_ref()
 
     for date in edited_dates_to_mark:
-        data[date] = data[date].astype(str)
-        data.loc[:, date] = data[date].replace("nan", "Absent")  # pyright: ignore[reportUnknownMemberType]
+        # students left without a status are absent; "Absent" is a category
+        # of the encoded columns, so they stay encoded
+        data[date] = data[date].fillna(str(RecordStatus.ABSENT))
 
         result = add_held_class(history, date)
         if result.is_err():
@@ -4,7 +4,7 @@ from ..cli import input_bool
 from ..constants import COMMA_DELIM, NAME
 from ..data import DataStore
 from ..errors import Result, Unit
-from ..history import History, all_dates
+from ..history import History
 from ..info import print_info
 from ..record import RecordStatus
 from .record_input import RECORDS, input_record
@@ -42,7 +42,8 @@ def edit_single_serial(
     if len(dates) == 0:
         raise Result.fail("dates argument cannot be empty")
 
-    bad_dates = [date for date in dates if date not in all_dates(history, "")]
+    class_dates = history.calendar.positions
+    bad_dates = [date for date in dates if date not in class_dates]
     if len(bad_dates) > 0:
         dates_str = COMMA_DELIM.join(bad_dates)
         msg = f"The following dates: '{dates_str}' do not correspond to any class dates"
@@ -142,7 +143,7 @@ def edit_single_date(
     if len(serials) == 0:
         raise Result.fail("serials argument cannot be empty")
 
-    if date not in all_dates(history, ""):
+    if history.calendar.position(date) is None:
         msg = f"Date: '{date}' is not a valid class date"
         raise Result.fail(msg)
 
@@ -5,10 +5,18 @@ from ._resource import (
     ResponseResource,
 )
 from .form_create import run_create_form
+from .form_provision import (
+    FormJob,
+    ServiceFactory,
+    provision_form,
+    run_provision_forms,
+)
 from .form_publish import run_publish_form
 from .form_setup import run_setup_form
 from .form_share import run_share_form
-from .service_init import run_service
+from .retry import RATE_LIMIT_STATUS, RETRY_STATUS, execute, is_retryable
+from .service_init import build_services, run_service
+from .session import ClientSession, SessionStats, get_session
 
 __all__ = [
     "run_service",
@@ -16,6 +24,18 @@ __all__ = [
     "run_publish_form",
     "run_setup_form",
     "run_share_form",
+    "run_provision_forms",
+    "provision_form",
+    "FormJob",
+    "ServiceFactory",
+    "build_services",
+    "execute",
+    "is_retryable",
+    "RETRY_STATUS",
+    "RATE_LIMIT_STATUS",
+    "ClientSession",
+    "SessionStats",
+    "get_session",
     "FormResource",
     "FormsService",
     "DriveResource",
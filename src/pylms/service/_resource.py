@@ -20,6 +20,7 @@ class ResponseResource(ABC):
         formId: str,
         filter: str | None = None,
         pageSize: int = 5000,
+        pageToken: str | None = None,
     ) -> HttpRequest:
         """
         Currently, the only supported filters are: * timestamp > *N* which means to get all form responses submitted after (but not at) timestamp *N*. * timestamp >= *N* which means to get all form responses submitted at and after timestamp *N*. For both supported filters, timestamp must be formatted in RFC3339 UTC "Zulu" format. Examples: "2014-10-02T15:01:23Z" and "2014-10-02T15:01:23.045123456Z".
@@ -30,6 +31,8 @@ class ResponseResource(ABC):
         :type filter: str | None
         :param pageSize: ( int, optional ): The number of responses to return per page. Defaults to 5000.
         :type pageSize: int
+        :param pageToken: ( str | None, optional ): The `nextPageToken` returned by a previous list request. Defaults to None.
+        :type pageToken: str | None
 
         :return: ( HttpRequest ): A request which when executed returns the responses from the selected form.
         :rtype: HttpRequest
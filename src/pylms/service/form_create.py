@@ -7,6 +7,7 @@ from ..errors import eprint
 from ..info import print_info
 from ..models import Form, FormData
 from ._resource import FormResource, FormsService
+from .retry import RATE_LIMIT_STATUS, execute
 from .service_init import run_service
 
 
@@ -39,7 +40,7 @@ def _create_form(
     form_resource: FormResource = service.forms()
     try:
         create_request: HttpRequest = form_resource.create(body=request_body)
-        response: dict[Any, Any] = create_request.execute()  # pyright: ignore[reportUnknownMemberType]
+        response: dict[Any, Any] = execute(create_request, retry_on=RATE_LIMIT_STATUS)
         form_url: str | None = response.get(url_key)  # pyright: ignore[reportUnknownMemberType]
         form_id: str | None = response.get(form_key)  # pyright: ignore[reportUnknownMemberType]
         if form_url is None or form_id is None:
@@ -0,0 +1,132 @@
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from ..constants import FORM_WORKERS
+from ..errors import Result, eprint
+from ..models import ContentBody, Form
+from ._resource import DriveResource, FormsService
+from .form_create import _create_form  # pyright: ignore[reportPrivateUsage]
+from .form_publish import _publish_form  # pyright: ignore[reportPrivateUsage]
+from .form_setup import _setup_form  # pyright: ignore[reportPrivateUsage]
+from .form_share import _share_form  # pyright: ignore[reportPrivateUsage]
+from .service_init import build_services
+
+type ServiceFactory = Callable[[], tuple[FormsService, DriveResource]]
+
+
+class FormJob(NamedTuple):
+    """
+    Everything needed to provision one Google Form.
+
+    :param title: (str) - The title of the form as seen by the end user.
+    :param name: (str) - The name of the form as seen on the Google Forms webpage.
+    :param content: (ContentBody) - The items the form is set up with.
+    """
+
+    title: str
+    name: str
+    content: ContentBody
+
+
+def provision_form(
+    job: FormJob, email: str, *, forms: FormsService, drive: DriveResource
+) -> Result[Form]:
+    """
+    Runs the create, setup, publish and share steps of a form one after the other.
+
+    :param job: (FormJob) - The form to provision.
+    :type job: FormJob
+    :param email: (str) - The email address the form is shared with.
+    :type email: str
+    :param forms: (FormsService) - The Forms client used for the first three steps.
+    :type forms: FormsService
+    :param drive: (DriveResource) - The Drive client used to share the form.
+    :type drive: DriveResource
+
+    :return: (Result[Form]) - Ok with the shared form, or Err naming the step that failed.
+    :rtype: Result[Form]
+    """
+    created = _create_form(job.title, job.name, service=forms)
+    if created is None:
+        msg = f"Form creation failed for form '{job.name}'."
+        eprint(msg)
+        return Result.err(msg)
+
+    # From here on the form exists in Drive; name it so it can be removed
+    left_behind = f"The form was created but not completed. Delete it from Google Drive.\nUrl: {created.url}"
+
+    form = _setup_form(created, job.content, service=forms)
+    if form is None:
+        msg = f"Form setup failed for form '{job.name}'. {left_behind}"
+        eprint(msg)
+        return Result.err(msg)
+
+    form = _publish_form(form, service=forms)
+    if form is None:
+        msg = f"Failed to publish form '{job.name}'. {left_behind}"
+        eprint(msg)
+        return Result.err(msg)
+
+    form = _share_form(form, email, service=drive)
+    if form is None:
+        msg = f"Form sharing failed when trying to share form '{job.name}'. {left_behind}"
+        eprint(msg)
+        return Result.err(msg)
+
+    return Result.ok(form)
+
+
+def run_provision_forms(
+    jobs: Sequence[FormJob],
+    email: str,
+    *,
+    max_workers: int = FORM_WORKERS,
+    services: ServiceFactory = build_services,
+) -> list[Result[Form]]:
+    """
+    Provisions many forms concurrently on a bounded pool of threads. Each thread builds its own API clients with `services` the first time it runs a job, since the clients cannot be shared between threads. Once a job fails, jobs that have not started yet are skipped.
+
+    :param jobs: (Sequence[FormJob]) - The forms to provision.
+    :type jobs: Sequence[FormJob]
+    :param email: (str) - The email address every form is shared with.
+    :type email: str
+    :param max_workers: (int, optional) - The maximum number of forms provisioned at once. Defaults to FORM_WORKERS.
+    :type max_workers: int
+    :param services: (ServiceFactory, optional) - Builds the Forms and Drive clients of a thread. Defaults to `build_services`.
+    :type services: ServiceFactory
+
+    :return: (list[Result[Form]]) - The outcome of every job, in the order of `jobs`.
+    :rtype: list[Result[Form]]
+    """
+    local = threading.local()
+    failed = threading.Event()
+
+    def _run(job: FormJob) -> Result[Form]:
+        if failed.is_set():
+            return Result.err(f"Provisioning of form '{job.name}' was cancelled.")
+
+        clients: tuple[FormsService, DriveResource] | None = getattr(
+            local, "clients", None
+        )
+        if clients is None:
+            try:
+                clients = services()
+            except Exception as e:
+                failed.set()
+                msg = f"Failed to build the Google API clients. Error details: {e}"
+                eprint(msg)
+                return Result.err(msg)
+            local.clients = clients
+        forms, drive = clients
+
+        result = provision_form(job, email, forms=forms, drive=drive)
+        if result.is_err():
+            failed.set()
+        return result
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="forms"
+    ) as executor:
+        return list(executor.map(_run, jobs))
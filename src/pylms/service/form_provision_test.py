@@ -0,0 +1,162 @@
+import threading
+import unittest
+from typing import Any, Callable, Self, final, override
+
+import httplib2  # pyright: ignore[reportMissingTypeStubs]
+from googleapiclient.errors import HttpError  # pyright: ignore[reportMissingTypeStubs]
+
+from ..models import ContentBody, FormData, PermissionsData
+from ._resource import DriveResource, FormResource, FormsService, ResponseResource
+from .form_provision import FormJob, run_provision_forms
+from .retry import RATE_LIMIT_STATUS, execute
+
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": status}), b"fake error")
+
+
+@final
+class FakeRequest:
+    def __init__(self, func: Callable[[], Any]) -> None:
+        self.func = func
+
+    def execute(self) -> Any:
+        return self.func()
+
+
+@final
+class FakeForms(FormResource, FormsService):
+    """In-memory Forms API that fails the first calls listed in `failures`."""
+
+    def __init__(self, failures: dict[str, list[int]] | None = None) -> None:
+        self.failures = failures if failures is not None else {}
+        self.lock = threading.Lock()
+        self.calls: list[str] = []
+        self.count = 0
+
+    def _call(self, step: str, value: Any) -> FakeRequest:
+        def _execute() -> Any:
+            with self.lock:
+                self.calls.append(step)
+                statuses = self.failures.get(step, [])
+                if len(statuses) > 0:
+                    raise _http_error(statuses.pop(0))
+            return value
+
+        return FakeRequest(_execute)
+
+    @override
+    def forms(self) -> Self:
+        return self
+
+    @override
+    def create(self, *, body: FormData) -> Any:
+        with self.lock:
+            self.count += 1
+            uuid = f"form-{self.count}"
+        return self._call("create", {"formId": uuid, "responderUri": f"url/{uuid}"})
+
+    @override
+    def get(self, *, formId: str) -> Any:
+        return self._call("get", {"formId": formId})
+
+    @override
+    def batchUpdate(self, *, formId: str, body: dict[str, Any]) -> Any:
+        return self._call("setup", {})
+
+    @override
+    def setPublishSettings(self, *, formId: str, body: dict[str, Any]) -> Any:
+        return self._call("publish", {})
+
+    @override
+    def responses(self) -> ResponseResource:
+        raise NotImplementedError
+
+
+@final
+class FakeDrive(DriveResource):
+    def __init__(self) -> None:
+        self.shared: list[str] = []
+
+    @override
+    def permissions(self) -> Self:
+        return self
+
+    @override
+    def create(self, *, fileId: str, body: PermissionsData) -> Any:
+        return FakeRequest(lambda: self.shared.append(fileId))
+
+
+@final
+class FormProvisionTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.jobs = [  # pyright: ignore[reportUninitializedInstanceVariable]
+            FormJob(title=f"Title {i}", name=f"Name {i}", content=ContentBody(requests=[]))
+            for i in range(6)
+        ]
+
+    def test_provision_in_order(self) -> None:
+        forms, drive = FakeForms(), FakeDrive()
+        results = run_provision_forms(
+            self.jobs, "a@b.com", max_workers=3, services=lambda: (forms, drive)
+        )
+        names = [result.unwrap().name for result in results]
+        self.assertEqual(names, [job.name for job in self.jobs])
+        self.assertEqual(len(drive.shared), len(self.jobs))
+        self.assertEqual(forms.calls.count("publish"), len(self.jobs))
+
+    def test_fail_fast(self) -> None:
+        forms = FakeForms({"setup": [403]})
+        results = run_provision_forms(
+            self.jobs, "a@b.com", max_workers=1, services=lambda: (forms, FakeDrive())
+        )
+        self.assertTrue(results[0].is_err())
+        self.assertTrue(all(result.is_err() for result in results[1:]))
+        self.assertEqual(forms.calls.count("create"), 1)
+
+    def test_retry(self) -> None:
+        forms = FakeForms({"create": [429, 503]})
+        response = execute(forms.create(body={}), backoff=0.0)
+        self.assertEqual(response["formId"], "form-1")
+        self.assertEqual(forms.calls, ["create"] * 3)
+
+    def test_no_retry(self) -> None:
+        forms = FakeForms({"create": [404]})
+        with self.assertRaises(HttpError):
+            _ = execute(forms.create(body={}), backoff=0.0)
+
+    def test_no_server_error_retry_when_not_idempotent(self) -> None:
+        forms = FakeForms({"create": [503]})
+        with self.assertRaises(HttpError):
+            _ = execute(forms.create(body={}), backoff=0.0, retry_on=RATE_LIMIT_STATUS)
+        self.assertEqual(forms.calls, ["create"])
+
+        forms = FakeForms({"create": [429]})
+        _ = execute(forms.create(body={}), backoff=0.0, retry_on=RATE_LIMIT_STATUS)
+        self.assertEqual(forms.calls, ["create"] * 2)
+
+    def test_create_and_setup_not_retried_on_server_error(self) -> None:
+        forms = FakeForms({"create": [500]})
+        results = run_provision_forms(
+            self.jobs[:1], "a@b.com", max_workers=1, services=lambda: (forms, FakeDrive())
+        )
+        self.assertTrue(results[0].is_err())
+        self.assertEqual(forms.calls, ["create"])
+
+        forms = FakeForms({"setup": [502]})
+        results = run_provision_forms(
+            self.jobs[:1], "a@b.com", max_workers=1, services=lambda: (forms, FakeDrive())
+        )
+        self.assertTrue(results[0].is_err())
+        self.assertEqual(forms.calls, ["create", "setup"])
+
+    def test_retries_exhausted(self) -> None:
+        forms = FakeForms({"create": [500, 500, 500]})
+        with self.assertRaises(HttpError):
+            _ = execute(forms.create(body={}), retries=2, backoff=0.0)
+        self.assertEqual(len(forms.calls), 3)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -3,6 +3,7 @@ from ..errors import eprint
 from ..info import print_info
 from ..models import Form, PublishRequest, PublishSettings, PublishState
 from ._resource import FormsService
+from .retry import execute
 from .service_init import run_service
 
 
@@ -17,7 +18,7 @@ def _publish_form(form: Form, service: FormsService) -> Form | None:
     )
 
     try:
-        _ = request.execute()  # pyright: ignore[reportUnknownMemberType]
+        _ = execute(request)
         print_info(
             f"Form with \nName = {emphasis(form.name)}\nTitle = {emphasis(form.title)}"
         )
@@ -7,6 +7,7 @@ from ..errors import eprint
 from ..info import print_info
 from ..models import ContentBody, Form
 from ._resource import FormResource, FormsService
+from .retry import RATE_LIMIT_STATUS, execute
 from .service_init import run_service
 
 
@@ -42,7 +43,7 @@ def _setup_form(
         request: HttpRequest = form_resource.batchUpdate(
             formId=form_id, body=request_body
         )
-        request.execute()  # pyright: ignore [reportUnknownMemberType]
+        execute(request, retry_on=RATE_LIMIT_STATUS)
         print_info(
             f"Form with \nName = {emphasis(form.name)}\nTitle = {emphasis(form.title)}\nUrl = {emphasis(form.url)}"
         )
@@ -7,6 +7,7 @@ from ..errors import eprint
 from ..info import printpass
 from ..models import Form, PermissionsData
 from ._resource import DriveResource
+from .retry import execute
 from .service_init import run_service
 
 
@@ -32,7 +33,7 @@ def _share_form(form: Form, email: str, *, service: DriveResource) -> Form | Non
         share_request: HttpRequest = drive_resource.create(
             fileId=form.uuid, body=user_permission
         )
-        share_request.execute()  # pyright: ignore[reportUnknownMemberType]
+        execute(share_request)
         printpass(
             f"Success, form {emphasis(form.name)} has been shared to {email}. SUCCESS\n"
         )
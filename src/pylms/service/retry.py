@@ -0,0 +1,71 @@
+import random
+import time
+from typing import Any, Protocol
+
+from googleapiclient.errors import HttpError  # pyright: ignore[reportMissingTypeStubs]
+
+from ..constants import API_BACKOFF, API_RETRIES
+from ..info import print_info
+
+# Status codes worth retrying: rate limiting and transient server failures.
+RETRY_STATUS: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+# Status codes worth retrying for requests that are not idempotent, such as
+# `forms.create` and `batchUpdate`. A server error may come back after the
+# request was applied, so sending it again could create a second form or
+# add the questions twice; a rate limited request was never applied.
+RATE_LIMIT_STATUS: frozenset[int] = frozenset({429})
+
+
+class Executable(Protocol):
+    def execute(self) -> Any: ...
+
+
+def is_retryable(error: Exception, retry_on: frozenset[int] = RETRY_STATUS) -> bool:
+    """
+    :param error: (Exception) - The error raised while executing a request.
+    :type error: Exception
+    :param retry_on: (frozenset[int], optional) - The statuses worth retrying. Defaults to RETRY_STATUS.
+    :type retry_on: frozenset[int]
+
+    :return: (bool) - True if the error is an `HttpError` whose status shows the request may succeed when sent again.
+    :rtype: bool
+    """
+    return isinstance(error, HttpError) and error.status_code in retry_on
+
+
+def execute(
+    request: Executable,
+    *,
+    retries: int = API_RETRIES,
+    backoff: float = API_BACKOFF,
+    retry_on: frozenset[int] = RETRY_STATUS,
+) -> Any:
+    """
+    Executes a Google API request, retrying rate limited and transient server errors with exponential backoff and full jitter. Any other error, or the last retryable one, is raised to the caller. Requests that are not idempotent should pass `retry_on=RATE_LIMIT_STATUS`.
+
+    :param request: (Executable) - The request to execute, usually an `HttpRequest`.
+    :type request: Executable
+    :param retries: (int, optional) - The maximum number of retries after the first attempt. Defaults to API_RETRIES.
+    :type retries: int
+    :param backoff: (float, optional) - The delay in seconds before the first retry. It doubles after every retry. Defaults to API_BACKOFF.
+    :type backoff: float
+    :param retry_on: (frozenset[int], optional) - The statuses that are retried. Defaults to RETRY_STATUS.
+    :type retry_on: frozenset[int]
+
+    :return: (Any) - The response of the request.
+    :rtype: Any
+    """
+    attempt: int = 0
+    while True:
+        try:
+            return request.execute()
+        except Exception as e:
+            if attempt >= retries or not is_retryable(e, retry_on):
+                raise
+            delay = random.uniform(0, backoff * 2**attempt)
+            attempt += 1
+            print_info(
+                f"Request failed with a retryable error, retrying in {delay:.1f}s ({attempt}/{retries}). Error details: {e}"
+            )
+            time.sleep(delay)
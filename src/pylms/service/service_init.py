@@ -1,19 +1,8 @@
 from typing import Callable, Literal, overload
 
-from apiclient import discovery  # pyright: ignore[reportMissingTypeStubs]
-from google.oauth2.service_account import Credentials as ServiceCredentials
-
-from ..constants import SECRETS_PATH
 from ._resource import DriveResource, FormsService
-
-
-def load_creds() -> ServiceCredentials:
-    """
-    :return: (ServiceCredentials) - The credentials loaded from the file at SECRETS_PATH
-    :rtype: ServiceCredentials
-    """
-    creds = ServiceCredentials.from_service_account_file(str(SECRETS_PATH))  # pyright: ignore[reportUnknownMemberType]
-    return creds
+from .session import get_session
+from .session import load_creds as load_creds
 
 
 @overload
@@ -36,14 +25,26 @@ def run_service[T: FormsService | DriveResource, K](
     func: Callable[[T], K],
 ) -> K:
     """
-    Creates a Google API client from the credentials stored in the path specified by SECRETS_PATH, and calls the provided function with the created service as an argument.
+    Calls the provided function with the Google API client of the process-wide `ClientSession`. The client is built from the credentials stored in the path specified by SECRETS_PATH the first time it is needed and reused afterwards.
 
     :param api: The API to be used. Must be "drive" or "forms".
     :param version: The version of the API to use. Must be "v3" or "v1".
     :param func: The function to be called with the created service as an argument.
 
-    :return: The result of calling the provided function with the created service as an argument.
+    :return: The result of calling the provided function with the client as an argument.
+    """
+    service: T = get_session().client(api, version)
+    return func(service)
+
+
+def build_services() -> tuple[FormsService, DriveResource]:
+    """
+    Returns the Forms and Drive clients of the calling thread from the process-wide `ClientSession`. The clients are not thread-safe, so every thread gets its own pair.
+
+    :return: (tuple[FormsService, DriveResource]) - The Forms client and the Drive client.
+    :rtype: tuple[FormsService, DriveResource]
     """
-    creds: ServiceCredentials = load_creds()
-    with discovery.build(api, version, credentials=creds) as service:  # pyright: ignore[reportUnknownMemberType]
-        return func(service)
+    session = get_session()
+    forms: FormsService = session.client("forms", "v1")
+    drive: DriveResource = session.client("drive", "v3")
+    return forms, drive
@@ -0,0 +1,198 @@
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple, final
+
+import httplib2  # pyright: ignore[reportMissingTypeStubs]
+from apiclient import discovery  # pyright: ignore[reportMissingTypeStubs]
+from google.oauth2.service_account import Credentials as ServiceCredentials
+from googleapiclient import discovery_cache  # pyright: ignore[reportMissingTypeStubs]
+
+from ..constants import DISCOVERY_CACHE_PATH, SECRETS_PATH
+
+DISCOVERY_URL: str = "https://{api}.googleapis.com/$discovery/rest?version={version}"
+
+
+class SessionStats(NamedTuple):
+    """
+    Counters of a `ClientSession`.
+
+    :param hits: (int) - Clients served from the cache.
+    :param misses: (int) - Clients that had to be built.
+    :param fetches: (int) - Discovery documents downloaded because no copy was on disk or bundled.
+    """
+
+    hits: int
+    misses: int
+    fetches: int
+
+
+def _fetch_document(api: str, version: str) -> str:
+    response, content = httplib2.Http().request(  # pyright: ignore[reportUnknownMemberType]
+        DISCOVERY_URL.format(api=api, version=version)
+    )
+    if response.status >= 400:  # pyright: ignore[reportUnknownMemberType]
+        msg = f"Failed to download the discovery document of {api} {version}: HTTP {response.status}"  # pyright: ignore[reportUnknownMemberType]
+        raise RuntimeError(msg)
+    return content.decode("utf-8")  # pyright: ignore[reportUnknownMemberType]
+
+
+@final
+class ClientSession:
+    """
+    Process-wide cache of authorized Google API clients.
+
+    The service account file is read once, the first time a client is
+    needed, and the discovery document of every (api, version) is kept on
+    disk under `cache_dir` so that clients are built without a network
+    round trip. A built client owns one authorized `Http`, whose token is
+    refreshed by google-auth when a request finds it missing or expired.
+
+    Clients hold a non thread-safe `httplib2.Http`, so each thread gets its
+    own client per (api, version); the credentials and discovery documents
+    are shared.
+
+    :param cache_dir: (Path) - Directory holding the discovery documents.
+    :param load: (Callable[[], ServiceCredentials]) - Loads the credentials.
+    """
+
+    def __init__(
+        self, cache_dir: Path, load: Callable[[], ServiceCredentials]
+    ) -> None:
+        self.cache_dir: Path = cache_dir
+        self._load: Callable[[], ServiceCredentials] = load
+        self._lock: threading.Lock = threading.Lock()
+        self._local: threading.local = threading.local()
+        self._creds: ServiceCredentials | None = None
+        self._documents: dict[tuple[str, str], str] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+        self._fetches: int = 0
+
+    def credentials(self) -> ServiceCredentials:
+        """
+        :return: (ServiceCredentials) - The credentials, loaded on first use.
+        :rtype: ServiceCredentials
+        """
+        with self._lock:
+            if self._creds is None:
+                self._creds = self._load()
+            return self._creds
+
+    def _document_path(self, api: str, version: str) -> Path:
+        return self.cache_dir / f"{api}.{version}.json"
+
+    def document(self, api: str, version: str) -> str:
+        """
+        Returns the discovery document of an API, looking in memory, then on disk, then in the documents bundled with googleapiclient and finally on the network. Documents not read from disk are written there.
+
+        :param api: (str) - The API name, e.g. "forms".
+        :type api: str
+        :param version: (str) - The API version, e.g. "v1".
+        :type version: str
+
+        :return: (str) - The discovery document as JSON text.
+        :rtype: str
+        """
+        key = (api, version)
+        with self._lock:
+            if key in self._documents:
+                return self._documents[key]
+
+        path = self._document_path(api, version)
+        document: str | None = None
+        if path.exists():
+            document = path.read_text(encoding="utf-8")
+        else:
+            document = discovery_cache.get_static_doc(api, version)  # pyright: ignore[reportUnknownMemberType]
+            if document is None:
+                document = _fetch_document(api, version)
+                with self._lock:
+                    self._fetches += 1
+            self._store_document(path, document)
+
+        with self._lock:
+            return self._documents.setdefault(key, document)
+
+    def _store_document(self, path: Path, document: str) -> None:
+        # The disk copy is only an optimization; failing to write it is fine
+        try:
+            _ = json.loads(document)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                _ = file.write(document)
+            os.replace(tmp_name, path)
+        except (OSError, ValueError):
+            pass
+
+    def client(self, api: str, version: str) -> Any:
+        """
+        Returns the client of an API for the calling thread, building it on first use.
+
+        :param api: (str) - The API name, e.g. "forms".
+        :type api: str
+        :param version: (str) - The API version, e.g. "v1".
+        :type version: str
+
+        :return: (Any) - The API client.
+        :rtype: Any
+        """
+        clients: dict[tuple[str, str], Any] | None = getattr(
+            self._local, "clients", None
+        )
+        if clients is None:
+            clients = {}
+            self._local.clients = clients
+
+        key = (api, version)
+        if key in clients:
+            with self._lock:
+                self._hits += 1
+            return clients[key]
+
+        with self._lock:
+            self._misses += 1
+        client = discovery.build_from_document(  # pyright: ignore[reportUnknownMemberType]
+            self.document(api, version), credentials=self.credentials()
+        )
+        clients[key] = client
+        return client
+
+    def stats(self) -> SessionStats:
+        """
+        :return: (SessionStats) - The hit, miss and fetch counters.
+        :rtype: SessionStats
+        """
+        with self._lock:
+            return SessionStats(self._hits, self._misses, self._fetches)
+
+    def clear(self) -> None:
+        """Drops the credentials and the clients of the calling thread, so they are rebuilt on next use."""
+        with self._lock:
+            self._creds = None
+        self._local.clients = {}
+
+
+def load_creds() -> ServiceCredentials:
+    """
+    :return: (ServiceCredentials) - The credentials loaded from the file at SECRETS_PATH
+    :rtype: ServiceCredentials
+    """
+    creds = ServiceCredentials.from_service_account_file(str(SECRETS_PATH))  # pyright: ignore[reportUnknownMemberType]
+    return creds
+
+
+# Session shared by `run_service` and `build_services`.
+_SESSION = ClientSession(DISCOVERY_CACHE_PATH, load_creds)
+
+
+def get_session() -> ClientSession:
+    """
+    :return: (ClientSession) - The process-wide client session.
+    :rtype: ClientSession
+    """
+    return _SESSION
@@ -0,0 +1,66 @@
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, final, override
+
+from google.auth.credentials import AnonymousCredentials
+
+from .session import ClientSession
+
+
+@final
+class ClientSessionTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()  # pyright: ignore[reportUninitializedInstanceVariable]
+        self.loads = 0  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    @override
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _load(self) -> Any:
+        self.loads += 1
+        return AnonymousCredentials()
+
+    def _session(self) -> ClientSession:
+        return ClientSession(Path(self.tmp.name), self._load)
+
+    def test_client_cached(self) -> None:
+        session = self._session()
+        forms = session.client("forms", "v1")
+        self.assertIs(session.client("forms", "v1"), forms)
+        _ = session.client("drive", "v3")
+
+        self.assertEqual(self.loads, 1)
+        stats = session.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.fetches), (1, 2, 0))
+
+    def test_client_per_thread(self) -> None:
+        session = self._session()
+        forms = session.client("forms", "v1")
+        other: list[Any] = []
+        thread = threading.Thread(target=lambda: other.append(session.client("forms", "v1")))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], forms)
+        self.assertEqual(self.loads, 1)
+
+    def test_document_on_disk(self) -> None:
+        _ = self._session().document("forms", "v1")
+        path = Path(self.tmp.name) / "forms.v1.json"
+        self.assertTrue(path.exists())
+
+        # A later session reads the copy on disk instead of the bundled one
+        document = json.loads(path.read_text(encoding="utf-8"))
+        document["title"] = "From disk"
+        _ = path.write_text(json.dumps(document), encoding="utf-8")
+        self.assertEqual(
+            json.loads(self._session().document("forms", "v1"))["title"], "From disk"
+        )
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -1,11 +1,11 @@
 import unittest
-from pathlib import Path
 from typing import final, override
 from unittest import TestCase
 from uuid import UUID
 
 from pylms import paths
 from pylms.cache.cache import cache_for_cmd
+from pylms.cache.store import SnapshotStore
 from pylms.constants import CACHE_ID
 from pylms.data import read
 from pylms.data_service import load
@@ -20,7 +20,7 @@ class TestCopyData(TestCase):
     Unit test class for testing the cache_for_cmd functionality.
 
     This test class sets up the necessary data and history, performs operations to mark CDS records,
-    caches the command, and verifies that the snapshot path exists as expected.
+    caches the command, and verifies that the snapshot manifest exists as expected.
     """
 
     @override
@@ -69,11 +69,9 @@ class TestCopyData(TestCase):
         # Extract the snapshot ID from the cache record
         snapshot_id = cache_record[CACHE_ID].loc[0]
 
-        # Get the snapshot path using the snapshot ID
-        snapshot_path: Path = paths.get_snapshot_path(UUID(hex=snapshot_id, version=4))
-
-        # Assert that the snapshot path exists
-        self.assertTrue(snapshot_path.exists())
+        # Assert that the snapshot manifest exists in the snapshot store
+        store = SnapshotStore.default()
+        self.assertTrue(store.has_snapshot(UUID(hex=snapshot_id, version=4)))
 
 
 if __name__ == "__main__":
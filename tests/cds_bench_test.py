@@ -0,0 +1,90 @@
+import os
+import re
+import time
+import unittest
+from typing import cast, final
+
+import numpy as np
+import pandas as pd
+
+from pylms.constants import CDS, DATA_COLUMNS, NAME, WORK_DAYS
+from pylms.data import DataStore, DataStream
+from pylms.date import to_day_num
+from pylms.record import RecordStatus
+from pylms.rollcall import record_cds
+
+
+def _record_cds_by_row(ds: DataStore, cds_data_stream: DataStream[pd.DataFrame]) -> None:
+    """Row by row CDS marking as done before the columnar rewrite."""
+    names = ds.to_pretty().loc[:, NAME].astype(str)
+    data_ref = ds.as_ref()
+    cds_data = cds_data_stream()
+    cds_names = [name.title() for name in cds_data[NAME].tolist()]
+    cds_days = cds_data[CDS].tolist()
+
+    for idx, row in data_ref.iterrows():
+        idx = cast(int, idx)
+        new_row = row.copy()
+        each_name = names.iloc[idx]
+        if each_name not in cds_names:
+            continue
+        cds_day: str = cds_days[cds_names.index(each_name)]
+        if cds_day not in WORK_DAYS:
+            continue
+        cds_day_num = to_day_num(cds_day)
+        for index in row.index:
+            if re.fullmatch(r"^\d{2}/\d{2}/\d{4}", index) is None:
+                continue
+            if to_day_num(index) == cds_day_num and new_row.at[index] != str(
+                RecordStatus.NO_CLASS
+            ):
+                new_row.at[index] = str(RecordStatus.CDS)
+        data_ref.loc[idx, :] = new_row
+
+
+def _build(students: int, dates: int) -> tuple[DataStore, DataStream[pd.DataFrame]]:
+    rng = np.random.default_rng(students + dates)
+    data: dict[str, object] = {col: ["N/A"] * students for col in DATA_COLUMNS}
+    data[NAME] = [f"Student {i}" for i in range(students)]
+    date_cols = pd.date_range("2026-01-05", periods=dates, freq="D").strftime("%d/%m/%Y")
+    statuses = ["Present", "Absent", "No Class", "Excused", np.nan]
+    for col in date_cols:
+        data[col] = rng.choice(np.array(statuses, dtype=object), size=students)
+    ds = DataStore.from_data(pd.DataFrame(data)).unwrap()
+
+    # Duplicate names, lower-case names, non work days and unknown students
+    responders = rng.choice(students, size=students // 2, replace=False)
+    cds_names = [f"student {i}" for i in responders] + ["Student 0", "Nobody"]
+    days = WORK_DAYS + ["Saturday", np.nan]
+    cds_days = rng.choice(np.array(days, dtype=object), size=len(cds_names))
+    cds = pd.DataFrame({NAME: cds_names, CDS: cds_days})
+    return ds, DataStream(cds)
+
+
+@final
+class CdsBenchTest(unittest.TestCase):
+    def test_matches_row_by_row(self) -> None:
+        ds, cds = _build(300, 21)
+        expected, _ = _build(300, 21)
+        record_cds(ds, cds)
+        _record_cds_by_row(expected, cds)
+        pd.testing.assert_frame_equal(ds(), expected(), check_dtype=False)
+
+    @unittest.skipUnless(os.environ.get("PYLMS_BENCH"), "set PYLMS_BENCH=1 to run benchmarks")
+    def test_speedup(self) -> None:
+        ds, cds = _build(2_000, 30)
+        expected, _ = _build(2_000, 30)
+
+        start = time.perf_counter()
+        record_cds(ds, cds)
+        columnar = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _record_cds_by_row(expected, cds)
+        by_row = time.perf_counter() - start
+
+        self.assertLess(columnar * 10, by_row)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
@@ -0,0 +1,112 @@
+import os
+import time
+import unittest
+from typing import final
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from pylms.constants import COMPLETION, EMAIL, GENDER, INTERNSHIP, NAME, PHONE, TIME
+from pylms.data import DataStore, DataStream
+from pylms.errors import Result
+from pylms.preprocess import RegInfo, clean_reg_eager, clean_reg_lazy
+
+INFO = RegInfo(cohort=31, date="06/01/2026", day_first=True)
+
+
+def _sheet(rows: int, string_times: bool = False) -> pd.DataFrame:
+    """Synthetic registration sheet with the quirks of real exports."""
+    rng = np.random.default_rng(rows)
+    surnames = np.array([f"Surname{i}" for i in range(rows // 5)], dtype=object)
+    names = rng.choice(surnames, size=rows) + " Student"
+
+    phones: list[object] = []
+    for i, shape in enumerate(rng.integers(0, 6, size=rows)):
+        digits = f"{8_000_000_000 + i:010d}"
+        match shape:
+            case 0:
+                phones.append(int(digits))
+            case 1:
+                phones.append(f"0{digits}")
+            case 2:
+                phones.append(f" 0{digits[:3]} {digits[3:6]} {digits[6:]} ")
+            case 3:
+                phones.append(f"+234{digits}")
+            case 4:
+                phones.append(f"0{digits}/0{digits[::-1]}")
+            case _:
+                phones.append(np.nan)
+
+    times = pd.Timestamp("2026-01-02 08:00:00") + pd.to_timedelta(
+        rng.integers(0, 10**6, size=rows), unit="s"
+    )
+    completions = rng.choice(
+        np.array(["15/08/2026", "2026-09-01", "March 2027", "01/02/2027"], dtype=object),
+        size=rows,
+    )
+    data = pd.DataFrame(
+        {
+            TIME: times.strftime("%d/%m/%Y %H:%M:%S") if string_times else times,
+            NAME: names,
+            GENDER: rng.choice(np.array(["Male", "Female", np.nan], dtype=object), size=rows),
+            PHONE: pd.Series(phones, dtype=object),
+            EMAIL: [f" Student{i % (rows - rows // 10)}@Mail.COM " for i in range(rows)],
+            INTERNSHIP: rng.choice(np.array(["nysc", "siwes", "Nysc"], dtype=object), size=rows),
+            COMPLETION: completions,
+            "Address": ["Somewhere"] * rows,
+        }
+    )
+    # Repeat a slice so that some rows are exact duplicates of earlier ones
+    return pd.concat([data, data.iloc[: rows // 20]], ignore_index=True)
+
+
+def _eager(data: pd.DataFrame) -> DataStore:
+    with (
+        patch("pylms.clean.clean_info.input_num", return_value=Result.ok(INFO.cohort)),
+        patch("pylms.clean.clean_info.input_str", return_value=Result.ok(INFO.date)),
+        patch(
+            "pylms.clean.clean_completion_date.input_option",
+            return_value=Result.ok((1, "day first")),
+        ),
+    ):
+        return clean_reg_eager(DataStream(data)).unwrap()
+
+
+@final
+class CleanRegBenchTest(unittest.TestCase):
+    def test_matches_eager_with_string_times(self) -> None:
+        data = _sheet(2_000, string_times=True)
+        expected = _eager(data.copy())
+        actual = clean_reg_lazy(DataStream(data.copy()), INFO).unwrap()
+        pd.testing.assert_frame_equal(actual(), expected())
+
+    def test_streaming_matches(self) -> None:
+        data = _sheet(2_000)
+        expected = clean_reg_lazy(DataStream(data.copy()), INFO).unwrap()
+        actual = clean_reg_lazy(DataStream(data.copy()), INFO, streaming=True).unwrap()
+        pd.testing.assert_frame_equal(actual(), expected())
+
+    def test_missing_email_is_an_error(self) -> None:
+        data = _sheet(100)
+        data.loc[3, EMAIL] = np.nan
+        self.assertTrue(clean_reg_lazy(DataStream(data), INFO).is_err())
+
+    @unittest.skipUnless(os.environ.get("PYLMS_BENCH"), "set PYLMS_BENCH=1 to run benchmarks")
+    def test_speedup(self) -> None:
+        data = _sheet(50_000)
+
+        start = time.perf_counter()
+        expected = _eager(data.copy())
+        eager = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = clean_reg_lazy(DataStream(data.copy()), INFO).unwrap()
+        lazy = time.perf_counter() - start
+
+        pd.testing.assert_frame_equal(actual(), expected())
+        self.assertLess(lazy, eager)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
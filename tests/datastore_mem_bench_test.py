@@ -0,0 +1,107 @@
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from typing import final
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+# The tree before the data classes relied on pandas Copy-on-Write
+_BASELINE = "33eed7e~1"
+
+# Runs in a fresh interpreter for each source tree. Prints how far the peak
+# RSS grows above the RSS holding the frame alone, in KiB.
+_SCRIPT = """
+import gc
+
+import numpy as np
+import pandas as pd
+
+from pylms.constants import COHORT, DATA_COLUMNS, SERIAL
+from pylms.data import DataStore
+
+ROWS, DATES = 20_000, 120 - len(DATA_COLUMNS)
+rng = np.random.default_rng(0)
+columns = {col: np.array([f"{col} {i}" for i in range(ROWS)], dtype=object) for col in DATA_COLUMNS}
+columns[SERIAL] = np.arange(1, ROWS + 1)
+columns[COHORT] = np.full(ROWS, 4)
+statuses = np.array(["Present", "Absent", "Excused", "No Class"], dtype=object)
+for day in range(DATES):
+    columns[f"{day % 28 + 1:02d}/{day // 28 + 1:02d}/2026"] = rng.choice(statuses, size=ROWS)
+frame = pd.DataFrame(columns)
+del columns
+
+
+def status(field):
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith(field):
+                return int(line.split()[1])
+
+
+gc.collect()
+# Reset the peak to the current RSS, so building the frame does not count
+with open("/proc/self/clear_refs", "w") as file:
+    file.write("5")
+before = status("VmRSS:")
+ds = DataStore.from_data(frame).unwrap()
+data = ds.data
+pretty = ds.pretty()
+kept = (ds, data, pretty)
+print(status("VmHWM:") - before)
+"""
+
+
+def _baseline_src(dst: Path) -> Path | None:
+    """Extract the sources of `_BASELINE` into `dst`, or return None outside a git checkout."""
+    try:
+        archive = subprocess.run(
+            ["git", "archive", _BASELINE, "src"],
+            cwd=_ROOT,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    tar_path = dst / "baseline.tar"
+    _ = tar_path.write_bytes(archive.stdout)
+    with tarfile.open(tar_path) as tar:
+        tar.extractall(dst, filter="data")
+    return dst / "src"
+
+
+def _peak_growth(src: Path) -> int:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(src), env.get("PYTHONPATH")]))
+    out = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return int(out.stdout.strip().splitlines()[-1])
+
+
+@final
+@unittest.skipUnless(os.environ.get("PYLMS_BENCH"), "set PYLMS_BENCH=1 to run benchmarks")
+@unittest.skipUnless(sys.platform.startswith("linux"), "reads the peak RSS from /proc")
+class DataStoreMemBenchTest(unittest.TestCase):
+    def test_copy_on_write_peak_rss(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline_src = _baseline_src(Path(tmp))
+            if baseline_src is None:
+                self.skipTest(f"needs git and the {_BASELINE} revision")
+            eager = _peak_growth(baseline_src)
+        current = _peak_growth(_ROOT / "src")
+
+        # Before Copy-on-Write, from_data, `data` and `pretty()` each copied
+        # the whole frame; now only the rewritten Name column is materialized.
+        self.assertLess(current, eager / 2)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()
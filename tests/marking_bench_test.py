@@ -0,0 +1,53 @@
+import os
+import time
+import unittest
+from typing import final
+
+import numpy as np
+import pandas as pd
+
+from pylms.data import decode_status, encode_status
+from pylms.rollcall.marking import mark_codes
+
+
+def _time_marking(students: int, dates: int) -> float:
+    """Return the seconds taken to mark `dates` class dates for `students` students."""
+    rng = np.random.default_rng(students)
+    names = pd.Series([f"Student {i}" for i in range(students)])
+    columns = [
+        pd.Series(rng.choice(["Absent", "CDS", "No Class"], size=students), dtype=object)
+        for _ in range(dates)
+    ]
+    turnouts = [
+        (
+            names.sample(frac=0.6, random_state=date),
+            names.sample(frac=0.05, random_state=date + dates),
+        )
+        for date in range(dates)
+    ]
+
+    start = time.perf_counter()
+    for column, (present, excused) in zip(columns, turnouts):
+        _ = decode_status(mark_codes(names, encode_status(column), present, excused))
+    return time.perf_counter() - start
+
+
+@final
+class MarkingBenchTest(unittest.TestCase):
+    @unittest.skipUnless(os.environ.get("PYLMS_BENCH"), "set PYLMS_BENCH=1 to run benchmarks")
+    def test_linear_scaling(self) -> None:
+        # warm up pandas and numpy code paths before timing
+        _ = _time_marking(100, 2)
+
+        small = _time_marking(1_000, 10)
+        large = _time_marking(10_000, 100)
+        small_per_cell = small / (1_000 * 10)
+        large_per_cell = large / (10_000 * 100)
+
+        # 100x the cells should cost at most about 100x the time. A quadratic
+        # engine would take 10x longer per cell on the large grid.
+        self.assertLess(large_per_cell, small_per_cell * 3)
+
+
+if __name__ == "__main__":
+    _ = unittest.main()